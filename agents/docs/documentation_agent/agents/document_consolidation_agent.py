@@ -13,6 +13,8 @@ from datetime import datetime
 import json
 import re
 
+import numpy as np
+
 from ..models.document_model import Document
 from ..connectors.knowledge_graph_connector import DocumentKnowledgeGraphConnector
 from ..connectors.vector_store_connector import DocumentVectorStoreConnector
@@ -23,6 +25,7 @@ from ..core.inter_agent_handoff import (
     HandoffStatus
 )
 from ..core.redundancy_detection import RedundancyDetectionResult
+from ..core.minhash import MinHasher
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -63,6 +66,9 @@ class DocumentConsolidationAgent:
         # Active consolidation tasks
         self.active_tasks = {}
         
+        # Signature generator for documents without vectors
+        self.minhasher = MinHasher(num_perm=self.config.get("minhash_permutations", 128))
+        
         # Register with handoff manager
         # This would typically use event-based registration
         logger.info(f"DocumentConsolidationAgent initialized with ID {agent_id}")
@@ -194,18 +200,15 @@ class DocumentConsolidationAgent:
             return {"status": "failed", "reason": "Source document not found"}
         
         # Get consolidation candidates
-        candidates = []
         candidate_ids = []
         for action in context.metadata.get("actions", []):
             if action.get("action_type") == "consolidation_strategy":
                 candidate_ids = action.get("candidate_documents", [])
                 break
         
-        # Get candidate documents
-        for doc_id in candidate_ids:
-            doc = await self._get_document(doc_id)
-            if doc:
-                candidates.append(doc)
+        # Get candidate documents in one batch
+        found = await self.knowledge_graph.get_documents(candidate_ids) if candidate_ids else {}
+        candidates = [found[doc_id] for doc_id in dict.fromkeys(candidate_ids) if doc_id in found]
         
         # Create consolidation strategy
         strategy = await self._develop_consolidation_strategy(
@@ -274,7 +277,7 @@ class DocumentConsolidationAgent:
             return {"status": "failed", "reason": "Source document not found"}
         
         # Get related documents
-        related_docs = await self._get_related_documents(source_document.id)
+        related_docs = await self._get_related_documents(source_document)
         
         # Analyze relationships
         relationship_analysis = await self._analyze_document_relationships(
@@ -306,50 +309,37 @@ class DocumentConsolidationAgent:
             Document object or None if not found
         """
         try:
-            doc_data = await self.knowledge_graph.get_document(doc_id)
+            document = await self.knowledge_graph.get_document(doc_id)
             
-            if not doc_data:
+            if not document:
                 logger.warning(f"Document {doc_id} not found in knowledge graph")
                 return None
                 
-            # Create Document object
-            return Document(
-                id=doc_id,
-                title=doc_data.get("title", "Untitled"),
-                content=doc_data.get("content", ""),
-                document_type=doc_data.get("document_type", "text")
-            )
+            return document
         except Exception as e:
             logger.error(f"Error getting document {doc_id}: {e}")
             return None
     
-    async def _get_related_documents(self, doc_id: str) -> List[Document]:
+    async def _get_related_documents(self, document: Document) -> List[Document]:
         """
         Get documents related to the given document.
         
         Args:
-            doc_id: Document ID
+            document: Document loaded with its relationships
             
         Returns:
             List of related documents
         """
         try:
-            # Get document relationships
-            relationships = await self.knowledge_graph.get_document_relationships(doc_id)
-            
             # Extract related document IDs
-            related_ids = [r["target_id"] for r in relationships]
+            related_ids = [r.entity_id for r in document.relationships if r.entity_type == "document"]
             
-            # Get document objects
-            related_docs = []
-            for related_id in related_ids:
-                doc = await self._get_document(related_id)
-                if doc:
-                    related_docs.append(doc)
+            # Get document objects in one batch
+            found = await self.knowledge_graph.get_documents(related_ids)
             
-            return related_docs
+            return [found[related_id] for related_id in dict.fromkeys(related_ids) if related_id in found]
         except Exception as e:
-            logger.error(f"Error getting related documents for {doc_id}: {e}")
+            logger.error(f"Error getting related documents for {document.id}: {e}")
             return []
     
     async def _merge_documents(self, source_doc: Document, 
@@ -784,23 +774,20 @@ class DocumentConsolidationAgent:
         analysis["section_consolidation"] = consolidated_sections
         
         # 3. Identify cross-reference candidates
-        for doc in doc_list:
+        merged_ids = {d["id"] for group in analysis["merge_candidates"] for d in group}
+        related_mask = (similarity_matrix > 0.3) & (similarity_matrix < similarity_threshold)
+        
+        for i, doc in enumerate(doc_list):
             # Skip docs that are being merged
-            if any(doc.id in [d["id"] for d in group] for group in analysis["merge_candidates"]):
+            if doc.id in merged_ids:
                 continue
                 
             # Find documents this should reference
-            references = []
-            for other_doc in doc_list:
-                if doc.id == other_doc.id:
-                    continue
-                    
-                # Check for related content
-                i = doc_list.index(doc)
-                j = doc_list.index(other_doc)
-                
-                if similarity_matrix[i][j] > 0.3 and similarity_matrix[i][j] < similarity_threshold:
-                    references.append(other_doc.id)
+            references = [
+                doc_list[j].id
+                for j in np.flatnonzero(related_mask[i])
+                if doc_list[j].id != doc.id
+            ]
             
             if references:
                 analysis["cross_reference_candidates"].append({
@@ -817,50 +804,87 @@ class DocumentConsolidationAgent:
         return analysis
     
     async def _compute_document_similarity_matrix(self, 
-                                              documents: List[Document]) -> List[List[float]]:
+                                              documents: List[Document]) -> np.ndarray:
         """
         Compute similarity matrix between documents.
         
+        Vectors are fetched in one batch and compared with a single normalized
+        matrix product. Pairs where either document lacks a vector fall back to
+        MinHash-estimated token Jaccard similarity.
+        
         Args:
             documents: List of documents
             
         Returns:
-            Matrix of similarity scores
+            Symmetric n x n array of similarity scores
         """
         # If vector store supports batch similarity, use it
         if hasattr(self.vector_store, 'compute_similarity_matrix'):
-            return await self.vector_store.compute_similarity_matrix(documents)
+            return np.asarray(await self.vector_store.compute_similarity_matrix(documents), dtype=float)
         
-        # Otherwise compute pairwise similarity
         n = len(documents)
-        matrix = [[0.0 for _ in range(n)] for _ in range(n)]
+        if n == 0:
+            return np.zeros((0, 0))
+        
+        vectors = await self._get_document_vectors([doc.id for doc in documents])
+        
+        # Only vectors of the dominant dimension can share a matrix
+        dims = [len(vectors[doc.id]) for doc in documents if doc.id in vectors]
+        dim = max(set(dims), key=dims.count) if dims else 0
+        has_vector = np.array([
+            doc.id in vectors and len(vectors[doc.id]) == dim and dim > 0
+            for doc in documents
+        ])
+        
+        matrix = np.zeros((n, n))
+        
+        vector_rows = np.flatnonzero(has_vector)
+        if len(vector_rows):
+            embeddings = np.array([vectors[documents[i].id] for i in vector_rows], dtype=float)
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            embeddings /= norms
+            matrix[np.ix_(vector_rows, vector_rows)] = embeddings @ embeddings.T
+        
+        # Fallback to estimated content similarity for documents without vectors
+        missing_rows = np.flatnonzero(~has_vector)
+        if len(missing_rows):
+            signatures = self.minhasher.signatures(doc.content for doc in documents)
+            estimates = self.minhasher.estimate_similarity(signatures, list(missing_rows))
+            matrix[missing_rows, :] = estimates
+            matrix[:, missing_rows] = estimates.T
         
         # Diagonal is always 1.0 (self-similarity)
-        for i in range(n):
-            matrix[i][i] = 1.0
-        
-        # Compute pairwise similarity
-        for i in range(n):
-            for j in range(i+1, n):
-                doc1 = documents[i]
-                doc2 = documents[j]
-                
-                # Get document vectors
-                vec1 = await self.vector_store.get_document_vector(doc1.id)
-                vec2 = await self.vector_store.get_document_vector(doc2.id)
-                
-                # Compute similarity if both vectors exist
-                if vec1 is not None and vec2 is not None:
-                    similarity = await self.vector_store.compute_vector_similarity(vec1, vec2)
-                else:
-                    # Fallback to content similarity
-                    similarity = self._compute_content_similarity(doc1.content, doc2.content)
-                
-                # Symmetric matrix
-                matrix[i][j] = similarity
-                matrix[j][i] = similarity
+        np.fill_diagonal(matrix, 1.0)
         
-        return matrix
+        return np.clip(matrix, 0.0, 1.0)
+    
+    async def _get_document_vectors(self, document_ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Fetch stored vectors for several documents.
+        
+        Args:
+            document_ids: Document IDs
+            
+        Returns:
+            Dictionary mapping document IDs to vectors (missing vectors omitted)
+        """
+        try:
+            if hasattr(self.vector_store, 'get_document_vectors'):
+                return await self.vector_store.get_document_vectors(document_ids)
+            
+            # Connectors without a batch lookup are queried concurrently
+            results = await asyncio.gather(
+                *(self.vector_store.get_document_vector(doc_id) for doc_id in document_ids)
+            )
+            return {
+                doc_id: vector
+                for doc_id, vector in zip(document_ids, results)
+                if vector is not None
+            }
+        except Exception as e:
+            logger.error(f"Error fetching document vectors: {str(e)}")
+            return {}
     
     def _compute_content_similarity(self, content1: str, content2: str) -> float:
         """
@@ -35,70 +35,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger('document_kg_connector')
 
-# Try to import the base knowledge_graph_connector
+# Try to import the indexed access to the knowledge graph shared with the feature creation agent
 try:
-    from agents.planning.feature_creation.knowledge_graph_connector import KnowledgeGraphConnector as BaseKGConnector
-    from agents.planning.feature_creation.knowledge_graph_connector import get_knowledge_graph_connector
+    from agents.planning.feature_creation.graph_store import IndexedGraphFile, default_graph_path
     USING_BASE_KG = True
 except ImportError:
-    logger.warning("Could not import base KnowledgeGraphConnector, using simplified implementation")
+    logger.warning("Could not import IndexedGraphFile, using a separate document graph store")
     USING_BASE_KG = False
     
-    # Simple mock implementation if the real one isn't available
+    from agents.utils.graph_node_store import GraphNodeStore
+    
+    # Simple standalone implementation if the shared graph isn't available
     class BaseKGConnector:
-        """Mock implementation of KnowledgeGraphConnector"""
-        
-        def __init__(self, kg_file_path=None):
-            self.kg_file_path = kg_file_path or os.path.expanduser("~/.devloop/sdk/storage/knowledge_graph.json")
-            self.kg = {
-                "knowledge_graph": {
-                    "nodes": {},
-                    "edges": [],
-                    "indices": {
-                        "node_type_index": {},
-                        "edge_type_index": {},
-                        "node_outgoing_edges": {},
-                        "node_incoming_edges": {}
-                    }
-                }
-            }
-            self._load()
+        """Document graph kept in its own store, separate from the shared knowledge graph"""
         
-        def _load(self):
-            if os.path.exists(self.kg_file_path):
-                try:
-                    with open(self.kg_file_path, 'r') as f:
-                        self.kg = json.load(f)
-                except Exception as e:
-                    logger.error(f"Error loading knowledge graph: {e}")
+        def __init__(self, db_path=None):
+            self.db_path = db_path or os.path.expanduser("~/.devloop/sdk/storage/document_graph.sqlite")
+            try:
+                self.store = GraphNodeStore(self.db_path)
+            except Exception as e:
+                logger.error(f"Error opening document graph: {e}")
+                self.store = GraphNodeStore(":memory:")
         
         def save(self):
             try:
-                os.makedirs(os.path.dirname(self.kg_file_path), exist_ok=True)
-                with open(self.kg_file_path, 'w') as f:
-                    json.dump(self.kg, f, indent=2)
+                self.store.commit()
                 return True
             except Exception as e:
-                logger.error(f"Error saving knowledge graph: {e}")
+                logger.error(f"Error saving document graph: {e}")
                 return False
         
         def get_node(self, node_id):
-            return self.kg.get("knowledge_graph", {}).get("nodes", {}).get(node_id)
+            return self.store.get_node(node_id)
+        
+        def get_nodes(self, node_ids):
+            return self.store.get_nodes(node_ids)
         
         def get_nodes_by_type(self, node_type):
-            nodes = []
-            for node_id, node in self.kg.get("knowledge_graph", {}).get("nodes", {}).items():
-                if node.get("type") == node_type:
-                    nodes.append(node)
-            return nodes
+            return self.store.get_nodes_by_type(node_type)
+        
+        def get_edges(self, source_id=None, target_id=None, edge_type=None):
+            return self.store.get_edges(source_id=source_id, target_id=target_id, edge_type=edge_type)
         
         def add_node(self, node_id, node_type, properties=None, metadata=None):
-            if "knowledge_graph" not in self.kg:
-                self.kg["knowledge_graph"] = {"nodes": {}, "edges": [], "indices": {}}
-            
-            if "nodes" not in self.kg["knowledge_graph"]:
-                self.kg["knowledge_graph"]["nodes"] = {}
-            
             # Create node
             node = {
                 "id": node_id,
@@ -107,39 +86,24 @@ except ImportError:
                 "metadata": metadata or {}
             }
             
-            # Add to nodes
-            self.kg["knowledge_graph"]["nodes"][node_id] = node
-            
-            # Update indices
-            if "indices" not in self.kg["knowledge_graph"]:
-                self.kg["knowledge_graph"]["indices"] = {
-                    "node_type_index": {},
-                    "edge_type_index": {},
-                    "node_outgoing_edges": {},
-                    "node_incoming_edges": {}
-                }
-            
-            indices = self.kg["knowledge_graph"]["indices"]
-            
-            # Update node type index
-            if "node_type_index" not in indices:
-                indices["node_type_index"] = {}
+            self.store.put_node(node_id, node, [node_type])
             
-            if node_type not in indices["node_type_index"]:
-                indices["node_type_index"][node_type] = []
+            return node
+        
+        def update_node(self, node_id, properties=None, metadata=None):
+            node = self.store.get_node(node_id)
+            if not node:
+                return None
+            if properties is not None:
+                node["properties"] = properties
+            if metadata is not None:
+                node["metadata"] = metadata
             
-            if node_id not in indices["node_type_index"][node_type]:
-                indices["node_type_index"][node_type].append(node_id)
+            self.store.put_node(node_id, node, [node.get("type")])
             
             return node
         
         def add_edge(self, edge_type, source_id, target_id, properties=None, metadata=None):
-            if "knowledge_graph" not in self.kg:
-                self.kg["knowledge_graph"] = {"nodes": {}, "edges": [], "indices": {}}
-            
-            if "edges" not in self.kg["knowledge_graph"]:
-                self.kg["knowledge_graph"]["edges"] = []
-            
             # Create edge
             edge = {
                 "type": edge_type,
@@ -149,14 +113,22 @@ except ImportError:
                 "metadata": metadata or {}
             }
             
-            # Add to edges
-            self.kg["knowledge_graph"]["edges"].append(edge)
+            self.store.add_edge(edge_type, source_id, target_id, edge)
             
             return edge
+
+
+def get_knowledge_graph_connector():
+    """
+    Open the knowledge graph without loading it.
     
-    def get_knowledge_graph_connector():
-        """Get singleton instance"""
-        return BaseKGConnector()
+    Returns:
+        IndexedGraphFile over the shared knowledge graph file, or the
+        standalone document graph if it is unavailable
+    """
+    if USING_BASE_KG:
+        return IndexedGraphFile(default_graph_path())
+    return BaseKGConnector()
 
 
 class DocumentKnowledgeGraphConnector:
@@ -201,13 +173,15 @@ class DocumentKnowledgeGraphConnector:
         
         logger.info("Document knowledge graph connector initialized")
     
-    async def add_document(self, document: Document, related_entities: List[Dict[str, Any]] = None) -> bool:
+    async def add_document(self, document: Document, related_entities: List[Dict[str, Any]] = None,
+                           save: bool = True) -> bool:
         """
         Add a document to the knowledge graph.
         
         Args:
             document: Document to add
             related_entities: List of related entities to link the document to
+            save: Whether to persist the knowledge graph afterwards
             
         Returns:
             Success status
@@ -219,215 +193,268 @@ class DocumentKnowledgeGraphConnector:
             existing_node = self.base_kg.get_node(document_id)
             if existing_node:
                 logger.info(f"Document {document_id} already exists in knowledge graph, updating...")
-                return await self.update_document(document)
-            
-            logger.info(f"Adding document {document_id} to knowledge graph")
-            
-            # Prepare document properties
-            properties = {
-                "title": document.metadata.title,
-                "description": document.metadata.description,
-                "authors": document.metadata.authors,
-                "created_at": document.metadata.created_at.isoformat(),
-                "updated_at": document.metadata.updated_at.isoformat(),
-                "document_type": document.metadata.document_type.value,
-                "status": document.metadata.status.value,
-                "version": document.metadata.version,
-                "tags": document.metadata.tags,
-                "source_path": document.metadata.source_path,
-                "language": document.metadata.language,
-                "word_count": document.metadata.word_count,
-                "reading_time_minutes": document.metadata.reading_time_minutes,
-                "url": document.metadata.custom_metadata.get("url", ""),
-                "content_summary": document.summary
-            }
+                return await self.update_document(document, save=save)
             
-            # Add additional metadata
-            metadata = {
-                "created_by": "documentation_agent",
-                "created_at": datetime.now().isoformat(),
-                "validation_status": "pending",
-                "storage_path": await self._store_document_file(document)
-            }
+            await self._insert_document(document, related_entities)
             
-            # Create document node in the knowledge graph
-            self.base_kg.add_node(
-                node_id=document_id,
-                node_type=self.document_node_type,
-                properties=properties,
-                metadata=metadata
-            )
+            # Save the knowledge graph
+            if save:
+                self.base_kg.save()
+            
+            logger.info(f"Document {document_id} added to knowledge graph successfully")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error adding document to knowledge graph: {str(e)}")
+            return False
+    
+    async def add_documents(self, documents: List[Document],
+                            related_entities: Dict[str, List[Dict[str, Any]]] = None) -> Dict[str, bool]:
+        """
+        Add or update several documents in the knowledge graph.
+        
+        Existing documents are looked up in one pass and the knowledge graph
+        is persisted once after all documents are written.
+        
+        Args:
+            documents: Documents to add
+            related_entities: Optional mapping of document ID to related entities
             
-            # Add relationships to the document
-            if document.relationships:
-                for rel in document.relationships:
-                    edge_type = self.edge_types.get(rel.relationship_type, "document_related_to")
-                    
-                    # Check if target entity exists, create placeholder if not
-                    target_node = self.base_kg.get_node(rel.entity_id)
-                    if not target_node:
-                        logger.info(f"Creating placeholder node for {rel.entity_type} {rel.entity_id}")
-                        self.base_kg.add_node(
-                            node_id=rel.entity_id,
-                            node_type=rel.entity_type,
-                            properties={
-                                "name": rel.metadata.get("name", rel.entity_id),
-                                "placeholder": True
-                            },
-                            metadata={
-                                "created_by": "documentation_agent",
-                                "created_at": datetime.now().isoformat(),
-                                "placeholder": True
-                            }
-                        )
-                    
-                    # Create relationship
-                    logger.info(f"Adding relationship {edge_type} from {document_id} to {rel.entity_id}")
+        Returns:
+            Dictionary mapping document IDs to success status
+        """
+        related_entities = related_entities or {}
+        results = {}
+        
+        existing_nodes = self._get_nodes([document.id for document in documents])
+        logger.info(f"Adding {len(documents)} documents to knowledge graph "
+                    f"({len(existing_nodes)} already present)")
+        
+        for document in documents:
+            try:
+                if document.id in existing_nodes:
+                    await self._update_document_node(document, existing_nodes[document.id])
+                else:
+                    await self._insert_document(document, related_entities.get(document.id))
+                results[document.id] = True
+            except Exception as e:
+                logger.error(f"Error adding document {document.id} to knowledge graph: {str(e)}")
+                results[document.id] = False
+        
+        # Save the knowledge graph once for the whole batch
+        if any(results.values()):
+            self.base_kg.save()
+        
+        return results
+    
+    async def _insert_document(self, document: Document, related_entities: List[Dict[str, Any]] = None):
+        """
+        Write a new document node with its relationships, placeholders and concepts.
+        
+        Args:
+            document: Document to add
+            related_entities: List of related entities to link the document to
+        """
+        document_id = document.id
+        
+        logger.info(f"Adding document {document_id} to knowledge graph")
+        
+        # Prepare document properties
+        properties = {
+            "title": document.metadata.title,
+            "description": document.metadata.description,
+            "authors": document.metadata.authors,
+            "created_at": document.metadata.created_at.isoformat(),
+            "updated_at": document.metadata.updated_at.isoformat(),
+            "document_type": document.metadata.document_type.value,
+            "status": document.metadata.status.value,
+            "version": document.metadata.version,
+            "tags": document.metadata.tags,
+            "source_path": document.metadata.source_path,
+            "language": document.metadata.language,
+            "word_count": document.metadata.word_count,
+            "reading_time_minutes": document.metadata.reading_time_minutes,
+            "url": document.metadata.custom_metadata.get("url", ""),
+            "content_summary": document.summary
+        }
+        
+        # Add additional metadata
+        metadata = {
+            "created_by": "documentation_agent",
+            "created_at": datetime.now().isoformat(),
+            "validation_status": "pending",
+            "storage_path": await self._store_document_file(document)
+        }
+        
+        # Create document node in the knowledge graph
+        self.base_kg.add_node(
+            node_id=document_id,
+            node_type=self.document_node_type,
+            properties=properties,
+            metadata=metadata
+        )
+        
+        # Add relationships to the document
+        if document.relationships:
+            for rel in document.relationships:
+                edge_type = self.edge_types.get(rel.relationship_type, "document_related_to")
+                
+                # Check if target entity exists, create placeholder if not
+                target_node = self.base_kg.get_node(rel.entity_id)
+                if not target_node:
+                    logger.info(f"Creating placeholder node for {rel.entity_type} {rel.entity_id}")
+                    self.base_kg.add_node(
+                        node_id=rel.entity_id,
+                        node_type=rel.entity_type,
+                        properties={
+                            "name": rel.metadata.get("name", rel.entity_id),
+                            "placeholder": True
+                        },
+                        metadata={
+                            "created_by": "documentation_agent",
+                            "created_at": datetime.now().isoformat(),
+                            "placeholder": True
+                        }
+                    )
+                
+                # Create relationship
+                logger.info(f"Adding relationship {edge_type} from {document_id} to {rel.entity_id}")
+                self.base_kg.add_edge(
+                    edge_type=edge_type,
+                    source_id=document_id,
+                    target_id=rel.entity_id,
+                    properties={
+                        "relationship_type": rel.relationship_type,
+                        "strength": rel.strength,
+                        "bidirectional": rel.bidirectional
+                    },
+                    metadata=rel.metadata
+                )
+                
+                # If bidirectional, add reverse relationship
+                if rel.bidirectional:
+                    reverse_edge_type = edge_type + "_by"
+                    logger.info(f"Adding reverse relationship {reverse_edge_type} from {rel.entity_id} to {document_id}")
                     self.base_kg.add_edge(
-                        edge_type=edge_type,
-                        source_id=document_id,
-                        target_id=rel.entity_id,
+                        edge_type=reverse_edge_type,
+                        source_id=rel.entity_id,
+                        target_id=document_id,
                         properties={
-                            "relationship_type": rel.relationship_type,
+                            "relationship_type": rel.relationship_type + "_by",
                             "strength": rel.strength,
-                            "bidirectional": rel.bidirectional
+                            "bidirectional": True
                         },
                         metadata=rel.metadata
                     )
-                    
-                    # If bidirectional, add reverse relationship
-                    if rel.bidirectional:
-                        reverse_edge_type = edge_type + "_by"
-                        logger.info(f"Adding reverse relationship {reverse_edge_type} from {rel.entity_id} to {document_id}")
-                        self.base_kg.add_edge(
-                            edge_type=reverse_edge_type,
-                            source_id=rel.entity_id,
-                            target_id=document_id,
-                            properties={
-                                "relationship_type": rel.relationship_type + "_by",
-                                "strength": rel.strength,
-                                "bidirectional": True
-                            },
-                            metadata=rel.metadata
-                        )
-            
-            # Add relationships to explicitly provided related entities
-            if related_entities:
-                for entity in related_entities:
-                    entity_id = entity.get("id")
-                    entity_type = entity.get("type", "feature")
-                    relationship_type = entity.get("relationship", "references")
-                    
-                    if not entity_id:
-                        continue
-                    
-                    edge_type = self.edge_types.get(relationship_type, "document_related_to")
-                    
-                    # Check if entity node exists, create placeholder if not
-                    entity_node = self.base_kg.get_node(entity_id)
-                    if not entity_node:
-                        logger.info(f"Creating placeholder node for {entity_type} {entity_id}")
-                        self.base_kg.add_node(
-                            node_id=entity_id,
-                            node_type=entity_type,
-                            properties={
-                                "name": entity.get("name", entity_id),
-                                "placeholder": True
-                            },
-                            metadata={
-                                "created_by": "documentation_agent",
-                                "created_at": datetime.now().isoformat(),
-                                "placeholder": True
-                            }
-                        )
-                    
-                    # Create relationship
-                    logger.info(f"Adding relationship {edge_type} from {document_id} to {entity_id}")
+        
+        # Add relationships to explicitly provided related entities
+        if related_entities:
+            for entity in related_entities:
+                entity_id = entity.get("id")
+                entity_type = entity.get("type", "feature")
+                relationship_type = entity.get("relationship", "references")
+                
+                if not entity_id:
+                    continue
+                
+                edge_type = self.edge_types.get(relationship_type, "document_related_to")
+                
+                # Check if entity node exists, create placeholder if not
+                entity_node = self.base_kg.get_node(entity_id)
+                if not entity_node:
+                    logger.info(f"Creating placeholder node for {entity_type} {entity_id}")
+                    self.base_kg.add_node(
+                        node_id=entity_id,
+                        node_type=entity_type,
+                        properties={
+                            "name": entity.get("name", entity_id),
+                            "placeholder": True
+                        },
+                        metadata={
+                            "created_by": "documentation_agent",
+                            "created_at": datetime.now().isoformat(),
+                            "placeholder": True
+                        }
+                    )
+                
+                # Create relationship
+                logger.info(f"Adding relationship {edge_type} from {document_id} to {entity_id}")
+                self.base_kg.add_edge(
+                    edge_type=edge_type,
+                    source_id=document_id,
+                    target_id=entity_id,
+                    properties={
+                        "relationship_type": relationship_type,
+                        "strength": entity.get("strength", 1.0),
+                        "bidirectional": entity.get("bidirectional", False)
+                    },
+                    metadata={
+                        "created_by": "documentation_agent",
+                        "created_at": datetime.now().isoformat()
+                    }
+                )
+                
+                # If bidirectional, add reverse relationship
+                if entity.get("bidirectional", False):
+                    reverse_edge_type = edge_type + "_by"
+                    logger.info(f"Adding reverse relationship {reverse_edge_type} from {entity_id} to {document_id}")
                     self.base_kg.add_edge(
-                        edge_type=edge_type,
-                        source_id=document_id,
-                        target_id=entity_id,
+                        edge_type=reverse_edge_type,
+                        source_id=entity_id,
+                        target_id=document_id,
                         properties={
-                            "relationship_type": relationship_type,
+                            "relationship_type": relationship_type + "_by",
                             "strength": entity.get("strength", 1.0),
-                            "bidirectional": entity.get("bidirectional", False)
+                            "bidirectional": True
                         },
                         metadata={
                             "created_by": "documentation_agent",
                             "created_at": datetime.now().isoformat()
                         }
                     )
-                    
-                    # If bidirectional, add reverse relationship
-                    if entity.get("bidirectional", False):
-                        reverse_edge_type = edge_type + "_by"
-                        logger.info(f"Adding reverse relationship {reverse_edge_type} from {entity_id} to {document_id}")
-                        self.base_kg.add_edge(
-                            edge_type=reverse_edge_type,
-                            source_id=entity_id,
-                            target_id=document_id,
-                            properties={
-                                "relationship_type": relationship_type + "_by",
-                                "strength": entity.get("strength", 1.0),
-                                "bidirectional": True
-                            },
-                            metadata={
-                                "created_by": "documentation_agent",
-                                "created_at": datetime.now().isoformat()
-                            }
-                        )
-            
-            # Add tags as concept nodes and create relationships
-            if document.metadata.tags:
-                for tag in document.metadata.tags:
-                    # Create consistent concept ID
-                    concept_id = f"concept-{tag.lower().replace(' ', '-')}"
-                    
-                    # Check if concept exists, create it if not
-                    concept_node = self.base_kg.get_node(concept_id)
-                    if not concept_node:
-                        logger.info(f"Creating concept node {concept_id}")
-                        self.base_kg.add_node(
-                            node_id=concept_id,
-                            node_type="concept",
-                            properties={
-                                "name": tag,
-                                "normalized": concept_id.replace("concept-", "")
-                            },
-                            metadata={
-                                "created_by": "documentation_agent",
-                                "created_at": datetime.now().isoformat()
-                            }
-                        )
-                    
-                    # Connect document to concept
-                    logger.info(f"Connecting document {document_id} to concept {concept_id}")
-                    self.base_kg.add_edge(
-                        edge_type="document_related_to_concept",
-                        source_id=document_id,
-                        target_id=concept_id,
+        
+        # Add tags as concept nodes and create relationships
+        if document.metadata.tags:
+            for tag in document.metadata.tags:
+                # Create consistent concept ID
+                concept_id = f"concept-{tag.lower().replace(' ', '-')}"
+                
+                # Check if concept exists, create it if not
+                concept_node = self.base_kg.get_node(concept_id)
+                if not concept_node:
+                    logger.info(f"Creating concept node {concept_id}")
+                    self.base_kg.add_node(
+                        node_id=concept_id,
+                        node_type="concept",
+                        properties={
+                            "name": tag,
+                            "normalized": concept_id.replace("concept-", "")
+                        },
                         metadata={
                             "created_by": "documentation_agent",
                             "created_at": datetime.now().isoformat()
                         }
                     )
-            
-            # Save the knowledge graph
-            self.base_kg.save()
-            
-            logger.info(f"Document {document_id} added to knowledge graph successfully")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error adding document to knowledge graph: {str(e)}")
-            return False
+                
+                # Connect document to concept
+                logger.info(f"Connecting document {document_id} to concept {concept_id}")
+                self.base_kg.add_edge(
+                    edge_type="document_related_to_concept",
+                    source_id=document_id,
+                    target_id=concept_id,
+                    metadata={
+                        "created_by": "documentation_agent",
+                        "created_at": datetime.now().isoformat()
+                    }
+                )
     
-    async def update_document(self, document: Document) -> bool:
+    async def update_document(self, document: Document, save: bool = True) -> bool:
         """
         Update an existing document in the knowledge graph.
         
         Args:
             document: Updated document
+            save: Whether to persist the knowledge graph afterwards
             
         Returns:
             Success status
@@ -439,50 +466,13 @@ class DocumentKnowledgeGraphConnector:
             existing_node = self.base_kg.get_node(document_id)
             if not existing_node:
                 logger.warning(f"Document {document_id} not found in knowledge graph, adding instead...")
-                return await self.add_document(document)
-            
-            logger.info(f"Updating document {document_id} in knowledge graph")
-            
-            # Get current properties and update with new data
-            properties = existing_node.get("properties", {}).copy()
-            
-            # Update properties
-            properties.update({
-                "title": document.metadata.title,
-                "description": document.metadata.description,
-                "authors": document.metadata.authors,
-                "updated_at": document.metadata.updated_at.isoformat(),
-                "document_type": document.metadata.document_type.value,
-                "status": document.metadata.status.value,
-                "version": document.metadata.version,
-                "tags": document.metadata.tags,
-                "word_count": document.metadata.word_count,
-                "reading_time_minutes": document.metadata.reading_time_minutes,
-                "content_summary": document.summary
-            })
+                return await self.add_document(document, save=save)
             
-            # Update metadata
-            metadata = existing_node.get("metadata", {}).copy()
-            metadata.update({
-                "updated_by": "documentation_agent",
-                "updated_at": datetime.now().isoformat(),
-                "storage_path": await self._store_document_file(document, update=True)
-            })
-            
-            # Update the node in the knowledge graph
-            if hasattr(self.base_kg, 'update_node'):
-                self.base_kg.update_node(document_id, properties=properties, metadata=metadata)
-            else:
-                # If update_node method isn't available, add node replaces existing one
-                self.base_kg.add_node(
-                    node_id=document_id,
-                    node_type=self.document_node_type,
-                    properties=properties,
-                    metadata=metadata
-                )
+            await self._update_document_node(document, existing_node)
             
             # Save the knowledge graph
-            self.base_kg.save()
+            if save:
+                self.base_kg.save()
             
             logger.info(f"Document {document_id} updated in knowledge graph successfully")
             return True
@@ -491,6 +481,56 @@ class DocumentKnowledgeGraphConnector:
             logger.error(f"Error updating document in knowledge graph: {str(e)}")
             return False
     
+    async def _update_document_node(self, document: Document, existing_node: Dict[str, Any]):
+        """
+        Update the node of an existing document.
+        
+        Args:
+            document: Updated document
+            existing_node: Current node of the document
+        """
+        document_id = document.id
+        
+        logger.info(f"Updating document {document_id} in knowledge graph")
+        
+        # Get current properties and update with new data
+        properties = existing_node.get("properties", {}).copy()
+        
+        # Update properties
+        properties.update({
+            "title": document.metadata.title,
+            "description": document.metadata.description,
+            "authors": document.metadata.authors,
+            "updated_at": document.metadata.updated_at.isoformat(),
+            "document_type": document.metadata.document_type.value,
+            "status": document.metadata.status.value,
+            "version": document.metadata.version,
+            "tags": document.metadata.tags,
+            "word_count": document.metadata.word_count,
+            "reading_time_minutes": document.metadata.reading_time_minutes,
+            "content_summary": document.summary
+        })
+        
+        # Update metadata
+        metadata = existing_node.get("metadata", {}).copy()
+        metadata.update({
+            "updated_by": "documentation_agent",
+            "updated_at": datetime.now().isoformat(),
+            "storage_path": await self._store_document_file(document, update=True)
+        })
+        
+        # Update the node in the knowledge graph
+        if hasattr(self.base_kg, 'update_node'):
+            self.base_kg.update_node(document_id, properties=properties, metadata=metadata)
+        else:
+            # If update_node method isn't available, add node replaces existing one
+            self.base_kg.add_node(
+                node_id=document_id,
+                node_type=self.document_node_type,
+                properties=properties,
+                metadata=metadata
+            )
+    
     async def update_document_validation(self, document_id: str, validation_result: ValidationResult) -> bool:
         """
         Update the validation status of a document in the knowledge graph.
@@ -592,73 +632,134 @@ class DocumentKnowledgeGraphConnector:
             
             logger.info(f"Retrieving document {document_id} from knowledge graph")
             
-            # Extract properties
-            properties = node.get("properties", {})
-            metadata_dict = node.get("metadata", {})
-            
-            # Create document metadata
-            from ..models.document_model import DocumentType, DocumentStatus
-            
-            metadata = DocumentMetadata(
-                title=properties.get("title", ""),
-                description=properties.get("description", ""),
-                authors=properties.get("authors", []),
-                document_type=DocumentType(properties.get("document_type", "unknown")),
-                status=DocumentStatus(properties.get("status", "draft")),
-                version=properties.get("version", "1.0.0"),
-                tags=properties.get("tags", []),
-                source_path=properties.get("source_path", ""),
-                language=properties.get("language", "en"),
-                word_count=properties.get("word_count", 0),
-                reading_time_minutes=properties.get("reading_time_minutes", 0)
-            )
+            document = self._node_to_document(document_id, node)
             
-            # Parse dates
-            if "created_at" in properties:
-                try:
-                    metadata.created_at = datetime.fromisoformat(properties["created_at"])
-                except ValueError:
-                    pass
-                
-            if "updated_at" in properties:
-                try:
-                    metadata.updated_at = datetime.fromisoformat(properties["updated_at"])
-                except ValueError:
-                    pass
+            # Get document relationships
+            document.relationships = await self._get_document_relationships(document_id)
             
-            # Create document
-            document = Document(
-                id=document_id,
-                metadata=metadata
-            )
+            return document
             
-            # Load document content if available
-            storage_path = metadata_dict.get("storage_path")
-            if storage_path and os.path.exists(storage_path):
-                with open(storage_path, 'r', encoding='utf-8') as f:
-                    document.content = f.read()
-            else:
-                # Set summary as content if full content not available
-                document.content = properties.get("content_summary", "")
+        except Exception as e:
+            logger.error(f"Error retrieving document from knowledge graph: {str(e)}")
+            return None
+    
+    async def get_documents(self, document_ids: List[str]) -> Dict[str, Document]:
+        """
+        Get several documents from the knowledge graph.
+        
+        The document nodes, and then the targets of all their relationships,
+        are each looked up in one pass instead of once per document.
+        
+        Args:
+            document_ids: IDs of the documents to retrieve
             
-            # Get document relationships
-            document.relationships = await self._get_document_relationships(document_id)
+        Returns:
+            Dictionary mapping found document IDs to documents, in request order
+        """
+        try:
+            document_ids = list(dict.fromkeys(document_ids))
+            nodes = self._get_nodes(document_ids)
             
-            # Get validation results if available
-            validation_path = metadata_dict.get("validation_path")
-            if validation_path and os.path.exists(validation_path):
+            logger.info(f"Retrieving {len(document_ids)} documents from knowledge graph")
+            
+            documents = {}
+            edges_by_document = {}
+            for document_id in document_ids:
+                node = nodes.get(document_id)
+                if not node or node.get("type") != self.document_node_type:
+                    logger.warning(f"Document {document_id} not found in knowledge graph")
+                    continue
+                
                 try:
-                    with open(validation_path, 'r') as f:
-                        validation_dict = json.load(f)
-                        document.validation_results = ValidationResult.from_dict(validation_dict)
+                    documents[document_id] = self._node_to_document(document_id, node)
+                    edges_by_document[document_id] = self._get_node_edges(document_id, "outgoing")
                 except Exception as e:
-                    logger.error(f"Error loading validation results: {str(e)}")
+                    logger.error(f"Error retrieving document {document_id} from knowledge graph: {str(e)}")
             
-            return document
+            # Resolve the targets of every relationship together
+            target_ids = {edge.get("target") for edges in edges_by_document.values() for edge in edges}
+            target_nodes = self._get_nodes(list(target_ids))
+            for document_id, edges in edges_by_document.items():
+                documents[document_id].relationships = self._relationships_from_edges(
+                    document_id, edges, target_nodes)
+            
+            return documents
             
         except Exception as e:
-            logger.error(f"Error retrieving document from knowledge graph: {str(e)}")
-            return None
+            logger.error(f"Error retrieving documents from knowledge graph: {str(e)}")
+            return {}
+    
+    def _node_to_document(self, document_id: str, node: Dict[str, Any]) -> Document:
+        """
+        Build a document from its knowledge graph node, without relationships.
+        
+        Args:
+            document_id: ID of the document
+            node: Document node
+            
+        Returns:
+            Document with its stored content and validation results
+        """
+        # Extract properties
+        properties = node.get("properties", {})
+        metadata_dict = node.get("metadata", {})
+        
+        # Create document metadata
+        from ..models.document_model import DocumentType, DocumentStatus
+        
+        metadata = DocumentMetadata(
+            title=properties.get("title", ""),
+            description=properties.get("description", ""),
+            authors=properties.get("authors", []),
+            document_type=DocumentType(properties.get("document_type", "unknown")),
+            status=DocumentStatus(properties.get("status", "draft")),
+            version=properties.get("version", "1.0.0"),
+            tags=properties.get("tags", []),
+            source_path=properties.get("source_path", ""),
+            language=properties.get("language", "en"),
+            word_count=properties.get("word_count", 0),
+            reading_time_minutes=properties.get("reading_time_minutes", 0)
+        )
+        
+        # Parse dates
+        if "created_at" in properties:
+            try:
+                metadata.created_at = datetime.fromisoformat(properties["created_at"])
+            except ValueError:
+                pass
+            
+        if "updated_at" in properties:
+            try:
+                metadata.updated_at = datetime.fromisoformat(properties["updated_at"])
+            except ValueError:
+                pass
+        
+        # Create document
+        document = Document(
+            id=document_id,
+            metadata=metadata
+        )
+        
+        # Load document content if available
+        storage_path = metadata_dict.get("storage_path")
+        if storage_path and os.path.exists(storage_path):
+            with open(storage_path, 'r', encoding='utf-8') as f:
+                document.content = f.read()
+        else:
+            # Set summary as content if full content not available
+            document.content = properties.get("content_summary", "")
+        
+        # Get validation results if available
+        validation_path = metadata_dict.get("validation_path")
+        if validation_path and os.path.exists(validation_path):
+            try:
+                with open(validation_path, 'r') as f:
+                    validation_dict = json.load(f)
+                    document.validation_results = ValidationResult.from_dict(validation_dict)
+            except Exception as e:
+                logger.error(f"Error loading validation results: {str(e)}")
+        
+        return document
     
     async def get_document_validation(self, document_id: str) -> Optional[ValidationResult]:
         """
@@ -763,21 +864,19 @@ class DocumentKnowledgeGraphConnector:
         try:
             document_ids = []
             
-            # Search all edges
-            for edge in self.base_kg.kg.memory.get("knowledge_graph", {}).get("edges", []):
-                # Check for direct relationships (document -> entity)
-                if edge.get("target") == entity_id:
-                    source_id = edge.get("source")
-                    source_node = self.base_kg.get_node(source_id)
-                    if source_node and source_node.get("type") == self.document_node_type:
-                        document_ids.append(source_id)
-                
-                # Check for reverse relationships (entity -> document)
-                if edge.get("source") == entity_id:
-                    target_id = edge.get("target")
-                    target_node = self.base_kg.get_node(target_id)
-                    if target_node and target_node.get("type") == self.document_node_type:
-                        document_ids.append(target_id)
+            # Check for direct relationships (document -> entity)
+            for edge in self._get_node_edges(entity_id, "incoming"):
+                source_id = edge.get("source")
+                source_node = self.base_kg.get_node(source_id)
+                if source_node and source_node.get("type") == self.document_node_type:
+                    document_ids.append(source_id)
+            
+            # Check for reverse relationships (entity -> document)
+            for edge in self._get_node_edges(entity_id, "outgoing"):
+                target_id = edge.get("target")
+                target_node = self.base_kg.get_node(target_id)
+                if target_node and target_node.get("type") == self.document_node_type:
+                    document_ids.append(target_id)
             
             # Remove duplicates
             document_ids = list(set(document_ids))
@@ -830,16 +929,14 @@ class DocumentKnowledgeGraphConnector:
                 
                 # Get related documents
                 doc_ids = await self.get_documents_for_entity(entity_type, entity_id)
-                for doc_id in doc_ids:
-                    doc = await self.get_document(doc_id)
-                    if doc:
-                        context["related_documents"].append({
-                            "id": doc.id,
-                            "title": doc.metadata.title,
-                            "description": doc.metadata.description,
-                            "summary": doc.summary,
-                            "tags": doc.metadata.tags
-                        })
+                for doc in (await self.get_documents(doc_ids)).values():
+                    context["related_documents"].append({
+                        "id": doc.id,
+                        "title": doc.metadata.title,
+                        "description": doc.metadata.description,
+                        "summary": doc.summary,
+                        "tags": doc.metadata.tags
+                    })
                 
                 # Get concepts/tags
                 if "tags" in properties:
@@ -858,6 +955,29 @@ class DocumentKnowledgeGraphConnector:
             logger.error(f"Error retrieving context for entities: {str(e)}")
             return {}
     
+    def _get_node_edges(self, node_id: str, direction: str = "outgoing") -> List[Dict[str, Any]]:
+        """
+        Get the edges leaving or entering a node.
+        
+        Args:
+            node_id: ID of the node
+            direction: "outgoing" or "incoming"
+            
+        Returns:
+            List of edge dictionaries
+        """
+        # Graphs with an on-disk edge index answer this without a scan
+        if hasattr(self.base_kg, "get_edges"):
+            if direction == "outgoing":
+                return self.base_kg.get_edges(source_id=node_id)
+            return self.base_kg.get_edges(target_id=node_id)
+        
+        endpoint = "source" if direction == "outgoing" else "target"
+        return [
+            edge for edge in self.base_kg.kg.memory.get("knowledge_graph", {}).get("edges", [])
+            if edge.get(endpoint) == node_id
+        ]
+    
     async def _get_document_relationships(self, document_id: str) -> List[DocumentRelationship]:
         """
         Get all relationships for a document.
@@ -868,47 +988,88 @@ class DocumentKnowledgeGraphConnector:
         Returns:
             List of DocumentRelationship objects
         """
-        relationships = []
-        
         try:
-            # Find all edges where document is the source
-            for edge in self.base_kg.kg.memory.get("knowledge_graph", {}).get("edges", []):
-                if edge.get("source") == document_id:
-                    target_id = edge.get("target")
-                    target_node = self.base_kg.get_node(target_id)
-                    
-                    if not target_node:
-                        continue
-                    
-                    # Determine relationship type
-                    edge_type = edge.get("type", "")
-                    relationship_type = "related"
-                    
-                    for rel_type, edge_name in self.edge_types.items():
-                        if edge_type == edge_name:
-                            relationship_type = rel_type
-                            break
-                    
-                    # Create relationship
-                    relationship = DocumentRelationship(
-                        entity_id=target_id,
-                        entity_type=target_node.get("type", "unknown"),
-                        relationship_type=relationship_type,
-                        metadata={
-                            "name": target_node.get("properties", {}).get("name", target_id),
-                            "edge_type": edge_type
-                        },
-                        bidirectional=edge.get("properties", {}).get("bidirectional", False),
-                        strength=edge.get("properties", {}).get("strength", 1.0)
-                    )
-                    
-                    relationships.append(relationship)
+            edges = self._get_node_edges(document_id, "outgoing")
+            target_nodes = self._get_nodes(list({edge.get("target") for edge in edges}))
+            return self._relationships_from_edges(document_id, edges, target_nodes)
             
         except Exception as e:
             logger.error(f"Error retrieving document relationships: {str(e)}")
+            return []
+    
+    def _relationships_from_edges(self, document_id: str, edges: List[Dict[str, Any]],
+                                  target_nodes: Dict[str, Dict[str, Any]]) -> List[DocumentRelationship]:
+        """
+        Convert the outgoing edges of a document into relationships.
+        
+        Args:
+            document_id: ID of the document
+            edges: Outgoing edges of the document
+            target_nodes: Mapping of node ID to node for the edge targets
+            
+        Returns:
+            List of DocumentRelationship objects
+        """
+        relationships = []
+        
+        # Find all edges where document is the source
+        for edge in edges:
+            if edge.get("source") != document_id:
+                continue
+            
+            target_id = edge.get("target")
+            target_node = target_nodes.get(target_id)
+            
+            if not target_node:
+                continue
+            
+            # Determine relationship type
+            edge_type = edge.get("type", "")
+            relationship_type = "related"
+            
+            for rel_type, edge_name in self.edge_types.items():
+                if edge_type == edge_name:
+                    relationship_type = rel_type
+                    break
+            
+            # Create relationship
+            relationship = DocumentRelationship(
+                entity_id=target_id,
+                entity_type=target_node.get("type", "unknown"),
+                relationship_type=relationship_type,
+                metadata={
+                    "name": target_node.get("properties", {}).get("name", target_id),
+                    "edge_type": edge_type
+                },
+                bidirectional=edge.get("properties", {}).get("bidirectional", False),
+                strength=edge.get("properties", {}).get("strength", 1.0)
+            )
+            
+            relationships.append(relationship)
         
         return relationships
     
+    def _get_nodes(self, node_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several nodes by ID.
+        
+        Args:
+            node_ids: IDs of the nodes
+            
+        Returns:
+            Dictionary mapping found node IDs to node dictionaries
+        """
+        # Graphs with an on-disk node index fetch the whole batch in one query
+        if hasattr(self.base_kg, "get_nodes"):
+            return self.base_kg.get_nodes(node_ids)
+        
+        nodes = {}
+        for node_id in node_ids:
+            node = self.base_kg.get_node(node_id)
+            if node:
+                nodes[node_id] = node
+        return nodes
+    
     async def _store_document_file(self, document: Document, update: bool = False) -> str:
         """
         Store document content to file system.
@@ -9,20 +9,51 @@ Git repositories or local file systems.
 import os
 import re
 import glob
+import hashlib
 import logging
 import asyncio
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set, Tuple, Union
+from typing import Dict, List, Any, Optional, Set, Tuple, Union, Iterator, AsyncIterator, Callable
 from datetime import datetime
+from itertools import islice
+from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
 
 from ..models.document_model import Document, DocumentMetadata, DocumentType
+from ..core.file_manifest import FileManifest, ManifestChanges
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PipelineMetrics:
+    """Throughput and backpressure counters for one streaming repository run."""
+    files_queued: int = 0
+    files_processed: int = 0
+    files_failed: int = 0
+    workers: int = 0
+    queue_size: int = 0
+    max_input_depth: int = 0
+    max_output_depth: int = 0
+    input_wait_seconds: float = 0.0  # scanner blocked on a full input queue (workers saturated)
+    output_wait_seconds: float = 0.0  # workers blocked on a full output queue (consumer too slow)
+    elapsed_seconds: float = 0.0
+    
+    @property
+    def throughput(self) -> float:
+        """Files completed per second."""
+        if not self.elapsed_seconds:
+            return 0.0
+        return (self.files_processed + self.files_failed) / self.elapsed_seconds
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the metrics to a dictionary."""
+        return {**asdict(self), "throughput": self.throughput}
+
+
 class RepositoryConnector:
     """
     Connector for accessing and processing code repositories.
@@ -78,6 +109,22 @@ class RepositoryConnector:
             re.compile(r"^\.pytest_cache/")
         ]
         
+        # Combined ignore matchers, keyed by the gitignore patterns they include
+        self._ignore_matchers: Dict[Tuple[str, ...], re.Pattern] = {}
+        
+        # File-state manifests for incremental scans (opt-in), one per
+        # repository and destination so consumers never take each other's changes
+        self.incremental = config.get("repository", {}).get("incremental", False)
+        self.manifest_dir = config.get("repository", {}).get(
+            "manifest_dir", os.path.expanduser("~/.devloop/repository_manifests"))
+        self.manifests: Dict[Tuple[str, str], FileManifest] = {}  # (absolute repo path, manifest key) -> manifest
+        self.last_changes: Optional[ManifestChanges] = None
+        
+        # Streaming pipeline settings
+        self.workers = config.get("repository", {}).get("workers", 10)
+        self.queue_size = config.get("repository", {}).get("queue_size", 0)  # 0 -> 4 slots per worker
+        self.last_metrics: Optional[PipelineMetrics] = None
+        
         logger.info(f"Repository connector initialized with base path: {self.base_path}")
     
     async def clone_repository(self, repo_url: str, target_dir: Optional[str] = None) -> str:
@@ -187,41 +234,165 @@ class RepositoryConnector:
         """
         logger.info(f"Scanning repository at {repo_path}")
         
-        if extensions is None:
-            extensions = self.default_extensions
+        # Load gitignore if present
+        gitignore_patterns = await self._load_gitignore(repo_path)
+        matcher = self._get_ignore_matcher(gitignore_patterns)
         
-        file_paths = []
+        file_paths = [
+            os.path.join(repo_path, rel_path)
+            for rel_path in self._walk_files(repo_path, extensions or self.default_extensions, matcher)
+        ]
+        
+        logger.info(f"Found {len(file_paths)} files in repository")
+        return file_paths
+    
+    async def scan_changes(self, repo_path: str, extensions: Optional[List[str]] = None,
+                           manifest_key: str = "default") -> ManifestChanges:
+        """
+        Scan a repository and compare it with its file-state manifest.
+        
+        The manifest is not updated; record the reported files in
+        get_manifest() and save it once they have been ingested.
+        
+        Args:
+            repo_path: Path to the repository
+            extensions: List of file extensions to include (optional)
+            manifest_key: Destination the manifest tracks ingestion for
+            
+        Returns:
+            Added, changed, deleted and unchanged files as paths relative to repo_path
+        """
+        logger.info(f"Scanning repository for changes at {repo_path}")
         
-        # Load gitignore if present
         gitignore_patterns = await self._load_gitignore(repo_path)
+        matcher = self._get_ignore_matcher(gitignore_patterns)
+        manifest = self.get_manifest(repo_path, manifest_key)
+        
+        def scan():
+            current = self._walk_files(repo_path, extensions or self.default_extensions, matcher)
+            return manifest.classify(repo_path, current)
+        
+        # Hashing reads files, so keep it off the event loop
+        changes = await asyncio.get_running_loop().run_in_executor(None, scan)
+        
+        logger.info(f"Repository changes: {len(changes.added)} added, {len(changes.changed)} changed, "
+                    f"{len(changes.deleted)} deleted, {len(changes.unchanged)} unchanged")
+        return changes
+    
+    def get_manifest(self, repo_path: str, manifest_key: str = "default") -> FileManifest:
+        """
+        Get the file-state manifest of a repository, loading it on first use.
+        
+        Each destination ingesting the same repository has its own manifest,
+        so one consumer's run never hides changes from another.
+        
+        Args:
+            repo_path: Path to the repository
+            manifest_key: Destination the manifest tracks ingestion for
+            
+        Returns:
+            FileManifest for the repository and destination
+        """
+        abs_path = os.path.abspath(repo_path)
+        key = (abs_path, manifest_key)
+        if key not in self.manifests:
+            path_hash = hashlib.sha1(f"{abs_path}\0{manifest_key}".encode("utf-8")).hexdigest()[:12]
+            storage_path = os.path.join(self.manifest_dir, f"{os.path.basename(abs_path)}-{path_hash}.json")
+            self.manifests[key] = FileManifest(storage_path)
+        return self.manifests[key]
+    
+    def _walk_files(self, repo_path: str, extensions: List[str], matcher: re.Pattern) -> Dict[str, Tuple[int, int]]:
+        """
+        Walk a repository, pruning ignored directories before descending.
         
-        # Walk the repository
-        for root, dirs, files in os.walk(repo_path):
-            # Skip ignored directories
-            dirs[:] = [d for d in dirs if not self._is_ignored(os.path.join(root, d), gitignore_patterns)]
+        Args:
+            repo_path: Path to the repository
+            extensions: File extensions to include
+            matcher: Combined ignore pattern
+            
+        Returns:
+            Mapping of path relative to repo_path to (mtime_ns, size), in walk order
+        """
+        return dict(self._iter_files(repo_path, extensions, matcher))
+    
+    def _iter_files(self, repo_path: str, extensions: List[str],
+                    matcher: re.Pattern) -> Iterator[Tuple[str, Tuple[int, int]]]:
+        """
+        Lazily walk a repository, pruning ignored directories before descending.
+        
+        Files are filtered by extension first, then by the ignore matcher,
+        and only the remaining files are stat'ed.
+        
+        Args:
+            repo_path: Path to the repository
+            extensions: File extensions to include
+            matcher: Combined ignore pattern
+            
+        Yields:
+            (path relative to repo_path, (mtime_ns, size)) tuples in walk order
+        """
+        extensions = tuple(extensions)
+        
+        # Ignore patterns are matched against paths relative to the base path
+        base_prefix = os.path.relpath(repo_path, self.base_path).replace(os.sep, "/")
+        base_prefix = "" if base_prefix == "." else base_prefix + "/"
+        
+        pending = [""]  # directories relative to repo_path, "" for the root
+        while pending:
+            rel_dir = pending.pop()
+            try:
+                with os.scandir(os.path.join(repo_path, rel_dir) if rel_dir else repo_path) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError as e:
+                logger.warning(f"Could not scan directory {rel_dir or repo_path}: {e}")
+                continue
             
-            # Filter files by extension and ignore patterns
-            for file in files:
-                file_path = os.path.join(root, file)
+            subdirs = []
+            for entry in entries:
+                rel_path = rel_dir + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    match_path = base_prefix + rel_path
+                    if not (matcher.search(match_path) or matcher.search(match_path + "/")):
+                        subdirs.append(rel_path + "/")
+                    continue
                 
-                # Skip files that don't match extensions
-                if not any(file.endswith(ext) for ext in extensions):
+                if not entry.name.endswith(extensions) or matcher.search(base_prefix + rel_path):
                     continue
                 
-                # Skip ignored files
-                if self._is_ignored(file_path, gitignore_patterns):
+                try:
+                    stat = entry.stat()
+                except OSError:
                     continue
                 
                 # Skip files that are too large
-                if os.path.getsize(file_path) > self.max_file_size:
-                    logger.warning(f"Skipping file that exceeds size limit: {file_path}")
+                if stat.st_size > self.max_file_size:
+                    logger.warning(f"Skipping file that exceeds size limit: {rel_path}")
                     continue
                 
-                # Add file to the list
-                file_paths.append(file_path)
+                yield rel_path, (stat.st_mtime_ns, stat.st_size)
+            
+            # Visit subdirectories depth first, in name order
+            pending.extend(reversed(subdirs))
+    
+    def _get_ignore_matcher(self, gitignore_patterns: List[re.Pattern]) -> re.Pattern:
+        """
+        Get one compiled pattern matching any default, configured or gitignore pattern.
         
-        logger.info(f"Found {len(file_paths)} files in repository")
-        return file_paths
+        Args:
+            gitignore_patterns: List of gitignore patterns
+            
+        Returns:
+            Combined compiled pattern
+        """
+        key = tuple(pattern.pattern for pattern in gitignore_patterns)
+        if key not in self._ignore_matchers:
+            patterns = self.default_ignore_patterns + self.compiled_ignore_patterns + list(gitignore_patterns)
+            if patterns:
+                combined = "|".join(f"(?:{pattern.pattern})" for pattern in patterns)
+            else:
+                combined = r"(?!)"
+            self._ignore_matchers[key] = re.compile(combined)
+        return self._ignore_matchers[key]
     
     def _is_ignored(self, path: str, gitignore_patterns: List[re.Pattern]) -> bool:
         """
@@ -235,24 +406,9 @@ class RepositoryConnector:
             True if the path should be ignored
         """
         # Get relative path
-        rel_path = os.path.relpath(path, self.base_path)
-        
-        # Check default ignore patterns
-        for pattern in self.default_ignore_patterns:
-            if pattern.search(rel_path):
-                return True
-        
-        # Check configured ignore patterns
-        for pattern in self.compiled_ignore_patterns:
-            if pattern.search(rel_path):
-                return True
+        rel_path = os.path.relpath(path, self.base_path).replace(os.sep, "/")
         
-        # Check gitignore patterns
-        for pattern in gitignore_patterns:
-            if pattern.search(rel_path):
-                return True
-        
-        return False
+        return bool(self._get_ignore_matcher(gitignore_patterns).search(rel_path))
     
     async def _load_gitignore(self, repo_path: str) -> List[re.Pattern]:
         """
@@ -475,10 +631,13 @@ class RepositoryConnector:
         # Get file metadata
         file_metadata = await self.get_file_metadata(file_path)
         
-        # Read file content
-        try:
+        # Read file content off the event loop so concurrent workers overlap I/O
+        def _read():
             with open(file_path, "rb") as f:
-                raw_content = f.read()
+                return f.read()
+        
+        try:
+            raw_content = await asyncio.get_running_loop().run_in_executor(None, _read)
         except Exception as e:
             logger.error(f"Error reading file: {e}")
             raise
@@ -549,49 +708,183 @@ class RepositoryConnector:
         """
         Process an entire repository through the document pipeline.
         
+        This collects the output of iter_repository(); use that directly to
+        handle documents as they complete without holding them all in memory.
+        
         Args:
             repo_path: Path to the repository
             pipeline_processor: Document processing pipeline
             extensions: List of file extensions to include (optional)
-            options: Processing options
+            options: Processing options (see iter_repository)
             
         Returns:
-            List of processed documents
+            List of processed documents, in completion order
+        """
+        documents = []
+        async for document in self.iter_repository(repo_path, pipeline_processor, extensions, options):
+            documents.append(document)
+        
+        logger.info(f"Repository processing complete: {len(documents)} documents processed")
+        return documents
+    
+    async def iter_repository(self, repo_path: str,
+                              pipeline_processor,
+                              extensions: Optional[List[str]] = None,
+                              options: Dict[str, Any] = None) -> AsyncIterator[Document]:
+        """
+        Stream a repository through the document pipeline.
+        
+        The scanner feeds file paths into a bounded queue consumed by a fixed
+        pool of workers, and processed documents are yielded as soon as they
+        complete, so one slow file never holds back the others and a slow
+        consumer throttles the workers instead of buffering documents.
+        Metrics for the run are left in last_metrics.
+        
+        Args:
+            repo_path: Path to the repository
+            pipeline_processor: Document processing pipeline
+            extensions: List of file extensions to include (optional)
+            options: Processing options. Besides the document options these
+                include "workers", "queue_size", "incremental" (overrides the
+                configured default; when set, only added and changed files are
+                processed and the repository manifest is updated),
+                "manifest_key" (the destination the manifest tracks, by
+                default the class of pipeline_processor), and
+                "cpu_processor", a picklable function taking and returning a
+                Document that runs in a process pool (sized by
+                "process_workers") before pipeline_processor
+            
+        Yields:
+            Processed documents, in completion order
         """
         options = options or {}
         logger.info(f"Processing repository: {repo_path}")
         
-        # Scan repository for files
-        file_paths = await self.scan_repository(repo_path, extensions)
+        workers = max(1, options.get("workers", options.get("batch_size", self.workers)))
+        queue_size = options.get("queue_size", self.queue_size) or workers * 4
+        metrics = PipelineMetrics(workers=workers, queue_size=queue_size)
+        self.last_metrics = metrics
+        
+        incremental = options.get("incremental", self.incremental)
+        manifest_key = options.get("manifest_key") or (
+            f"{type(pipeline_processor).__module__}.{type(pipeline_processor).__qualname__}")
+        changes = None
+        if incremental:
+            # Only files added or changed since this destination's last run are reprocessed
+            changes = await self.scan_changes(repo_path, extensions, manifest_key)
+            rel_paths = iter(changes.modified)
+        else:
+            gitignore_patterns = await self._load_gitignore(repo_path)
+            matcher = self._get_ignore_matcher(gitignore_patterns)
+            rel_paths = (rel_path for rel_path, _ in
+                         self._iter_files(repo_path, extensions or self.default_extensions, matcher))
+        
+        cpu_processor = options.get("cpu_processor")
+        process_pool = ProcessPoolExecutor(options.get("process_workers")) if cpu_processor else None
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        input_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        output_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        
+        async def put(queue: asyncio.Queue, item, wait_field: str, depth_field: str):
+            # Time spent waiting on a full queue is the backpressure signal
+            if queue.full():
+                wait_started = loop.time()
+                await queue.put(item)
+                setattr(metrics, wait_field, getattr(metrics, wait_field) + loop.time() - wait_started)
+            else:
+                await queue.put(item)
+            setattr(metrics, depth_field, max(getattr(metrics, depth_field), queue.qsize()))
+        
+        stopping = False
+        
+        async def produce():
+            try:
+                # The walk is blocking, so advance it in chunks off the event loop
+                while True:
+                    chunk = await loop.run_in_executor(None, lambda: list(islice(rel_paths, 256)))
+                    if not chunk:
+                        break
+                    for rel_path in chunk:
+                        await put(input_queue, rel_path, "input_wait_seconds", "max_input_depth")
+                        metrics.files_queued += 1
+            finally:
+                # Stop the workers even if the walk fails, or the consumer would
+                # wait for them forever; on teardown they are cancelled instead
+                if not stopping:
+                    for _ in range(workers):
+                        await input_queue.put(None)
+        
+        async def work():
+            while True:
+                rel_path = await input_queue.get()
+                if rel_path is None:
+                    break
+                try:
+                    result = await self._process_file(os.path.join(repo_path, rel_path), pipeline_processor,
+                                                      options, cpu_processor, process_pool)
+                except Exception as e:
+                    result = e
+                await put(output_queue, (rel_path, result), "output_wait_seconds", "max_output_depth")
+            await output_queue.put(None)
         
-        # Process files in batches
-        batch_size = options.get("batch_size", 10)
-        documents = []
+        producer = asyncio.create_task(produce())
+        tasks = [producer] + [asyncio.create_task(work()) for _ in range(workers)]
+        manifest = self.get_manifest(repo_path, manifest_key) if incremental else None
         
-        for i in range(0, len(file_paths), batch_size):
-            batch = file_paths[i:i+batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1}/{(len(file_paths)-1)//batch_size + 1} ({len(batch)} files)")
+        try:
+            running = workers
+            while running:
+                item = await output_queue.get()
+                
+                # Surface scanner errors as soon as they happen
+                if producer.done() and producer.exception() is not None:
+                    raise producer.exception()
+                
+                if item is None:
+                    running -= 1
+                    continue
+                
+                rel_path, result = item
+                if isinstance(result, Exception):
+                    metrics.files_failed += 1
+                    logger.error(f"Error processing file: {result}")
+                    continue
+                
+                metrics.files_processed += 1
+                if manifest is not None:
+                    # Failed files stay out of the manifest and are retried next run
+                    manifest.record(rel_path, changes.states[rel_path])
+                yield result
             
-            # Process files in parallel
-            tasks = []
-            for file_path in batch:
-                task = asyncio.create_task(self._process_file(file_path, pipeline_processor, options))
-                tasks.append(task)
+            # Surface scanner errors raised after the last document
+            await producer
             
-            # Wait for all tasks to complete
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+            if manifest is not None:
+                for rel_path in changes.deleted:
+                    manifest.remove(rel_path)
+                if changes.deleted:
+                    logger.info(f"Files deleted since last run: {len(changes.deleted)}")
+                self.last_changes = changes
+        
+        finally:
+            stopping = True
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if process_pool is not None:
+                process_pool.shutdown(wait=False, cancel_futures=True)
+            if manifest is not None:
+                manifest.save()
             
-            # Filter out exceptions
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    logger.error(f"Error processing file: {result}")
-                else:
-                    documents.append(result)
-        
-        logger.info(f"Repository processing complete: {len(documents)} documents processed")
-        return documents
+            metrics.elapsed_seconds = loop.time() - started
+            logger.info(f"Repository pipeline: {metrics.files_processed} processed, {metrics.files_failed} failed, "
+                        f"{metrics.throughput:.1f} files/s")
     
-    async def _process_file(self, file_path: str, pipeline_processor, options: Dict[str, Any]) -> Document:
+    async def _process_file(self, file_path: str, pipeline_processor, options: Dict[str, Any],
+                            cpu_processor: Optional[Callable[[Document], Document]] = None,
+                            process_pool: Optional[ProcessPoolExecutor] = None) -> Document:
         """
         Process a single file through the document pipeline.
         
@@ -599,6 +892,8 @@ class RepositoryConnector:
             file_path: Path to the file
             pipeline_processor: Document processing pipeline
             options: Processing options
+            cpu_processor: Optional CPU-bound step run in process_pool first
+            process_pool: Process pool for cpu_processor
             
         Returns:
             Processed document
@@ -607,6 +902,10 @@ class RepositoryConnector:
             # Create document from file
             document = await self.create_document_from_file(file_path, options)
             
+            # Run CPU-heavy work in another process so it does not block the event loop
+            if cpu_processor is not None:
+                document = await asyncio.get_running_loop().run_in_executor(process_pool, cpu_processor, document)
+            
             # Process document
             processed_document = await pipeline_processor.process_document(document)
             
@@ -10,6 +10,7 @@ import sys
 import json
 import logging
 import uuid
+import inspect
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple, Union
 
@@ -236,6 +237,9 @@ class DocumentVectorStoreConnector:
             self.llm_connector = None
             self.embedding_available = False
         
+        # Whether the last get_embeddings() call fell back to deterministic embeddings
+        self.last_embedding_fallback = False
+        
         logger.info("Document vector store connector initialized")
     
     async def add_document(self, 
@@ -463,6 +467,111 @@ class DocumentVectorStoreConnector:
         except Exception as e:
             logger.error(f"Error getting similar documents: {str(e)}")
             return []
+
+    async def get_document_vector(self, document_id: str) -> Optional[List[float]]:
+        """
+        Get the stored embedding of a document.
+
+        Args:
+            document_id: ID of the document
+
+        Returns:
+            Embedding vector, or None if the document has no stored vector
+        """
+        vectors = await self.get_document_vectors([document_id])
+        return vectors.get(document_id)
+
+    async def get_document_vectors(self, document_ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Get the stored embeddings of several documents in one lookup.
+
+        Args:
+            document_ids: IDs of the documents
+
+        Returns:
+            Dictionary mapping document IDs to vectors; documents without a
+            stored vector are omitted
+        """
+        stored = getattr(self.vector_store, "vectors", {})
+
+        vectors = {}
+        for document_id in document_ids:
+            vector = stored.get(document_id)
+            if vector is not None:
+                vectors[document_id] = vector
+
+        return vectors
+
+    async def get_embedding(self, text: str) -> List[float]:
+        """
+        Get the embedding for a single text.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Embedding vector
+        """
+        return await self._generate_embedding(text)
+    
+    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for several texts with a single embedding request.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors, in the same order as the texts
+        """
+        if not texts:
+            return []
+        
+        embeddings = [None] * len(texts)
+        pending = [i for i, text in enumerate(texts) if text]
+        
+        # Use LLM connector if available
+        if pending and self.embedding_available and self.llm_connector:
+            try:
+                generated = self.llm_connector.create_embeddings([texts[i] for i in pending])
+                if inspect.isawaitable(generated):
+                    generated = await generated
+                if generated and len(generated) == len(pending):
+                    for i, embedding in zip(pending, generated):
+                        embeddings[i] = embedding
+                    pending = []
+            except Exception as e:
+                logger.error(f"Error generating embeddings with LLM connector: {str(e)}")
+        
+        # Fall back to deterministic embeddings for anything left
+        self.last_embedding_fallback = bool(pending)
+        for i in range(len(texts)):
+            if embeddings[i] is None:
+                embeddings[i] = self._deterministic_embedding(texts[i])
+        
+        return embeddings
+    
+    def embedding_signature(self) -> Dict[str, Any]:
+        """
+        Describe what currently generates embeddings.
+        
+        Vectors from different sources, models or dimensions cannot be
+        compared, so this is part of the key of any cached embeddings.
+        
+        Returns:
+            Dictionary with the embedding source, model and dimension
+        """
+        llm_connector = self.llm_connector if self.embedding_available else None
+        if llm_connector is None:
+            return {"source": "deterministic", "model": None, "dimension": self.vector_dim}
+        
+        # Without an available LLM the connector returns its own mock embeddings
+        if getattr(llm_connector, "llm_available", False) and getattr(llm_connector, "openai_available", False):
+            openai_config = getattr(llm_connector, "openai_config", None) or {}
+            model = openai_config.get("embedding_model", "text-embedding-3-large")
+            return {"source": "openai", "model": model, "dimension": self.vector_dim}
+        
+        return {"source": "llm_connector_mock", "model": None, "dimension": self.vector_dim}
     
     async def _generate_embedding(self, text: str) -> List[float]:
         """
@@ -477,17 +586,8 @@ class DocumentVectorStoreConnector:
         if not text:
             return [0.0] * self.vector_dim
         
-        # Use LLM connector if available
-        if self.embedding_available and self.llm_connector:
-            try:
-                embeddings = await self.llm_connector.create_embeddings([text])
-                if embeddings and len(embeddings) > 0:
-                    return embeddings[0]
-            except Exception as e:
-                logger.error(f"Error generating embedding with LLM connector: {str(e)}")
-        
-        # Fall back to deterministic embedding
-        return self._deterministic_embedding(text)
+        embeddings = await self.get_embeddings([text])
+        return embeddings[0]
     
     def _deterministic_embedding(self, text: str) -> List[float]:
         """
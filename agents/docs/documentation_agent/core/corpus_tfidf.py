@@ -0,0 +1,475 @@
+"""
+Corpus TF-IDF Model for Documentation Agent.
+
+This module implements an incrementally updated TF-IDF model over the
+whole documentation corpus. Term counts are computed once per document
+version and cached, so similarity queries become a sparse transform plus
+a sparse dot product against cached rows instead of refitting a
+vectorizer on every comparison. IDF weights are refit only once enough
+of the corpus has changed, so updating a document only replaces its own
+weighted row.
+"""
+
+import os
+import hashlib
+import logging
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+from agents.utils.atomic_write import atomic_write
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class CorpusTfidfModel:
+    """
+    Incrementally maintained TF-IDF model over a document corpus.
+
+    The vocabulary only grows; document frequencies are updated as
+    documents are added, changed or removed. IDF weights are fitted
+    lazily and kept until the number of changed documents exceeds
+    refit_threshold times the corpus size they were fitted on; until
+    then a change only drops the weighted row of that document, and
+    terms new to the vocabulary are weighted with the fitted statistics.
+    """
+
+    def __init__(self, min_df: int = 1, max_df: float = 1.0,
+                 stop_words: Optional[str] = 'english',
+                 storage_path: Optional[str] = None,
+                 refit_threshold: float = 0.1):
+        """
+        Initialize the corpus model.
+
+        Args:
+            min_df: Minimum number of documents a term must appear in to be weighted
+            max_df: Maximum fraction of documents a term may appear in to be weighted
+            stop_words: Stop word list passed to the scikit-learn analyzer
+            storage_path: Optional .npz path used by save() and load()
+            refit_threshold: Fraction of the fitted corpus that may change before
+                IDF weights are refit (0 refits after every change)
+        """
+        self.min_df = min_df
+        self.max_df = max_df
+        self.storage_path = storage_path
+        self.refit_threshold = refit_threshold
+
+        # Whether the corpus changed since it was last saved or loaded
+        self.dirty = False
+
+        # Same tokenization as the TfidfVectorizer previously fitted per call
+        self.analyzer = TfidfVectorizer(lowercase=True, stop_words=stop_words).build_analyzer()
+
+        self.vocabulary: Dict[str, int] = {}  # term -> column
+        self.document_frequency: List[int] = []  # column -> number of documents
+        self.doc_hashes: Dict[str, str] = {}  # doc_id -> content hash
+        self.doc_counts: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}  # doc_id -> (columns, counts)
+
+        # Fitted IDF weights, refit once the corpus drifted past refit_threshold
+        self._idf: Optional[np.ndarray] = None
+        self._weighted_idf: Optional[np.ndarray] = None
+        self._fitted_count = 0
+        self._max_doc_count = 0.0
+        self._changes_since_fit = 0
+
+        # doc_id -> normalized weighted (columns, values) under the fitted weights
+        self._rows: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+        if storage_path and os.path.exists(storage_path):
+            self.load()
+
+    @property
+    def document_count(self) -> int:
+        """Number of documents in the corpus."""
+        return len(self.doc_counts)
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """
+        Compute the hash used to detect content changes.
+
+        Args:
+            content: Document content
+
+        Returns:
+            Hex digest of the content
+        """
+        return hashlib.sha256((content or "").encode("utf-8")).hexdigest()
+
+    def has_document(self, doc_id: str, content: Optional[str] = None) -> bool:
+        """
+        Check whether a document (optionally at a given content) is indexed.
+
+        Args:
+            doc_id: Document ID
+            content: Optional content to compare against the indexed version
+
+        Returns:
+            True if indexed and, when content is given, unchanged
+        """
+        if doc_id not in self.doc_hashes:
+            return False
+        if content is None:
+            return True
+        return self.doc_hashes[doc_id] == self.content_hash(content)
+
+    def update_document(self, doc_id: str, content: str) -> bool:
+        """
+        Add or update a document in the corpus.
+
+        Unchanged content is detected by hash and costs nothing.
+
+        Args:
+            doc_id: Document ID
+            content: Document content
+
+        Returns:
+            True if the corpus changed
+        """
+        content_hash = self.content_hash(content)
+        if self.doc_hashes.get(doc_id) == content_hash:
+            return False
+
+        if doc_id in self.doc_counts:
+            self._remove_counts(doc_id)
+
+        columns, counts = self._count_terms(content, grow=True)
+        for column in columns:
+            self.document_frequency[column] += 1
+
+        self.doc_counts[doc_id] = (columns, counts)
+        self.doc_hashes[doc_id] = content_hash
+        self._record_change(doc_id)
+        return True
+
+    def update_documents(self, documents: Iterable[Tuple[str, str]]) -> int:
+        """
+        Add or update several documents.
+
+        Args:
+            documents: Iterable of (doc_id, content) pairs
+
+        Returns:
+            Number of documents that changed
+        """
+        return sum(1 for doc_id, content in documents if self.update_document(doc_id, content))
+
+    def remove_document(self, doc_id: str) -> bool:
+        """
+        Remove a document from the corpus.
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            True if the document was indexed
+        """
+        if doc_id not in self.doc_counts:
+            return False
+
+        self._remove_counts(doc_id)
+        del self.doc_counts[doc_id]
+        del self.doc_hashes[doc_id]
+        self._record_change(doc_id)
+        return True
+
+    def transform(self, texts: List[str], apply_df_limits: bool = True) -> sparse.csr_matrix:
+        """
+        Transform texts into L2-normalized TF-IDF rows using corpus statistics.
+
+        Terms that are not in the corpus vocabulary are ignored, as with a
+        fitted scikit-learn vectorizer.
+
+        Args:
+            texts: Texts to transform
+            apply_df_limits: Whether to zero terms outside min_df/max_df
+
+        Returns:
+            Sparse matrix with one row per text
+        """
+        rows = [self._count_terms(text, grow=False) for text in texts]
+        counts = self._stack_counts(rows)
+        return self._weight_counts(counts, apply_df_limits)
+
+    def similarity(self, doc_id: str, other_ids: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """
+        Compute cosine similarity between an indexed document and others.
+
+        Args:
+            doc_id: Indexed source document ID
+            other_ids: Indexed document IDs to compare against (defaults to all)
+
+        Returns:
+            Dictionary mapping document IDs to similarity scores
+        """
+        if doc_id not in self.doc_counts:
+            return {}
+
+        if other_ids is None:
+            other_ids = self.doc_counts
+        other_ids = [other for other in other_ids if other in self.doc_counts and other != doc_id]
+        if not other_ids:
+            return {}
+
+        source = self._stack_counts([self._get_row(doc_id)])
+        targets = self._stack_counts([self._get_row(other) for other in other_ids])
+        scores = (targets @ source.T).toarray().ravel()
+        return {other: float(score) for other, score in zip(other_ids, scores)}
+
+    def similarity_to_text(self, text: str, other_ids: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """
+        Compute cosine similarity between arbitrary text and indexed documents.
+
+        Args:
+            text: Query text
+            other_ids: Indexed document IDs to compare against (defaults to all)
+
+        Returns:
+            Dictionary mapping document IDs to similarity scores
+        """
+        if other_ids is None:
+            other_ids = self.doc_counts
+        other_ids = [other for other in other_ids if other in self.doc_counts]
+        if not other_ids:
+            return {}
+
+        query = self.transform([text])
+        targets = self._stack_counts([self._get_row(other) for other in other_ids])
+        scores = (targets @ query.T).toarray().ravel()
+        return {other: float(score) for other, score in zip(other_ids, scores)}
+
+    def save(self, storage_path: Optional[str] = None) -> bool:
+        """
+        Persist the corpus counts and vocabulary.
+
+        Args:
+            storage_path: Optional path overriding the configured one
+
+        Returns:
+            Success status
+        """
+        storage_path = storage_path or self.storage_path
+        if not storage_path:
+            return False
+
+        try:
+            doc_ids = list(self.doc_counts.keys())
+            counts = self._stack_counts([self.doc_counts[doc_id] for doc_id in doc_ids])
+            terms = sorted(self.vocabulary, key=self.vocabulary.get)
+
+            with atomic_write(storage_path, 'wb') as f:
+                np.savez_compressed(
+                    f,
+                    terms=np.array(terms, dtype=str),
+                    document_frequency=np.asarray(self.document_frequency, dtype=np.int64),
+                    doc_ids=np.array(doc_ids, dtype=str),
+                    doc_hashes=np.array([self.doc_hashes[doc_id] for doc_id in doc_ids], dtype=str),
+                    data=counts.data,
+                    indices=counts.indices,
+                    indptr=counts.indptr
+                )
+            self.dirty = False
+
+            logger.info(f"Saved TF-IDF corpus model with {len(doc_ids)} documents and {len(terms)} terms")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving TF-IDF corpus model: {e}")
+            return False
+
+    def load(self, storage_path: Optional[str] = None) -> bool:
+        """
+        Load corpus counts and vocabulary saved by save().
+
+        Args:
+            storage_path: Optional path overriding the configured one
+
+        Returns:
+            Success status
+        """
+        storage_path = storage_path or self.storage_path
+        if not storage_path or not os.path.exists(storage_path):
+            return False
+
+        try:
+            with np.load(storage_path, allow_pickle=False) as saved:
+                terms = [str(term) for term in saved["terms"]]
+                document_frequency = saved["document_frequency"].tolist()
+                doc_ids = [str(doc_id) for doc_id in saved["doc_ids"]]
+                doc_hashes = [str(doc_hash) for doc_hash in saved["doc_hashes"]]
+                data = saved["data"]
+                indices = saved["indices"]
+                indptr = saved["indptr"]
+
+            self.vocabulary = {term: column for column, term in enumerate(terms)}
+            self.document_frequency = document_frequency
+            self.doc_hashes = dict(zip(doc_ids, doc_hashes))
+            self.doc_counts = {
+                doc_id: (indices[indptr[row]:indptr[row + 1]].copy(), data[indptr[row]:indptr[row + 1]].copy())
+                for row, doc_id in enumerate(doc_ids)
+            }
+            self._invalidate()
+            self.dirty = False
+
+            logger.info(f"Loaded TF-IDF corpus model with {len(doc_ids)} documents and {len(terms)} terms")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error loading TF-IDF corpus model: {e}")
+            return False
+
+    def _count_terms(self, text: str, grow: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Tokenize text into sorted (column, count) arrays.
+
+        Args:
+            text: Text to tokenize
+            grow: Whether to add unseen terms to the vocabulary
+
+        Returns:
+            Tuple of column indices and term counts
+        """
+        term_counts: Dict[int, int] = {}
+        for term in self.analyzer(text or ""):
+            column = self.vocabulary.get(term)
+            if column is None:
+                if not grow:
+                    continue
+                column = len(self.vocabulary)
+                self.vocabulary[term] = column
+                self.document_frequency.append(0)
+            term_counts[column] = term_counts.get(column, 0) + 1
+
+        columns = np.fromiter(sorted(term_counts), dtype=np.int64, count=len(term_counts))
+        counts = np.array([term_counts[column] for column in columns], dtype=np.float64)
+        return columns, counts
+
+    def _remove_counts(self, doc_id: str) -> None:
+        """Remove a document's contribution to the document frequencies."""
+        columns, _ = self.doc_counts[doc_id]
+        for column in columns:
+            self.document_frequency[column] -= 1
+
+    def _stack_counts(self, rows: List[Tuple[np.ndarray, np.ndarray]]) -> sparse.csr_matrix:
+        """
+        Stack (columns, counts) rows into a CSR matrix over the full vocabulary.
+
+        Args:
+            rows: Per-document (columns, counts) pairs
+
+        Returns:
+            Sparse count matrix
+        """
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        for i, (columns, _) in enumerate(rows):
+            indptr[i + 1] = indptr[i] + len(columns)
+
+        if rows:
+            indices = np.concatenate([columns for columns, _ in rows])
+            data = np.concatenate([counts for _, counts in rows])
+        else:
+            indices = np.zeros(0, dtype=np.int64)
+            data = np.zeros(0, dtype=np.float64)
+
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), len(self.vocabulary)))
+
+    def _get_weights(self, apply_df_limits: bool) -> np.ndarray:
+        """
+        Get per-term IDF weights for the current corpus.
+
+        Uses the same smoothed IDF as scikit-learn's TfidfTransformer.
+
+        Args:
+            apply_df_limits: Whether to zero terms outside min_df/max_df
+
+        Returns:
+            Row vector of term weights
+        """
+        if self._idf is None:
+            self._fitted_count = self.document_count
+            self._max_doc_count = (self.max_df if isinstance(self.max_df, int)
+                                   else self.max_df * self._fitted_count)
+            self._changes_since_fit = 0
+            self._idf = np.zeros(0, dtype=np.float64)
+            self._weighted_idf = np.zeros(0, dtype=np.float64)
+
+        if len(self._idf) < len(self.vocabulary):
+            # Weight terms added since the fit with the fitted corpus size
+            df = np.asarray(self.document_frequency[len(self._idf):], dtype=np.float64)
+            idf = np.log((1.0 + self._fitted_count) / (1.0 + df)) + 1.0
+            in_range = (df >= self.min_df) & (df <= self._max_doc_count)
+            self._idf = np.concatenate([self._idf, idf])
+            self._weighted_idf = np.concatenate([self._weighted_idf, np.where(in_range, idf, 0.0)])
+
+        weights = self._weighted_idf if apply_df_limits else self._idf
+        return weights.reshape(1, -1)
+
+    def _weight_counts(self, counts: sparse.csr_matrix, apply_df_limits: bool) -> sparse.csr_matrix:
+        """
+        Apply IDF weights to term counts and L2-normalize the rows.
+
+        Args:
+            counts: Sparse count matrix
+            apply_df_limits: Whether to zero terms outside min_df/max_df
+
+        Returns:
+            Normalized TF-IDF matrix
+        """
+        weighted = sparse.csr_matrix(counts.multiply(self._get_weights(apply_df_limits)))
+        weighted.eliminate_zeros()
+        if 0 in weighted.shape:
+            return weighted
+        return normalize(weighted, norm='l2', copy=False)
+
+    def _get_row(self, doc_id: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the normalized TF-IDF row of an indexed document.
+
+        Args:
+            doc_id: Indexed document ID
+
+        Returns:
+            Tuple of column indices and weights
+        """
+        row = self._rows.get(doc_id)
+        if row is None:
+            columns, counts = self.doc_counts[doc_id]
+            weights = self._get_weights(apply_df_limits=True).ravel()
+            values = counts * weights[columns]
+            kept = values != 0
+            columns, values = columns[kept], values[kept]
+            norm = np.sqrt(np.dot(values, values))
+            if norm > 0:
+                values = values / norm
+            row = (columns, values)
+            self._rows[doc_id] = row
+        return row
+
+    def _record_change(self, doc_id: str) -> None:
+        """
+        Account for a changed document.
+
+        Only the document's own row is dropped unless the corpus drifted
+        past the refit threshold, in which case all weights are refit.
+
+        Args:
+            doc_id: Changed document ID
+        """
+        self.dirty = True
+        self._rows.pop(doc_id, None)
+        if self._idf is None:
+            return
+
+        self._changes_since_fit += 1
+        if self._changes_since_fit > self.refit_threshold * self._fitted_count:
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drop the fitted weights and every row weighted with them."""
+        self._idf = None
+        self._weighted_idf = None
+        self._rows = {}
@@ -221,6 +221,25 @@ class DocumentationAgentHub:
             
         return document
     
+    async def get_documents(self, document_ids: List[str]) -> List[Document]:
+        """
+        Get several documents by ID.
+        
+        Documents missing from the cache are loaded from the knowledge graph
+        in one batch.
+        
+        Args:
+            document_ids: IDs of the documents to retrieve
+            
+        Returns:
+            Documents that were found, in request order
+        """
+        missing_ids = [doc_id for doc_id in document_ids if doc_id not in self.document_cache]
+        if missing_ids:
+            self.document_cache.update(await self.kg_connector.get_documents(missing_ids))
+        
+        return [self.document_cache[doc_id] for doc_id in document_ids if doc_id in self.document_cache]
+    
     async def find_related_documents(self, 
                                    query: str, 
                                    k: int = 5) -> List[Document]:
@@ -240,13 +259,7 @@ class DocumentationAgentHub:
         document_ids = await self.vector_store.search(query, k=k)
         
         # Get full documents
-        documents = []
-        for doc_id in document_ids:
-            doc = await self.get_document(doc_id)
-            if doc:
-                documents.append(doc)
-        
-        return documents
+        return await self.get_documents(document_ids)
     
     async def find_documents_for_entity(self, 
                                       entity_type: str,
@@ -267,13 +280,7 @@ class DocumentationAgentHub:
         document_ids = await self.kg_connector.get_documents_for_entity(entity_type, entity_id)
         
         # Get full documents
-        documents = []
-        for doc_id in document_ids:
-            doc = await self.get_document(doc_id)
-            if doc:
-                documents.append(doc)
-        
-        return documents
+        return await self.get_documents(document_ids)
     
     async def validate_documents(self, 
                                document_ids: List[str] = None) -> Dict[str, ValidationResult]:
@@ -294,15 +301,13 @@ class DocumentationAgentHub:
             document_ids = await self.kg_connector.get_all_document_ids()
         
         results = {}
-        for doc_id in document_ids:
-            doc = await self.get_document(doc_id)
-            if doc:
-                validation_result = await self.validation_orchestrator.validate_document(doc)
-                doc.validation_results = validation_result
-                results[doc_id] = validation_result
-                
-                # Update document in knowledge graph
-                await self.kg_connector.update_document_validation(doc_id, validation_result)
+        for doc in await self.get_documents(document_ids):
+            validation_result = await self.validation_orchestrator.validate_document(doc)
+            doc.validation_results = validation_result
+            results[doc.id] = validation_result
+            
+            # Update document in knowledge graph
+            await self.kg_connector.update_document_validation(doc.id, validation_result)
         
         logger.info(f"Completed validation for {len(results)} documents")
         return results
@@ -0,0 +1,191 @@
+"""
+File Manifest for Documentation Agent.
+
+This module records the state (modification time, size and content hash)
+of every file ingested from a repository, so repeated scans can report
+only the files that were added, changed or deleted since the last run.
+Files whose modification time and size are unchanged are not read; files
+that were only touched are detected by their unchanged content hash.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+
+from agents.utils.atomic_write import atomic_write
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ManifestChanges:
+    """Files that differ between a scan and the manifest, keyed by relative path."""
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    states: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # rel_path -> new file state
+
+    @property
+    def modified(self) -> List[str]:
+        """Added and changed files, in that order."""
+        return self.added + self.changed
+
+    def has_changes(self) -> bool:
+        """Check whether any file was added, changed or deleted."""
+        return bool(self.added or self.changed or self.deleted)
+
+
+class FileManifest:
+    """
+    Persistent map of relative file paths to their last ingested state.
+
+    Scans are compared with classify(); states are only recorded once the
+    caller has processed a file, so a failed run is retried on the next scan.
+    """
+
+    def __init__(self, storage_path: Optional[str] = None):
+        """
+        Initialize the manifest.
+
+        Args:
+            storage_path: Optional JSON path used by save() and load()
+        """
+        self.storage_path = storage_path
+        self.entries: Dict[str, Dict[str, Any]] = {}  # rel_path -> {"mtime_ns", "size", "hash"}
+
+        if storage_path and os.path.exists(storage_path):
+            self.load()
+
+    @staticmethod
+    def file_hash(path: str) -> str:
+        """
+        Compute the content hash of a file.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            Hex digest of the file content
+        """
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def classify(self, root: str, current: Dict[str, Tuple[int, int]]) -> ManifestChanges:
+        """
+        Compare scanned files with the manifest.
+
+        Only files whose modification time or size differ from the manifest
+        are hashed.
+
+        Args:
+            root: Directory the relative paths are resolved against
+            current: Mapping of relative path to (mtime_ns, size) for every scanned file
+
+        Returns:
+            ManifestChanges describing the differences
+        """
+        changes = ManifestChanges()
+
+        for rel_path, (mtime_ns, size) in current.items():
+            entry = self.entries.get(rel_path)
+            if entry and entry["mtime_ns"] == mtime_ns and entry["size"] == size:
+                changes.unchanged.append(rel_path)
+                continue
+
+            try:
+                content_hash = self.file_hash(os.path.join(root, rel_path))
+            except OSError as e:
+                logger.warning(f"Could not hash {rel_path}: {e}")
+                continue
+
+            state = {"mtime_ns": mtime_ns, "size": size, "hash": content_hash}
+            if entry is None:
+                changes.added.append(rel_path)
+                changes.states[rel_path] = state
+            elif entry["hash"] != content_hash:
+                changes.changed.append(rel_path)
+                changes.states[rel_path] = state
+            else:
+                # Touched but identical: refresh the stat so it is not hashed again
+                self.entries[rel_path] = state
+                changes.unchanged.append(rel_path)
+
+        changes.deleted = [rel_path for rel_path in self.entries if rel_path not in current]
+        return changes
+
+    def record(self, rel_path: str, state: Dict[str, Any]) -> None:
+        """
+        Record the state of a processed file.
+
+        Args:
+            rel_path: Path relative to the repository root
+            state: File state from ManifestChanges.states
+        """
+        self.entries[rel_path] = state
+
+    def remove(self, rel_path: str) -> None:
+        """
+        Forget a deleted file.
+
+        Args:
+            rel_path: Path relative to the repository root
+        """
+        self.entries.pop(rel_path, None)
+
+    def save(self, storage_path: Optional[str] = None) -> bool:
+        """
+        Persist the manifest as JSON.
+
+        Args:
+            storage_path: Optional path overriding the configured one
+
+        Returns:
+            Success status
+        """
+        storage_path = storage_path or self.storage_path
+        if not storage_path:
+            return False
+
+        try:
+            with atomic_write(storage_path) as f:
+                json.dump({"entries": self.entries}, f)
+
+            logger.info(f"Saved manifest of {len(self.entries)} files to {storage_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving file manifest: {e}")
+            return False
+
+    def load(self, storage_path: Optional[str] = None) -> bool:
+        """
+        Load the manifest from JSON.
+
+        Args:
+            storage_path: Optional path overriding the configured one
+
+        Returns:
+            Success status
+        """
+        storage_path = storage_path or self.storage_path
+        if not storage_path or not os.path.exists(storage_path):
+            return False
+
+        try:
+            with open(storage_path, 'r') as f:
+                self.entries = json.load(f).get("entries", {})
+
+            logger.info(f"Loaded manifest of {len(self.entries)} files from {storage_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error loading file manifest: {e}")
+            return False
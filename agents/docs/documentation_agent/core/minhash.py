@@ -0,0 +1,132 @@
+"""
+MinHash signatures for fast approximate Jaccard similarity.
+
+This module estimates token-set Jaccard similarity between documents
+from fixed-size MinHash signatures, so that all pairs of a document
+group can be compared with array operations instead of set arithmetic.
+"""
+
+import hashlib
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+# Mersenne prime used for the universal hash permutations
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+class MinHasher:
+    """
+    Computes MinHash signatures over lowercase whitespace tokens.
+
+    The tokenization matches the Jaccard fallback used by the consolidation
+    agent, so estimated similarities converge on the exact token Jaccard.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        """
+        Initialize the hasher.
+
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            seed: Seed for the permutation parameters
+        """
+        self.num_perm = num_perm
+
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+
+    def tokenize(self, text: str) -> set:
+        """
+        Split text into the token set that is hashed.
+
+        Args:
+            text: Text to tokenize
+
+        Returns:
+            Set of lowercase tokens
+        """
+        return set((text or "").lower().split())
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: Text to sign
+
+        Returns:
+            Signature array of length num_perm, or None for text without tokens
+        """
+        tokens = self.tokenize(text)
+        if not tokens:
+            return None
+
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "little")
+             for token in tokens),
+            dtype=np.uint64,
+            count=len(tokens)
+        )
+
+        # Overflow wraps modulo 2^64, which keeps the permutations well mixed
+        with np.errstate(over="ignore"):
+            permuted = (hashes[:, None] * self._a + self._b) % _MERSENNE_PRIME
+        return np.bitwise_and(permuted, _MAX_HASH).min(axis=0)
+
+    def signatures(self, texts: Iterable[str]) -> np.ndarray:
+        """
+        Compute signatures for several texts.
+
+        Texts without tokens get a row of -1 so they never match anything.
+
+        Args:
+            texts: Texts to sign
+
+        Returns:
+            Array of shape (len(texts), num_perm)
+        """
+        rows: List[np.ndarray] = []
+        for text in texts:
+            signature = self.signature(text)
+            if signature is None:
+                rows.append(np.full(self.num_perm, -1, dtype=np.int64))
+            else:
+                rows.append(signature.astype(np.int64))
+
+        if not rows:
+            return np.zeros((0, self.num_perm), dtype=np.int64)
+        return np.vstack(rows)
+
+    @staticmethod
+    def estimate_similarity(signatures: np.ndarray, rows: Optional[List[int]] = None) -> np.ndarray:
+        """
+        Estimate Jaccard similarity from signatures.
+
+        Args:
+            signatures: Signature array from signatures()
+            rows: Rows to compare against all rows (defaults to all rows)
+
+        Returns:
+            Array of shape (len(rows), len(signatures)) with estimated similarities
+        """
+        if rows is None:
+            rows = list(range(len(signatures)))
+
+        selected = signatures[rows]
+
+        # Compare one permutation at a time, so memory stays at the size of
+        # the result instead of growing with the number of permutations
+        matches = np.zeros((len(selected), len(signatures)), dtype=np.int32)
+        for column in range(signatures.shape[1]):
+            matches += selected[:, column, None] == signatures[None, :, column]
+        estimates = matches / max(signatures.shape[1], 1)
+
+        # Empty documents (all -1) have no similarity to anything
+        empty = (signatures == -1).all(axis=1)
+        estimates[:, empty] = 0.0
+        estimates[empty[rows], :] = 0.0
+
+        return estimates
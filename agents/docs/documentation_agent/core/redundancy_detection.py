@@ -8,17 +8,17 @@ duplication and improving overall documentation quality.
 
 import logging
 import asyncio
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Any, Optional, Tuple, Set, Union
 from datetime import datetime
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
 from ..models.document_model import Document
 from ..connectors.vector_store_connector import DocumentVectorStoreConnector
 from ..connectors.knowledge_graph_connector import DocumentKnowledgeGraphConnector
 from .inter_agent_handoff import HandoffContext, HandoffManager, HandoffPriority
+from .corpus_tfidf import CorpusTfidfModel
+from .redundancy_result_store import RedundancyResultStore
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -46,6 +46,12 @@ class RedundancyDetectionResult:
     # Recommendations
     consolidation_candidates: List[str] = field(default_factory=list)
     recommended_actions: List[Dict[str, Any]] = field(default_factory=list)
+    
+    # Every document this result was compared against, significant or not
+    compared_doc_ids: List[str] = field(default_factory=list)
+    
+    # Content hashes of the compared documents whose content was fetched
+    compared_doc_hashes: Dict[str, str] = field(default_factory=dict)
 
 
 class RedundancyDetector:
@@ -62,7 +68,8 @@ class RedundancyDetector:
     
     def __init__(self, vector_store: DocumentVectorStoreConnector, 
                  knowledge_graph: DocumentKnowledgeGraphConnector,
-                 config: Dict[str, Any] = None):
+                 config: Dict[str, Any] = None,
+                 corpus_model: Optional[CorpusTfidfModel] = None):
         """Initialize the redundancy detector."""
         self.vector_store = vector_store
         self.knowledge_graph = knowledge_graph
@@ -73,16 +80,62 @@ class RedundancyDetector:
         self.min_segment_length = self.config.get("min_segment_length", 100)
         self.significant_overlap_threshold = self.config.get("significant_overlap_threshold", 0.3)
         
-        # TF-IDF vectorizer
-        self.vectorizer = TfidfVectorizer(
-            lowercase=True,
-            stop_words='english',
-            min_df=2,
-            max_df=0.85
+        # Corpus-level TF-IDF model, shared across detection calls
+        self.corpus_model = corpus_model or CorpusTfidfModel(
+            min_df=self.config.get("tfidf_min_df", 2),
+            max_df=self.config.get("tfidf_max_df", 0.85),
+            storage_path=self.config.get("tfidf_model_path")
         )
         
         logger.info("RedundancyDetector initialized")
     
+    def index_documents(self, documents: List[Document]) -> int:
+        """
+        Add or refresh documents in the corpus TF-IDF model.
+        
+        Documents whose content is unchanged since they were last indexed
+        are skipped, so re-indexing the whole corpus after a small change
+        only re-tokenizes what changed.
+        
+        Args:
+            documents: Documents to index
+            
+        Returns:
+            Number of documents that were added or changed
+        """
+        changed = self.corpus_model.update_documents(
+            (document.id, document.content) for document in documents
+        )
+        logger.info(f"Indexed {len(documents)} documents in TF-IDF corpus model ({changed} changed)")
+        self.save_corpus_model()
+        return changed
+    
+    def remove_missing_documents(self, current_ids: Set[str]) -> int:
+        """
+        Remove documents that no longer exist from the corpus TF-IDF model.
+        
+        Args:
+            current_ids: IDs of every document that still exists
+            
+        Returns:
+            Number of documents that were removed
+        """
+        removed = [doc_id for doc_id in self.corpus_model.doc_hashes if doc_id not in current_ids]
+        for doc_id in removed:
+            self.corpus_model.remove_document(doc_id)
+        return len(removed)
+    
+    def save_corpus_model(self) -> bool:
+        """
+        Persist the corpus TF-IDF model if it changed and a tfidf_model_path is configured.
+        
+        Returns:
+            True if the model was saved
+        """
+        if not self.corpus_model.storage_path or not self.corpus_model.dirty:
+            return False
+        return self.corpus_model.save()
+    
     async def detect_redundancy(self, document: Document) -> RedundancyDetectionResult:
         """
         Detect redundancy between this document and others in the system.
@@ -96,16 +149,20 @@ class RedundancyDetector:
         # Initialize result
         result = RedundancyDetectionResult(
             source_doc_id=document.id,
-            source_doc_title=document.title
+            source_doc_title=document.metadata.title
         )
         
+        # Candidate documents examined by any detection method
+        compared_doc_ids: Set[str] = set()
+        compared_hashes: Dict[str, str] = {}
+        
         # Run detection methods in parallel
         vector_similarity_task = asyncio.create_task(
             self._detect_vector_similarity(document)
         )
         
         content_comparison_task = asyncio.create_task(
-            self._detect_content_similarity(document)
+            self._detect_content_similarity(document, compared_doc_ids, compared_hashes)
         )
         
         kg_relationship_task = asyncio.create_task(
@@ -113,7 +170,7 @@ class RedundancyDetector:
         )
         
         section_comparison_task = asyncio.create_task(
-            self._compare_document_sections(document)
+            self._compare_document_sections(document, compared_doc_ids, compared_hashes)
         )
         
         # Await all tasks
@@ -124,6 +181,14 @@ class RedundancyDetector:
             section_comparison_task
         )
         
+        compared_doc_ids.update(vector_results)
+        compared_doc_ids.update(kg_results)
+        compared_doc_ids.discard(document.id)
+        result.compared_doc_ids = sorted(compared_doc_ids)
+        result.compared_doc_hashes = {
+            doc_id: compared_hashes[doc_id] for doc_id in result.compared_doc_ids if doc_id in compared_hashes
+        }
+        
         # Combine results
         similar_docs = {}
         
@@ -183,14 +248,17 @@ class RedundancyDetector:
             for doc_id, data in significant_similar_docs.items()
         }
         
+        # Get all similar documents in one batch
+        similar_documents = await self._get_documents(list(significant_similar_docs))
+        
         # Format similar docs list
         for doc_id, data in significant_similar_docs.items():
-            # Get document details
-            doc_details = await self._get_document_details(doc_id)
+            similar_document = similar_documents.get(doc_id)
+            title = (similar_document.metadata.title if similar_document else "") or "Unknown"
             
             similar_doc = {
                 "id": doc_id,
-                "title": doc_details.get("title", "Unknown"),
+                "title": title,
                 "similarity_score": data["similarity_score"],
                 "relationship": data.get("relationship", {}).get("relationship_type", "none"),
                 "overlapping_sections": data.get("overlapping_sections", []),
@@ -203,20 +271,20 @@ class RedundancyDetector:
             if "duplicate_segments" in data:
                 for segment in data["duplicate_segments"]:
                     segment["compared_doc_id"] = doc_id
-                    segment["compared_doc_title"] = doc_details.get("title", "Unknown")
+                    segment["compared_doc_title"] = title
                     result.duplicate_segments.append(segment)
         
         # Calculate overlap percentages
         for doc_id, data in significant_similar_docs.items():
-            doc_details = await self._get_document_details(doc_id)
+            similar_document = similar_documents.get(doc_id)
             
-            # Skip if we couldn't get document details
-            if not doc_details:
+            # Skip if we couldn't get the document
+            if not similar_document:
                 continue
                 
             # Calculate content overlap percentage
             source_content_length = len(document.content)
-            target_content_length = len(doc_details.get("content", ""))
+            target_content_length = len(similar_document.content)
             
             total_duplicate_length = sum(
                 len(segment["text"]) 
@@ -270,18 +338,24 @@ class RedundancyDetector:
         # Return as dictionary of document ID to similarity score
         return {doc["id"]: doc["similarity"] for doc in similar_docs}
     
-    async def _detect_content_similarity(self, document: Document) -> Dict[str, Dict[str, Any]]:
+    async def _detect_content_similarity(self, document: Document,
+                                       compared_doc_ids: Optional[Set[str]] = None,
+                                       compared_hashes: Optional[Dict[str, str]] = None) -> Dict[str, Dict[str, Any]]:
         """
         Detect content similarity using TF-IDF and segment comparison.
         
         Args:
             document: The document to check
+            compared_doc_ids: Optional set collecting the candidate IDs examined
+            compared_hashes: Optional dict collecting content hashes of the fetched candidates
             
         Returns:
             Dictionary mapping document IDs to similarity data
         """
         # Get potentially similar documents first (faster check)
         similar_doc_ids = await self.vector_store.find_candidate_documents(document)
+        if compared_doc_ids is not None:
+            compared_doc_ids.update(similar_doc_ids)
         
         results = {}
         
@@ -289,37 +363,31 @@ class RedundancyDetector:
         docs_content = {}
         docs_content[document.id] = document.content
         
-        for doc_id in similar_doc_ids:
-            if doc_id == document.id:
-                continue
-                
-            doc_details = await self._get_document_details(doc_id)
-            if doc_details and "content" in doc_details:
-                docs_content[doc_id] = doc_details["content"]
+        candidates = await self._get_documents(
+            [doc_id for doc_id in similar_doc_ids if doc_id != document.id]
+        )
+        for doc_id, candidate in candidates.items():
+            docs_content[doc_id] = candidate.content
+            if compared_hashes is not None:
+                compared_hashes[doc_id] = self.corpus_model.content_hash(candidate.content)
         
         # Skip if no other documents to compare
         if len(docs_content) <= 1:
             return {}
         
-        # Compute TF-IDF similarity
-        content_list = [docs_content[doc_id] for doc_id in docs_content]
+        # Compute TF-IDF similarity against cached corpus rows
         try:
-            tfidf_matrix = self.vectorizer.fit_transform(content_list)
-            similarity_matrix = cosine_similarity(tfidf_matrix)
+            # Only new or changed documents are re-tokenized
+            self.corpus_model.update_documents(docs_content.items())
             
-            # First document is our target document
-            doc_ids = list(docs_content.keys())
-            source_idx = doc_ids.index(document.id)
+            similarities = self.corpus_model.similarity(
+                document.id,
+                [doc_id for doc_id in docs_content if doc_id != document.id]
+            )
             
-            # Get similarity scores
-            for i, doc_id in enumerate(doc_ids):
-                if doc_id == document.id:
-                    continue
-                    
-                similarity = similarity_matrix[source_idx, i]
-                
+            for doc_id, similarity in similarities.items():
                 results[doc_id] = {
-                    "similarity": float(similarity),
+                    "similarity": similarity,
                     "duplicate_segments": []
                 }
                 
@@ -345,6 +413,16 @@ class RedundancyDetector:
         """
         source_segments = self._split_into_segments(document.content)
         
+        # Only substantial segments are compared; transform them once up front
+        source_positions = [
+            idx for idx, segment in enumerate(source_segments)
+            if len(segment) >= self.min_segment_length
+        ]
+        source_matrix = self.corpus_model.transform(
+            [source_segments[idx] for idx in source_positions],
+            apply_df_limits=False
+        )
+        
         for doc_id, content in docs_content.items():
             if doc_id == document.id:
                 continue
@@ -352,21 +430,25 @@ class RedundancyDetector:
             target_segments = self._split_into_segments(content)
             duplicate_segments = []
             
-            # Compare segments
-            for src_idx, src_segment in enumerate(source_segments):
-                if len(src_segment) < self.min_segment_length:
-                    continue
-                    
-                for tgt_idx, tgt_segment in enumerate(target_segments):
-                    if len(tgt_segment) < self.min_segment_length:
-                        continue
-                        
-                    # Compute similarity for more substantial segments
-                    similarity = self._compute_segment_similarity(src_segment, tgt_segment)
+            target_positions = [
+                idx for idx, segment in enumerate(target_segments)
+                if len(segment) >= self.min_segment_length
+            ]
+            
+            # Compare all segment pairs with one sparse product
+            similarity_matrix = self._segment_similarity_matrix(
+                source_matrix,
+                [source_segments[idx] for idx in source_positions],
+                [target_segments[idx] for idx in target_positions]
+            )
+            
+            for i, src_idx in enumerate(source_positions):
+                for j, tgt_idx in enumerate(target_positions):
+                    similarity = float(similarity_matrix[i, j])
                     
                     if similarity > self.similarity_threshold:
                         duplicate_segments.append({
-                            "text": src_segment,
+                            "text": source_segments[src_idx],
                             "source_position": src_idx,
                             "target_position": tgt_idx,
                             "similarity": similarity
@@ -408,17 +490,53 @@ class RedundancyDetector:
             
         return segments
     
-    def _compute_segment_similarity(self, segment1: str, segment2: str) -> float:
-        """Compute similarity between two segments."""
+    def _segment_similarity_matrix(self, source_matrix: Any,
+                                   source_segments: List[str],
+                                   target_segments: List[str]) -> np.ndarray:
+        """
+        Compute TF-IDF similarities between all source and target segments.
+        
+        Uses the corpus model's IDF weights; pairs where either segment has
+        no known terms fall back to Jaccard similarity.
+        
+        Args:
+            source_matrix: Transformed source segments
+            source_segments: Source segment texts
+            target_segments: Target segment texts
+            
+        Returns:
+            Dense similarity matrix (source x target)
+        """
+        if not source_segments or not target_segments:
+            return np.zeros((len(source_segments), len(target_segments)))
+        
         try:
-            vectorizer = TfidfVectorizer()
-            tfidf_matrix = vectorizer.fit_transform([segment1, segment2])
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])
-            return float(similarity[0][0])
+            target_matrix = self.corpus_model.transform(target_segments, apply_df_limits=False)
+            similarity_matrix = (source_matrix @ target_matrix.T).toarray()
+            
+            empty_sources = np.flatnonzero(source_matrix.getnnz(axis=1) == 0)
+            empty_targets = np.flatnonzero(target_matrix.getnnz(axis=1) == 0)
         except Exception as e:
             logger.warning(f"Error computing segment similarity: {e}")
-            # Fallback to simpler method
-            return self._compute_jaccard_similarity(segment1, segment2)
+            similarity_matrix = np.zeros((len(source_segments), len(target_segments)))
+            empty_sources = np.arange(len(source_segments))
+            empty_targets = np.arange(len(target_segments))
+        
+        # Fallback to simpler method where TF-IDF has nothing to compare
+        for i in empty_sources:
+            for j in range(len(target_segments)):
+                similarity_matrix[i, j] = self._compute_jaccard_similarity(source_segments[i], target_segments[j])
+        for j in empty_targets:
+            for i in range(len(source_segments)):
+                similarity_matrix[i, j] = self._compute_jaccard_similarity(source_segments[i], target_segments[j])
+        
+        return similarity_matrix
+    
+    def _compute_segment_similarity(self, segment1: str, segment2: str) -> float:
+        """Compute similarity between two segments."""
+        source_matrix = self.corpus_model.transform([segment1], apply_df_limits=False)
+        similarity_matrix = self._segment_similarity_matrix(source_matrix, [segment1], [segment2])
+        return float(similarity_matrix[0, 0])
     
     def _compute_jaccard_similarity(self, segment1: str, segment2: str) -> float:
         """Compute Jaccard similarity between two segments."""
@@ -457,40 +575,47 @@ class RedundancyDetector:
             
         return results
     
-    async def _compare_document_sections(self, document: Document) -> Dict[str, List[Dict[str, Any]]]:
+    async def _compare_document_sections(self, document: Document,
+                                       compared_doc_ids: Optional[Set[str]] = None,
+                                       compared_hashes: Optional[Dict[str, str]] = None) -> Dict[str, List[Dict[str, Any]]]:
         """
         Compare document sections with related documents.
         
         Args:
             document: The document to check
+            compared_doc_ids: Optional set collecting the candidate IDs examined
+            compared_hashes: Optional dict collecting content hashes of the fetched candidates
             
         Returns:
             Dictionary mapping document IDs to lists of overlapping sections
         """
         # Extract sections from source document
         source_sections = await self._extract_document_sections(document)
+        self.corpus_model.update_document(document.id, document.content)
         
         # Get potentially related documents
         related_doc_ids = await self.knowledge_graph.find_related_documents(document.id)
+        if compared_doc_ids is not None:
+            compared_doc_ids.update(related_doc_ids)
         
         results = {}
+        related_documents = await self._get_documents(
+            [doc_id for doc_id in related_doc_ids if doc_id != document.id]
+        )
         
         # Compare with each related document
         for doc_id in related_doc_ids:
             if doc_id == document.id:
                 continue
                 
-            doc_details = await self._get_document_details(doc_id)
-            if not doc_details:
+            related_doc = related_documents.get(doc_id)
+            if not related_doc:
                 continue
-                
-            # Create temporary document object
-            related_doc = Document(
-                id=doc_id,
-                title=doc_details.get("title", ""),
-                content=doc_details.get("content", ""),
-                document_type=doc_details.get("document_type", "")
-            )
+            
+            # Keep the corpus model covering every document we compare against
+            self.corpus_model.update_document(doc_id, related_doc.content)
+            if compared_hashes is not None:
+                compared_hashes[doc_id] = self.corpus_model.content_hash(related_doc.content)
             
             # Extract sections
             related_sections = await self._extract_document_sections(related_doc)
@@ -584,6 +709,25 @@ class RedundancyDetector:
             logger.error(f"Error getting document details for {doc_id}: {e}")
             return None
     
+    async def _get_documents(self, doc_ids: List[str]) -> Dict[str, Document]:
+        """
+        Get several documents from the knowledge graph in one batch.
+        
+        Args:
+            doc_ids: Document IDs
+            
+        Returns:
+            Dictionary mapping found document IDs to documents
+        """
+        if not doc_ids:
+            return {}
+        
+        try:
+            return await self.knowledge_graph.get_documents(doc_ids)
+        except Exception as e:
+            logger.error(f"Error getting {len(doc_ids)} documents: {e}")
+            return {}
+    
     async def _generate_recommendations(self, document: Document,
                                       result: RedundancyDetectionResult) -> None:
         """
@@ -596,17 +740,23 @@ class RedundancyDetector:
         # Clear existing recommendations
         result.recommended_actions = []
         
+        # Get merge and consolidation candidates in one batch
+        candidates = await self._get_documents(list(dict.fromkeys(
+            [doc_id for doc_id, similarity in result.similarity_scores.items() if similarity > 0.85] +
+            result.consolidation_candidates
+        )))
+        
         # Case 1: High similarity with another document - consider merging
         for doc_id, similarity in result.similarity_scores.items():
             if similarity > 0.85:
-                doc_details = await self._get_document_details(doc_id)
-                if not doc_details:
+                candidate = candidates.get(doc_id)
+                if not candidate:
                     continue
                     
                 result.recommended_actions.append({
                     "action_type": "merge_documents",
                     "priority": "high",
-                    "description": f"Merge with highly similar document '{doc_details.get('title', 'Unknown')}'",
+                    "description": f"Merge with highly similar document '{candidate.metadata.title or 'Unknown'}'",
                     "target_document_id": doc_id,
                     "similarity_score": similarity
                 })
@@ -640,9 +790,9 @@ class RedundancyDetector:
             # Get document titles
             candidate_titles = []
             for doc_id in result.consolidation_candidates:
-                doc_details = await self._get_document_details(doc_id)
-                if doc_details:
-                    candidate_titles.append(doc_details.get("title", f"Document {doc_id}"))
+                candidate = candidates.get(doc_id)
+                if candidate:
+                    candidate_titles.append(candidate.metadata.title or f"Document {doc_id}")
             
             if candidate_titles:
                 result.recommended_actions.append({
@@ -688,12 +838,18 @@ class RedundancyManager:
     
     def __init__(self, detector: RedundancyDetector, 
                  handoff_manager: HandoffManager, 
-                 config: Dict[str, Any] = None):
+                 config: Dict[str, Any] = None,
+                 result_store: Optional[RedundancyResultStore] = None):
         """Initialize the redundancy manager."""
         self.detector = detector
         self.handoff_manager = handoff_manager
         self.config = config or {}
         
+        # Results keyed by content hash, so unchanged documents are not re-analyzed
+        self.result_store = result_store or RedundancyResultStore(
+            storage_path=self.config.get("result_store_path")
+        )
+        
         # Agents responsible for different actions
         self.consolidation_agent_id = self.config.get("consolidation_agent_id", "doc_consolidation_agent")
         self.refactoring_agent_id = self.config.get("refactoring_agent_id", "doc_refactoring_agent")
@@ -701,21 +857,115 @@ class RedundancyManager:
         
         logger.info("RedundancyManager initialized")
     
-    async def process_document(self, document: Document) -> RedundancyDetectionResult:
+    async def process_document(self, document: Document, force: bool = False) -> RedundancyDetectionResult:
         """
         Process a document for redundancy detection and management.
         
+        If neither the document nor any document it was compared against has
+        changed since the last analysis, the stored result is returned and no
+        handoffs are initiated again.
+        
+        Args:
+            document: The document to process
+            force: Re-run detection even if a valid stored result exists
+            
+        Returns:
+            RedundancyDetectionResult with analysis and actions taken
+        """
+        result = await self._process_document(document, force)
+        self.result_store.save()
+        self.detector.save_corpus_model()
+        return result
+    
+    async def rescan_changed(self, since: Optional[datetime] = None,
+                             documents: Optional[List[Document]] = None) -> Dict[str, RedundancyDetectionResult]:
+        """
+        Re-run redundancy detection for documents affected by recent changes.
+        
+        Content hashes of all documents are recorded first, so a changed
+        document invalidates the results of every document compared against
+        it. Only documents without a valid stored result are then analyzed.
+        
+        Args:
+            since: Documents with an older updated_at and a stored result are
+                assumed unchanged and not re-hashed (None hashes everything)
+            documents: Documents to consider (defaults to the whole knowledge graph)
+            
+        Returns:
+            Dictionary mapping re-analyzed document IDs to their results
+        """
+        full_scan = documents is None
+        if full_scan:
+            documents = await self._get_all_documents()
+        
+        # Record current content first so every invalidation is known up front
+        for document in documents:
+            updated_at = getattr(document.metadata, "updated_at", None)
+            if (since is not None and updated_at is not None and updated_at < since
+                    and self.result_store.has_result(document.id)):
+                continue
+            self.result_store.record_content(
+                document.id, self.result_store.content_hash(document.content)
+            )
+        
+        # Documents that no longer exist invalidate results compared against them
+        # and are dropped from the corpus statistics
+        if full_scan:
+            current_ids = {document.id for document in documents}
+            for doc_id in list(self.result_store.document_hashes):
+                if doc_id not in current_ids:
+                    self.result_store.remove_document(doc_id)
+            self.detector.remove_missing_documents(current_ids)
+        
+        results = {}
+        for document in documents:
+            content_hash = self.result_store.document_hashes.get(document.id)
+            if self.result_store.get(document.id, content_hash) is not None:
+                continue
+            results[document.id] = await self._process_document(document)
+        
+        self.result_store.save()
+        self.detector.save_corpus_model()
+        
+        logger.info(f"Redundancy rescan analyzed {len(results)} of {len(documents)} documents")
+        return results
+    
+    async def _process_document(self, document: Document, force: bool = False) -> RedundancyDetectionResult:
+        """
+        Run or reuse redundancy detection for a document, without persisting.
+        
         Args:
             document: The document to process
+            force: Re-run detection even if a valid stored result exists
             
         Returns:
             RedundancyDetectionResult with analysis and actions taken
         """
+        content_hash = self.result_store.content_hash(document.content)
+        self.result_store.record_content(document.id, content_hash)
+        
+        if not force:
+            cached = self.result_store.get(document.id, content_hash)
+            if cached is not None:
+                logger.info(f"Reusing redundancy result for unchanged document {document.id}")
+                return RedundancyDetectionResult(**cached)
+        
         # Detect redundancy
         result = await self.detector.detect_redundancy(document)
         
+        # The fetched candidate content is the newest known version of each candidate
+        for doc_id, doc_hash in result.compared_doc_hashes.items():
+            self.result_store.record_content(doc_id, doc_hash)
+        
+        self.result_store.put(
+            document.id,
+            asdict(result),
+            content_hash,
+            self._get_compared_hashes(result)
+        )
+        
         # Log findings
-        logger.info(f"Redundancy detection for '{document.title}' found:")
+        logger.info(f"Redundancy detection for '{document.metadata.title}' found:")
         logger.info(f" - {len(result.similar_docs)} similar documents")
         logger.info(f" - {len(result.duplicate_segments)} duplicate segments")
         logger.info(f" - {len(result.consolidation_candidates)} consolidation candidates")
@@ -726,6 +976,37 @@ class RedundancyManager:
         
         return result
     
+    def _get_compared_hashes(self, result: RedundancyDetectionResult) -> Dict[str, Optional[str]]:
+        """
+        Get content hashes of the documents a result was compared against.
+        
+        Hashes of the content the detector fetched are used first, then the
+        hashes this store last recorded.
+        
+        Args:
+            result: Redundancy detection result
+            
+        Returns:
+            Dictionary mapping compared document IDs to content hashes (None if unknown)
+        """
+        return {
+            doc_id: result.compared_doc_hashes.get(doc_id) or self.result_store.document_hashes.get(doc_id)
+            for doc_id in result.compared_doc_ids
+        }
+    
+    async def _get_all_documents(self) -> List[Document]:
+        """
+        Load every document from the knowledge graph.
+        
+        Returns:
+            List of documents
+        """
+        knowledge_graph = self.detector.knowledge_graph
+        doc_ids = await knowledge_graph.get_all_document_ids()
+        
+        documents = await knowledge_graph.get_documents(doc_ids)
+        return list(documents.values())
+    
     async def _initiate_action_handoffs(self, document: Document, 
                                       result: RedundancyDetectionResult) -> None:
         """
@@ -775,7 +1056,7 @@ class RedundancyManager:
                 document_type=document.document_type,
                 document_version=getattr(document, "version", "1.0"),
                 metadata={
-                    "document_title": document.title,
+                    "document_title": document.metadata.title,
                     "redundancy_detection_timestamp": result.analyzed_at,
                     "similar_docs_count": len(result.similar_docs),
                     "duplicate_segments_count": len(result.duplicate_segments),
@@ -786,7 +1067,7 @@ class RedundancyManager:
             # Add reasoning step
             context.add_reasoning_step(
                 description="Redundancy detection analysis",
-                input_data={"document_id": document.id, "title": document.title},
+                input_data={"document_id": document.id, "title": document.metadata.title},
                 output={"similar_docs": len(result.similar_docs), 
                         "duplicate_segments": len(result.duplicate_segments)},
                 confidence=0.9
@@ -794,14 +1075,14 @@ class RedundancyManager:
             
             # Create task description based on action type
             task_descriptions = {
-                "merge_documents": f"Merge document '{document.title}' with similar documents",
-                "reorganize_section": f"Reorganize overlapping sections in document '{document.title}'",
-                "consolidation_strategy": f"Develop consolidation strategy for document '{document.title}' and related documents",
-                "refactor_segments": f"Refactor duplicate segments in document '{document.title}'",
-                "add_cross_references": f"Add cross-references to document '{document.title}'"
+                "merge_documents": f"Merge document '{document.metadata.title}' with similar documents",
+                "reorganize_section": f"Reorganize overlapping sections in document '{document.metadata.title}'",
+                "consolidation_strategy": f"Develop consolidation strategy for document '{document.metadata.title}' and related documents",
+                "refactor_segments": f"Refactor duplicate segments in document '{document.metadata.title}'",
+                "add_cross_references": f"Add cross-references to document '{document.metadata.title}'"
             }
             
-            task = task_descriptions.get(action_type, f"Process redundancy in document '{document.title}'")
+            task = task_descriptions.get(action_type, f"Process redundancy in document '{document.metadata.title}'")
             
             # Add actions to context
             if "metadata" not in context.__dict__:
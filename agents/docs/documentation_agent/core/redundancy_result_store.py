@@ -0,0 +1,292 @@
+"""
+Redundancy Result Store for Documentation Agent.
+
+This module caches serialized redundancy detection results keyed by
+document content hash. Each result records the content hashes of the
+documents it was compared against, so a cached result is invalidated
+only when the document itself or one of its compared candidates changes.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Set
+
+from agents.utils.atomic_write import atomic_write
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class RedundancyResultStore:
+    """
+    Content-hash keyed store of redundancy detection results.
+
+    Results are invalidated eagerly: recording a new content hash for a
+    document drops its own result and the results of every document that
+    was compared against it, using a reverse dependency index.
+    """
+
+    def __init__(self, storage_path: Optional[str] = None):
+        """
+        Initialize the result store.
+
+        Args:
+            storage_path: Optional JSON path used by save() and load()
+        """
+        self.storage_path = storage_path
+
+        self.entries: Dict[str, Dict[str, Any]] = {}  # doc_id -> cached result entry
+        self.dependents: Dict[str, Set[str]] = {}  # doc_id -> IDs of results compared against it
+        self.document_hashes: Dict[str, str] = {}  # doc_id -> last seen content hash
+        self.changed_at: Dict[str, str] = {}  # doc_id -> time the content hash last changed
+
+        if storage_path and os.path.exists(storage_path):
+            self.load()
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """
+        Compute the hash used to detect content changes.
+
+        Args:
+            content: Document content
+
+        Returns:
+            Hex digest of the content
+        """
+        return hashlib.sha256((content or "").encode("utf-8")).hexdigest()
+
+    def record_content(self, doc_id: str, content_hash: str) -> bool:
+        """
+        Record the current content hash of a document.
+
+        If the hash differs from the one the store last saw, the document's
+        own result and every result compared against another version of it
+        are invalidated. Results compared against the document before its
+        hash was known are assumed to have seen this version.
+
+        Args:
+            doc_id: Document ID
+            content_hash: Current content hash
+
+        Returns:
+            True if the content changed (or the document is new)
+        """
+        if self.document_hashes.get(doc_id) == content_hash:
+            return False
+
+        self.document_hashes[doc_id] = content_hash
+        self.changed_at[doc_id] = datetime.now().isoformat()
+
+        invalidated = [doc_id] if self._remove_entry(doc_id) else []
+        for dependent_id in list(self.dependents.get(doc_id, ())):
+            dependencies = self.entries[dependent_id]["dependencies"]
+            if dependencies.get(doc_id) is None:
+                dependencies[doc_id] = content_hash
+            elif dependencies[doc_id] != content_hash and self._remove_entry(dependent_id):
+                invalidated.append(dependent_id)
+
+        if invalidated:
+            logger.debug(f"Invalidated redundancy results for {invalidated}")
+        return True
+
+    def get(self, doc_id: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached result for a document version.
+
+        Args:
+            doc_id: Document ID
+            content_hash: Content hash of the document version
+
+        Returns:
+            Cached result data, or None if missing or stale
+        """
+        entry = self.entries.get(doc_id)
+        if not entry or entry["content_hash"] != content_hash:
+            return None
+
+        # Any compared document seen with different content makes the result stale
+        for dep_id, dep_hash in entry["dependencies"].items():
+            current = self.document_hashes.get(dep_id)
+            if dep_hash is not None and current is not None and current != dep_hash:
+                self.invalidate(doc_id)
+                return None
+
+        return entry["result"]
+
+    def put(self, doc_id: str, result: Dict[str, Any], content_hash: str,
+            dependencies: Optional[Dict[str, Optional[str]]] = None) -> None:
+        """
+        Store a result and the content hashes it was computed against.
+
+        Args:
+            doc_id: ID of the analyzed document
+            result: Serialized detection result
+            content_hash: Content hash of the analyzed document
+            dependencies: Mapping of compared document IDs to their content
+                hashes (None when unknown; the currently recorded hash is used)
+        """
+        self._remove_entry(doc_id)
+
+        self.document_hashes.setdefault(doc_id, content_hash)
+
+        recorded = {}
+        for dep_id, dep_hash in (dependencies or {}).items():
+            if dep_id == doc_id:
+                continue
+            recorded[dep_id] = dep_hash or self.document_hashes.get(dep_id)
+            self.dependents.setdefault(dep_id, set()).add(doc_id)
+
+        self.entries[doc_id] = {
+            "content_hash": content_hash,
+            "dependencies": recorded,
+            "result": result,
+            "stored_at": datetime.now().isoformat()
+        }
+
+    def invalidate(self, doc_id: str) -> List[str]:
+        """
+        Drop the result of a document and of every result compared against it.
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            IDs of the documents whose results were dropped
+        """
+        invalidated = []
+        if self._remove_entry(doc_id):
+            invalidated.append(doc_id)
+
+        for dependent_id in list(self.dependents.get(doc_id, ())):
+            if self._remove_entry(dependent_id):
+                invalidated.append(dependent_id)
+
+        if invalidated:
+            logger.debug(f"Invalidated redundancy results for {invalidated}")
+        return invalidated
+
+    def remove_document(self, doc_id: str) -> List[str]:
+        """
+        Forget a deleted document and invalidate results compared against it.
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            IDs of the documents whose results were dropped
+        """
+        invalidated = self.invalidate(doc_id)
+        self.dependents.pop(doc_id, None)
+        self.document_hashes.pop(doc_id, None)
+        self.changed_at.pop(doc_id, None)
+        return invalidated
+
+    def has_result(self, doc_id: str) -> bool:
+        """Check whether a document has a cached result."""
+        return doc_id in self.entries
+
+    def changed_since(self, since: datetime) -> List[str]:
+        """
+        Get documents whose content changed at or after a point in time.
+
+        Args:
+            since: Cutoff time
+
+        Returns:
+            List of document IDs
+        """
+        cutoff = since.isoformat()
+        return [doc_id for doc_id, changed in self.changed_at.items() if changed >= cutoff]
+
+    def _remove_entry(self, doc_id: str) -> bool:
+        """
+        Remove a cached entry and its reverse dependency links.
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            True if an entry was removed
+        """
+        entry = self.entries.pop(doc_id, None)
+        if not entry:
+            return False
+
+        for dep_id in entry["dependencies"]:
+            dependents = self.dependents.get(dep_id)
+            if dependents:
+                dependents.discard(doc_id)
+                if not dependents:
+                    del self.dependents[dep_id]
+
+        return True
+
+    def save(self, storage_path: Optional[str] = None) -> bool:
+        """
+        Persist the store as JSON.
+
+        Args:
+            storage_path: Optional path overriding the configured one
+
+        Returns:
+            Success status
+        """
+        storage_path = storage_path or self.storage_path
+        if not storage_path:
+            return False
+
+        try:
+            data = {
+                "entries": self.entries,
+                "document_hashes": self.document_hashes,
+                "changed_at": self.changed_at
+            }
+
+            with atomic_write(storage_path) as f:
+                json.dump(data, f)
+
+            logger.info(f"Saved {len(self.entries)} redundancy results to {storage_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving redundancy results: {e}")
+            return False
+
+    def load(self, storage_path: Optional[str] = None) -> bool:
+        """
+        Load the store from JSON.
+
+        Args:
+            storage_path: Optional path overriding the configured one
+
+        Returns:
+            Success status
+        """
+        storage_path = storage_path or self.storage_path
+        if not storage_path or not os.path.exists(storage_path):
+            return False
+
+        try:
+            with open(storage_path, 'r') as f:
+                data = json.load(f)
+
+            self.entries = data.get("entries", {})
+            self.document_hashes = data.get("document_hashes", {})
+            self.changed_at = data.get("changed_at", {})
+
+            # Rebuild the reverse dependency index
+            self.dependents = {}
+            for doc_id, entry in self.entries.items():
+                for dep_id in entry["dependencies"]:
+                    self.dependents.setdefault(dep_id, set()).add(doc_id)
+
+            logger.info(f"Loaded {len(self.entries)} redundancy results from {storage_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error loading redundancy results: {e}")
+            return False
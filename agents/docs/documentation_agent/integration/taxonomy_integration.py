@@ -411,23 +411,9 @@ class TaxonomyIntegrationService:
             await self.initialize()
         
         try:
-            # Get all documents
-            documents = []
-            
-            for doc_id in document_ids:
-                doc_data = await self.knowledge_graph.get_document(doc_id)
-                
-                if not doc_data:
-                    continue
-                    
-                document = Document(
-                    id=doc_id,
-                    title=doc_data.get("title", ""),
-                    content=doc_data.get("content", ""),
-                    document_type=doc_data.get("document_type", "")
-                )
-                
-                documents.append(document)
+            # Get all documents in one batch
+            found = await self.knowledge_graph.get_documents(document_ids)
+            documents = [found[doc_id] for doc_id in dict.fromkeys(document_ids) if doc_id in found]
             
             if not documents:
                 return {"error": "No valid documents found"}
@@ -437,9 +423,12 @@ class TaxonomyIntegrationService:
             action_counts = {}
             category_counts = {}
             
-            for document in documents:
-                categorization = await self.taxonomy.categorize_text(document.content)
-                
+            # Categorize all documents in one batched pass
+            categorizations = await self.taxonomy.categorize_texts(
+                [document.content for document in documents]
+            )
+            
+            for document, categorization in zip(documents, categorizations):
                 # Track actions and categories
                 actions = [a["verb"] for a in categorization.get("actions", [])]
                 categories = [c["category"] for c in categorization.get("categories", [])]
@@ -457,7 +446,7 @@ class TaxonomyIntegrationService:
                 
                 analyses.append({
                     "document_id": document.id,
-                    "title": document.title,
+                    "title": document.metadata.title,
                     "actions": actions,
                     "categories": categories
                 })
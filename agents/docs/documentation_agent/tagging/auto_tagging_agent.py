@@ -15,6 +15,11 @@ from typing import Dict, List, Any, Optional, Set, Tuple
 from ..models.document_model import Document, DocumentMetadata
 from ..models.tag_model import Tag, TagType, DocumentTagAssociation, TaggingSuggestion
 
+try:
+    from agents.utils.llm_response_cache import get_response_cache
+except ImportError:
+    get_response_cache = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -50,6 +55,11 @@ class AutoTaggingAgent:
         self.max_tags = tagging_config.get("max_tags", 10)
         self.tag_registry_enabled = tagging_config.get("use_tag_registry", True)
         
+        # Reuse LLM tags for identical prompts (opt-in: tagging prompts are sampled)
+        self.response_cache = None
+        if tagging_config.get("use_response_cache", False) and get_response_cache:
+            self.response_cache = get_response_cache(tagging_config.get("response_cache_path"))
+        
         # Tag registry for controlling available tags
         self.tag_registry = {}
         if self.tag_registry_enabled:
@@ -267,7 +277,19 @@ class AutoTaggingAgent:
             """
             
             # Generate tags using LLM
-            response = await self.llm_connector.generate_text(prompt)
+            if self.response_cache:
+                model = getattr(self.llm_connector, "model", None)
+                request = {
+                    "connector": type(self.llm_connector).__name__,
+                    "model": model if isinstance(model, str) else None,
+                    "prompt": prompt
+                }
+                response = await self.response_cache.get_or_call_async(
+                    "auto_tagging_agent._generate_llm_tags", request,
+                    lambda: self.llm_connector.generate_text(prompt)
+                )
+            else:
+                response = await self.llm_connector.generate_text(prompt)
             
             # Parse response
             tags = []
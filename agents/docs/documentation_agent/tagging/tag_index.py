@@ -0,0 +1,267 @@
+"""
+Tag Index - Lookup structures for tag autocomplete
+
+This module implements the in-memory indexes used by the TagRegistry to
+serve tag suggestions: a prefix trie for "starts with" lookups and an
+n-gram index for substring and fuzzy lookups.
+"""
+
+import heapq
+from typing import Dict, List, Any, Optional, Set, Iterable
+
+
+class TagTrie:
+    """
+    Character trie mapping indexed names to tag IDs.
+
+    Each node stores its children by character and the IDs of the tags
+    whose name ends at that node, so a prefix lookup only visits the
+    subtree below the prefix.
+    """
+
+    def __init__(self):
+        """Initialize an empty trie."""
+        self.root = self._new_node()
+        self.size = 0
+
+    @staticmethod
+    def _new_node() -> Dict[str, Any]:
+        return {"children": {}, "ids": set()}
+
+    def insert(self, name: str, tag_id: str):
+        """
+        Index a tag ID under a name.
+
+        Args:
+            name: Indexed tag name
+            tag_id: Tag ID
+        """
+        node = self.root
+        for char in name:
+            children = node["children"]
+            if char not in children:
+                children[char] = self._new_node()
+            node = children[char]
+
+        if tag_id not in node["ids"]:
+            node["ids"].add(tag_id)
+            self.size += 1
+
+    def remove(self, name: str, tag_id: str) -> bool:
+        """
+        Remove a tag ID from under a name, pruning empty branches.
+
+        Args:
+            name: Indexed tag name
+            tag_id: Tag ID
+
+        Returns:
+            True if the entry was found and removed
+        """
+        path = [self.root]
+        node = self.root
+        for char in name:
+            node = node["children"].get(char)
+            if node is None:
+                return False
+            path.append(node)
+
+        if tag_id not in node["ids"]:
+            return False
+
+        node["ids"].discard(tag_id)
+        self.size -= 1
+
+        # Prune nodes that no longer lead to any tag
+        for depth in range(len(name), 0, -1):
+            current = path[depth]
+            if current["ids"] or current["children"]:
+                break
+            del path[depth - 1]["children"][name[depth - 1]]
+
+        return True
+
+    def find_prefix(self, prefix: str) -> Set[str]:
+        """
+        Find all tag IDs whose indexed name starts with a prefix.
+
+        Args:
+            prefix: Name prefix
+
+        Returns:
+            Set of matching tag IDs
+        """
+        node = self.root
+        for char in prefix:
+            node = node["children"].get(char)
+            if node is None:
+                return set()
+
+        # Iterative walk of the subtree to avoid recursion limits on long names
+        matches = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            matches.update(current["ids"])
+            stack.extend(current["children"].values())
+
+        return matches
+
+    def clear(self):
+        """Remove all entries from the trie."""
+        self.root = self._new_node()
+        self.size = 0
+
+
+class TagNgramIndex:
+    """
+    N-gram index mapping character grams to tag IDs.
+
+    Grams of length 1 up to ``n`` are indexed, so a query shorter than
+    ``n`` is answered by a single posting lookup and a longer query by
+    intersecting its trigram postings. The same trigram postings are
+    used to score fuzzy matches by gram overlap.
+    """
+
+    def __init__(self, n: int = 3):
+        """
+        Initialize the n-gram index.
+
+        Args:
+            n: Maximum gram length to index
+        """
+        self.n = n
+        self.postings = {}  # gram -> set of tag IDs
+
+    def _grams(self, text: str, size: int) -> Set[str]:
+        """Get the distinct grams of a given size in a text."""
+        return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+    def _all_grams(self, text: str) -> Set[str]:
+        """Get the distinct grams of every indexed size in a text."""
+        grams = set()
+        for size in range(1, self.n + 1):
+            grams.update(self._grams(text, size))
+        return grams
+
+    def insert(self, name: str, tag_id: str):
+        """
+        Index a tag ID under all grams of a name.
+
+        Args:
+            name: Indexed tag name
+            tag_id: Tag ID
+        """
+        for gram in self._all_grams(name):
+            if gram not in self.postings:
+                self.postings[gram] = set()
+            self.postings[gram].add(tag_id)
+
+    def remove(self, name: str, tag_id: str):
+        """
+        Remove a tag ID from all grams of a name.
+
+        Args:
+            name: Indexed tag name
+            tag_id: Tag ID
+        """
+        for gram in self._all_grams(name):
+            posting = self.postings.get(gram)
+            if posting is None:
+                continue
+            posting.discard(tag_id)
+            if not posting:
+                del self.postings[gram]
+
+    def find_candidates(self, query: str) -> Set[str]:
+        """
+        Find tag IDs whose names may contain a query string.
+
+        For queries up to ``n`` characters the result is exact. For longer
+        queries it is a superset that callers verify with a substring check.
+
+        Args:
+            query: Query string
+
+        Returns:
+            Set of candidate tag IDs
+        """
+        if not query:
+            return set()
+
+        if len(query) <= self.n:
+            return set(self.postings.get(query, ()))
+
+        # Intersect postings smallest-first so the working set shrinks fast
+        postings = []
+        for gram in self._grams(query, self.n):
+            posting = self.postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+
+        return candidates
+
+    def find_similar(self, query: str, min_overlap: float = 0.5) -> Dict[str, float]:
+        """
+        Score tags by the fraction of the query's trigrams they share.
+
+        Args:
+            query: Query string
+            min_overlap: Minimum fraction of shared trigrams to include a tag
+
+        Returns:
+            Dictionary mapping tag IDs to overlap scores
+        """
+        grams = self._grams(query, self.n)
+        if not grams:
+            return {}
+
+        counts = {}
+        for gram in grams:
+            for tag_id in self.postings.get(gram, ()):
+                counts[tag_id] = counts.get(tag_id, 0) + 1
+
+        total = len(grams)
+        return {
+            tag_id: count / total
+            for tag_id, count in counts.items()
+            if count / total >= min_overlap
+        }
+
+    def clear(self):
+        """Remove all entries from the index."""
+        self.postings = {}
+
+
+def rank_by_usage(tag_ids: Iterable[str], usage: Dict[str, int], names: Dict[str, str],
+                  limit: Optional[int] = None) -> List[str]:
+    """
+    Order tag IDs by usage frequency, most used first.
+
+    Ties are broken by shorter name, then alphabetically, so results are
+    stable between calls.
+
+    Args:
+        tag_ids: Tag IDs to rank
+        usage: Tag ID -> usage count
+        names: Tag ID -> indexed name
+        limit: Optional maximum number of IDs to return
+
+    Returns:
+        Ranked list of tag IDs
+    """
+    def sort_key(tag_id):
+        name = names.get(tag_id, "")
+        return (-usage.get(tag_id, 0), len(name), name)
+
+    if limit is None:
+        return sorted(tag_ids, key=sort_key)
+    return heapq.nsmallest(limit, tag_ids, key=sort_key)
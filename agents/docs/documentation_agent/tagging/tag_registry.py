@@ -13,6 +13,7 @@ from typing import Dict, List, Any, Optional, Set
 
 # Import tag models
 from ..models.tag_model import Tag, TagType, TagSet
+from .tag_index import TagTrie, TagNgramIndex, rank_by_usage
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -54,6 +55,14 @@ class TagRegistry:
         self.name_index = {}  # normalized name -> id
         self.category_index = {}  # category -> [id]
         
+        # Suggestion indices, keyed by the same normalized name as name_index
+        self.prefix_index = TagTrie()
+        self.ngram_index = TagNgramIndex(n=registry_config.get("ngram_size", 3))
+        self.indexed_names = {}  # id -> normalized name
+        self.usage_index = {}  # id -> usage count
+        self.tag_set_membership = {}  # id -> number of tag sets containing it
+        self.fuzzy_min_overlap = registry_config.get("fuzzy_min_overlap", 0.5)
+        
         # Normalization patterns
         self.normalization_patterns = [
             (r'[^\w\s-]', ''),  # Remove special characters
@@ -138,6 +147,9 @@ class TagRegistry:
             self.category_index[category] = []
         self.category_index[category].append(tag.id)
         
+        # Update suggestion indices
+        self._index_tag(tag, normalized_name)
+        
         # Save registry
         self._save_registry()
         
@@ -170,6 +182,8 @@ class TagRegistry:
         if old_category in self.category_index and tag_id in self.category_index[old_category]:
             self.category_index[old_category].remove(tag_id)
         
+        self._unindex_tag(tag_id)
+        
         # Update tag properties
         if "name" in updates:
             tag.name = updates["name"]
@@ -194,6 +208,8 @@ class TagRegistry:
         if tag_id not in self.category_index[new_category]:
             self.category_index[new_category].append(tag_id)
         
+        self._index_tag(tag, new_normalized_name)
+        
         # Save registry
         self._save_registry()
         
@@ -225,6 +241,10 @@ class TagRegistry:
         if category in self.category_index and tag_id in self.category_index[category]:
             self.category_index[category].remove(tag_id)
         
+        self._unindex_tag(tag_id)
+        self.usage_index.pop(tag_id, None)
+        self.tag_set_membership.pop(tag_id, None)
+        
         # Remove from tag sets
         for tag_set in self.tag_sets.values():
             if tag_id in tag_set.tags:
@@ -286,38 +306,61 @@ class TagRegistry:
         
         return True
     
-    def suggest_tags(self, partial_name: str, max_suggestions: int = 5) -> List[Tag]:
+    def suggest_tags(self, partial_name: str, max_suggestions: int = 5, fuzzy: bool = True) -> List[Tag]:
         """
         Suggest tags based on partial name.
         
+        Prefix matches are returned first, then substring matches, then
+        (optionally) fuzzy matches sharing most of the query's trigrams.
+        Within each group tags are ranked by usage frequency.
+        
         Args:
             partial_name: Partial tag name
             max_suggestions: Maximum number of suggestions
+            fuzzy: Whether to fall back to fuzzy matches
             
         Returns:
             List of suggested tags
         """
-        partial_name = partial_name.lower()
-        suggestions = []
+        query = self.normalize_tag(partial_name) if self.auto_normalize else partial_name.lower()
+        if not query or max_suggestions <= 0:
+            return []
+        
+        suggested_ids = []
+        seen = set()
+        
+        def add_ranked(tag_ids):
+            remaining = max_suggestions - len(suggested_ids)
+            candidates = [tag_id for tag_id in tag_ids if tag_id not in seen]
+            for tag_id in rank_by_usage(candidates, self.usage_index, self.indexed_names, limit=remaining):
+                suggested_ids.append(tag_id)
+                seen.add(tag_id)
         
         # Find tags that start with the partial name
-        for tag_id, normalized_name in self.name_index.items():
-            tag = self.tags.get(tag_id)
-            if tag and tag.name.lower().startswith(partial_name):
-                suggestions.append(tag)
-                if len(suggestions) >= max_suggestions:
-                    break
+        add_ranked(self.prefix_index.find_prefix(query))
         
         # If we need more suggestions, find tags that contain the partial name
-        if len(suggestions) < max_suggestions:
-            for tag_id, normalized_name in self.name_index.items():
-                tag = self.tags.get(tag_id)
-                if tag and partial_name in tag.name.lower() and tag not in suggestions:
-                    suggestions.append(tag)
-                    if len(suggestions) >= max_suggestions:
-                        break
-        
-        return suggestions
+        if len(suggested_ids) < max_suggestions:
+            candidates = self.ngram_index.find_candidates(query)
+            add_ranked(
+                tag_id for tag_id in candidates
+                if query in self.indexed_names.get(tag_id, "")
+            )
+        
+        # Fall back to tags sharing most of the query's trigrams
+        if fuzzy and len(suggested_ids) < max_suggestions:
+            scores = self.ngram_index.find_similar(query, self.fuzzy_min_overlap)
+            for tag_id in sorted(
+                (tag_id for tag_id in scores if tag_id not in seen),
+                key=lambda tag_id: (-scores[tag_id], -self.usage_index.get(tag_id, 0),
+                                    self.indexed_names.get(tag_id, ""))
+            ):
+                suggested_ids.append(tag_id)
+                seen.add(tag_id)
+                if len(suggested_ids) >= max_suggestions:
+                    break
+        
+        return [self.tags[tag_id] for tag_id in suggested_ids if tag_id in self.tags]
     
     def process_tags(self, tags: List[str], domain: str = None) -> List[str]:
         """
@@ -387,12 +430,63 @@ class TagRegistry:
         # Add tag set to registry
         self.tag_sets[tag_set.id] = tag_set
         
+        # Tag set membership counts towards suggestion ranking
+        for tag_id in set(tag_set.tags):
+            self.tag_set_membership[tag_id] = self.tag_set_membership.get(tag_id, 0) + 1
+            self._refresh_usage(tag_id)
+        
         # Save registry
         self._save_registry()
         
         logger.info(f"Registered tag set '{tag_set.name}' with ID {tag_set.id}")
         return True
     
+    def _index_tag(self, tag: Tag, normalized_name: str):
+        """
+        Add a tag to the suggestion indices.
+        
+        Args:
+            tag: Tag to index
+            normalized_name: Normalized tag name
+        """
+        self.prefix_index.insert(normalized_name, tag.id)
+        self.ngram_index.insert(normalized_name, tag.id)
+        self.indexed_names[tag.id] = normalized_name
+        self._refresh_usage(tag.id)
+    
+    def _unindex_tag(self, tag_id: str):
+        """
+        Remove a tag from the suggestion indices.
+        
+        Args:
+            tag_id: ID of the tag to remove
+        """
+        indexed_name = self.indexed_names.pop(tag_id, None)
+        if indexed_name is not None:
+            self.prefix_index.remove(indexed_name, tag_id)
+            self.ngram_index.remove(indexed_name, tag_id)
+    
+    def _refresh_usage(self, tag_id: str):
+        """
+        Recompute the usage count used to rank a tag in suggestions.
+        
+        Usage is the number of tag sets containing the tag plus any
+        ``usage_count`` recorded in the tag's metadata.
+        
+        Args:
+            tag_id: Tag ID
+        """
+        tag = self.tags.get(tag_id)
+        if not tag:
+            self.usage_index.pop(tag_id, None)
+            return
+        
+        try:
+            recorded = int(tag.metadata.get("usage_count", 0))
+        except (TypeError, ValueError):
+            recorded = 0
+        self.usage_index[tag_id] = self.tag_set_membership.get(tag_id, 0) + recorded
+    
     def _load_registry(self):
         """Load registry data from storage"""
         if not os.path.exists(self.storage_path):
@@ -416,11 +510,22 @@ class TagRegistry:
                 if category not in self.category_index:
                     self.category_index[category] = []
                 self.category_index[category].append(tag.id)
+                
+                # Update suggestion indices
+                self.prefix_index.insert(normalized_name, tag.id)
+                self.ngram_index.insert(normalized_name, tag.id)
+                self.indexed_names[tag.id] = normalized_name
             
             # Load tag sets
             for tag_set_data in data.get("tag_sets", []):
                 tag_set = TagSet.from_dict(tag_set_data)
                 self.tag_sets[tag_set.id] = tag_set
+                for tag_id in set(tag_set.tags):
+                    self.tag_set_membership[tag_id] = self.tag_set_membership.get(tag_id, 0) + 1
+            
+            # Compute usage counts once all tag sets are known
+            for tag_id in self.tags:
+                self._refresh_usage(tag_id)
             
             logger.info(f"Loaded {len(self.tags)} tags and {len(self.tag_sets)} tag sets from registry")
             
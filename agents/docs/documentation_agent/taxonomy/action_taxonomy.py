@@ -8,10 +8,14 @@ redundancy detection without requiring GPU-based training.
 
 import json
 import os
+import hashlib
+import asyncio
 import logging
 from typing import Dict, List, Set, Tuple, Any, Optional
 import numpy as np
 
+from agents.utils.atomic_write import atomic_write
+
 from ..connectors.vector_store_connector import DocumentVectorStoreConnector
 
 # Set up logging
@@ -26,12 +30,14 @@ class ActionTaxonomy:
     enhance semantic search, and improve documentation organization.
     """
     
-    def __init__(self, vector_store: Optional[DocumentVectorStoreConnector] = None):
+    def __init__(self, vector_store: Optional[DocumentVectorStoreConnector] = None,
+                 cache_dir: Optional[str] = None):
         """
         Initialize the action taxonomy.
         
         Args:
             vector_store: Vector store connector for embedding operations
+            cache_dir: Directory for cached taxonomy embeddings
         """
         self.vector_store = vector_store
         self.taxonomy: Dict[str, Dict[str, Any]] = {}
@@ -39,6 +45,16 @@ class ActionTaxonomy:
         self.category_vectors: Dict[str, List[float]] = {}
         self.initialized = False
         
+        # Stacked, L2-normalized embedding matrices (one row per label)
+        self.action_labels: List[str] = []
+        self.action_matrix: Optional[np.ndarray] = None
+        self.category_labels: List[str] = []
+        self.category_matrix: Optional[np.ndarray] = None
+        self._matrices_stale = False
+        
+        # Embedding cache, keyed by taxonomy content and embedding source
+        self.cache_dir = cache_dir or os.path.expanduser("~/.devloop/taxonomy_embedding_cache")
+        
         # Track indexed taxonomy terms
         self.indexed_terms: Set[str] = set()
         
@@ -171,6 +187,9 @@ class ActionTaxonomy:
         if self.vector_store:
             self._embed_action(verb)
         
+        # Category embeddings list their actions, so they are stale too
+        self._matrices_stale = True
+        
         logger.info(f"Added action '{verb}' to taxonomy")
         return True
     
@@ -208,6 +227,12 @@ class ActionTaxonomy:
         """
         Initialize embeddings for all taxonomy actions.
         
+        Actions and categories are embedded in batches and cached on disk,
+        keyed by a hash of the taxonomy content and the embedding source,
+        model and dimension, so an unchanged taxonomy is loaded without any
+        embedding calls. Batches that fell back to deterministic embeddings
+        are not cached.
+        
         Returns:
             Success status
         """
@@ -219,14 +244,29 @@ class ActionTaxonomy:
             self.load_taxonomy()
         
         try:
-            # Embed all actions
-            for verb in self.taxonomy:
-                await self._embed_action(verb)
+            taxonomy_hash = self._compute_taxonomy_hash()
+            categories = sorted(set(item["category"] for item in self.taxonomy.values()))
             
-            # Embed categories
-            categories = set(item["category"] for item in self.taxonomy.values())
-            for category in categories:
-                await self._embed_category(category)
+            if self._load_embedding_cache(taxonomy_hash):
+                logger.info(f"Loaded cached embeddings for {len(self.action_labels)} actions and {len(self.category_labels)} categories")
+                return True
+            
+            # Embed all actions and categories in one batch
+            verbs = list(self.taxonomy.keys())
+            texts = [self._action_embedding_text(verb) for verb in verbs]
+            texts.extend(self._category_embedding_text(category) for category in categories)
+            
+            vectors = await self._embed_texts(texts)
+            
+            self.action_vectors = dict(zip(verbs, vectors[:len(verbs)]))
+            self.category_vectors = dict(zip(categories, vectors[len(verbs):]))
+            self.indexed_terms.update(verbs)
+            self._rebuild_matrices()
+            
+            if getattr(self.vector_store, "last_embedding_fallback", False):
+                logger.warning("Not caching taxonomy embeddings that fell back to deterministic embeddings")
+            else:
+                self._save_embedding_cache(taxonomy_hash)
             
             logger.info(f"Initialized embeddings for {len(self.taxonomy)} actions and {len(categories)} categories")
             return True
@@ -235,6 +275,50 @@ class ActionTaxonomy:
             logger.error(f"Error initializing embeddings: {e}")
             return False
     
+    def _action_embedding_text(self, verb: str) -> str:
+        """
+        Build the text embedded for an action.
+        
+        Args:
+            verb: Action verb
+            
+        Returns:
+            Embedding text capturing the essence of the action
+        """
+        action = self.taxonomy[verb]
+        return f"{verb}: {action['description']} Examples: {', '.join(action['examples'])}. Category: {action['category']}"
+    
+    def _category_embedding_text(self, category: str) -> str:
+        """
+        Build the text embedded for a category.
+        
+        Args:
+            category: Category name
+            
+        Returns:
+            Embedding text listing the category's actions
+        """
+        actions = [verb for verb, data in self.taxonomy.items() if data["category"] == category]
+        return f"Category: {category}. Actions: {', '.join(actions)}."
+    
+    async def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several texts, using the vector store's batch API when available.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors, in the same order as the texts
+        """
+        if not texts:
+            return []
+        
+        if hasattr(self.vector_store, "get_embeddings"):
+            return await self.vector_store.get_embeddings(texts)
+        
+        return await asyncio.gather(*(self.vector_store.get_embedding(text) for text in texts))
+    
     async def _embed_action(self, verb: str) -> bool:
         """
         Create embeddings for an action.
@@ -248,10 +332,8 @@ class ActionTaxonomy:
         if verb not in self.taxonomy:
             return False
         
-        action = self.taxonomy[verb]
-        
         # Create an embedding prompt that captures the essence of the action
-        embedding_text = f"{verb}: {action['description']} Examples: {', '.join(action['examples'])}. Category: {action['category']}"
+        embedding_text = self._action_embedding_text(verb)
         
         try:
             # Generate embedding
@@ -259,6 +341,7 @@ class ActionTaxonomy:
             
             # Store the vector
             self.action_vectors[verb] = vector
+            self._matrices_stale = True
             
             # Add to indexed terms
             self.indexed_terms.add(verb)
@@ -286,7 +369,7 @@ class ActionTaxonomy:
             return False
         
         # Create an embedding prompt that captures the essence of the category
-        embedding_text = f"Category: {category}. Actions: {', '.join(actions)}."
+        embedding_text = self._category_embedding_text(category)
         
         try:
             # Generate embedding
@@ -294,6 +377,7 @@ class ActionTaxonomy:
             
             # Store the vector
             self.category_vectors[category] = vector
+            self._matrices_stale = True
             
             return True
             
@@ -301,6 +385,136 @@ class ActionTaxonomy:
             logger.error(f"Error embedding category '{category}': {e}")
             return False
     
+    def _rebuild_matrices(self) -> None:
+        """Stack action and category vectors into normalized matrices."""
+        self.action_labels = list(self.action_vectors.keys())
+        self.action_matrix = self._normalize_rows(
+            [self.action_vectors[verb] for verb in self.action_labels]
+        )
+        self.category_labels = list(self.category_vectors.keys())
+        self.category_matrix = self._normalize_rows(
+            [self.category_vectors[category] for category in self.category_labels]
+        )
+        self._matrices_stale = False
+    
+    def _ensure_matrices(self) -> None:
+        """Rebuild the embedding matrices if vectors changed since the last build."""
+        if self._matrices_stale or self.action_matrix is None or self.category_matrix is None:
+            self._rebuild_matrices()
+    
+    @staticmethod
+    def _normalize_rows(vectors: Any) -> np.ndarray:
+        """
+        Stack vectors into a float32 matrix with unit-length rows.
+        
+        Zero vectors are left as zero rows, so they score 0 against everything.
+        
+        Args:
+            vectors: Sequence of vectors or 2-D array
+            
+        Returns:
+            Normalized matrix
+        """
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.size == 0:
+            return np.zeros((0, 0), dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+    
+    def _compute_taxonomy_hash(self) -> str:
+        """
+        Compute a hash of the taxonomy content and the embedding source.
+        
+        Returns:
+            Hex digest identifying the taxonomy and how it is embedded
+        """
+        serialized = json.dumps(
+            {"taxonomy": self.taxonomy, "embedding": self._embedding_signature()},
+            sort_keys=True
+        )
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    
+    def _embedding_signature(self) -> Dict[str, Any]:
+        """
+        Describe the source, model and dimension of the vector store's embeddings.
+        
+        Returns:
+            Embedding signature, or the vector store type if it cannot describe itself
+        """
+        embedding_signature = getattr(self.vector_store, "embedding_signature", None)
+        if callable(embedding_signature):
+            return embedding_signature()
+        return {"source": f"{type(self.vector_store).__module__}.{type(self.vector_store).__qualname__}"}
+    
+    def _embedding_cache_path(self, taxonomy_hash: str) -> str:
+        """Get the cache file path for a taxonomy hash."""
+        return os.path.join(self.cache_dir, f"taxonomy_embeddings_{taxonomy_hash[:16]}.npz")
+    
+    def _load_embedding_cache(self, taxonomy_hash: str) -> bool:
+        """
+        Load cached embedding matrices for a taxonomy hash.
+        
+        Args:
+            taxonomy_hash: Taxonomy content hash
+            
+        Returns:
+            True if the cache was found and loaded
+        """
+        cache_path = self._embedding_cache_path(taxonomy_hash)
+        if not os.path.exists(cache_path):
+            return False
+        
+        try:
+            with np.load(cache_path, allow_pickle=False) as cached:
+                if str(cached["taxonomy_hash"]) != taxonomy_hash:
+                    return False
+                action_labels = [str(label) for label in cached["action_labels"]]
+                category_labels = [str(label) for label in cached["category_labels"]]
+                action_matrix = cached["action_matrix"]
+                category_matrix = cached["category_matrix"]
+            
+            self.action_vectors = {verb: action_matrix[i].tolist() for i, verb in enumerate(action_labels)}
+            self.category_vectors = {category: category_matrix[i].tolist() for i, category in enumerate(category_labels)}
+            self.indexed_terms.update(action_labels)
+            
+            self.action_labels = action_labels
+            self.action_matrix = action_matrix.astype(np.float32)
+            self.category_labels = category_labels
+            self.category_matrix = category_matrix.astype(np.float32)
+            self._matrices_stale = False
+            return True
+            
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable embedding cache {cache_path}: {e}")
+            return False
+    
+    def _save_embedding_cache(self, taxonomy_hash: str) -> None:
+        """
+        Save the embedding matrices for a taxonomy hash.
+        
+        Args:
+            taxonomy_hash: Taxonomy content hash
+        """
+        cache_path = self._embedding_cache_path(taxonomy_hash)
+        
+        try:
+            with atomic_write(cache_path, 'wb') as f:
+                np.savez(
+                    f,
+                    taxonomy_hash=np.array(taxonomy_hash),
+                    action_labels=np.array(self.action_labels, dtype=str),
+                    action_matrix=self.action_matrix,
+                    category_labels=np.array(self.category_labels, dtype=str),
+                    category_matrix=self.category_matrix
+                )
+            
+        except Exception as e:
+            logger.warning(f"Could not save embedding cache: {e}")
+    
     async def find_similar_actions(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """
         Find actions similar to a query.
@@ -320,24 +534,28 @@ class ActionTaxonomy:
             # Generate embedding for the query
             query_vector = await self.vector_store.get_embedding(query)
             
-            # Calculate similarity with all action vectors
-            similarities = []
-            for verb, vector in self.action_vectors.items():
-                similarity = self._calculate_similarity(query_vector, vector)
-                similarities.append((verb, similarity))
+            self._ensure_matrices()
+            if not self.action_labels or top_k <= 0:
+                return []
+            
+            # Cosine similarity with all actions in one matrix-vector product
+            similarities = self.action_matrix @ self._normalize_rows([query_vector])[0]
             
-            # Sort by similarity (descending)
-            similarities.sort(key=lambda x: x[1], reverse=True)
+            # Select top-k without sorting the whole array
+            k = min(top_k, len(self.action_labels))
+            top_indices = np.argpartition(-similarities, k - 1)[:k]
+            top_indices = top_indices[np.argsort(-similarities[top_indices], kind="stable")]
             
             # Return top-k results
             results = []
-            for verb, similarity in similarities[:top_k]:
+            for index in top_indices:
+                verb = self.action_labels[index]
                 results.append({
                     "verb": verb,
                     "description": self.taxonomy[verb]["description"],
                     "category": self.taxonomy[verb]["category"],
                     "examples": self.taxonomy[verb]["examples"],
-                    "similarity": similarity
+                    "similarity": float(similarities[index])
                 })
             
             return results
@@ -362,54 +580,99 @@ class ActionTaxonomy:
             return []
         
         try:
-            # Generate embedding for the text
-            text_vector = await self.vector_store.get_embedding(text)
-            
-            # Calculate similarity with all action vectors
-            action_similarities = []
-            for verb, vector in self.action_vectors.items():
-                similarity = self._calculate_similarity(text_vector, vector)
-                if similarity >= threshold:
-                    action_similarities.append((verb, similarity))
-            
-            # Calculate similarity with all category vectors
-            category_similarities = []
-            for category, vector in self.category_vectors.items():
-                similarity = self._calculate_similarity(text_vector, vector)
-                if similarity >= threshold:
-                    category_similarities.append((category, similarity))
-            
-            # Sort by similarity (descending)
-            action_similarities.sort(key=lambda x: x[1], reverse=True)
-            category_similarities.sort(key=lambda x: x[1], reverse=True)
-            
-            # Prepare results
-            results = {
+            results = await self.categorize_texts([text], threshold)
+            return results[0]
+            
+        except Exception as e:
+            logger.error(f"Error categorizing text: {e}")
+            return []
+    
+    async def categorize_texts(self, texts: List[str], threshold: float = 0.6) -> List[Dict[str, Any]]:
+        """
+        Categorize several texts based on action taxonomy.
+        
+        All texts are embedded in one batch and scored against every
+        action and category with a single matrix product each.
+        
+        Args:
+            texts: Texts to categorize
+            threshold: Similarity threshold
+            
+        Returns:
+            One categorization (matched actions and categories) per text
+        """
+        if not self.vector_store:
+            logger.warning("No vector store available for categorization")
+            return [{"actions": [], "categories": []} for _ in texts]
+        
+        if not texts:
+            return []
+        
+        # Generate embeddings for all texts
+        text_matrix = self._normalize_rows(await self._embed_texts(list(texts)))
+        
+        self._ensure_matrices()
+        action_scores = self._score_matrix(text_matrix, self.action_matrix)
+        category_scores = self._score_matrix(text_matrix, self.category_matrix)
+        
+        results = []
+        for row in range(len(texts)):
+            result = {
                 "actions": [],
                 "categories": []
             }
             
-            # Add matched actions
-            for verb, similarity in action_similarities:
-                results["actions"].append({
+            # Add matched actions, most similar first
+            for index in self._rank_above_threshold(action_scores[row], threshold):
+                verb = self.action_labels[index]
+                result["actions"].append({
                     "verb": verb,
                     "description": self.taxonomy[verb]["description"],
                     "category": self.taxonomy[verb]["category"],
-                    "similarity": similarity
+                    "similarity": float(action_scores[row, index])
                 })
             
-            # Add matched categories
-            for category, similarity in category_similarities:
-                results["categories"].append({
-                    "category": category,
-                    "similarity": similarity
+            # Add matched categories, most similar first
+            for index in self._rank_above_threshold(category_scores[row], threshold):
+                result["categories"].append({
+                    "category": self.category_labels[index],
+                    "similarity": float(category_scores[row, index])
                 })
             
-            return results
+            results.append(result)
+        
+        return results
+    
+    @staticmethod
+    def _score_matrix(queries: np.ndarray, targets: Optional[np.ndarray]) -> np.ndarray:
+        """
+        Compute cosine similarities between normalized query and target rows.
+        
+        Args:
+            queries: Normalized query matrix (m x d)
+            targets: Normalized target matrix (n x d)
             
-        except Exception as e:
-            logger.error(f"Error categorizing text: {e}")
-            return []
+        Returns:
+            Similarity matrix (m x n)
+        """
+        if targets is None or targets.size == 0 or queries.size == 0:
+            return np.zeros((queries.shape[0], 0), dtype=np.float32)
+        return queries @ targets.T
+    
+    @staticmethod
+    def _rank_above_threshold(scores: np.ndarray, threshold: float) -> List[int]:
+        """
+        Get indices of scores at or above a threshold, highest first.
+        
+        Args:
+            scores: Similarity scores
+            threshold: Similarity threshold
+            
+        Returns:
+            Ranked indices
+        """
+        indices = np.flatnonzero(scores >= threshold)
+        return indices[np.argsort(-scores[indices], kind="stable")].tolist()
     
     def _calculate_similarity(self, vector1: List[float], vector2: List[float]) -> float:
         """
@@ -508,33 +771,53 @@ class ActionTaxonomy:
         Returns:
             Analysis results
         """
+        results = await self.analyze_codes([code], threshold)
+        return results[0]
+    
+    async def analyze_codes(self, codes: List[str], threshold: float = 0.6) -> List[Dict[str, Any]]:
+        """
+        Analyze several code snippets to identify actions and categories.
+        
+        Uses a single batched categorization pass, so analyzing a whole
+        repository costs one embedding batch and two matrix products.
+        
+        Args:
+            codes: Code snippets to analyze
+            threshold: Similarity threshold
+            
+        Returns:
+            Analysis results, one per snippet
+        """
+        empty_result = {"actions": [], "categories": [], "summary": ""}
+        
         if not self.vector_store:
             logger.warning("No vector store available for code analysis")
-            return {"actions": [], "categories": [], "summary": ""}
+            return [dict(empty_result) for _ in codes]
         
         try:
-            # First, categorize the code
-            categorization = await self.categorize_text(code, threshold)
-            
-            # Identify primary actions and categories
-            primary_actions = categorization["actions"][:3]  # Top 3 actions
-            primary_categories = categorization["categories"][:2]  # Top 2 categories
+            # First, categorize all the code
+            categorizations = await self.categorize_texts(codes, threshold)
             
-            # Generate a summary
-            summary = self._generate_code_summary(code, primary_actions, primary_categories)
-            
-            # Add summary to results
-            result = {
-                "actions": primary_actions,
-                "categories": primary_categories,
-                "summary": summary
-            }
+            results = []
+            for code, categorization in zip(codes, categorizations):
+                # Identify primary actions and categories
+                primary_actions = categorization["actions"][:3]  # Top 3 actions
+                primary_categories = categorization["categories"][:2]  # Top 2 categories
+                
+                # Generate a summary
+                summary = self._generate_code_summary(code, primary_actions, primary_categories)
+                
+                results.append({
+                    "actions": primary_actions,
+                    "categories": primary_categories,
+                    "summary": summary
+                })
             
-            return result
+            return results
             
         except Exception as e:
             logger.error(f"Error analyzing code: {e}")
-            return {"actions": [], "categories": [], "summary": ""}
+            return [dict(empty_result) for _ in codes]
     
     def _generate_code_summary(self, code: str, 
                               actions: List[Dict[str, Any]], 
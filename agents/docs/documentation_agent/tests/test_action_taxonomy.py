@@ -0,0 +1,152 @@
+"""
+Tests for the action taxonomy embedding matrices.
+
+This module tests that the ActionTaxonomy embeds actions and categories
+in batches, scores queries with matrix products, and reuses embeddings
+cached on disk for an unchanged taxonomy.
+"""
+
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from ..taxonomy.action_taxonomy import ActionTaxonomy
+
+
+class FakeEmbeddingStore:
+    """Bag-of-words embedding stand-in for the vector store connector."""
+
+    def __init__(self, dim=64, source="deterministic", fallback=False):
+        self.dim = dim
+        self.source = source
+        self.fallback = fallback
+        self.batch_calls = 0
+        self.last_embedding_fallback = False
+
+    def _embed(self, text):
+        vector = np.zeros(self.dim)
+        for word in text.lower().replace(":", " ").replace(",", " ").replace(".", " ").split():
+            vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % self.dim] += 1
+        return vector.tolist()
+
+    async def get_embedding(self, text):
+        return self._embed(text)
+
+    async def get_embeddings(self, texts):
+        self.batch_calls += 1
+        self.last_embedding_fallback = self.fallback
+        return [self._embed(text) for text in texts]
+
+    def embedding_signature(self):
+        return {"source": self.source, "model": None, "dimension": self.dim}
+
+
+class TestActionTaxonomy(unittest.TestCase):
+    """Test cases for matrix-based taxonomy matching."""
+
+    def setUp(self):
+        """Set up a taxonomy with the default actions."""
+        self.cache_dir = tempfile.mkdtemp()
+        self.vector_store = FakeEmbeddingStore()
+        self.taxonomy = self._create_taxonomy(self.vector_store)
+
+    def tearDown(self):
+        """Remove the embedding cache directory."""
+        shutil.rmtree(self.cache_dir)
+
+    def _create_taxonomy(self, vector_store):
+        taxonomy = ActionTaxonomy(vector_store=vector_store, cache_dir=self.cache_dir)
+        taxonomy.taxonomy = taxonomy._create_default_taxonomy()
+        taxonomy.initialized = True
+        return taxonomy
+
+    def test_initialize_embeddings_batches(self):
+        """Test that all actions and categories are embedded in one batch."""
+        self.assertTrue(asyncio.run(self.taxonomy.initialize_embeddings()))
+
+        self.assertEqual(self.vector_store.batch_calls, 1)
+        self.assertEqual(self.taxonomy.action_matrix.shape, (len(self.taxonomy.taxonomy), 64))
+        self.assertTrue(np.allclose(np.linalg.norm(self.taxonomy.action_matrix, axis=1), 1.0))
+
+    def test_embeddings_cached_by_taxonomy_hash(self):
+        """Test that an unchanged taxonomy reuses cached embeddings."""
+        asyncio.run(self.taxonomy.initialize_embeddings())
+
+        other_store = FakeEmbeddingStore()
+        reloaded = self._create_taxonomy(other_store)
+        self.assertTrue(asyncio.run(reloaded.initialize_embeddings()))
+        self.assertEqual(other_store.batch_calls, 0)
+        self.assertEqual(reloaded.action_labels, self.taxonomy.action_labels)
+
+        # Changing the taxonomy changes its hash and forces re-embedding
+        reloaded.taxonomy["cache"] = {"description": "To store results", "examples": [], "category": "Data Operations"}
+        asyncio.run(reloaded.initialize_embeddings())
+        self.assertEqual(other_store.batch_calls, 1)
+
+    def test_embedding_source_is_part_of_the_key(self):
+        """Test that embeddings cached for another source or dimension are not reused."""
+        asyncio.run(self.taxonomy.initialize_embeddings())
+
+        llm_store = FakeEmbeddingStore(dim=128, source="openai")
+        reloaded = self._create_taxonomy(llm_store)
+        self.assertTrue(asyncio.run(reloaded.initialize_embeddings()))
+
+        self.assertEqual(llm_store.batch_calls, 1)
+        self.assertEqual(reloaded.action_matrix.shape[1], 128)
+        self.assertEqual(len(asyncio.run(reloaded.find_similar_actions("parse the json", top_k=1))), 1)
+
+    def test_fallback_embeddings_are_not_cached(self):
+        """Test that a batch that fell back to deterministic embeddings is not cached."""
+        store = FakeEmbeddingStore(source="openai", fallback=True)
+        taxonomy = self._create_taxonomy(store)
+
+        self.assertTrue(asyncio.run(taxonomy.initialize_embeddings()))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_default_cache_dir_is_outside_the_source_tree(self):
+        """Test that the default embedding cache lives in the user data directory."""
+        taxonomy = ActionTaxonomy(vector_store=self.vector_store)
+
+        self.assertTrue(taxonomy.cache_dir.startswith(os.path.expanduser("~/.devloop")))
+
+    def test_find_similar_actions_matches_pairwise(self):
+        """Test that matrix scoring agrees with pairwise cosine similarity."""
+        asyncio.run(self.taxonomy.initialize_embeddings())
+        query = "validate the user input form data"
+
+        results = asyncio.run(self.taxonomy.find_similar_actions(query, top_k=3))
+
+        query_vector = self.vector_store._embed(query)
+        expected = sorted(
+            ((verb, self.taxonomy._calculate_similarity(query_vector, vector))
+             for verb, vector in self.taxonomy.action_vectors.items()),
+            key=lambda item: item[1], reverse=True
+        )[:3]
+        self.assertEqual([r["verb"] for r in results], [verb for verb, _ in expected])
+        for result, (_, similarity) in zip(results, expected):
+            self.assertAlmostEqual(result["similarity"], similarity, places=5)
+
+    def test_categorize_texts_matches_single(self):
+        """Test that batched categorization matches per-text categorization."""
+        asyncio.run(self.taxonomy.initialize_embeddings())
+        texts = ["render the component template", "deploy application to cloud", ""]
+
+        batched = asyncio.run(self.taxonomy.categorize_texts(texts, threshold=0.2))
+        single = [asyncio.run(self.taxonomy.categorize_text(text, threshold=0.2)) for text in texts]
+
+        self.assertEqual(len(batched), 3)
+        for batch_result, single_result in zip(batched, single):
+            self.assertEqual(
+                [a["verb"] for a in batch_result["actions"]],
+                [a["verb"] for a in single_result["actions"]]
+            )
+        self.assertEqual(batched[2], {"actions": [], "categories": []})
+
+
+if __name__ == '__main__':
+    unittest.main()
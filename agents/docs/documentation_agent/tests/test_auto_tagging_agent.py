@@ -0,0 +1,62 @@
+"""
+Tests for the auto-tagging agent's LLM response cache option.
+
+This module tests that the tagging agent reuses LLM tags from the shared
+response cache only when configured to.
+"""
+
+import os
+import shutil
+import asyncio
+import tempfile
+import unittest
+
+from ..tagging.auto_tagging_agent import AutoTaggingAgent
+from ..models.document_model import Document, DocumentMetadata
+
+
+class CountingConnector:
+    """LLM connector counting its calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_text(self, prompt):
+        self.calls += 1
+        return "python, testing, caching"
+
+
+class TestAutoTaggingResponseCache(unittest.TestCase):
+    """Test cases for the auto-tagging response cache option."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "responses.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_auto_tagging_is_opt_in(self):
+        """Test that the tagging agent reuses LLM tags only when configured to."""
+        document = Document(id="doc-1", content="Caching LLM responses in Python.",
+                            metadata=DocumentMetadata(title="Caching"))
+
+        connector = CountingConnector()
+        agent = AutoTaggingAgent({"tagging": {"use_tag_registry": False, "use_response_cache": True,
+                                              "response_cache_path": self.db_path}},
+                                 llm_connector=connector)
+        first = asyncio.run(agent._generate_llm_tags(document))
+        second = asyncio.run(agent._generate_llm_tags(document))
+
+        self.assertEqual(first, second)
+        self.assertEqual(first[0], ["python", "testing", "caching"])
+        self.assertEqual(connector.calls, 1)
+
+        uncached = AutoTaggingAgent({"tagging": {"use_tag_registry": False}}, llm_connector=connector)
+        asyncio.run(uncached._generate_llm_tags(document))
+        self.assertIsNone(uncached.response_cache)
+        self.assertEqual(connector.calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
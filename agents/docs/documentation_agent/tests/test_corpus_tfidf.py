@@ -0,0 +1,146 @@
+"""
+Tests for the corpus-level TF-IDF model.
+
+This module tests that the CorpusTfidfModel agrees with scikit-learn's
+TF-IDF weighting, only re-tokenizes changed documents, only reweights
+changed rows until the corpus drifts, and survives a save/load round trip.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from ..core.corpus_tfidf import CorpusTfidfModel
+
+
+DOCUMENTS = {
+    "install": "Install the agent with pip and configure the logging handler.",
+    "logging": "Configure the logging handler and rotate log files daily.",
+    "deploy": "Deploy the agent to the cluster and configure health checks.",
+    "faq": "Frequently asked questions about the agent and the cluster.",
+}
+
+
+class TestCorpusTfidfModel(unittest.TestCase):
+    """Test cases for CorpusTfidfModel."""
+
+    def setUp(self):
+        """Set up a model indexing the sample documents."""
+        self.model = CorpusTfidfModel()
+        self.model.update_documents(DOCUMENTS.items())
+
+    def test_matches_sklearn_weighting(self):
+        """Test that similarities match a TfidfVectorizer fitted on the corpus."""
+        doc_ids = list(DOCUMENTS)
+        vectorizer = TfidfVectorizer(lowercase=True, stop_words='english')
+        expected = cosine_similarity(vectorizer.fit_transform([DOCUMENTS[d] for d in doc_ids]))
+
+        similarities = self.model.similarity("install")
+
+        for i, doc_id in enumerate(doc_ids[1:], start=1):
+            self.assertAlmostEqual(similarities[doc_id], expected[0, i], places=6)
+
+    def test_unchanged_content_is_not_reindexed(self):
+        """Test that only new or changed documents update the corpus."""
+        self.assertEqual(self.model.update_documents(DOCUMENTS.items()), 0)
+        self.assertTrue(self.model.has_document("faq", DOCUMENTS["faq"]))
+
+        self.assertTrue(self.model.update_document("faq", "Questions about deploying the cluster."))
+        self.assertFalse(self.model.has_document("faq", DOCUMENTS["faq"]))
+
+    def test_remove_document_updates_frequencies(self):
+        """Test that removing a document removes its document frequencies."""
+        column = self.model.vocabulary["cluster"]
+        self.assertEqual(self.model.document_frequency[column], 2)
+
+        self.model.remove_document("faq")
+
+        self.assertEqual(self.model.document_frequency[column], 1)
+        self.assertNotIn("faq", self.model.similarity("deploy"))
+
+    def test_updates_only_replace_changed_rows(self):
+        """Test that IDF weights are kept until the corpus drifts past the threshold."""
+        model = CorpusTfidfModel(refit_threshold=0.5)
+        model.update_documents(DOCUMENTS.items())
+        model.similarity("install")
+        idf = model._idf.copy()
+        deploy_row = model._rows["deploy"]
+
+        model.update_document("faq", "Questions about rotating log files on the cluster.")
+        scores = model.similarity("logging")
+
+        np.testing.assert_array_equal(model._idf[:len(idf)], idf)
+        self.assertIs(model._rows["deploy"], deploy_row)
+        self.assertGreater(scores["faq"], 0.0)
+
+        # Words new to the vocabulary are weighted with the fitted statistics
+        model.update_document("extra", "Kubernetes operators for the cluster.")
+        self.assertGreater(model.similarity("extra")["faq"], 0.0)
+        self.assertIs(model._rows["deploy"], deploy_row)
+
+        # A third change exceeds half of the four fitted documents: refit
+        model.remove_document("extra")
+        model.similarity("install")
+        self.assertEqual(model._changes_since_fit, 0)
+        self.assertIsNot(model._rows["deploy"], deploy_row)
+        self.assertEqual(model._fitted_count, len(DOCUMENTS))
+
+    def test_dirty_until_saved(self):
+        """Test that changes mark the model dirty until it is saved."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            self.assertTrue(self.model.dirty)
+            self.assertTrue(self.model.save(os.path.join(temp_dir, "tfidf.npz")))
+            self.assertFalse(self.model.dirty)
+
+            self.model.update_documents(DOCUMENTS.items())
+            self.assertFalse(self.model.dirty)
+            self.model.remove_document("faq")
+            self.assertTrue(self.model.dirty)
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_df_limits(self):
+        """Test that min_df and max_df exclude terms from weighting."""
+        model = CorpusTfidfModel(min_df=2, max_df=0.6)
+        model.update_documents(DOCUMENTS.items())
+
+        # "agent" is in 3 of 4 documents (above max_df), "pip" in only one (below min_df)
+        row = model.transform([DOCUMENTS["install"]])
+        weighted_columns = set(row.indices)
+        self.assertNotIn(model.vocabulary["agent"], weighted_columns)
+        self.assertNotIn(model.vocabulary["pip"], weighted_columns)
+        self.assertIn(model.vocabulary["logging"], weighted_columns)
+
+    def test_save_and_load(self):
+        """Test that a saved model reloads with identical similarities."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, "tfidf.npz")
+            self.assertTrue(self.model.save(path))
+
+            reloaded = CorpusTfidfModel(storage_path=path)
+
+            self.assertEqual(reloaded.document_count, len(DOCUMENTS))
+            expected = self.model.similarity("logging")
+            actual = reloaded.similarity("logging")
+            for doc_id, score in expected.items():
+                self.assertAlmostEqual(actual[doc_id], score)
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_similarity_to_text(self):
+        """Test scoring unindexed text against indexed documents."""
+        scores = self.model.similarity_to_text("rotate the log files")
+
+        self.assertEqual(max(scores, key=scores.get), "logging")
+        self.assertTrue(np.isclose(scores["faq"], 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
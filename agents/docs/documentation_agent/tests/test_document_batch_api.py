@@ -0,0 +1,231 @@
+"""
+Tests for the batch document APIs of the knowledge graph connector.
+
+This module tests that get_documents looks up document nodes and their
+relationship targets in batches, that add_documents writes new and
+existing documents with a single knowledge graph save, and that the
+consolidation agent and redundancy detector work with the documents
+get_documents returns.
+"""
+
+import os
+import asyncio
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from ..agents.document_consolidation_agent import DocumentConsolidationAgent
+from ..connectors import knowledge_graph_connector
+from ..connectors.knowledge_graph_connector import DocumentKnowledgeGraphConnector
+from ..core.redundancy_detection import RedundancyDetector, RedundancyDetectionResult
+from ..models.document_model import Document, DocumentMetadata, DocumentRelationship, DocumentType
+
+
+class CountingKG:
+    """In-memory base connector that counts lookups and saves."""
+
+    def __init__(self):
+        self.nodes = {}
+        self.edges = []
+        self.get_node_calls = 0
+        self.get_nodes_calls = 0
+        self.saves = 0
+
+    def get_node(self, node_id):
+        self.get_node_calls += 1
+        return self.nodes.get(node_id)
+
+    def get_nodes(self, node_ids):
+        self.get_nodes_calls += 1
+        return {node_id: self.nodes[node_id] for node_id in node_ids if node_id in self.nodes}
+
+    def get_edges(self, source_id=None, target_id=None, edge_type=None):
+        return [
+            edge for edge in self.edges
+            if source_id in (None, edge["source"]) and target_id in (None, edge["target"])
+            and edge_type in (None, edge["type"])
+        ]
+
+    def add_node(self, node_id, node_type, properties=None, metadata=None):
+        self.nodes[node_id] = {"id": node_id, "type": node_type,
+                               "properties": properties or {}, "metadata": metadata or {}}
+        return self.nodes[node_id]
+
+    def update_node(self, node_id, properties=None, metadata=None):
+        node = self.nodes[node_id]
+        if properties is not None:
+            node["properties"] = properties
+        if metadata is not None:
+            node["metadata"] = metadata
+        return node
+
+    def add_edge(self, edge_type, source_id, target_id, properties=None, metadata=None):
+        edge = {"type": edge_type, "source": source_id, "target": target_id,
+                "properties": properties or {}, "metadata": metadata or {}}
+        self.edges.append(edge)
+        return edge
+
+    def save(self):
+        self.saves += 1
+        return True
+
+
+def make_document(doc_id, content="# Title\n\nBody text.\n", relationships=None):
+    """Create a markdown document."""
+    return Document(
+        id=doc_id,
+        metadata=DocumentMetadata(title=doc_id.title(), document_type=DocumentType.MARKDOWN),
+        content=content,
+        relationships=relationships or []
+    )
+
+
+class TestDocumentBatchAPI(unittest.TestCase):
+    """Test cases for get_documents and add_documents."""
+
+    def setUp(self):
+        """Set up a connector over an in-memory knowledge graph."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.kg = CountingKG()
+        with patch.object(knowledge_graph_connector, "get_knowledge_graph_connector", return_value=self.kg):
+            self.connector = DocumentKnowledgeGraphConnector({"document_storage_dir": self.temp_dir})
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_add_documents_saves_once(self):
+        """Test that new and existing documents are written with one save."""
+        asyncio.run(self.connector.add_document(make_document("doc-a")))
+        self.assertEqual(self.kg.saves, 1)
+
+        relationship = DocumentRelationship(entity_id="feature-1", entity_type="feature",
+                                            relationship_type="documents")
+        documents = [
+            make_document("doc-a", "# Title\n\nUpdated.\n"),
+            make_document("doc-b", relationships=[relationship]),
+            make_document("doc-c")
+        ]
+        results = asyncio.run(self.connector.add_documents(
+            documents, related_entities={"doc-c": [{"id": "doc-a", "type": "document"}]}))
+
+        self.assertEqual(results, {"doc-a": True, "doc-b": True, "doc-c": True})
+        self.assertEqual(self.kg.saves, 2)
+        self.assertEqual(self.kg.get_nodes_calls, 1)
+        self.assertIn("feature-1", self.kg.nodes)
+        self.assertEqual(self.kg.get_edges(source_id="doc-c")[0]["target"], "doc-a")
+
+        # The existing document was updated in place
+        document = asyncio.run(self.connector.get_document("doc-a"))
+        self.assertEqual(document.content, "# Title\n\nUpdated.\n")
+
+    def test_get_documents_batches_lookups(self):
+        """Test that documents and relationship targets are fetched in batches."""
+        relationship = DocumentRelationship(entity_id="feature-1", entity_type="feature",
+                                            relationship_type="documents")
+        asyncio.run(self.connector.add_documents([
+            make_document("doc-a", relationships=[relationship]),
+            make_document("doc-b"),
+            make_document("doc-c", relationships=[relationship])
+        ]))
+        self.kg.get_node_calls = 0
+        self.kg.get_nodes_calls = 0
+
+        documents = asyncio.run(self.connector.get_documents(["doc-c", "missing", "feature-1", "doc-a", "doc-c"]))
+
+        self.assertEqual(list(documents), ["doc-c", "doc-a"])
+        self.assertEqual(self.kg.get_node_calls, 0)
+        self.assertEqual(self.kg.get_nodes_calls, 2)
+        self.assertEqual(documents["doc-a"].metadata.title, "Doc-A")
+        self.assertEqual(documents["doc-a"].content, "# Title\n\nBody text.\n")
+
+        relationships = documents["doc-c"].relationships
+        self.assertEqual([(r.entity_id, r.relationship_type) for r in relationships], [("feature-1", "documents")])
+
+        # Single and batch lookups build the same document
+        single = asyncio.run(self.connector.get_document("doc-c"))
+        self.assertEqual(single.relationships[0].entity_type, relationships[0].entity_type)
+
+
+class TestBatchCallers(unittest.TestCase):
+    """Test cases for callers of get_documents."""
+
+    def setUp(self):
+        """Set up a connector holding three documents, the first related to the second."""
+        self.temp_dir = tempfile.mkdtemp()
+        with patch.object(knowledge_graph_connector, "get_knowledge_graph_connector", return_value=CountingKG()):
+            self.connector = DocumentKnowledgeGraphConnector({"document_storage_dir": self.temp_dir})
+
+        related = DocumentRelationship(entity_id="doc-b", entity_type="document", relationship_type="related")
+        asyncio.run(self.connector.add_documents([
+            make_document("doc-b", "# Install\n\nInstall the package with pip and configure logging.\n"),
+            make_document("doc-c", "# Deploy\n\nDeploy the service with helm charts.\n"),
+            make_document("doc-a", "# Install\n\nInstall the package with pip and configure logging.\n",
+                          relationships=[related])
+        ]))
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_consolidation_agent_uses_loaded_documents(self):
+        """Test that the consolidation agent passes the loaded documents on unchanged."""
+        agent = DocumentConsolidationAgent(
+            agent_id="consolidation_agent",
+            knowledge_graph=self.connector,
+            vector_store=MagicMock(),
+            handoff_manager=MagicMock()
+        )
+
+        source = asyncio.run(agent._get_document("doc-a"))
+        self.assertEqual(source.metadata.title, "Doc-A")
+
+        related = asyncio.run(agent._get_related_documents(source))
+        self.assertEqual([(doc.id, doc.metadata.title) for doc in related], [("doc-b", "Doc-B")])
+        self.assertIn("Install the package", related[0].content)
+
+        agent._develop_consolidation_strategy = AsyncMock(return_value={"strategy_id": "s-1", "tasks": []})
+        agent._store_consolidation_strategy = AsyncMock(return_value="s-1")
+        context = SimpleNamespace(document_id="doc-a", document_type="markdown", metadata={"actions": [
+            {"action_type": "consolidation_strategy", "candidate_documents": ["doc-c", "missing", "doc-b"]}
+        ]})
+
+        result = asyncio.run(agent._handle_consolidation_strategy(context))
+
+        self.assertEqual(result["candidate_document_ids"], ["doc-c", "doc-b"])
+        candidates = agent._develop_consolidation_strategy.call_args[0][1]
+        self.assertEqual([doc.metadata.title for doc in candidates], ["Doc-C", "Doc-B"])
+
+    def test_redundancy_detector_uses_loaded_documents(self):
+        """Test that content, section and recommendation passes read the loaded documents."""
+        vector_store = MagicMock()
+        vector_store.find_candidate_documents = AsyncMock(return_value=["doc-b", "doc-c"])
+        self.connector.find_related_documents = AsyncMock(return_value=["doc-b"])
+        detector = RedundancyDetector(
+            vector_store=vector_store,
+            knowledge_graph=self.connector,
+            config={"tfidf_model_path": os.path.join(self.temp_dir, "tfidf.npz")}
+        )
+        document = asyncio.run(self.connector.get_document("doc-a"))
+
+        compared_hashes = {}
+        content = asyncio.run(detector._detect_content_similarity(document, set(), compared_hashes))
+        sections = asyncio.run(detector._compare_document_sections(document, set(), compared_hashes))
+
+        self.assertGreater(content["doc-b"]["similarity"], 0.9)
+        self.assertIn("doc-b", sections)
+        self.assertEqual(sorted(compared_hashes), ["doc-b", "doc-c"])
+
+        result = RedundancyDetectionResult(source_doc_id="doc-a", source_doc_title=document.metadata.title)
+        result.similarity_scores = {"doc-b": 0.95}
+        result.consolidation_candidates = ["doc-b", "doc-c"]
+        asyncio.run(detector._generate_recommendations(document, result))
+
+        descriptions = [action["description"] for action in result.recommended_actions]
+        self.assertIn("Merge with highly similar document 'Doc-B'", descriptions)
+
+
+if __name__ == "__main__":
+    unittest.main()
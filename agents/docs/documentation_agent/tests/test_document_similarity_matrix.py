@@ -0,0 +1,113 @@
+"""
+Tests for the document similarity matrix used in consolidation.
+
+This module tests that the DocumentConsolidationAgent builds its similarity
+matrix from one batch vector lookup and falls back to MinHash estimates of
+token Jaccard similarity for documents without vectors.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from ..agents.document_consolidation_agent import DocumentConsolidationAgent
+from ..core.minhash import MinHasher
+from ..models.document_model import Document
+
+
+class FakeVectorStore:
+    """Vector store stand-in that records batch lookups."""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.batch_calls = 0
+
+    async def get_document_vectors(self, document_ids):
+        self.batch_calls += 1
+        return {doc_id: self.vectors[doc_id] for doc_id in document_ids if doc_id in self.vectors}
+
+
+class TestMinHasher(unittest.TestCase):
+    """Test cases for MinHash similarity estimates."""
+
+    def test_estimate_tracks_jaccard(self):
+        """Test that estimates approximate exact token Jaccard similarity."""
+        hasher = MinHasher(num_perm=256)
+        texts = [
+            "the agent merges overlapping api documentation pages",
+            "the agent merges overlapping api reference pages",
+            "deploy the cluster with helm charts",
+            "",
+        ]
+
+        estimates = hasher.estimate_similarity(hasher.signatures(texts))
+
+        tokens = [set(text.split()) for text in texts]
+        exact = len(tokens[0] & tokens[1]) / len(tokens[0] | tokens[1])
+        self.assertAlmostEqual(estimates[0, 1], exact, delta=0.1)
+        self.assertLess(estimates[0, 2], 0.1)
+        self.assertEqual(estimates[3, 3], 0.0)
+        self.assertEqual(estimates[0, 0], 1.0)
+
+    def test_selected_rows_match_pairwise_comparison(self):
+        """Test that estimates for a subset of rows equal the share of equal signature entries."""
+        hasher = MinHasher(num_perm=64)
+        texts = ["alpha beta gamma", "beta gamma delta", "gamma delta epsilon", "alpha epsilon"]
+        signatures = hasher.signatures(texts)
+
+        estimates = hasher.estimate_similarity(signatures, rows=[2, 0])
+
+        self.assertEqual(estimates.shape, (2, 4))
+        for i, row in enumerate([2, 0]):
+            for j in range(len(texts)):
+                self.assertAlmostEqual(estimates[i, j], np.mean(signatures[row] == signatures[j]))
+
+
+class TestDocumentSimilarityMatrix(unittest.TestCase):
+    """Test cases for DocumentConsolidationAgent._compute_document_similarity_matrix."""
+
+    def _create_agent(self, vector_store):
+        return DocumentConsolidationAgent(
+            agent_id="consolidation_agent",
+            knowledge_graph=MagicMock(),
+            vector_store=vector_store,
+            handoff_manager=MagicMock()
+        )
+
+    def test_vectors_use_cosine_similarity(self):
+        """Test that stored vectors are compared with cosine similarity."""
+        store = FakeVectorStore({"a": [1.0, 0.0], "b": [1.0, 1.0], "c": [0.0, 2.0]})
+        agent = self._create_agent(store)
+        documents = [Document(id=doc_id, content=doc_id) for doc_id in ("a", "b", "c")]
+
+        matrix = asyncio.run(agent._compute_document_similarity_matrix(documents))
+
+        self.assertEqual(store.batch_calls, 1)
+        self.assertEqual(matrix.shape, (3, 3))
+        self.assertTrue(np.allclose(np.diag(matrix), 1.0))
+        self.assertAlmostEqual(matrix[0, 1], 1 / np.sqrt(2))
+        self.assertAlmostEqual(matrix[0, 2], 0.0)
+        self.assertTrue(np.allclose(matrix, matrix.T))
+
+    def test_minhash_fallback_for_missing_vectors(self):
+        """Test that documents without vectors are compared by content."""
+        store = FakeVectorStore({"a": [1.0, 0.0], "b": [0.0, 1.0]})
+        agent = self._create_agent(store)
+        documents = [
+            Document(id="a", content="install the agent with pip"),
+            Document(id="b", content="install the agent with pip"),
+            Document(id="c", content="install the agent with pip"),
+        ]
+
+        matrix = asyncio.run(agent._compute_document_similarity_matrix(documents))
+
+        # Vectors decide a-b; c has no vector, so identical content scores 1.0
+        self.assertAlmostEqual(matrix[0, 1], 0.0)
+        self.assertAlmostEqual(matrix[0, 2], 1.0)
+        self.assertAlmostEqual(matrix[2, 1], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
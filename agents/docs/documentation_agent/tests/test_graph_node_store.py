@@ -0,0 +1,140 @@
+"""
+Tests for the on-disk knowledge graph node index.
+
+This module tests that the SQLite node store answers point lookups, type
+scans and edge lookups, imports a JSON knowledge graph once, and that the
+document connector reads document edges through it and writes documents to
+the knowledge graph file shared with the feature creation agent.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from ..connectors import knowledge_graph_connector
+from ..connectors.knowledge_graph_connector import DocumentKnowledgeGraphConnector
+from ..models.document_model import Document, DocumentMetadata
+from agents.utils.graph_node_store import GraphNodeStore
+from agents.planning.feature_creation.graph_store import IndexedGraphFile, JournaledGraphStore
+
+
+def import_graph(store, data):
+    """Import a knowledge graph JSON document into a store."""
+    graph = data["knowledge_graph"]
+    store.insert_nodes((node_id, node, [node["type"]]) for node_id, node in graph["nodes"].items())
+    store.add_edges((edge["type"], edge["source"], edge["target"], edge) for edge in graph["edges"])
+
+
+class StoreBackedKG:
+    """Minimal base connector reading from a GraphNodeStore."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def get_node(self, node_id):
+        return self.store.get_node(node_id)
+
+    def get_edges(self, source_id=None, target_id=None, edge_type=None):
+        return self.store.get_edges(source_id=source_id, target_id=target_id, edge_type=edge_type)
+
+
+class TestGraphNodeStore(unittest.TestCase):
+    """Test cases for GraphNodeStore."""
+
+    def setUp(self):
+        """Write a small knowledge graph JSON file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.json_path = os.path.join(self.temp_dir, "knowledge_graph.json")
+        self.db_path = os.path.join(self.temp_dir, "knowledge_graph.sqlite")
+
+        nodes = {
+            "doc-1": {"id": "doc-1", "type": "document", "properties": {"title": "One"}},
+            "doc-2": {"id": "doc-2", "type": "document", "properties": {"title": "Two"}},
+            "feature-1": {"id": "feature-1", "type": "feature", "properties": {"name": "F"}}
+        }
+        edges = [
+            {"type": "document_describes", "source": "doc-1", "target": "feature-1"},
+            {"type": "document_references", "source": "doc-2", "target": "doc-1"}
+        ]
+        with open(self.json_path, "w") as f:
+            json.dump({"knowledge_graph": {"nodes": nodes, "edges": edges}}, f)
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_import_once_and_lookups(self):
+        """Test that the JSON graph is imported once and served by index lookups."""
+        store = GraphNodeStore(self.db_path)
+        self.assertTrue(store.import_once(self.json_path, import_graph))
+        store.close()
+
+        # Reopening does not import again
+        store = GraphNodeStore(self.db_path)
+        self.assertFalse(store.import_once(self.json_path, import_graph))
+
+        self.assertEqual(store.get_node("doc-2")["properties"]["title"], "Two")
+        self.assertIsNone(store.get_node("missing"))
+        self.assertEqual(store.node_ids_by_type("document"), ["doc-1", "doc-2"])
+        self.assertEqual(sorted(store.get_nodes(["feature-1", "doc-1", "missing"])), ["doc-1", "feature-1"])
+        self.assertEqual([e["source"] for e in store.get_edges(target_id="doc-1")], ["doc-2"])
+        self.assertEqual(store.get_edges(source_id="doc-1", edge_type="document_references"), [])
+        store.close()
+
+    def test_put_node_moves_types_and_keeps_order(self):
+        """Test that replacing a node updates its type entries in place."""
+        store = GraphNodeStore(self.db_path)
+        store.import_once(self.json_path, import_graph)
+
+        store.put_node("doc-1", {"id": "doc-1", "type": "archived"}, ["archived"])
+        store.put_node("doc-3", {"id": "doc-3", "type": "document"}, ["document"])
+
+        self.assertEqual(store.node_ids_by_type("document"), ["doc-2", "doc-3"])
+        self.assertEqual(store.node_ids_by_type("archived"), ["doc-1"])
+        self.assertEqual([node_id for node_id, _ in store.iter_nodes()], ["doc-1", "doc-2", "feature-1", "doc-3"])
+        store.close()
+
+    def test_connector_reads_edges_through_index(self):
+        """Test that document edge lookups use the store instead of scanning."""
+        store = GraphNodeStore(self.db_path)
+        store.import_once(self.json_path, import_graph)
+
+        connector = DocumentKnowledgeGraphConnector.__new__(DocumentKnowledgeGraphConnector)
+        connector.base_kg = StoreBackedKG(store)
+        connector.document_node_type = "document"
+
+        document_ids = asyncio.run(connector.get_documents_for_entity("feature", "feature-1"))
+
+        self.assertEqual(document_ids, ["doc-1"])
+        self.assertEqual(connector._get_node_edges("doc-1", "incoming")[0]["source"], "doc-2")
+        store.close()
+
+    def test_connector_writes_to_shared_graph_without_loading_it(self):
+        """Test that the connector opens the shared graph through its index and journals documents."""
+        graph_path = os.path.join(self.temp_dir, "shared", "knowledge_graph.json")
+        config = {"document_storage_dir": os.path.join(self.temp_dir, "documents")}
+        document = Document(id="doc-9", content="# Guide", metadata=DocumentMetadata(title="Guide"))
+
+        with patch.object(knowledge_graph_connector, "default_graph_path", return_value=graph_path):
+            connector = DocumentKnowledgeGraphConnector(config)
+            self.assertIsInstance(connector.base_kg, IndexedGraphFile)
+            self.assertTrue(asyncio.run(connector.add_document(document)))
+            connector.base_kg.close()
+
+            # Reopening reads the index instead of the graph file
+            with patch.object(IndexedGraphFile, "_rebuild") as rebuild:
+                connector = DocumentKnowledgeGraphConnector(config)
+            rebuild.assert_not_called()
+            self.assertEqual(connector.base_kg.get_node("doc-9")["properties"]["title"], "Guide")
+            connector.base_kg.close()
+
+        nodes = JournaledGraphStore(graph_path).load()["knowledge_graph"]["nodes"]
+        self.assertEqual(nodes["doc-9"]["type"], "document")
+
+
+if __name__ == '__main__':
+    unittest.main()
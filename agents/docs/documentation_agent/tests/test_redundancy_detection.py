@@ -9,6 +9,8 @@ and initiates appropriate handoffs.
 import unittest
 import asyncio
 import os
+import shutil
+import tempfile
 from unittest.mock import MagicMock, patch
 from datetime import datetime
 
@@ -17,12 +19,67 @@ from ..core.redundancy_detection import (
     RedundancyManager,
     RedundancyDetectionResult
 )
-from ..models.document_model import Document
+from ..models.document_model import Document, DocumentMetadata
 from ..connectors.vector_store_connector import DocumentVectorStoreConnector
 from ..connectors.knowledge_graph_connector import DocumentKnowledgeGraphConnector
 from ..core.inter_agent_handoff import HandoffManager, HandoffRegistry, HandoffStatus
 
 
+class TestCorpusSimilarity(unittest.TestCase):
+    """Test cases for the corpus TF-IDF model used by the detector."""
+    
+    def setUp(self):
+        """Set up a detector with plain mock connectors."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.model_path = os.path.join(self.temp_dir, "tfidf.npz")
+        self.detector = RedundancyDetector(
+            vector_store=MagicMock(),
+            knowledge_graph=MagicMock(),
+            config={"tfidf_model_path": self.model_path}
+        )
+    
+    def tearDown(self):
+        """Remove the saved model."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_compute_segment_similarity(self):
+        """Test segment similarity computation."""
+        segment1 = "Configure the logging handler before starting the server"
+        segment2 = "Configure the logging handler after starting the worker"
+        
+        # Without corpus statistics the TF-IDF terms are unknown: Jaccard fallback
+        self.assertAlmostEqual(
+            self.detector._compute_segment_similarity(segment1, segment2),
+            self.detector._compute_jaccard_similarity(segment1, segment2)
+        )
+        
+        # Once the corpus knows the terms, the corpus IDF weights are used
+        self.detector.corpus_model.update_document("doc1", segment1)
+        self.detector.corpus_model.update_document("doc2", segment2)
+        similarity = self.detector._compute_segment_similarity(segment1, segment2)
+        
+        self.assertGreater(similarity, 0.0)
+        self.assertLess(similarity, 1.0)
+        self.assertAlmostEqual(self.detector._compute_segment_similarity(segment1, segment1), 1.0)
+    
+    def test_corpus_model_is_saved_when_changed(self):
+        """Test that indexing persists the model to tfidf_model_path."""
+        documents = [
+            Document(id="doc1", metadata=DocumentMetadata(title="Logging"), content="Configure the logging handler"),
+            Document(id="doc2", metadata=DocumentMetadata(title="Deploy"), content="Deploy the server")
+        ]
+        
+        self.assertEqual(self.detector.index_documents(documents), 2)
+        self.assertTrue(os.path.exists(self.model_path))
+        self.assertFalse(self.detector.save_corpus_model())
+        
+        self.assertEqual(self.detector.remove_missing_documents({"doc1"}), 1)
+        self.assertTrue(self.detector.save_corpus_model())
+        
+        reloaded = RedundancyDetector(MagicMock(), MagicMock(), {"tfidf_model_path": self.model_path})
+        self.assertEqual(set(reloaded.corpus_model.doc_hashes), {"doc1"})
+
+
 class TestRedundancyDetection(unittest.TestCase):
     """Test cases for redundancy detection functionality."""
     
@@ -128,25 +185,6 @@ class TestRedundancyDetection(unittest.TestCase):
         
         self.assertEqual(len(segments), 3)  # Each paragraph should be its own segment
     
-    @patch('sklearn.feature_extraction.text.TfidfVectorizer')
-    @patch('sklearn.metrics.pairwise.cosine_similarity')
-    def test_compute_segment_similarity(self, mock_cosine, mock_tfidf):
-        """Test segment similarity computation."""
-        # Mock TF-IDF and cosine similarity
-        mock_tfidf_instance = MagicMock()
-        mock_tfidf.return_value = mock_tfidf_instance
-        mock_tfidf_instance.fit_transform.return_value = "transformed"
-        mock_cosine.return_value = [[0.75]]
-        
-        segment1 = "This is a test segment"
-        segment2 = "This is a similar segment"
-        
-        similarity = self.detector._compute_segment_similarity(segment1, segment2)
-        
-        self.assertEqual(similarity, 0.75)
-        mock_tfidf_instance.fit_transform.assert_called_once()
-        mock_cosine.assert_called_once()
-    
     @patch('asyncio.gather')
     async def test_detect_redundancy(self, mock_gather):
         """Test redundancy detection integration."""
@@ -0,0 +1,199 @@
+"""
+Tests for incremental redundancy scanning.
+
+This module tests that redundancy results are cached by content hash,
+invalidated when the document or a compared candidate changes, and that
+RedundancyManager.rescan_changed only re-analyzes affected documents.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from ..core.redundancy_detection import RedundancyManager, RedundancyDetectionResult
+from ..core.redundancy_result_store import RedundancyResultStore
+from ..models.document_model import Document, DocumentMetadata
+
+
+class FakeDetector:
+    """Detector stand-in with a fixed set of compared candidates per document."""
+
+    def __init__(self, compared, hashes=None):
+        self.compared = compared
+        self.hashes = hashes or {}
+        self.calls = []
+        self.current_ids = None
+        self.saves = 0
+
+    async def detect_redundancy(self, document):
+        self.calls.append(document.id)
+        result = RedundancyDetectionResult(source_doc_id=document.id, source_doc_title=document.title)
+        result.compared_doc_ids = self.compared[document.id]
+        result.compared_doc_hashes = {
+            doc_id: self.hashes[doc_id] for doc_id in result.compared_doc_ids if doc_id in self.hashes
+        }
+        return result
+
+    def remove_missing_documents(self, current_ids):
+        self.current_ids = set(current_ids)
+        return 0
+
+    def save_corpus_model(self):
+        self.saves += 1
+        return True
+
+
+def make_document(doc_id, content, updated_at=None):
+    document = Document(id=doc_id, metadata=DocumentMetadata(title=doc_id), content=content)
+    if updated_at:
+        document.metadata.updated_at = updated_at
+    document.title = doc_id
+    return document
+
+
+class TestRedundancyResultStore(unittest.TestCase):
+    """Test cases for RedundancyResultStore."""
+
+    def setUp(self):
+        """Set up a store with one result depending on another document."""
+        self.store = RedundancyResultStore()
+        self.store.record_content("a", "hash-a")
+        self.store.record_content("b", "hash-b")
+        self.store.put("a", {"source_doc_id": "a"}, "hash-a", {"b": None})
+
+    def test_get_requires_matching_hash(self):
+        """Test that results are only returned for the stored content hash."""
+        self.assertEqual(self.store.get("a", "hash-a"), {"source_doc_id": "a"})
+        self.assertIsNone(self.store.get("a", "other"))
+
+    def test_dependency_change_invalidates(self):
+        """Test that changing a compared document drops dependent results."""
+        self.assertEqual(self.store.entries["a"]["dependencies"], {"b": "hash-b"})
+
+        self.assertFalse(self.store.record_content("b", "hash-b"))
+        self.assertTrue(self.store.has_result("a"))
+
+        self.assertTrue(self.store.record_content("b", "hash-b2"))
+        self.assertFalse(self.store.has_result("a"))
+        self.assertNotIn("b", self.store.dependents)
+
+    def test_unknown_dependency_adopts_first_recorded_hash(self):
+        """Test that first recording a compared document does not invalidate the result."""
+        self.store.record_content("c", "hash-c")
+        self.store.put("c", {"source_doc_id": "c"}, "hash-c", {"d": None})
+
+        self.assertTrue(self.store.record_content("d", "hash-d"))
+        self.assertEqual(self.store.get("c", "hash-c"), {"source_doc_id": "c"})
+        self.assertEqual(self.store.entries["c"]["dependencies"], {"d": "hash-d"})
+
+        self.store.record_content("d", "hash-d2")
+        self.assertFalse(self.store.has_result("c"))
+
+    def test_save_and_load(self):
+        """Test that a saved store reloads with its dependency index."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, "results.json")
+            self.assertTrue(self.store.save(path))
+
+            reloaded = RedundancyResultStore(storage_path=path)
+
+            self.assertEqual(reloaded.get("a", "hash-a"), {"source_doc_id": "a"})
+            self.assertEqual(reloaded.dependents, {"b": {"a"}})
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+class TestIncrementalRedundancyManager(unittest.TestCase):
+    """Test cases for incremental RedundancyManager scans."""
+
+    def setUp(self):
+        """Set up a manager over three documents."""
+        self.documents = {
+            doc_id: make_document(doc_id, f"content of {doc_id}")
+            for doc_id in ("a", "b", "c")
+        }
+        # "a" is compared against "b", "b" against "c", "c" against nothing
+        self.detector = FakeDetector({"a": ["b"], "b": ["c"], "c": []})
+        self.manager = RedundancyManager(detector=self.detector, handoff_manager=MagicMock())
+
+    def test_process_document_reuses_unchanged_result(self):
+        """Test that an unchanged document is not re-analyzed."""
+        first = asyncio.run(self.manager.process_document(self.documents["a"]))
+        second = asyncio.run(self.manager.process_document(self.documents["a"]))
+
+        self.assertEqual(self.detector.calls, ["a"])
+        self.assertEqual(second.compared_doc_ids, first.compared_doc_ids)
+
+        asyncio.run(self.manager.process_document(self.documents["a"], force=True))
+        self.assertEqual(self.detector.calls, ["a", "a"])
+
+    def test_rescan_changed_follows_dependencies(self):
+        """Test that a rescan only re-analyzes changed documents and their dependents."""
+        documents = list(self.documents.values())
+        results = asyncio.run(self.manager.rescan_changed(documents=documents))
+        self.assertEqual(set(results), {"a", "b", "c"})
+
+        # Nothing changed: nothing is re-analyzed
+        self.detector.calls = []
+        self.assertEqual(asyncio.run(self.manager.rescan_changed(documents=documents)), {})
+        self.assertEqual(self.detector.calls, [])
+
+        # Changing "c" invalidates "c" and "b", which was compared against it
+        self.documents["c"].content = "changed content of c"
+
+        results = asyncio.run(self.manager.rescan_changed(documents=documents))
+
+        self.assertEqual(set(results), {"b", "c"})
+
+        # A full scan that no longer finds "b" invalidates "a"
+        async def get_all_documents():
+            return [self.documents["a"], self.documents["c"]]
+
+        self.manager._get_all_documents = get_all_documents
+
+        results = asyncio.run(self.manager.rescan_changed())
+
+        self.assertEqual(set(results), {"a"})
+        self.assertNotIn("b", self.manager.result_store.document_hashes)
+        self.assertEqual(self.detector.current_ids, {"a", "c"})
+        self.assertGreater(self.detector.saves, 0)
+
+    def test_compared_hashes_come_from_fetched_content(self):
+        """Test that candidates unknown to the store are keyed on the content the detector fetched."""
+        store = RedundancyResultStore()
+        detector = FakeDetector({"a": ["x", "y"], "x": [], "y": []}, hashes={"x": store.content_hash("content of x")})
+        manager = RedundancyManager(detector=detector, handoff_manager=MagicMock(), result_store=store)
+
+        asyncio.run(manager.process_document(self.documents["a"]))
+
+        self.assertEqual(store.entries["a"]["dependencies"],
+                         {"x": store.content_hash("content of x"), "y": None})
+
+        # Hashing the same candidates during a rescan keeps the result
+        others = [make_document(doc_id, f"content of {doc_id}") for doc_id in ("x", "y")]
+        detector.calls = []
+        results = asyncio.run(manager.rescan_changed(documents=[self.documents["a"]] + others))
+
+        self.assertNotIn("a", results)
+        self.assertNotIn("a", detector.calls)
+
+    def test_rescan_changed_since_skips_old_documents(self):
+        """Test that documents older than the cutoff are not re-hashed."""
+        documents = list(self.documents.values())
+        asyncio.run(self.manager.rescan_changed(documents=documents))
+
+        cutoff = datetime.now() + timedelta(hours=1)
+        self.documents["a"].content = "edited without touching updated_at"
+        self.detector.calls = []
+
+        self.assertEqual(asyncio.run(self.manager.rescan_changed(since=cutoff, documents=documents)), {})
+        self.assertEqual(self.detector.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
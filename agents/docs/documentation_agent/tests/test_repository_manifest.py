@@ -0,0 +1,147 @@
+"""
+Tests for incremental repository scanning.
+
+This module tests that the repository connector compares scans with its
+file-state manifest, prunes ignored directories, and only reprocesses
+added and changed files.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+
+from ..connectors.repository_connector import RepositoryConnector
+
+
+class RecordingProcessor:
+    """Pipeline processor that records the documents it receives."""
+
+    def __init__(self):
+        self.paths = []
+
+    async def process_document(self, document):
+        self.paths.append(os.path.basename(document.metadata.source_path))
+        return document
+
+
+class TestRepositoryManifest(unittest.TestCase):
+    """Test cases for the repository file-state manifest."""
+
+    def setUp(self):
+        """Set up a small repository in a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.repo = os.path.join(self.temp_dir, "repo")
+        os.makedirs(os.path.join(self.repo, "src"))
+        os.makedirs(os.path.join(self.repo, "node_modules", "lib"))
+
+        self.write("README.md", "# Repo\n")
+        self.write("src/main.py", "print('hello')\n")
+        self.write("src/util.py", "def util():\n    pass\n")
+        self.write("node_modules/lib/index.js", "module.exports = {};\n")
+
+        self.connector = RepositoryConnector({"repository": {
+            "base_path": self.repo,
+            "git_enabled": False,
+            "manifest_dir": os.path.join(self.temp_dir, "manifests")
+        }})
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, rel_path, content):
+        """Write a file in the repository."""
+        with open(os.path.join(self.repo, rel_path), "w") as f:
+            f.write(content)
+
+    def scan(self):
+        """Scan the repository for changes and accept them into the manifest."""
+        changes = asyncio.run(self.connector.scan_changes(self.repo))
+        manifest = self.connector.get_manifest(self.repo)
+        for rel_path in changes.modified:
+            manifest.record(rel_path, changes.states[rel_path])
+        for rel_path in changes.deleted:
+            manifest.remove(rel_path)
+        return changes
+
+    def test_scan_prunes_ignored_directories(self):
+        """Test that ignored directories are not descended into."""
+        file_paths = asyncio.run(self.connector.scan_repository(self.repo))
+        rel_paths = sorted(os.path.relpath(path, self.repo) for path in file_paths)
+
+        self.assertEqual(rel_paths, ["README.md", "src/main.py", "src/util.py"])
+
+    def test_repeated_scans_report_only_differences(self):
+        """Test added, unchanged, changed and deleted files across scans."""
+        first = self.scan()
+        self.assertEqual(sorted(first.added), ["README.md", "src/main.py", "src/util.py"])
+
+        second = self.scan()
+        self.assertFalse(second.has_changes())
+        self.assertEqual(len(second.unchanged), 3)
+
+        # Touch one file without changing it, and modify and delete others
+        main_path = os.path.join(self.repo, "src", "main.py")
+        stat = os.stat(main_path)
+        os.utime(main_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.write("src/util.py", "def util():\n    return 1\n")
+        os.remove(os.path.join(self.repo, "README.md"))
+
+        third = self.scan()
+        self.assertEqual(third.added, [])
+        self.assertEqual(third.changed, ["src/util.py"])
+        self.assertEqual(third.deleted, ["README.md"])
+        self.assertIn("src/main.py", third.unchanged)
+
+    def test_manifest_persists_between_connectors(self):
+        """Test that a new connector resumes from the saved manifest."""
+        self.scan()
+        self.connector.get_manifest(self.repo).save()
+
+        connector = RepositoryConnector(self.connector.config)
+        changes = asyncio.run(connector.scan_changes(self.repo))
+
+        self.assertFalse(changes.has_changes())
+
+    def test_process_repository_skips_unchanged_files(self):
+        """Test that only added and changed files go through the pipeline."""
+        options = {"incremental": True}
+        processor = RecordingProcessor()
+        documents = asyncio.run(self.connector.process_repository(self.repo, processor, options=options))
+        self.assertEqual(len(documents), 3)
+
+        processor = RecordingProcessor()
+        self.write("src/main.py", "print('changed')\n")
+        documents = asyncio.run(self.connector.process_repository(self.repo, processor, options=options))
+
+        self.assertEqual(len(documents), 1)
+        self.assertEqual(processor.paths, ["main.py"])
+        self.assertEqual(self.connector.last_changes.changed, ["src/main.py"])
+
+    def test_incremental_scans_are_opt_in(self):
+        """Test that by default every file is processed on every run."""
+        for _ in range(2):
+            documents = asyncio.run(self.connector.process_repository(self.repo, RecordingProcessor()))
+            self.assertEqual(len(documents), 3)
+
+        self.assertEqual(os.listdir(os.path.join(self.temp_dir)), ["repo"])
+
+    def test_destinations_have_their_own_manifests(self):
+        """Test that one destination's run does not hide changes from another."""
+        for key in ("index", "search"):
+            documents = asyncio.run(self.connector.process_repository(
+                self.repo, RecordingProcessor(), options={"incremental": True, "manifest_key": key}))
+            self.assertEqual(len(documents), 3)
+
+        self.write("src/main.py", "print('changed')\n")
+        for key in ("index", "search"):
+            processor = RecordingProcessor()
+            asyncio.run(self.connector.process_repository(
+                self.repo, processor, options={"incremental": True, "manifest_key": key}))
+            self.assertEqual(processor.paths, ["main.py"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""
+Tests for the streaming repository pipeline.
+
+This module tests that iter_repository yields documents as they complete,
+applies backpressure through its bounded queues, runs CPU-bound steps in a
+process pool, and records pipeline metrics.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+
+from ..connectors.repository_connector import RepositoryConnector
+
+
+def count_lines(document):
+    """CPU-bound step run in the process pool."""
+    document.metadata.custom_metadata["line_count"] = len(document.content.splitlines())
+    document.metadata.custom_metadata["pid"] = os.getpid()
+    return document
+
+
+class DelayProcessor:
+    """Pipeline processor that is slow for one file."""
+
+    def __init__(self, slow_name=None, delay=0.3):
+        self.slow_name = slow_name
+        self.delay = delay
+
+    async def process_document(self, document):
+        if os.path.basename(document.metadata.source_path) == self.slow_name:
+            await asyncio.sleep(self.delay)
+        return document
+
+
+class FailingProcessor:
+    """Pipeline processor that fails for one file."""
+
+    async def process_document(self, document):
+        if document.metadata.source_path.endswith("file_3.py"):
+            raise ValueError("cannot process")
+        return document
+
+
+class TestRepositoryPipeline(unittest.TestCase):
+    """Test cases for the streaming repository pipeline."""
+
+    def setUp(self):
+        """Set up a repository of small files in a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.repo = os.path.join(self.temp_dir, "repo")
+        os.makedirs(self.repo)
+        for i in range(20):
+            with open(os.path.join(self.repo, f"file_{i}.py"), "w") as f:
+                f.write("x = 1\n" * (i + 1))
+
+        self.connector = RepositoryConnector({"repository": {
+            "base_path": self.repo,
+            "git_enabled": False,
+            "manifest_dir": os.path.join(self.temp_dir, "manifests")
+        }})
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def collect(self, processor, options):
+        """Run the pipeline and return the processed file names in yield order."""
+        async def run():
+            return [os.path.basename(document.metadata.source_path)
+                    async for document in self.connector.iter_repository(self.repo, processor, options=options)]
+        return asyncio.run(run())
+
+    def test_slow_file_does_not_hold_back_others(self):
+        """Test that documents are yielded in completion order."""
+        names = self.collect(DelayProcessor("file_0.py"), {"workers": 4, "incremental": False})
+
+        self.assertEqual(len(names), 20)
+        self.assertEqual(names[-1], "file_0.py")
+
+    def test_failed_files_are_counted_and_retried(self):
+        """Test that failures are skipped, counted and left out of the manifest."""
+        names = self.collect(FailingProcessor(), {"workers": 3, "incremental": True,
+                                                  "manifest_key": "index"})
+
+        self.assertEqual(len(names), 19)
+        self.assertEqual(self.connector.last_metrics.files_failed, 1)
+        self.assertEqual(self.connector.last_metrics.files_processed, 19)
+
+        # Only the failed file is picked up again
+        names = self.collect(DelayProcessor(), {"workers": 3, "incremental": True, "manifest_key": "index"})
+        self.assertEqual(names, ["file_3.py"])
+
+    def test_bounded_queues_apply_backpressure(self):
+        """Test that a slow consumer throttles the workers."""
+        async def run():
+            count = 0
+            async for _ in self.connector.iter_repository(
+                    self.repo, DelayProcessor(), options={"workers": 2, "queue_size": 2, "incremental": False}):
+                await asyncio.sleep(0.01)
+                count += 1
+            return count
+
+        self.assertEqual(asyncio.run(run()), 20)
+
+        metrics = self.connector.last_metrics
+        self.assertLessEqual(metrics.max_input_depth, 2)
+        self.assertLessEqual(metrics.max_output_depth, 2)
+        self.assertGreater(metrics.output_wait_seconds, 0)
+        self.assertGreater(metrics.throughput, 0)
+
+    def test_cpu_processor_runs_in_process_pool(self):
+        """Test that the CPU-bound step runs in worker processes."""
+        async def run():
+            return [document async for document in self.connector.iter_repository(
+                self.repo, DelayProcessor(),
+                options={"cpu_processor": count_lines, "process_workers": 2, "incremental": False})]
+
+        documents = asyncio.run(run())
+
+        self.assertEqual(len(documents), 20)
+        for document in documents:
+            name = os.path.basename(document.metadata.source_path)
+            expected = int(name[len("file_"):-len(".py")]) + 1
+            self.assertEqual(document.metadata.custom_metadata["line_count"], expected)
+            self.assertNotEqual(document.metadata.custom_metadata["pid"], os.getpid())
+
+    def test_stopping_early_cancels_workers(self):
+        """Test that closing the generator early shuts the pipeline down."""
+        async def run():
+            stream = self.connector.iter_repository(self.repo, DelayProcessor(),
+                                                    options={"workers": 2, "incremental": False})
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first
+
+        self.assertIsNotNone(asyncio.run(run()))
+        self.assertEqual(self.connector.last_metrics.files_processed, 1)
+
+    def test_scanner_errors_are_raised(self):
+        """Test that a failing walk stops the pipeline instead of hanging it."""
+        def broken_walk(repo_path, extensions, matcher):
+            yield "file_0.py", None
+            raise OSError("walk failed")
+
+        self.connector._iter_files = broken_walk
+
+        async def run():
+            names = []
+            with self.assertRaises(OSError):
+                async for document in self.connector.iter_repository(
+                        self.repo, DelayProcessor(), options={"workers": 3, "incremental": False}):
+                    names.append(os.path.basename(document.metadata.source_path))
+            return names
+
+        self.assertLessEqual(len(asyncio.run(asyncio.wait_for(run(), timeout=5))), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
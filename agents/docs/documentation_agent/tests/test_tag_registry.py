@@ -0,0 +1,123 @@
+"""
+Tests for the tag registry suggestion indices.
+
+This module tests that TagRegistry.suggest_tags serves prefix, substring
+and fuzzy matches from its trie and n-gram indices, ranks them by usage,
+and keeps the indices in sync with tag registration, updates and deletion.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from ..tagging.tag_registry import TagRegistry
+from ..tagging.tag_index import TagTrie, TagNgramIndex
+from ..models.tag_model import Tag, TagType, TagSet
+
+
+class TestTagIndex(unittest.TestCase):
+    """Test cases for the trie and n-gram index structures."""
+
+    def test_trie_prefix_and_remove(self):
+        """Test prefix lookups and branch pruning on removal."""
+        trie = TagTrie()
+        trie.insert("python", "t1")
+        trie.insert("pytest", "t2")
+        trie.insert("rust", "t3")
+
+        self.assertEqual(trie.find_prefix("py"), {"t1", "t2"})
+        self.assertEqual(trie.find_prefix("pyt"), {"t1", "t2"})
+        self.assertEqual(trie.find_prefix("go"), set())
+
+        self.assertTrue(trie.remove("pytest", "t2"))
+        self.assertFalse(trie.remove("pytest", "t2"))
+        self.assertEqual(trie.find_prefix("py"), {"t1"})
+        self.assertNotIn("e", trie.root["children"]["p"]["children"]["y"]["children"]["t"]["children"])
+        self.assertEqual(trie.size, 2)
+
+    def test_ngram_candidates(self):
+        """Test short and long substring candidate lookups."""
+        index = TagNgramIndex(n=3)
+        index.insert("machine-learning", "t1")
+        index.insert("learning-path", "t2")
+        index.insert("rust", "t3")
+
+        self.assertEqual(index.find_candidates("ar"), {"t1", "t2"})
+        self.assertEqual(index.find_candidates("learn"), {"t1", "t2"})
+        self.assertEqual(index.find_candidates("xyz"), set())
+
+        index.remove("learning-path", "t2")
+        self.assertEqual(index.find_candidates("learn"), {"t1"})
+        self.assertNotIn("pat", index.postings)
+
+
+class TestTagRegistrySuggestions(unittest.TestCase):
+    """Test cases for TagRegistry.suggest_tags."""
+
+    def setUp(self):
+        """Set up a registry backed by a temporary file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.registry = TagRegistry({
+            "tagging": {
+                "registry": {"storage_path": os.path.join(self.temp_dir, "tag_registry.json")}
+            }
+        })
+        for tag_id, name in [
+            ("t1", "Python"),
+            ("t2", "PyTorch"),
+            ("t3", "Mypy"),
+            ("t4", "Rust"),
+            ("t5", "Python Packaging"),
+        ]:
+            self.registry.register_tag(Tag(id=tag_id, name=name, type=TagType.TECHNOLOGY))
+
+    def tearDown(self):
+        """Remove the temporary registry file."""
+        shutil.rmtree(self.temp_dir)
+
+    def _names(self, tags):
+        return [tag.name for tag in tags]
+
+    def test_prefix_before_substring(self):
+        """Test that prefix matches come before substring matches."""
+        suggestions = self._names(self.registry.suggest_tags("py", max_suggestions=10, fuzzy=False))
+
+        self.assertEqual(set(suggestions[:3]), {"Python", "PyTorch", "Python Packaging"})
+        self.assertEqual(suggestions[3:], ["Mypy"])
+
+    def test_ranked_by_usage(self):
+        """Test that more frequently used tags are suggested first."""
+        self.registry.register_tag_set(TagSet(id="s1", name="ML", tags=["t2"]))
+        self.registry.update_tag("t5", {"metadata": {"usage_count": 5}})
+
+        suggestions = self._names(self.registry.suggest_tags("py", max_suggestions=3))
+
+        self.assertEqual(suggestions, ["Python Packaging", "PyTorch", "Python"])
+
+    def test_fuzzy_fallback(self):
+        """Test that near misses are suggested when nothing matches exactly."""
+        self.assertEqual(self._names(self.registry.suggest_tags("pythn", fuzzy=False)), [])
+        self.assertIn("Python", self._names(self.registry.suggest_tags("pythoon")))
+
+    def test_indices_follow_updates(self):
+        """Test that renames and deletions are reflected in suggestions."""
+        self.registry.update_tag("t4", {"name": "Rustlang"})
+        self.assertEqual(self._names(self.registry.suggest_tags("rustl")), ["Rustlang"])
+
+        self.registry.delete_tag("t1")
+        suggestions = self._names(self.registry.suggest_tags("pyth", fuzzy=False))
+        self.assertEqual(suggestions, ["Python Packaging"])
+
+    def test_indices_rebuilt_on_load(self):
+        """Test that a reloaded registry serves the same suggestions."""
+        reloaded = TagRegistry(self.registry.config)
+
+        self.assertEqual(
+            self._names(reloaded.suggest_tags("py", max_suggestions=10)),
+            self._names(self.registry.suggest_tags("py", max_suggestions=10))
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
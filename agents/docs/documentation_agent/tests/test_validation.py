@@ -0,0 +1,311 @@
+"""
+Tests for the document validation engine.
+
+This module tests that documents are parsed once into a shared structure
+consumed by every validator, that batch validation respects its
+concurrency cap, that CPU-bound validators can run in a process pool, and
+that validator results are cached by content and configuration.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+
+from ..models.document_model import Document, DocumentMetadata, DocumentType
+from ..models.validation_result import ValidationIssue, ValidationResult, ValidationSeverity, ValidationType
+from ..validation.parsed_document import ParsedDocument
+from ..validation.validation_manager import ValidationManager
+
+SAMPLE_CONTENT = """# Getting Started
+
+This guide was written for new users. It explains the setup, e.g. installing the tools.
+
+## Installation
+
+Run `pip install devloop` and configure the service.
+
+```python
+import os
+print(os.getcwd())
+```
+
+- First step
+- Second step
+
+See [the API reference](./api.md) or https://example.com/docs for details.
+
+$ git commit -m fix
+"""
+
+
+def make_document(doc_id, content=SAMPLE_CONTENT):
+    """Create a markdown document."""
+    return Document(
+        id=doc_id,
+        metadata=DocumentMetadata(title=doc_id, document_type=DocumentType.MARKDOWN),
+        content=content
+    )
+
+
+# Validator results are only cached when enabled
+CACHED = {"validation": {"cache_enabled": True}}
+
+
+class RecordingValidator:
+    """Validator that records the parses it receives and its peak concurrency."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.parses = []
+        self.active = 0
+        self.peak = 0
+
+    async def validate(self, document, parsed=None):
+        self.parses.append(parsed)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return []
+
+
+class CountingValidator:
+    """Cacheable validator that counts its runs and reports one issue per heading."""
+
+    def __init__(self):
+        self.calls = 0
+        self.level = 1
+
+    def configure(self, config):
+        self.level = config.get("level", self.level)
+
+    def get_cache_config(self):
+        return {"level": self.level}
+
+    async def validate(self, document, parsed=None):
+        self.calls += 1
+        return [
+            ValidationIssue(id=f"heading-{line}", type=ValidationType.CUSTOM,
+                            severity=ValidationSeverity.INFO, message=text)
+            for line, level, text in parsed.headings if level >= self.level
+        ]
+
+
+class FakeKnowledgeGraph:
+    """Knowledge graph connector with a batch document lookup."""
+
+    def __init__(self, documents):
+        self.documents = {document.id: document for document in documents}
+        self.batches = []
+
+    async def get_documents(self, document_ids):
+        self.batches.append(list(document_ids))
+        return {doc_id: self.documents[doc_id] for doc_id in document_ids if doc_id in self.documents}
+
+
+class TestParsedDocument(unittest.TestCase):
+    """Test cases for the shared document parse."""
+
+    def test_structure(self):
+        """Test headings, code blocks, links, commands and sentences."""
+        parsed = ParsedDocument(SAMPLE_CONTENT)
+
+        self.assertEqual(parsed.headings, [(1, 1, "Getting Started"), (5, 2, "Installation")])
+        self.assertEqual(parsed.code_blocks, [("python", "import os\nprint(os.getcwd())")])
+        self.assertIn("pip install devloop", parsed.inline_codes)
+        self.assertEqual(parsed.markdown_links, [("the API reference", "./api.md")])
+        self.assertEqual(parsed.urls, ["https://example.com/docs"])
+        self.assertEqual([marker for _, marker in parsed.bullet_items], ["-", "-"])
+        self.assertEqual(parsed.commands, ["git commit -m fix"])
+        self.assertTrue(parsed.has_heading("Install"))
+
+        # Code and URLs are stripped and abbreviations do not split sentences
+        self.assertNotIn("print", parsed.readable_text)
+        self.assertIn("It explains the setup, e.g. installing the tools", parsed.sentences)
+
+
+class TestValidationManager(unittest.TestCase):
+    """Test cases for the validation manager."""
+
+    def test_validators_share_one_parse(self):
+        """Test that every validator receives the same parse."""
+        manager = ValidationManager({})
+        recorders = {name: RecordingValidator() for name in manager.validators}
+        manager.validators = recorders
+
+        asyncio.run(manager.validate_document(make_document("doc")))
+
+        parses = [recorder.parses[0] for recorder in recorders.values()]
+        self.assertIsInstance(parses[0], ParsedDocument)
+        self.assertTrue(all(parsed is parses[0] for parsed in parses))
+
+    def test_batch_respects_concurrency_cap(self):
+        """Test that at most max_concurrency documents are validated at once."""
+        manager = ValidationManager({"validation": {"max_concurrency": 2}})
+        recorder = RecordingValidator(delay=0.01)
+        manager.validators = {"recording": recorder}
+
+        documents = [make_document(f"doc-{i}") for i in range(10)]
+        results = asyncio.run(manager.validate_multiple_documents(documents))
+
+        self.assertEqual(len(results), 10)
+        self.assertEqual(recorder.peak, 2)
+
+    def test_builtin_validators_run_cleanly(self):
+        """Test that the built-in validators report issues without validator errors."""
+        manager = ValidationManager({})
+        result = asyncio.run(manager.validate_document(make_document("doc")))
+
+        issue_ids = [issue.id for issue in result.issues]
+        self.assertFalse(any(issue_id.startswith("validator-error") for issue_id in issue_ids))
+        self.assertIn("git-commit-message-quotes-0", issue_ids)
+
+    def test_cpu_validators_run_in_process_pool(self):
+        """Test that pool and in-process readability validation agree."""
+        content = SAMPLE_CONTENT + "\nThe results were reviewed. The report was written. The bug was fixed.\n"
+        document = make_document("doc", content)
+
+        inline = ValidationManager({})
+        pooled = ValidationManager({"validation": {"process_workers": 2}})
+        try:
+            expected = asyncio.run(inline.validate_document(document, ["readability"]))
+            actual = asyncio.run(pooled.validate_document(document, ["readability"]))
+            self.assertIsNotNone(pooled.process_pool)
+        finally:
+            pooled.close()
+
+        self.assertEqual([issue.id for issue in actual.issues], [issue.id for issue in expected.issues])
+        self.assertIn("excessive-passive-voice", [issue.id for issue in actual.issues])
+
+
+class TestValidationCache(unittest.TestCase):
+    """Test cases for cached validator results."""
+
+    def setUp(self):
+        """Set up a manager with one cacheable and one uncacheable validator."""
+        self.manager = ValidationManager(CACHED)
+        self.counting = CountingValidator()
+        self.recording = RecordingValidator()
+        self.manager.validators = {"counting": self.counting, "recording": self.recording}
+
+    def test_unchanged_document_is_not_revalidated(self):
+        """Test that a second run reuses the cached issues."""
+        first = asyncio.run(self.manager.validate_document(make_document("doc")))
+        second = asyncio.run(self.manager.validate_document(make_document("doc")))
+
+        self.assertEqual(self.counting.calls, 1)
+        self.assertEqual(len(self.recording.parses), 2)
+        self.assertEqual([issue.to_dict() for issue in second.issues],
+                         [issue.to_dict() for issue in first.issues])
+        self.assertEqual(second.issues[0].metadata["validator"], "counting")
+
+    def test_changed_content_or_config_revalidates(self):
+        """Test that new content or a new configuration misses the cache."""
+        asyncio.run(self.manager.validate_document(make_document("doc")))
+        asyncio.run(self.manager.validate_document(make_document("doc", SAMPLE_CONTENT + "\n## Usage\n")))
+        self.assertEqual(self.counting.calls, 2)
+
+        self.manager.configure_validator("counting", {"level": 2})
+        result = asyncio.run(self.manager.validate_document(make_document("doc")))
+        self.assertEqual(self.counting.calls, 3)
+        self.assertEqual([issue.message for issue in result.issues], ["Installation"])
+
+        result = asyncio.run(self.manager.validate_document(make_document("doc"), use_cache=False))
+        self.assertEqual(self.counting.calls, 4)
+
+    def test_stored_result_seeds_cache(self):
+        """Test that a result stored with the document skips validation in a new manager."""
+        result = asyncio.run(self.manager.validate_document(make_document("doc")))
+
+        document = make_document("doc")
+        document.validation_results = ValidationResult.from_dict(result.to_dict())
+        manager = ValidationManager(CACHED)
+        counting = CountingValidator()
+        manager.validators = {"counting": counting}
+
+        reused = asyncio.run(manager.validate_document(document))
+
+        self.assertEqual(counting.calls, 0)
+        self.assertEqual([issue.id for issue in reused.issues],
+                         [issue.id for issue in result.issues])
+
+    def test_batch_loads_documents_together_and_persists_cache(self):
+        """Test batch document loading and the cache file."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            cache_path = os.path.join(temp_dir, "validation_cache.json")
+            documents = [make_document(f"doc-{i}", f"# Doc {i}\n") for i in range(3)]
+            kg = FakeKnowledgeGraph(documents)
+
+            manager = ValidationManager({"validation": {"cache_enabled": True, "cache_path": cache_path}},
+                                        knowledge_graph=kg)
+            manager.validators = {"counting": self.counting}
+            results = asyncio.run(manager.validate_document_batch(["doc-0", "doc-1", "missing", "doc-2"]))
+
+            self.assertEqual(kg.batches, [["doc-0", "doc-1", "missing", "doc-2"]])
+            self.assertEqual(sorted(results), ["doc-0", "doc-1", "doc-2"])
+            self.assertTrue(os.path.exists(cache_path))
+
+            # A new manager resumes from the saved cache
+            manager = ValidationManager({"validation": {"cache_enabled": True, "cache_path": cache_path}},
+                                        knowledge_graph=kg)
+            counting = CountingValidator()
+            manager.validators = {"counting": counting}
+            asyncio.run(manager.validate_document_batch(["doc-0", "doc-1", "doc-2"]))
+
+            self.assertEqual(counting.calls, 0)
+            self.assertEqual(manager.cache.get_stats()["hits"], 3)
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_builtin_validators_are_cacheable(self):
+        """Test that the built-in validators produce the same issues from the cache."""
+        manager = ValidationManager(CACHED)
+        first = asyncio.run(manager.validate_document(make_document("doc")))
+        second = asyncio.run(manager.validate_document(make_document("doc")))
+
+        self.assertEqual(manager.cache.get_stats()["hits"], len(manager.validators))
+        self.assertEqual([issue.id for issue in second.issues], [issue.id for issue in first.issues])
+
+        manager.configure_validator("readability", {"max_sentence_length": 5})
+        asyncio.run(manager.validate_document(make_document("doc")))
+        self.assertEqual(manager.cache.get_stats()["hits"], 2 * len(manager.validators) - 1)
+
+    def test_cache_is_off_by_default(self):
+        """Test that validators run every time unless caching is enabled."""
+        manager = ValidationManager({})
+        counting = CountingValidator()
+        manager.validators = {"counting": counting}
+        asyncio.run(manager.validate_document(make_document("doc")))
+        asyncio.run(manager.validate_document(make_document("doc")))
+
+        self.assertEqual(counting.calls, 2)
+
+    def test_document_fields_are_part_of_the_key(self):
+        """Test that documents sharing content but not metadata get their own results."""
+        manager = ValidationManager(CACHED)
+        guide = make_document("guide")
+        reference = Document(id="reference", content=SAMPLE_CONTENT,
+                             metadata=DocumentMetadata(title="API", document_type=DocumentType.API_SPEC))
+
+        first = asyncio.run(manager.validate_document(guide, validators=["completeness"]))
+        cached = asyncio.run(manager.validate_document(reference, validators=["completeness"]))
+        fresh = asyncio.run(ValidationManager({}).validate_document(reference, validators=["completeness"]))
+
+        self.assertEqual([issue.id for issue in cached.issues], [issue.id for issue in fresh.issues])
+        self.assertNotEqual([issue.id for issue in cached.issues], [issue.id for issue in first.issues])
+
+    def test_knowledge_graph_checks_are_not_cached(self):
+        """Test that consistency checks reading related documents always run."""
+        manager = ValidationManager(CACHED, knowledge_graph=FakeKnowledgeGraph([]))
+        asyncio.run(manager.validate_document(make_document("doc"), validators=["consistency"]))
+        result = asyncio.run(manager.validate_document(make_document("doc"), validators=["consistency"]))
+
+        self.assertEqual(manager.cache.get_stats()["hits"], 0)
+        self.assertNotIn("consistency", result.metadata["validator_keys"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,11 +13,16 @@ from typing import Dict, List, Any, Optional, Set
 # Import validation models
 from ..models.document_model import Document, DocumentType
 from ..models.validation_result import ValidationIssue, ValidationSeverity, ValidationType
+from .parsed_document import ParsedDocument
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+ENDPOINT_PATTERN = re.compile(r"(GET|POST|PUT|DELETE|PATCH)\s+(/[a-zA-Z0-9_/-]+)")
+REQUEST_EXAMPLE_PATTERN = re.compile(r"request.*?example|example.*?request", re.IGNORECASE)
+RESPONSE_EXAMPLE_PATTERN = re.compile(r"response.*?example|example.*?response", re.IGNORECASE)
+
 class CompletenessValidator:
     """
     Completeness validator for checking document content coverage.
@@ -71,12 +76,46 @@ class CompletenessValidator:
         
         logger.info("Completeness validator configuration updated")
     
-    async def validate(self, document: Document) -> List[ValidationIssue]:
+    def get_cache_config(self) -> Dict[str, Any]:
+        """
+        Get the settings and rules that determine this validator's output.
+        
+        Returns:
+            Dictionary hashed into the validation cache key
+        """
+        return {
+            "check_mandatory_sections": self.check_mandatory_sections,
+            "check_examples": self.check_examples,
+            "check_api_docs": self.check_api_docs,
+            "check_related_content": self.check_related_content,
+            "required_sections": self.required_sections,
+            "example_requirements": self.example_requirements,
+            "relationship_requirements": self.relationship_requirements
+        }
+    
+    def get_cache_inputs(self, document: Document) -> Dict[str, Any]:
+        """
+        Get the document fields besides its content that this validator reads.
+        
+        Args:
+            document: Document to validate
+            
+        Returns:
+            Dictionary hashed into the validation cache key
+        """
+        return {
+            "title": document.metadata.title,
+            "document_type": document.metadata.document_type.value,
+            "relationship_types": sorted(rel.relationship_type for rel in document.relationships) if self.kg else []
+        }
+    
+    async def validate(self, document: Document, parsed: Optional[ParsedDocument] = None) -> List[ValidationIssue]:
         """
         Validate document completeness.
         
         Args:
             document: Document to validate
+            parsed: Shared parse of the document (parsed here if not given)
             
         Returns:
             List of validation issues
@@ -84,42 +123,43 @@ class CompletenessValidator:
         logger.info(f"Validating completeness for document: {document.id}")
         
         issues = []
+        parsed = parsed or ParsedDocument(document.content)
         
         # Check mandatory sections
         if self.check_mandatory_sections:
-            section_issues = await self._validate_mandatory_sections(document)
+            section_issues = await self._validate_mandatory_sections(document, parsed)
             issues.extend(section_issues)
         
         # Check for examples
         if self.check_examples:
-            example_issues = await self._validate_examples(document)
+            example_issues = await self._validate_examples(document, parsed)
             issues.extend(example_issues)
         
         # Check API documentation
         if self.check_api_docs:
-            api_issues = await self._validate_api_documentation(document)
+            api_issues = await self._validate_api_documentation(document, parsed)
             issues.extend(api_issues)
         
         # Check related content
         if self.check_related_content:
-            relation_issues = await self._validate_related_content(document)
+            relation_issues = await self._validate_related_content(document, parsed)
             issues.extend(relation_issues)
         
         logger.info(f"Completeness validation completed for document {document.id}: {len(issues)} issues found")
         return issues
     
-    async def _validate_mandatory_sections(self, document: Document) -> List[ValidationIssue]:
+    async def _validate_mandatory_sections(self, document: Document, parsed: ParsedDocument) -> List[ValidationIssue]:
         """
         Validate that document contains all mandatory sections.
         
         Args:
             document: Document to validate
+            parsed: Parsed document
             
         Returns:
             List of validation issues
         """
         issues = []
-        content = document.content
         
         # Get document type
         doc_type = document.metadata.document_type
@@ -129,16 +169,8 @@ class CompletenessValidator:
         if not required_sections:
             return issues  # No required sections for this document type
         
-        # Extract headings from document
-        heading_pattern = r"^(#+)\s+(.+)$"
-        headings = []
-        
-        for line in content.splitlines():
-            match = re.match(heading_pattern, line)
-            if match:
-                level = len(match.group(1))
-                text = match.group(2).strip()
-                headings.append((level, text))
+        # Headings of the document
+        headings = [(level, text) for _, level, text in parsed.headings]
         
         # Check for each required section
         for section_info in required_sections:
@@ -191,18 +223,18 @@ class CompletenessValidator:
         
         return False
     
-    async def _validate_examples(self, document: Document) -> List[ValidationIssue]:
+    async def _validate_examples(self, document: Document, parsed: ParsedDocument) -> List[ValidationIssue]:
         """
         Validate that document contains appropriate examples.
         
         Args:
             document: Document to validate
+            parsed: Parsed document
             
         Returns:
             List of validation issues
         """
         issues = []
-        content = document.content
         
         # Get document type
         doc_type = document.metadata.document_type
@@ -213,12 +245,10 @@ class CompletenessValidator:
             return issues  # No example requirements for this document type
         
         # Look for code blocks (examples)
-        code_block_pattern = r"```(\w+)?\s*\n(.*?)\n```"
-        code_blocks = re.findall(code_block_pattern, content, re.DOTALL)
+        code_blocks = parsed.code_blocks
         
         # Look for example sections
-        example_section_pattern = r"^#+\s+(Example|Examples|Usage).*$"
-        has_example_section = bool(re.search(example_section_pattern, content, re.MULTILINE))
+        has_example_section = parsed.has_heading("Example", "Usage")
         
         # Check code block requirements
         min_blocks = example_requirements.get("min_blocks", 0)
@@ -267,18 +297,19 @@ class CompletenessValidator:
         
         return issues
     
-    async def _validate_api_documentation(self, document: Document) -> List[ValidationIssue]:
+    async def _validate_api_documentation(self, document: Document, parsed: ParsedDocument) -> List[ValidationIssue]:
         """
         Validate API documentation completeness.
         
         Args:
             document: Document to validate
+            parsed: Parsed document
             
         Returns:
             List of validation issues
         """
         issues = []
-        content = document.content
+        content = parsed.content
         
         # Check if document is API documentation
         api_doc_indicators = [
@@ -297,18 +328,17 @@ class CompletenessValidator:
             return issues
         
         # Check for API endpoint documentation
-        endpoint_pattern = r"(GET|POST|PUT|DELETE|PATCH)\s+(/[a-zA-Z0-9_/-]+)"
-        endpoints = re.findall(endpoint_pattern, content)
+        endpoints = ENDPOINT_PATTERN.findall(content)
         
         # Check for request/response examples
-        has_request_example = bool(re.search(r"request.*?example|example.*?request", content, re.IGNORECASE))
-        has_response_example = bool(re.search(r"response.*?example|example.*?response", content, re.IGNORECASE))
+        has_request_example = bool(REQUEST_EXAMPLE_PATTERN.search(content))
+        has_response_example = bool(RESPONSE_EXAMPLE_PATTERN.search(content))
         
         # Check for parameter documentation
-        parameter_section = bool(re.search(r"^#+\s+Parameters", content, re.MULTILINE))
+        parameter_section = parsed.has_heading("Parameters")
         
         # Check for JSON blocks (likely request/response examples)
-        json_blocks = re.findall(r"```(json|javascript)\s*\n.*?\n```", content, re.DOTALL)
+        json_blocks = [code for language, code in parsed.code_blocks if language in ("json", "javascript")]
         
         # Validate API documentation completeness
         if endpoints and not has_request_example:
@@ -361,12 +391,14 @@ class CompletenessValidator:
         
         return issues
     
-    async def _validate_related_content(self, document: Document) -> List[ValidationIssue]:
+    async def _validate_related_content(self, document: Document,
+                                        parsed: Optional[ParsedDocument] = None) -> List[ValidationIssue]:
         """
         Validate that document references related content appropriately.
         
         Args:
             document: Document to validate
+            parsed: Parsed document
             
         Returns:
             List of validation issues
@@ -403,7 +435,8 @@ class CompletenessValidator:
                     ))
         
         # Check for "See Also" or "Related" section
-        has_related_section = bool(re.search(r"^#+\s+(See Also|Related|Further Reading)", document.content, re.MULTILINE))
+        parsed = parsed or ParsedDocument(document.content)
+        has_related_section = parsed.has_heading("See Also", "Related", "Further Reading")
         
         if relationships and not has_related_section:
             issues.append(ValidationIssue(
@@ -14,11 +14,38 @@ import string
 # Import validation models
 from ..models.document_model import Document, DocumentType
 from ..models.validation_result import ValidationIssue, ValidationSeverity, ValidationType
+from .parsed_document import ParsedDocument
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Heuristics used to categorize code blocks, checked in order
+CODE_TYPE_PATTERNS = [
+    ("python", re.compile(r"import\s+|from\s+\w+\s+import")),
+    ("javascript", re.compile(r"function\s+\w+\s*\(|const\s+\w+\s*=|let\s+\w+\s*=")),
+    ("markup", re.compile(r"<\w+>.*?</\w+>|<\w+.*?/>")),
+    ("json", re.compile(r"\{\s*\"")),
+    ("shell", re.compile(r"curl\s+-[X]"))
+]
+
+# Potential technical terms (CamelCase words and hyphen or underscore compounds)
+TECH_TERM_PATTERN = re.compile(r'\b([A-Z][a-z]+[A-Z][a-zA-Z]*|[a-z]+[-_][a-z]+)\b')
+HEADING_TERM_PATTERN = re.compile(r'\b([A-Z][a-z]+(\s+[a-z]+){1,2})\b')
+
+# Common technical terms that often have capitalization issues
+CAPITALIZED_TECH_TERMS = [
+    "javascript", "typescript", "python", "java", "api", "rest", "json", "xml", "html", 
+    "css", "graphql", "http", "url", "uri", "npm", "webpack", "docker", "kubernetes",
+    "devops", "github", "gitlab", "azure", "aws", "gcp", "sql", "nosql", "mongodb",
+    "postgresql", "mysql", "redis", "kafka", "react", "angular", "vue", "node.js"
+]
+# One pass over the content finds every term; whole-word matches of two
+# different terms can never start at the same position
+CAPITALIZED_TECH_TERM_PATTERN = re.compile(
+    r'\b(' + "|".join(re.escape(term) for term in CAPITALIZED_TECH_TERMS) + r')\b', re.IGNORECASE)
+RELATIVE_LINK_EXTENSION_PATTERN = re.compile(r"\.\w+$")
+
 class ConsistencyValidator:
     """
     Consistency validator for checking document consistency.
@@ -69,12 +96,45 @@ class ConsistencyValidator:
         
         logger.info("Consistency validator configuration updated")
     
-    async def validate(self, document: Document) -> List[ValidationIssue]:
+    def get_cache_config(self) -> Dict[str, Any]:
+        """
+        Get the settings and rules that determine this validator's output.
+        
+        Returns:
+            Dictionary hashed into the validation cache key
+        """
+        return {
+            "check_internal_consistency": self.check_internal_consistency,
+            "check_terminology": self.check_terminology,
+            "check_cross_references": self.check_cross_references,
+            "check_version_alignment": self.check_version_alignment
+        }
+    
+    def get_cache_inputs(self, document: Document) -> Optional[Dict[str, Any]]:
+        """
+        Get the document fields besides its content that this validator reads.
+        
+        Cross-reference and version checks read related documents from the
+        knowledge graph, which can change without this document changing.
+        
+        Args:
+            document: Document to validate
+            
+        Returns:
+            Dictionary hashed into the validation cache key, or None if the
+            result depends on other documents and must not be cached
+        """
+        if self.kg and (self.check_cross_references or self.check_version_alignment):
+            return None
+        return {}
+    
+    async def validate(self, document: Document, parsed: Optional[ParsedDocument] = None) -> List[ValidationIssue]:
         """
         Validate document consistency.
         
         Args:
             document: Document to validate
+            parsed: Shared parse of the document (parsed here if not given)
             
         Returns:
             List of validation issues
@@ -82,20 +142,21 @@ class ConsistencyValidator:
         logger.info(f"Validating consistency for document: {document.id}")
         
         issues = []
+        parsed = parsed or ParsedDocument(document.content)
         
         # Check internal consistency
         if self.check_internal_consistency:
-            internal_issues = await self._validate_internal_consistency(document)
+            internal_issues = await self._validate_internal_consistency(document, parsed)
             issues.extend(internal_issues)
         
         # Check terminology consistency
         if self.check_terminology:
-            terminology_issues = await self._validate_terminology(document)
+            terminology_issues = await self._validate_terminology(document, parsed)
             issues.extend(terminology_issues)
         
         # Check cross-references
         if self.check_cross_references:
-            reference_issues = await self._validate_cross_references(document)
+            reference_issues = await self._validate_cross_references(document, parsed)
             issues.extend(reference_issues)
         
         # Check version alignment
@@ -106,59 +167,51 @@ class ConsistencyValidator:
         logger.info(f"Consistency validation completed for document {document.id}: {len(issues)} issues found")
         return issues
     
-    async def _validate_internal_consistency(self, document: Document) -> List[ValidationIssue]:
+    async def _validate_internal_consistency(self, document: Document, parsed: ParsedDocument) -> List[ValidationIssue]:
         """
         Validate internal consistency of document.
         
         Args:
             document: Document to validate
+            parsed: Parsed document
             
         Returns:
             List of validation issues
         """
         issues = []
-        content = document.content
         
         # Check heading structure consistency
-        heading_issues = self._check_heading_hierarchy(content)
+        heading_issues = self._check_heading_hierarchy(parsed)
         issues.extend(heading_issues)
         
         # Check list style consistency
-        list_issues = self._check_list_consistency(content)
+        list_issues = self._check_list_consistency(parsed)
         issues.extend(list_issues)
         
         # Check code block style consistency
-        code_issues = self._check_code_block_consistency(content)
+        code_issues = self._check_code_block_consistency(parsed)
         issues.extend(code_issues)
         
         # Check link format consistency
-        link_issues = self._check_link_format_consistency(content)
+        link_issues = self._check_link_format_consistency(parsed)
         issues.extend(link_issues)
         
         return issues
     
-    def _check_heading_hierarchy(self, content: str) -> List[ValidationIssue]:
+    def _check_heading_hierarchy(self, parsed: ParsedDocument) -> List[ValidationIssue]:
         """
         Check that heading hierarchy is consistent.
         
         Args:
-            content: Document content
+            parsed: Parsed document
             
         Returns:
             List of validation issues
         """
         issues = []
         
-        # Extract headings with their levels
-        heading_pattern = r"^(#+)\s+(.+)$"
-        headings = []
-        
-        for i, line in enumerate(content.splitlines()):
-            match = re.match(heading_pattern, line)
-            if match:
-                level = len(match.group(1))
-                text = match.group(2).strip()
-                headings.append((i + 1, level, text))
+        # Headings with their line numbers and levels
+        headings = parsed.headings
         
         if len(headings) < 2:
             return issues  # Not enough headings to check hierarchy
@@ -228,25 +281,21 @@ class ConsistencyValidator:
         
         return issues
     
-    def _check_list_consistency(self, content: str) -> List[ValidationIssue]:
+    def _check_list_consistency(self, parsed: ParsedDocument) -> List[ValidationIssue]:
         """
         Check that list formatting is consistent.
         
         Args:
-            content: Document content
+            parsed: Parsed document
             
         Returns:
             List of validation issues
         """
         issues = []
         
-        # Extract bullet lists
-        bullet_pattern = r"^(\s*)([-*+])\s"
-        bullet_lists = re.findall(bullet_pattern, content, re.MULTILINE)
-        
-        # Extract numbered lists
-        number_pattern = r"^(\s*)(\d+)([.):])\s"
-        number_lists = re.findall(number_pattern, content, re.MULTILINE)
+        # Bullet and numbered list items
+        bullet_lists = parsed.bullet_items
+        number_lists = parsed.numbered_items
         
         # Check bullet list consistency
         if bullet_lists:
@@ -331,21 +380,19 @@ class ConsistencyValidator:
         
         return issues
     
-    def _check_code_block_consistency(self, content: str) -> List[ValidationIssue]:
+    def _check_code_block_consistency(self, parsed: ParsedDocument) -> List[ValidationIssue]:
         """
         Check that code block formatting is consistent.
         
         Args:
-            content: Document content
+            parsed: Parsed document
             
         Returns:
             List of validation issues
         """
         issues = []
         
-        # Extract code blocks
-        code_block_pattern = r"```(\w+)?\s*\n(.*?)\n```"
-        code_blocks = re.findall(code_block_pattern, content, re.DOTALL)
+        code_blocks = parsed.code_blocks
         
         if len(code_blocks) < 2:
             return issues  # Not enough code blocks to check consistency
@@ -403,39 +450,27 @@ class ConsistencyValidator:
     def _determine_code_type(self, code: str) -> str:
         """Determine code type based on content patterns"""
         # Simple heuristics to categorize code blocks
-        if re.search(r"import\s+|from\s+\w+\s+import", code):
-            return "python"
-        elif re.search(r"function\s+\w+\s*\(|const\s+\w+\s*=|let\s+\w+\s*=", code):
-            return "javascript"
-        elif re.search(r"<\w+>.*?</\w+>|<\w+.*?/>", code):
-            return "markup"
-        elif re.search(r"\{\s*\"", code):
-            return "json"
-        elif re.search(r"curl\s+-[X]", code):
-            return "shell"
-        else:
-            return "generic"
+        for code_type, pattern in CODE_TYPE_PATTERNS:
+            if pattern.search(code):
+                return code_type
+        return "generic"
     
-    def _check_link_format_consistency(self, content: str) -> List[ValidationIssue]:
+    def _check_link_format_consistency(self, parsed: ParsedDocument) -> List[ValidationIssue]:
         """
         Check that link formatting is consistent.
         
         Args:
-            content: Document content
+            parsed: Parsed document
             
         Returns:
             List of validation issues
         """
         issues = []
         
-        # Extract markdown links [text](url)
-        md_links = re.findall(r"\[(.+?)\]\((.+?)\)", content)
-        
-        # Extract HTML links <a href="url">text</a>
-        html_links = re.findall(r"<a\s+href=[\"'](.+?)[\"'].*?>(.+?)</a>", content)
-        
-        # Extract raw URLs
-        raw_urls = re.findall(r"(?<!\]\()https?://[^\s)>]+", content)
+        # Markdown links [text](url), HTML links <a href="url">text</a> and raw URLs
+        md_links = parsed.markdown_links
+        html_links = parsed.html_links
+        raw_urls = parsed.raw_urls
         
         # Count link types
         md_count = len(md_links)
@@ -478,21 +513,22 @@ class ConsistencyValidator:
         
         return issues
     
-    async def _validate_terminology(self, document: Document) -> List[ValidationIssue]:
+    async def _validate_terminology(self, document: Document, parsed: ParsedDocument) -> List[ValidationIssue]:
         """
         Validate terminology consistency.
         
         Args:
             document: Document to validate
+            parsed: Parsed document
             
         Returns:
             List of validation issues
         """
         issues = []
-        content = document.content
+        content = parsed.content
         
         # Extract potential term variants
-        term_variants = self._find_term_variants(content)
+        term_variants = self._find_term_variants(parsed)
         
         for base_term, variants in term_variants.items():
             if len(variants) > 1:
@@ -538,27 +574,24 @@ class ConsistencyValidator:
         
         return issues
     
-    def _find_term_variants(self, content: str) -> Dict[str, Set[str]]:
+    def _find_term_variants(self, parsed: ParsedDocument) -> Dict[str, Set[str]]:
         """
         Find variants of the same term in content.
         
         Args:
-            content: Document content
+            parsed: Parsed document
             
         Returns:
             Dictionary mapping base terms to sets of variants
         """
         # Extract potential technical terms (words with specific patterns)
-        tech_term_pattern = r'\b([A-Z][a-z]+[A-Z][a-zA-Z]*|[a-z]+[-_][a-z]+)\b'
-        tech_terms = re.findall(tech_term_pattern, content)
+        tech_terms = TECH_TERM_PATTERN.findall(parsed.content)
         
         # Extract multi-word terms from headings
-        heading_pattern = r'^#+\s+(.+)$'
-        headings = re.findall(heading_pattern, content, re.MULTILINE)
         heading_terms = []
-        for heading in headings:
+        for heading in parsed.heading_texts():
             # Extract 2-3 word phrases that might be technical terms
-            heading_terms.extend(re.findall(r'\b([A-Z][a-z]+(\s+[a-z]+){1,2})\b', heading))
+            heading_terms.extend(HEADING_TERM_PATTERN.findall(heading))
         
         # Normalize terms and group variants
         term_variants = {}
@@ -605,38 +638,26 @@ class ConsistencyValidator:
         Returns:
             Dictionary mapping terms to sets of capitalization variants
         """
-        # Common technical terms that often have capitalization issues
-        tech_terms = [
-            "javascript", "typescript", "python", "java", "api", "rest", "json", "xml", "html", 
-            "css", "graphql", "http", "url", "uri", "npm", "webpack", "docker", "kubernetes",
-            "devops", "github", "gitlab", "azure", "aws", "gcp", "sql", "nosql", "mongodb",
-            "postgresql", "mysql", "redis", "kafka", "react", "angular", "vue", "node.js"
-        ]
-        
         # Find capitalization variants
-        cap_variants = {}
+        variants = {}
+        for match in CAPITALIZED_TECH_TERM_PATTERN.findall(content):
+            variants.setdefault(match.lower(), set()).add(match)
         
-        for term in tech_terms:
-            variants = set()
-            
-            # Find all capitalization variants
-            pattern = r'\b' + re.escape(term) + r'\b'
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            
-            for match in matches:
-                variants.add(match)
-            
-            if len(variants) > 1:
-                cap_variants[term] = variants
+        cap_variants = {}
+        for term in CAPITALIZED_TECH_TERMS:
+            if len(variants.get(term, ())) > 1:
+                cap_variants[term] = variants[term]
         
         return cap_variants
     
-    async def _validate_cross_references(self, document: Document) -> List[ValidationIssue]:
+    async def _validate_cross_references(self, document: Document,
+                                         parsed: Optional[ParsedDocument] = None) -> List[ValidationIssue]:
         """
         Validate cross-references between documents.
         
         Args:
             document: Document to validate
+            parsed: Parsed document
             
         Returns:
             List of validation issues
@@ -693,19 +714,15 @@ class ConsistencyValidator:
                     ))
         
         # Check for link consistency in content
-        content = document.content
-        
-        # Extract markdown links
-        link_pattern = r"\[(.+?)\]\((.+?)\)"
-        links = re.findall(link_pattern, content)
+        parsed = parsed or ParsedDocument(document.content)
         
-        for link_text, link_url in links:
+        for link_text, link_url in parsed.markdown_links:
             # Check if link is internal (to another document)
             if link_url.startswith('/') or link_url.startswith('./') or link_url.startswith('../'):
                 # This is a relative link to another document
                 # In a real implementation, would resolve the link and verify the document exists
                 # For now, just check if it has a file extension
-                if not re.search(r"\.\w+$", link_url) and not link_url.endswith('/'):
+                if not RELATIVE_LINK_EXTENSION_PATTERN.search(link_url) and not link_url.endswith('/'):
                     issues.append(ValidationIssue(
                         id=f"malformed-internal-link-{link_url}",
                         type=ValidationType.CONSISTENCY,
@@ -0,0 +1,201 @@
+"""
+Parsed Document - Shared markdown structure for validators
+
+This module implements ParsedDocument, which extracts the markdown
+structure of a document (headings, code blocks, links, lists, commands,
+paragraphs and sentences) once so that every validator can read it
+instead of re-scanning the raw content with its own regular expressions.
+Each part is parsed on first access and then cached, so validators that
+are disabled cost nothing.
+"""
+
+import re
+from functools import cached_property
+from typing import List, Tuple
+
+# Markdown structure
+HEADING_PATTERN = re.compile(r"^(#+)\s+(.+)$")
+CODE_BLOCK_PATTERN = re.compile(r"```(\w+)?\s*\n(.*?)\n```", re.DOTALL)
+FENCED_SPAN_PATTERN = re.compile(r"```.*?```", re.DOTALL)
+INLINE_CODE_PATTERN = re.compile(r"`([^`]+)`")
+MARKDOWN_LINK_PATTERN = re.compile(r"\[(.+?)\]\((.+?)\)")
+HTML_LINK_PATTERN = re.compile(r"<a\s+href=[\"'](.+?)[\"'].*?>(.+?)</a>")
+URL_PATTERN = re.compile(r"https?://[^\s)>]+")
+RAW_URL_PATTERN = re.compile(r"(?<!\]\()https?://[^\s)>]+")
+BULLET_PATTERN = re.compile(r"^(\s*)([-*+])\s", re.MULTILINE)
+NUMBER_PATTERN = re.compile(r"^(\s*)(\d+)([.):])\s", re.MULTILINE)
+COMMAND_PATTERN = re.compile(r"(?:^|\n)(?:\$|\>) ([^\n]+)")
+
+# Markup stripped before readability analysis, applied in order
+READABILITY_STRIP_PATTERNS = [
+    re.compile(r"```.*?```", re.DOTALL),          # code blocks
+    re.compile(r"`[^`]+`"),                       # inline code
+    re.compile(r"https?://\S+"),                  # URLs
+    re.compile(r"!\[.*?\]\(.*?\)"),               # image references
+    re.compile(r"<[^>]+>"),                       # HTML tags
+    re.compile(r"^#+\s+", re.MULTILINE),          # heading markup
+    re.compile(r"^[\*\-+]\s+", re.MULTILINE),     # bullet markers
+    re.compile(r"^\d+\.\s+", re.MULTILINE)        # number markers
+]
+PARAGRAPH_SPLIT_PATTERN = re.compile(r"\n\s*\n")
+SENTENCE_SPLIT_PATTERN = re.compile(r"[.!?]\s+")
+
+# Abbreviations whose periods do not end a sentence
+ABBREVIATIONS = [
+    ("e.g.", "e_g_"), ("i.e.", "i_e_"), ("vs.", "vs_"), ("etc.", "etc_"),
+    ("Dr.", "Dr_"), ("Mr.", "Mr_"), ("Ms.", "Ms_"), ("St.", "St_")
+]
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences.
+
+    This is a simplified approach. A proper implementation would use
+    a more sophisticated sentence tokenizer.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List of sentences
+    """
+    # Replace common abbreviations to avoid splitting on their periods
+    for abbreviation, placeholder in ABBREVIATIONS:
+        text = text.replace(abbreviation, placeholder)
+
+    sentences = []
+    for sentence in SENTENCE_SPLIT_PATTERN.split(text):
+        if not sentence.strip():
+            continue
+
+        # Restore abbreviations
+        for abbreviation, placeholder in ABBREVIATIONS:
+            sentence = sentence.replace(placeholder, abbreviation)
+
+        sentences.append(sentence.strip())
+
+    return sentences
+
+
+class ParsedDocument:
+    """
+    Markdown structure of a document, parsed once and shared by validators.
+
+    Instances are plain picklable objects, so they can be sent to a process
+    pool together with the document they describe.
+    """
+
+    def __init__(self, content: str):
+        """
+        Initialize the parsed document.
+
+        Args:
+            content: Document content
+        """
+        self.content = content or ""
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Content lines."""
+        return self.content.splitlines()
+
+    @cached_property
+    def headings(self) -> List[Tuple[int, int, str]]:
+        """(line number, level, text) for each heading."""
+        headings = []
+        for i, line in enumerate(self.lines):
+            if line.startswith("#"):
+                match = HEADING_PATTERN.match(line)
+                if match:
+                    headings.append((i + 1, len(match.group(1)), match.group(2).strip()))
+        return headings
+
+    @cached_property
+    def code_blocks(self) -> List[Tuple[str, str]]:
+        """(language, code) for each fenced code block; language may be empty."""
+        return CODE_BLOCK_PATTERN.findall(self.content)
+
+    @cached_property
+    def fenced_spans(self) -> List[str]:
+        """Raw text of each fenced span, including the backticks."""
+        return FENCED_SPAN_PATTERN.findall(self.content)
+
+    @cached_property
+    def inline_codes(self) -> List[str]:
+        """Text of each inline code span."""
+        return INLINE_CODE_PATTERN.findall(self.content)
+
+    @cached_property
+    def markdown_links(self) -> List[Tuple[str, str]]:
+        """(text, url) for each markdown link."""
+        return MARKDOWN_LINK_PATTERN.findall(self.content)
+
+    @cached_property
+    def html_links(self) -> List[Tuple[str, str]]:
+        """(url, text) for each HTML anchor."""
+        return HTML_LINK_PATTERN.findall(self.content)
+
+    @cached_property
+    def urls(self) -> List[str]:
+        """Every URL in the content."""
+        return URL_PATTERN.findall(self.content)
+
+    @cached_property
+    def raw_urls(self) -> List[str]:
+        """URLs that are not the target of a markdown link."""
+        return RAW_URL_PATTERN.findall(self.content)
+
+    @cached_property
+    def bullet_items(self) -> List[Tuple[str, str]]:
+        """(indent, marker) for each bullet list item."""
+        return BULLET_PATTERN.findall(self.content)
+
+    @cached_property
+    def numbered_items(self) -> List[Tuple[str, str, str]]:
+        """(indent, number, separator) for each numbered list item."""
+        return NUMBER_PATTERN.findall(self.content)
+
+    @cached_property
+    def commands(self) -> List[str]:
+        """Shell commands written as lines starting with $ or >."""
+        return COMMAND_PATTERN.findall(self.content)
+
+    @cached_property
+    def readable_text(self) -> str:
+        """Content with code, URLs, images, HTML and markup removed."""
+        text = self.content
+        for pattern in READABILITY_STRIP_PATTERNS:
+            text = pattern.sub("", text)
+        return text
+
+    @cached_property
+    def paragraphs(self) -> List[str]:
+        """Non-empty paragraphs of the readable text."""
+        return [p.strip() for p in PARAGRAPH_SPLIT_PATTERN.split(self.readable_text) if p.strip()]
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """Sentences of the readable text."""
+        return split_sentences(self.readable_text)
+
+    @cached_property
+    def words(self) -> List[str]:
+        """Whitespace-separated words of the readable text."""
+        return self.readable_text.split()
+
+    def heading_texts(self) -> List[str]:
+        """Text of each heading, in document order."""
+        return [text for _, _, text in self.headings]
+
+    def has_heading(self, *prefixes: str) -> bool:
+        """
+        Check whether any heading starts with one of the given prefixes.
+
+        Args:
+            prefixes: Heading text prefixes
+
+        Returns:
+            True if a matching heading exists
+        """
+        return any(text.startswith(prefixes) for _, _, text in self.headings)
@@ -14,11 +14,22 @@ from typing import Dict, List, Any, Optional, Tuple
 # Import validation models
 from ..models.document_model import Document
 from ..models.validation_result import ValidationIssue, ValidationSeverity, ValidationType
+from .parsed_document import ParsedDocument, split_sentences
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Simple passive voice detection patterns
+PASSIVE_VOICE_PATTERN = re.compile(
+    r"\b(am|is|are|was|were|be|being|been)\s+(\w+ed)\b|"
+    r"\b(am|is|are|was|were|be|being|been)\s+(\w+en)\b|"
+    r"\b(have|has|had)\s+been\s+(\w+ed)\b|"
+    r"\b(have|has|had)\s+been\s+(\w+en)\b",
+    re.IGNORECASE
+)
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+
 class ReadabilityValidator:
     """
     Readability validator for assessing document readability.
@@ -80,12 +91,47 @@ class ReadabilityValidator:
         
         logger.info("Readability validator configuration updated")
     
-    async def validate(self, document: Document) -> List[ValidationIssue]:
+    def get_cache_config(self) -> Dict[str, Any]:
+        """
+        Get the settings and rules that determine this validator's output.
+        
+        Returns:
+            Dictionary hashed into the validation cache key
+        """
+        return {
+            "check_readability_score": self.check_readability_score,
+            "check_sentence_length": self.check_sentence_length,
+            "check_paragraph_length": self.check_paragraph_length,
+            "check_passive_voice": self.check_passive_voice,
+            "flesch_kincaid_threshold": self.flesch_kincaid_threshold,
+            "max_sentence_length": self.max_sentence_length,
+            "max_paragraph_length": self.max_paragraph_length,
+            "max_passive_voice_percentage": self.max_passive_voice_percentage
+        }
+    
+    async def validate(self, document: Document, parsed: Optional[ParsedDocument] = None) -> List[ValidationIssue]:
         """
         Validate document readability.
         
         Args:
             document: Document to validate
+            parsed: Shared parse of the document (parsed here if not given)
+            
+        Returns:
+            List of validation issues
+        """
+        return self.validate_sync(document, parsed)
+    
+    def validate_sync(self, document: Document, parsed: Optional[ParsedDocument] = None) -> List[ValidationIssue]:
+        """
+        Validate document readability without awaiting anything.
+        
+        The check is pure CPU work over the document text, so the validation
+        manager may run it in a process pool.
+        
+        Args:
+            document: Document to validate
+            parsed: Shared parse of the document (parsed here if not given)
             
         Returns:
             List of validation issues
@@ -94,140 +140,38 @@ class ReadabilityValidator:
         
         issues = []
         
-        # Clean content (remove code blocks, URLs, etc.)
-        content = document.content
-        clean_content = self._clean_content_for_readability(content)
-        
-        # Split into paragraphs and sentences
-        paragraphs = self._split_paragraphs(clean_content)
-        sentences = self._split_sentences(clean_content)
+        # Readability is measured on the content without code blocks, URLs, etc.
+        parsed = parsed or ParsedDocument(document.content)
         
         # Check readability score
         if self.check_readability_score:
-            score_issues = self._check_readability_scores(clean_content)
+            score_issues = self._check_readability_scores(parsed)
             issues.extend(score_issues)
         
         # Check sentence length
         if self.check_sentence_length:
-            sentence_issues = self._check_sentence_length(sentences)
+            sentence_issues = self._check_sentence_length(parsed.sentences)
             issues.extend(sentence_issues)
         
         # Check paragraph length
         if self.check_paragraph_length:
-            paragraph_issues = self._check_paragraph_length(paragraphs)
+            paragraph_issues = self._check_paragraph_length(parsed.paragraphs)
             issues.extend(paragraph_issues)
         
         # Check passive voice
         if self.check_passive_voice:
-            passive_issues = self._check_passive_voice(sentences)
+            passive_issues = self._check_passive_voice(parsed.sentences)
             issues.extend(passive_issues)
         
         logger.info(f"Readability validation completed for document {document.id}: {len(issues)} issues found")
         return issues
     
-    def _clean_content_for_readability(self, content: str) -> str:
-        """
-        Clean content for readability analysis by removing code blocks, URLs, etc.
-        
-        Args:
-            content: Document content
-            
-        Returns:
-            Cleaned content
-        """
-        # Remove code blocks
-        content = re.sub(r"```.*?```", "", content, flags=re.DOTALL)
-        
-        # Remove inline code
-        content = re.sub(r"`[^`]+`", "", content)
-        
-        # Remove URLs
-        content = re.sub(r"https?://\S+", "", content)
-        
-        # Remove image references
-        content = re.sub(r"!\[.*?\]\(.*?\)", "", content)
-        
-        # Remove HTML tags
-        content = re.sub(r"<[^>]+>", "", content)
-        
-        # Remove heading markup
-        content = re.sub(r"^#+\s+", "", content, flags=re.MULTILINE)
-        
-        # Remove list markers
-        content = re.sub(r"^[\*\-+]\s+", "", content, flags=re.MULTILINE)
-        content = re.sub(r"^\d+\.\s+", "", content, flags=re.MULTILINE)
-        
-        return content
-    
-    def _split_paragraphs(self, content: str) -> List[str]:
-        """
-        Split content into paragraphs.
-        
-        Args:
-            content: Document content
-            
-        Returns:
-            List of paragraphs
-        """
-        # Split on double newlines
-        paragraphs = re.split(r"\n\s*\n", content)
-        
-        # Filter out empty paragraphs
-        return [p.strip() for p in paragraphs if p.strip()]
-    
-    def _split_sentences(self, content: str) -> List[str]:
-        """
-        Split content into sentences.
-        
-        Args:
-            content: Document content
-            
-        Returns:
-            List of sentences
-        """
-        # This is a simplified approach. A proper implementation would use
-        # a more sophisticated sentence tokenizer.
-        
-        # Replace common abbreviations to avoid splitting on their periods
-        content = content.replace("e.g.", "e_g_")
-        content = content.replace("i.e.", "i_e_")
-        content = content.replace("vs.", "vs_")
-        content = content.replace("etc.", "etc_")
-        content = content.replace("Dr.", "Dr_")
-        content = content.replace("Mr.", "Mr_")
-        content = content.replace("Ms.", "Ms_")
-        content = content.replace("St.", "St_")
-        
-        # Split on sentence boundaries
-        sentence_pattern = r"[.!?]\s+"
-        sentences = re.split(sentence_pattern, content)
-        
-        # Filter out empty sentences and restore abbreviations
-        clean_sentences = []
-        for sentence in sentences:
-            if not sentence.strip():
-                continue
-            
-            # Restore abbreviations
-            sentence = sentence.replace("e_g_", "e.g.")
-            sentence = sentence.replace("i_e_", "i.e.")
-            sentence = sentence.replace("vs_", "vs.")
-            sentence = sentence.replace("etc_", "etc.")
-            sentence = sentence.replace("Dr_", "Dr.")
-            sentence = sentence.replace("Mr_", "Mr.")
-            sentence = sentence.replace("Ms_", "Ms.")
-            sentence = sentence.replace("St_", "St.")
-            
-            clean_sentences.append(sentence.strip())
-        
-        return clean_sentences
-    
-    def _check_readability_scores(self, content: str) -> List[ValidationIssue]:
+    def _check_readability_scores(self, parsed: ParsedDocument) -> List[ValidationIssue]:
         """
         Check readability scores of content.
         
         Args:
-            content: Document content
+            parsed: Parsed document
             
         Returns:
             List of validation issues
@@ -236,7 +180,7 @@ class ReadabilityValidator:
         
         # Calculate Flesch-Kincaid Reading Ease score
         try:
-            score = self._calculate_flesch_reading_ease(content)
+            score = self._calculate_flesch_reading_ease(parsed.sentences, parsed.words)
             
             # Interpret the score
             if score < self.flesch_kincaid_threshold:
@@ -260,20 +204,18 @@ class ReadabilityValidator:
         
         return issues
     
-    def _calculate_flesch_reading_ease(self, text: str) -> float:
+    def _calculate_flesch_reading_ease(self, sentences: List[str], words: List[str]) -> float:
         """
         Calculate Flesch Reading Ease score.
         
         Args:
-            text: Text to analyze
+            sentences: Sentences of the text to analyze
+            words: Words of the text to analyze
             
         Returns:
             Flesch Reading Ease score (0-100)
         """
         # Count words, sentences, and syllables
-        sentences = self._split_sentences(text)
-        words = text.split()
-        
         sentence_count = len(sentences)
         word_count = len(words)
         
@@ -308,7 +250,7 @@ class ReadabilityValidator:
             Number of syllables
         """
         # Remove punctuation and lower case
-        word = re.sub(r'[^\w\s]', '', word).lower()
+        word = NON_WORD_PATTERN.sub('', word).lower()
         
         # Special cases
         if not word:
@@ -396,7 +338,7 @@ class ReadabilityValidator:
         # Count sentences in each paragraph
         long_paragraphs = []
         for i, paragraph in enumerate(paragraphs):
-            sentences = self._split_sentences(paragraph)
+            sentences = split_sentences(paragraph)
             if len(sentences) > self.max_paragraph_length:
                 long_paragraphs.append((i, paragraph, len(sentences)))
         
@@ -442,21 +384,11 @@ class ReadabilityValidator:
         """
         issues = []
         
-        # Simple passive voice detection patterns
-        passive_patterns = [
-            r"\b(am|is|are|was|were|be|being|been)\s+(\w+ed)\b",
-            r"\b(am|is|are|was|were|be|being|been)\s+(\w+en)\b",
-            r"\b(have|has|had)\s+been\s+(\w+ed)\b",
-            r"\b(have|has|had)\s+been\s+(\w+en)\b"
-        ]
-        
         # Count passive voice sentences
         passive_sentences = []
         for i, sentence in enumerate(sentences):
-            for pattern in passive_patterns:
-                if re.search(pattern, sentence, re.IGNORECASE):
-                    passive_sentences.append((i, sentence))
-                    break
+            if PASSIVE_VOICE_PATTERN.search(sentence):
+                passive_sentences.append((i, sentence))
         
         # Calculate percentage of passive voice sentences
         if sentences:
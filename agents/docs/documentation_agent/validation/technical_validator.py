@@ -15,11 +15,22 @@ from typing import Dict, List, Any, Optional, Set
 # Import validation models
 from ..models.document_model import Document
 from ..models.validation_result import ValidationIssue, ValidationSeverity, ValidationType
+from .parsed_document import ParsedDocument
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# API references in various formats
+API_REFERENCE_PATTERNS = [
+    # REST API endpoints
+    (re.compile(r"(GET|POST|PUT|DELETE|PATCH)\s+(/[a-zA-Z0-9_/-]+)"), "REST endpoint"),
+    # Function calls
+    (re.compile(r"([a-zA-Z][a-zA-Z0-9_]*)\((.*?)\)"), "Function call"),
+    # Class methods
+    (re.compile(r"([a-zA-Z][a-zA-Z0-9_]*)\.[a-zA-Z][a-zA-Z0-9_]*\((.*?)\)"), "Method call")
+]
+
 class TechnicalValidator:
     """
     Technical validator for checking document technical correctness.
@@ -78,12 +89,30 @@ class TechnicalValidator:
         
         logger.info("Technical validator configuration updated")
     
-    async def validate(self, document: Document) -> List[ValidationIssue]:
+    def get_cache_config(self) -> Dict[str, Any]:
+        """
+        Get the settings and rules that determine this validator's output.
+        
+        Returns:
+            Dictionary hashed into the validation cache key
+        """
+        return {
+            "check_code_blocks": self.check_code_blocks,
+            "check_api_references": self.check_api_references,
+            "check_commands": self.check_commands,
+            "check_urls": self.check_urls,
+            "api_references": self.api_references,
+            "technical_terms": self.technical_terms,
+            "code_language_patterns": self.code_language_patterns
+        }
+    
+    async def validate(self, document: Document, parsed: Optional[ParsedDocument] = None) -> List[ValidationIssue]:
         """
         Validate document technical correctness.
         
         Args:
             document: Document to validate
+            parsed: Shared parse of the document (parsed here if not given)
             
         Returns:
             List of validation issues
@@ -92,22 +121,23 @@ class TechnicalValidator:
         
         issues = []
         validation_tasks = []
+        parsed = parsed or ParsedDocument(document.content)
         
         # Check code blocks
         if self.check_code_blocks:
-            validation_tasks.append(self._validate_code_blocks(document))
+            validation_tasks.append(self._validate_code_blocks(document, parsed))
         
         # Check API references
         if self.check_api_references:
-            validation_tasks.append(self._validate_api_references(document))
+            validation_tasks.append(self._validate_api_references(document, parsed))
         
         # Check command syntax
         if self.check_commands:
-            validation_tasks.append(self._validate_commands(document))
+            validation_tasks.append(self._validate_commands(document, parsed))
         
         # Check URLs
         if self.check_urls:
-            validation_tasks.append(self._validate_urls(document))
+            validation_tasks.append(self._validate_urls(document, parsed))
         
         # Run validation tasks in parallel
         task_results = await asyncio.gather(*validation_tasks)
@@ -119,22 +149,21 @@ class TechnicalValidator:
         logger.info(f"Technical validation completed for document {document.id}: {len(issues)} issues found")
         return issues
     
-    async def _validate_code_blocks(self, document: Document) -> List[ValidationIssue]:
+    async def _validate_code_blocks(self, document: Document, parsed: ParsedDocument) -> List[ValidationIssue]:
         """
         Validate code blocks in the document.
         
         Args:
             document: Document to validate
+            parsed: Parsed document
             
         Returns:
             List of validation issues
         """
         issues = []
-        content = document.content
         
-        # Extract code blocks using markdown pattern ```language ... ```
-        code_block_pattern = r"```(\w+)?\s*\n(.*?)\n```"
-        code_blocks = re.findall(code_block_pattern, content, re.DOTALL)
+        # Code blocks in markdown pattern ```language ... ```
+        code_blocks = parsed.code_blocks
         
         logger.info(f"Found {len(code_blocks)} code blocks in document {document.id}")
         
@@ -171,8 +200,7 @@ class TechnicalValidator:
             issues.extend(block_issues)
         
         # Check for inline code consistency
-        inline_code_pattern = r"`([^`]+)`"
-        inline_codes = re.findall(inline_code_pattern, content)
+        inline_codes = parsed.inline_codes
         
         # Check if code elements mentioned in text also appear in code blocks
         if inline_codes and code_blocks:
@@ -180,7 +208,7 @@ class TechnicalValidator:
             
             for i, code in enumerate(inline_codes):
                 # Skip short inline codes (likely not references)
-                if len(code) < a:
+                if len(code) < 3:
                     continue
                 
                 if code not in code_block_content and not any(c in code for c in "{}[]():;,"):
@@ -511,36 +539,29 @@ class TechnicalValidator:
         
         return issues
     
-    async def _validate_api_references(self, document: Document) -> List[ValidationIssue]:
+    async def _validate_api_references(self, document: Document, parsed: ParsedDocument) -> List[ValidationIssue]:
         """
         Validate API references in the document.
         
         Args:
             document: Document to validate
+            parsed: Parsed document
             
         Returns:
             List of validation issues
         """
         issues = []
-        content = document.content
+        content = parsed.content
         
-        # Check for API references in various formats
-        api_patterns = [
-            # REST API endpoints
-            (r"(GET|POST|PUT|DELETE|PATCH)\s+(/[a-zA-Z0-9_/-]+)", "REST endpoint"),
-            # Function calls
-            (r"([a-zA-Z][a-zA-Z0-9_]*)\((.*?)\)", "Function call"),
-            # Class methods
-            (r"([a-zA-Z][a-zA-Z0-9_]*)\.[a-zA-Z][a-zA-Z0-9_]*\((.*?)\)", "Method call")
-        ]
+        # Join code blocks once so the membership test below is a single substring search
+        code_block_text = "\x00".join(parsed.fenced_spans)
         
-        for pattern, ref_type in api_patterns:
-            references = re.findall(pattern, content)
+        for pattern, ref_type in API_REFERENCE_PATTERNS:
+            references = pattern.findall(content)
             
             for ref in references:
                 # Skip references inside code blocks
-                code_blocks = re.findall(r"```.*?```", content, re.DOTALL)
-                in_code_block = any(str(ref) in block for block in code_blocks)
+                in_code_block = str(ref) in code_block_text
                 
                 if in_code_block:
                     continue
@@ -571,23 +592,21 @@ class TechnicalValidator:
             
         return False
     
-    async def _validate_commands(self, document: Document) -> List[ValidationIssue]:
+    async def _validate_commands(self, document: Document, parsed: ParsedDocument) -> List[ValidationIssue]:
         """
         Validate commands in the document.
         
         Args:
             document: Document to validate
+            parsed: Parsed document
             
         Returns:
             List of validation issues
         """
         issues = []
-        content = document.content
         
-        # Look for command-line instructions (e.g., bash commands)
-        # Pattern matches lines that start with $ or > followed by a command
-        command_pattern = r"(?:^|\n)(?:\$|\>) ([^\n]+)"
-        commands = re.findall(command_pattern, content)
+        # Command-line instructions: lines that start with $ or > followed by a command
+        commands = parsed.commands
         
         logger.info(f"Found {len(commands)} commands in document {document.id}")
         
@@ -699,22 +718,22 @@ class TechnicalValidator:
         
         return issues
     
-    async def _validate_urls(self, document: Document) -> List[ValidationIssue]:
+    async def _validate_urls(self, document: Document, parsed: ParsedDocument) -> List[ValidationIssue]:
         """
         Validate URLs in the document.
         
         Args:
             document: Document to validate
+            parsed: Parsed document
             
         Returns:
             List of validation issues
         """
         issues = []
-        content = document.content
+        content = parsed.content
         
-        # Find URLs in content
-        url_pattern = r"https?://[^\s)>]+"
-        urls = re.findall(url_pattern, content)
+        # URLs in content
+        urls = parsed.urls
         
         logger.info(f"Found {len(urls)} URLs in document {document.id}")
         
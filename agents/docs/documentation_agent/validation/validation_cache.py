@@ -0,0 +1,276 @@
+"""
+Validation Cache - Memoized validator results
+
+This module implements ValidationCache, which remembers the issues each
+validator reported for a document, keyed by the hash of everything the
+validator reads from the document, the validator name and the hash of the
+validator configuration. A document is only re-validated by a validator
+when its content, the document fields the validator reads or that
+validator's rule set has changed since the last run.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+from agents.utils.atomic_write import atomic_write
+
+from ..models.validation_result import ValidationResult, ValidationIssue
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Key under ValidationResult.metadata recording the cache key of each validator run
+VALIDATOR_KEYS_FIELD = "validator_keys"
+
+# Key under ValidationIssue.metadata naming the validator that reported the issue
+ISSUE_VALIDATOR_FIELD = "validator"
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize sets in a stable order and anything else by its string form."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+class ValidationCache:
+    """
+    Bounded LRU map of (document hash, validator name, config hash) to issues.
+
+    Validators opt in by providing get_cache_config(), which returns the
+    settings and rules that affect their output; validators without it are
+    never cached. Validators that read more of a document than its content
+    also provide get_cache_inputs(document), which returns those fields, or
+    None when their output depends on state outside the document (such as
+    other documents in the knowledge graph) and must not be cached. Entries can be persisted to a JSON file and are also
+    recovered from validation results stored in the knowledge graph.
+    """
+
+    def __init__(self, storage_path: Optional[str] = None, max_entries: int = 10000):
+        """
+        Initialize the validation cache.
+
+        Args:
+            storage_path: Optional JSON path used by save() and load()
+            max_entries: Maximum number of cached validator results
+        """
+        self.storage_path = storage_path
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[Tuple[str, str, str], List[Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        if storage_path and os.path.exists(storage_path):
+            self.load()
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """
+        Compute the hash of document content.
+
+        Args:
+            content: Document content
+
+        Returns:
+            Hex digest of the content
+        """
+        return hashlib.sha256((content or "").encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def document_hash(validator: Any, document: Any) -> Optional[str]:
+        """
+        Compute the hash of everything a validator reads from a document.
+
+        Args:
+            validator: Validator instance
+            document: Document to validate
+
+        Returns:
+            Hex digest of the content and the validator's other inputs, or
+            None if the validator's result for this document is not cacheable
+        """
+        get_cache_inputs = getattr(validator, "get_cache_inputs", None)
+        inputs = get_cache_inputs(document) if get_cache_inputs else {}
+        if inputs is None:
+            return None
+
+        content_hash = ValidationCache.content_hash(document.content)
+        if not inputs:
+            return content_hash
+
+        data = json.dumps({"content_hash": content_hash, "inputs": inputs}, sort_keys=True, default=_json_default)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def config_hash(validator: Any) -> Optional[str]:
+        """
+        Compute the hash of a validator's configuration.
+
+        Args:
+            validator: Validator instance
+
+        Returns:
+            Hex digest of the configuration, or None if the validator is not cacheable
+        """
+        get_cache_config = getattr(validator, "get_cache_config", None)
+        if get_cache_config is None:
+            return None
+
+        config = json.dumps(get_cache_config(), sort_keys=True, default=_json_default)
+        return hashlib.sha256(config.encode("utf-8")).hexdigest()
+
+    def get(self, content_hash: str, validator_name: str, config_hash: str) -> Optional[List[ValidationIssue]]:
+        """
+        Get the cached issues of a validator run.
+
+        Args:
+            content_hash: Hash of the validator's document inputs
+            validator_name: Name of the validator
+            config_hash: Hash of the validator configuration
+
+        Returns:
+            Fresh copies of the cached issues, or None on a miss
+        """
+        key = (content_hash, validator_name, config_hash)
+        issues = self.entries.get(key)
+        if issues is None:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return [ValidationIssue.from_dict(issue) for issue in issues]
+
+    def put(self, content_hash: str, validator_name: str, config_hash: str,
+            issues: List[ValidationIssue]) -> None:
+        """
+        Cache the issues of a validator run.
+
+        Args:
+            content_hash: Hash of the validator's document inputs
+            validator_name: Name of the validator
+            config_hash: Hash of the validator configuration
+            issues: Issues reported by the validator
+        """
+        key = (content_hash, validator_name, config_hash)
+        self.entries[key] = [issue.to_dict() for issue in issues]
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def seed(self, result: ValidationResult) -> int:
+        """
+        Recover cache entries from a stored validation result.
+
+        Results produced by ValidationManager record the cache key of each
+        validator in their metadata and the validator of each issue, so the
+        result persisted with the document doubles as its cache entry.
+
+        Args:
+            result: Previously stored validation result
+
+        Returns:
+            Number of entries recovered
+        """
+        validator_keys = result.metadata.get(VALIDATOR_KEYS_FIELD, {})
+        if not validator_keys:
+            return 0
+
+        issues_by_validator: Dict[str, List[ValidationIssue]] = {name: [] for name in validator_keys}
+        for issue in result.issues:
+            name = issue.metadata.get(ISSUE_VALIDATOR_FIELD)
+            if name in issues_by_validator:
+                issues_by_validator[name].append(issue)
+
+        recovered = 0
+        for name, key in validator_keys.items():
+            cache_key = (key["content_hash"], name, key["config_hash"])
+            if cache_key not in self.entries:
+                self.put(key["content_hash"], name, key["config_hash"], issues_by_validator[name])
+                recovered += 1
+
+        return recovered
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, hits, misses and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self.entries.clear()
+
+    def save(self, storage_path: Optional[str] = None) -> bool:
+        """
+        Persist the cache as JSON.
+
+        Args:
+            storage_path: Optional path overriding the configured one
+
+        Returns:
+            Success status
+        """
+        storage_path = storage_path or self.storage_path
+        if not storage_path:
+            return False
+
+        try:
+            entries = [
+                {"content_hash": content_hash, "validator": name, "config_hash": config_hash, "issues": issues}
+                for (content_hash, name, config_hash), issues in self.entries.items()
+            ]
+
+            with atomic_write(storage_path) as f:
+                json.dump({"entries": entries}, f)
+
+            logger.info(f"Saved {len(entries)} validation cache entries to {storage_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving validation cache: {e}")
+            return False
+
+    def load(self, storage_path: Optional[str] = None) -> bool:
+        """
+        Load the cache from JSON.
+
+        Args:
+            storage_path: Optional path overriding the configured one
+
+        Returns:
+            Success status
+        """
+        storage_path = storage_path or self.storage_path
+        if not storage_path or not os.path.exists(storage_path):
+            return False
+
+        try:
+            with open(storage_path, 'r') as f:
+                entries = json.load(f).get("entries", [])
+
+            self.entries.clear()
+            for entry in entries[-self.max_entries:]:
+                key = (entry["content_hash"], entry["validator"], entry["config_hash"])
+                self.entries[key] = entry["issues"]
+
+            logger.info(f"Loaded {len(self.entries)} validation cache entries from {storage_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error loading validation cache: {e}")
+            return False
@@ -8,6 +8,7 @@ validation agents to ensure document quality and correctness.
 import os
 import logging
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple, Union
 
 # Import validation models
@@ -19,6 +20,8 @@ from .technical_validator import TechnicalValidator
 from .completeness_validator import CompletenessValidator
 from .consistency_validator import ConsistencyValidator
 from .readability_validator import ReadabilityValidator
+from .parsed_document import ParsedDocument
+from .validation_cache import ValidationCache, VALIDATOR_KEYS_FIELD, ISSUE_VALIDATOR_FIELD
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -50,6 +53,21 @@ class ValidationManager:
         self.warning_threshold = config.get("validation", {}).get("warning_threshold", 5)
         self.critical_fails = config.get("validation", {}).get("critical_fails", True)
         
+        # Configure concurrency: documents validated at once, and worker
+        # processes for CPU-bound validators (0 runs them in this process)
+        self.max_concurrency = config.get("validation", {}).get("max_concurrency", 8)
+        self.process_workers = config.get("validation", {}).get("process_workers", 0)
+        self.process_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Configure the result cache: validators are skipped for documents whose
+        # content, validated fields and validator configuration are unchanged
+        # since the last run
+        self.cache_enabled = config.get("validation", {}).get("cache_enabled", False)
+        self.cache = ValidationCache(
+            storage_path=config.get("validation", {}).get("cache_path"),
+            max_entries=config.get("validation", {}).get("cache_max_entries", 10000)
+        )
+        
         # Initialize validators
         self.technical_validator = TechnicalValidator(config, knowledge_graph, vector_store)
         self.completeness_validator = CompletenessValidator(config, knowledge_graph, vector_store)
@@ -68,14 +86,24 @@ class ValidationManager:
     
     async def validate_document(self, document: Document, 
                               validators: List[str] = None,
-                              validate_related: bool = False) -> ValidationResult:
+                              validate_related: bool = False,
+                              parsed: Optional[ParsedDocument] = None,
+                              use_cache: bool = True) -> ValidationResult:
         """
         Validate a document using configured validators.
         
+        The document is parsed once and the parse is shared by all validators.
+        Validators whose result is cached for the current document inputs and
+        configuration are not run; the cache key of every validator is
+        recorded in the result metadata so the stored result can seed the
+        cache of a later run.
+        
         Args:
             document: Document to validate
             validators: List of validators to run (None for all)
             validate_related: Whether to validate related documents
+            parsed: Existing parse of the document (optional)
+            use_cache: Whether to reuse cached validator results
             
         Returns:
             ValidationResult with aggregated results
@@ -103,23 +131,70 @@ class ValidationManager:
         # Record which validators were run
         result.validators_run = list(validators_to_run.keys())
         
+        # Reuse cached results for unchanged content and configuration
+        use_cache = use_cache and self.cache_enabled
+        if use_cache and document.validation_results:
+            self.cache.seed(document.validation_results)
+        
+        cached_results = {}
+        config_hashes = {}
+        document_hashes = {}
+        for name, validator in validators_to_run.items():
+            config_hash = ValidationCache.config_hash(validator)
+            if config_hash is None:
+                continue
+            document_hash = ValidationCache.document_hash(validator, document)
+            if document_hash is None:
+                continue
+            config_hashes[name] = config_hash
+            document_hashes[name] = document_hash
+            if use_cache:
+                issues = self.cache.get(document_hash, name, config_hash)
+                if issues is not None:
+                    cached_results[name] = issues
+        
+        # Parse the document once for the validators that have to run
+        to_run = [name for name in validators_to_run if name not in cached_results]
+        if to_run:
+            parsed = parsed or ParsedDocument(document.content)
+        
         # Run validators in parallel
         validation_tasks = []
-        for name, validator in validators_to_run.items():
-            task = asyncio.create_task(self._run_validator(name, validator, document))
+        for name in to_run:
+            task = asyncio.create_task(self._run_validator(name, validators_to_run[name], document, parsed))
             validation_tasks.append(task)
         
         # Wait for all validation tasks to complete
         validator_results = await asyncio.gather(*validation_tasks, return_exceptions=True)
         
         # Process results
-        for validator_result in validator_results:
+        issues_by_validator = dict(cached_results)
+        for name, validator_result in zip(to_run, validator_results):
             if isinstance(validator_result, Exception):
                 logger.error(f"Validator error: {validator_result}")
                 continue
             
-            # Add issues from this validator
-            result.issues.extend(validator_result)
+            issues_by_validator[name] = validator_result
+            
+            # Cache clean runs of cacheable validators
+            failed = any(issue.id.startswith("validator-error") for issue in validator_result)
+            if name in config_hashes and not failed:
+                self.cache.put(document_hashes[name], name, config_hashes[name], validator_result)
+        
+        # Add issues in validator order, tagged with the validator that reported them
+        for name in validators_to_run:
+            for issue in issues_by_validator.get(name, []):
+                issue.metadata[ISSUE_VALIDATOR_FIELD] = name
+                result.issues.append(issue)
+        
+        result.metadata[VALIDATOR_KEYS_FIELD] = {
+            name: {"content_hash": document_hashes[name], "config_hash": config_hash}
+            for name, config_hash in config_hashes.items()
+            if name in issues_by_validator
+        }
+        
+        if cached_results:
+            logger.info(f"Reused cached results for {document.id}: {', '.join(cached_results)}")
         
         # Determine overall validation status
         error_count = len([issue for issue in result.issues 
@@ -162,14 +237,18 @@ class ValidationManager:
         return result
     
     async def _run_validator(self, validator_name: str, validator: Any, 
-                          document: Document) -> List[ValidationIssue]:
+                          document: Document, parsed: Optional[ParsedDocument] = None) -> List[ValidationIssue]:
         """
         Run a specific validator on a document.
         
+        Validators with a validate_sync method are pure CPU work and run in
+        the process pool when one is configured.
+        
         Args:
             validator_name: Name of the validator
             validator: Validator instance
             document: Document to validate
+            parsed: Shared parse of the document
             
         Returns:
             List of validation issues
@@ -178,7 +257,12 @@ class ValidationManager:
             logger.info(f"Running {validator_name} validator on document: {document.id}")
             
             # Run validator
-            issues = await validator.validate(document)
+            if self.process_workers and hasattr(validator, "validate_sync"):
+                loop = asyncio.get_running_loop()
+                issues = await loop.run_in_executor(self._get_process_pool(), validator.validate_sync,
+                                                    document, parsed)
+            else:
+                issues = await validator.validate(document, parsed)
             
             logger.info(f"{validator_name} validation completed: {len(issues)} issues found")
             return issues
@@ -203,6 +287,8 @@ class ValidationManager:
         """
         Validate multiple documents.
         
+        At most max_concurrency documents are validated at a time.
+        
         Args:
             documents: List of documents to validate
             validators: List of validators to run (None for all)
@@ -214,12 +300,15 @@ class ValidationManager:
         
         results = {}
         validation_tasks = []
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+        
+        async def validate_limited(document: Document) -> ValidationResult:
+            async with semaphore:
+                return await self.validate_document(document, validators)
         
         # Create validation tasks
         for document in documents:
-            task = asyncio.create_task(
-                self.validate_document(document, validators)
-            )
+            task = asyncio.create_task(validate_limited(document))
             validation_tasks.append((document.id, task))
         
         # Wait for all tasks to complete
@@ -246,6 +335,10 @@ class ValidationManager:
                     validators_run=validators or []
                 )
         
+        # Persist the cache once per batch rather than once per document
+        if self.cache_enabled and self.cache.storage_path:
+            self.cache.save()
+        
         logger.info(f"Completed validation for {len(results)} documents")
         return results
     
@@ -254,6 +347,10 @@ class ValidationManager:
         """
         Validate a batch of documents by their IDs.
         
+        Documents are loaded from the knowledge graph together rather than
+        one at a time; stored validation results that come with them seed
+        the cache, so unchanged documents are not re-validated.
+        
         Args:
             document_ids: List of document IDs to validate
             validators: List of validators to run (None for all)
@@ -264,16 +361,7 @@ class ValidationManager:
         logger.info(f"Validating batch of {len(document_ids)} documents")
         
         # Load documents
-        documents = []
-        for doc_id in document_ids:
-            if self.kg:
-                document = await self.kg.get_document(doc_id)
-                if document:
-                    documents.append(document)
-                else:
-                    logger.warning(f"Document not found: {doc_id}")
-            else:
-                logger.warning("Knowledge graph not available, cannot load documents")
+        documents = await self._load_documents(document_ids)
         
         # Validate documents
         return await self.validate_multiple_documents(documents, validators)
@@ -338,4 +426,60 @@ class ValidationManager:
             return True
         except Exception as e:
             logger.error(f"Error configuring validator {validator_name}: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    async def _load_documents(self, document_ids: List[str]) -> List[Document]:
+        """
+        Load documents from the knowledge graph in one batch.
+        
+        Uses the connector's get_documents when it has one, and otherwise
+        fetches the documents concurrently, at most max_concurrency at a time.
+        
+        Args:
+            document_ids: List of document IDs to load
+            
+        Returns:
+            Documents that were found, in request order
+        """
+        if not self.kg:
+            logger.warning("Knowledge graph not available, cannot load documents")
+            return []
+        
+        if hasattr(self.kg, "get_documents"):
+            loaded = await self.kg.get_documents(document_ids)
+        else:
+            semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+            
+            async def load_limited(doc_id: str) -> Optional[Document]:
+                async with semaphore:
+                    return await self.kg.get_document(doc_id)
+            
+            documents = await asyncio.gather(*(load_limited(doc_id) for doc_id in document_ids))
+            loaded = dict(zip(document_ids, documents))
+        
+        documents = []
+        for doc_id in document_ids:
+            document = loaded.get(doc_id)
+            if document:
+                documents.append(document)
+            else:
+                logger.warning(f"Document not found: {doc_id}")
+        
+        return documents
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """
+        Get the process pool for CPU-bound validators, creating it on first use.
+        
+        Returns:
+            Process pool executor
+        """
+        if self.process_pool is None:
+            self.process_pool = ProcessPoolExecutor(max_workers=self.process_workers)
+        return self.process_pool
+    
+    def close(self):
+        """Shut down the process pool, if one was started."""
+        if self.process_pool is not None:
+            self.process_pool.shutdown()
+            self.process_pool = None
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Typed Adjacency Index for the Knowledge Graph
+
+This module provides an in-memory adjacency layer over the knowledge graph's
+node and edge lists. Edges are indexed by (node, edge type, direction) and
+nodes by type, so traversals such as rendering the roadmap only touch the
+edges they follow instead of scanning the whole edge list. Secondary
+property indexes map node property values to node IDs for filtered queries.
+"""
+
+import heapq
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+
+class TypedAdjacencyIndex:
+    """
+    Index of edge IDs keyed by node, edge type and direction.
+
+    Edges are referenced by their stable "id" rather than their position in
+    the knowledge graph's "edges" list, so removing edges keeps the index valid.
+    """
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self.outgoing: Dict[str, Dict[str, Dict[str, None]]] = {}  # source_id -> edge_type -> ordered set of edge IDs
+        self.incoming: Dict[str, Dict[str, Dict[str, None]]] = {}  # target_id -> edge_type -> ordered set of edge IDs
+        self.nodes_by_type: Dict[str, Dict[str, None]] = {}  # node_type -> ordered set of node IDs
+        self.node_types: Dict[str, str] = {}  # node_id -> node_type
+
+    def build(self, graph: Dict[str, Any]) -> None:
+        """
+        Rebuild the index from a knowledge graph dictionary
+
+        Args:
+            graph: Dictionary with "nodes" and "edges" entries
+        """
+        self.outgoing = {}
+        self.incoming = {}
+        self.nodes_by_type = {}
+        self.node_types = {}
+
+        for node_id, node in graph.get("nodes", {}).items():
+            self.add_node(node_id, node.get("type"))
+
+        for edge in graph.get("edges", []):
+            self.add_edge(edge)
+
+    def add_node(self, node_id: str, node_type: str) -> None:
+        """
+        Index a node by type, moving it if its type changed
+
+        Args:
+            node_id: ID of the node
+            node_type: Type of the node
+        """
+        previous_type = self.node_types.get(node_id)
+        if previous_type == node_type:
+            return
+
+        if previous_type is not None:
+            self._discard_typed_node(previous_type, node_id)
+
+        self.node_types[node_id] = node_type
+        self.nodes_by_type.setdefault(node_type, {})[node_id] = None
+
+    def remove_node(self, node_id: str) -> None:
+        """
+        Remove a node from the type index
+
+        Args:
+            node_id: ID of the node
+        """
+        node_type = self.node_types.pop(node_id, None)
+        if node_type is not None:
+            self._discard_typed_node(node_type, node_id)
+
+    def _discard_typed_node(self, node_type: str, node_id: str) -> None:
+        """Remove a node from the IDs of its type, dropping the type once empty"""
+        node_ids = self.nodes_by_type.get(node_type)
+        if node_ids is None:
+            return
+        node_ids.pop(node_id, None)
+        if not node_ids:
+            del self.nodes_by_type[node_type]
+
+    def add_edge(self, edge: Dict[str, Any]) -> None:
+        """
+        Index an edge under both of its endpoints
+
+        Args:
+            edge: Edge dictionary with "id", "type", "source" and "target"
+        """
+        edge_type = edge.get("type")
+        self.outgoing.setdefault(edge.get("source"), {}).setdefault(edge_type, {})[edge["id"]] = None
+        self.incoming.setdefault(edge.get("target"), {}).setdefault(edge_type, {})[edge["id"]] = None
+
+    def remove_edge(self, edge: Dict[str, Any]) -> None:
+        """
+        Remove an edge from both of its endpoints
+
+        Args:
+            edge: Edge dictionary with "id", "type", "source" and "target"
+        """
+        edge_type = edge.get("type")
+        for by_node, node_id in ((self.outgoing, edge.get("source")), (self.incoming, edge.get("target"))):
+            by_type = by_node.get(node_id, {})
+            edge_ids = by_type.get(edge_type)
+            if edge_ids is None:
+                continue
+            edge_ids.pop(edge["id"], None)
+            if not edge_ids:
+                del by_type[edge_type]
+            if not by_type:
+                del by_node[node_id]
+
+    def edge_ids(self, node_id: str, edge_type: Optional[str] = None,
+                 direction: str = "outgoing") -> List[str]:
+        """
+        Get IDs of the edges attached to a node
+
+        Args:
+            node_id: ID of the node
+            edge_type: Edge type to follow (None for all types)
+            direction: "outgoing", "incoming" or "both"
+
+        Returns:
+            Edge IDs in insertion order per edge type
+        """
+        edge_ids = []
+        if direction in ("outgoing", "both"):
+            edge_ids.extend(self._edge_ids(self.outgoing.get(node_id, {}), edge_type))
+        if direction in ("incoming", "both"):
+            edge_ids.extend(self._edge_ids(self.incoming.get(node_id, {}), edge_type))
+        return edge_ids
+
+    def node_ids_by_type(self, node_type: str) -> List[str]:
+        """
+        Get the IDs of all nodes of a type
+
+        Args:
+            node_type: Type of node
+
+        Returns:
+            Node IDs in insertion order
+        """
+        return list(self.nodes_by_type.get(node_type, {}))
+
+    def _edge_ids(self, by_type: Dict[str, Dict[str, None]], edge_type: Optional[str]) -> Iterable[str]:
+        """Get edge IDs for one edge type, or all of them"""
+        if edge_type is not None:
+            return by_type.get(edge_type, {})
+        return [edge_id for edge_ids in by_type.values() for edge_id in edge_ids]
+
+
+class PropertyIndex:
+    """
+    Secondary index from node property values to node IDs.
+
+    Fields are declared as name -> (section, key), where section is
+    "properties" or "metadata". List values (such as tags) are indexed per
+    element. Query results keep the order in which nodes were first indexed.
+    """
+
+    def __init__(self, fields: Dict[str, Tuple[str, str]]):
+        """
+        Initialize an empty index
+
+        Args:
+            fields: Mapping of field name to (section, key) in the node dictionary
+        """
+        self.fields = fields
+        self.postings: Dict[str, Dict[Any, Dict[str, None]]] = {name: {} for name in fields}  # field -> value -> node IDs
+        self.indexed_values: Dict[str, Dict[str, List[Any]]] = {}  # node_id -> field -> values
+        self.order: Dict[str, int] = {}  # node_id -> first indexing sequence number
+        self._next_order = 0
+
+    def field_values(self, node: Dict[str, Any], name: str) -> List[Any]:
+        """
+        Get the indexable values of a field for a node
+
+        Args:
+            node: Node dictionary
+            name: Field name
+
+        Returns:
+            List of hashable values (empty if the field is missing)
+        """
+        section, key = self.fields[name]
+        value = node.get(section, {}).get(key)
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        return [v for v in values if isinstance(v, (str, int, float, bool))]
+
+    def index_node(self, node: Dict[str, Any]) -> None:
+        """
+        Index or re-index a node
+
+        Args:
+            node: Node dictionary with an "id"
+        """
+        node_id = node.get("id")
+        self._remove_postings(node_id)
+
+        if node_id not in self.order:
+            self.order[node_id] = self._next_order
+            self._next_order += 1
+
+        values = {}
+        for name in self.fields:
+            values[name] = self.field_values(node, name)
+            for value in values[name]:
+                self.postings[name].setdefault(value, {})[node_id] = None
+        self.indexed_values[node_id] = values
+
+    def remove_node(self, node_id: str) -> None:
+        """
+        Remove a node from the postings and forget its sequence number
+
+        Args:
+            node_id: ID of the node
+        """
+        self._remove_postings(node_id)
+        self.order.pop(node_id, None)
+
+    def _remove_postings(self, node_id: str) -> None:
+        """Remove a node from the postings, keeping its sequence number"""
+        values = self.indexed_values.pop(node_id, None)
+        if not values:
+            return
+
+        for name, field_values in values.items():
+            postings = self.postings[name]
+            for value in field_values:
+                node_ids = postings.get(value)
+                if node_ids is not None:
+                    node_ids.pop(node_id, None)
+                    if not node_ids:
+                        del postings[value]
+
+    def lookup(self, criteria: Dict[str, Any], limit: Optional[int] = None) -> List[str]:
+        """
+        Find nodes matching all criteria
+
+        A list criterion matches nodes having any of the listed values.
+        Posting sets are intersected smallest first.
+
+        Args:
+            criteria: Mapping of field name to value or list of values
+            limit: Maximum number of node IDs to return
+
+        Returns:
+            Matching node IDs in first-indexed order
+        """
+        candidate_sets = []
+        for name, wanted in criteria.items():
+            postings = self.postings[name]
+            if isinstance(wanted, (list, tuple, set)):
+                matched = {}
+                for value in wanted:
+                    matched.update(postings.get(value, {}))
+            else:
+                matched = postings.get(wanted, {})
+            if not matched:
+                return []
+            candidate_sets.append(matched)
+
+        if not candidate_sets:
+            node_ids = list(self.indexed_values)
+        else:
+            candidate_sets.sort(key=len)
+            smallest, others = candidate_sets[0], candidate_sets[1:]
+            node_ids = [node_id for node_id in smallest if all(node_id in other for other in others)]
+
+        if limit is not None and limit < len(node_ids):
+            return heapq.nsmallest(limit, node_ids, key=self.order.__getitem__)
+        return sorted(node_ids, key=self.order.__getitem__)
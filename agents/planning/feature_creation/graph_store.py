@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+Journaled Storage for the Knowledge Graph
+
+This module persists the knowledge graph as a JSON snapshot plus a
+write-ahead journal of node and edge mutations. Saves append only the
+changes made since the previous save, and the journal is compacted into a
+new snapshot once it grows past a threshold. Snapshots are written to a
+temporary file and atomically renamed, and a journal record cut short by a
+crash is discarded on load, so an interrupted save never leaves a
+truncated graph behind.
+
+IndexedGraphFile gives lazy access to the same files through an on-disk
+node index, for callers that read single nodes without loading the graph.
+"""
+
+import os
+import sys
+import json
+import uuid
+import logging
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+# Determine project root directory dynamically
+PROJECT_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from agents.utils.atomic_write import atomic_write
+from agents.utils.graph_node_store import GraphNodeStore
+
+logger = logging.getLogger('knowledge_graph_connector')
+
+
+def empty_graph() -> Dict[str, Any]:
+    """Create an empty knowledge graph memory dictionary"""
+    return {
+        "knowledge_graph": {
+            "nodes": {},
+            "edges": [],
+            "indices": {
+                "node_type_index": {},
+                "edge_type_index": {},
+                "node_outgoing_edges": {},
+                "node_incoming_edges": {}
+            }
+        }
+    }
+
+
+def default_graph_path() -> str:
+    """
+    Get the path of the knowledge graph file shared by the agents
+
+    Returns:
+        The system core memory graph if it exists, otherwise the SDK storage graph
+    """
+    memory_dir = os.path.join(PROJECT_ROOT, 'backups', 'system-core-backup', 'system-core', 'memory')
+    memory_path = os.path.join(memory_dir, 'knowledge_graph.json')
+    if os.path.exists(memory_path):
+        return memory_path
+    return os.path.join(os.path.expanduser("~/.devloop/sdk/storage"), 'knowledge_graph.json')
+
+
+def apply_changes(memory: Dict[str, Any], changes: List[Dict[str, Any]]) -> None:
+    """
+    Apply journal records to a knowledge graph memory dictionary
+
+    Records are idempotent, so replaying a journal over a snapshot that
+    already contains some of its changes gives the same graph.
+
+    Args:
+        memory: Knowledge graph memory dictionary (modified in place)
+        changes: Journal records ("put_node", "remove_node", "put_edge", "remove_edge")
+    """
+    graph = memory.setdefault("knowledge_graph", {})
+    nodes = graph.setdefault("nodes", {})
+    edges = graph.setdefault("edges", [])
+
+    positions = {edge.get("id"): position for position, edge in enumerate(edges)}  # edge_id -> position
+    removed = False
+
+    for change in changes:
+        op = change.get("op")
+        if op == "put_node":
+            nodes[change["node"]["id"]] = change["node"]
+        elif op == "remove_node":
+            nodes.pop(change["id"], None)
+        elif op == "put_edge":
+            edge = change["edge"]
+            position = positions.get(edge["id"])
+            if position is None or edges[position] is None:
+                positions[edge["id"]] = len(edges)
+                edges.append(edge)
+            else:
+                edges[position] = edge
+        elif op == "remove_edge":
+            position = positions.pop(change["id"], None)
+            if position is not None:
+                edges[position] = None
+                removed = True
+        else:
+            logger.warning(f"Skipping unknown journal record: {op}")
+
+    if removed:
+        graph["edges"] = [edge for edge in edges if edge is not None]
+
+
+class JournaledGraphStore:
+    """
+    Snapshot plus write-ahead journal for one knowledge graph file.
+
+    The snapshot lives at the configured path and the journal next to it
+    with a ".journal" suffix, one JSON record per line.
+    """
+
+    def __init__(self, snapshot_path: str, compact_threshold: int = 1000):
+        """
+        Initialize the store
+
+        Args:
+            snapshot_path: Path of the snapshot file
+            compact_threshold: Number of journal records that triggers compaction
+        """
+        self.snapshot_path = os.path.abspath(snapshot_path)
+        self.journal_path = f"{self.snapshot_path}.journal"
+        self.compact_threshold = compact_threshold
+        self.journal_records = 0
+
+    def exists(self) -> bool:
+        """Check whether a snapshot or journal exists on disk"""
+        return os.path.exists(self.snapshot_path) or os.path.exists(self.journal_path)
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Load the snapshot and replay the journal over it
+
+        Returns:
+            Knowledge graph memory dictionary
+        """
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r') as f:
+                memory = json.load(f)
+        else:
+            memory = empty_graph()
+
+        changes = self._read_journal()
+        apply_changes(memory, changes)
+        self.journal_records = len(changes)
+
+        if changes:
+            logger.info(f"Replayed {len(changes)} journal records from {self.journal_path}")
+        return memory
+
+    def commit(self, changes: List[Dict[str, Any]], memory: Dict[str, Any]) -> None:
+        """
+        Persist changes, compacting the journal when it grows too long
+
+        Args:
+            changes: Journal records made since the last commit
+            memory: Current knowledge graph memory dictionary (used for snapshots)
+        """
+        if self.snapshot_due(changes):
+            self.write_snapshot(memory)
+        elif changes:
+            self._append(changes)
+
+    def snapshot_due(self, changes: List[Dict[str, Any]]) -> bool:
+        """
+        Check whether committing changes writes a snapshot instead of appending to the journal
+
+        Args:
+            changes: Journal records made since the last commit
+
+        Returns:
+            True if there is no snapshot yet or the journal would reach the compaction threshold
+        """
+        return (not os.path.exists(self.snapshot_path)
+                or self.journal_records + len(changes) >= self.compact_threshold)
+
+    def write_snapshot(self, memory: Dict[str, Any]) -> None:
+        """
+        Write a full snapshot and truncate the journal
+
+        Args:
+            memory: Knowledge graph memory dictionary
+        """
+        with atomic_write(self.snapshot_path, durable=True) as f:
+            json.dump(memory, f, separators=(",", ":"))
+
+        # The journal is only dropped once the snapshot containing it is durable
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.journal_records = 0
+
+        logger.info(f"Wrote knowledge graph snapshot to {self.snapshot_path}")
+
+    def _append(self, changes: List[Dict[str, Any]]) -> None:
+        """Append records to the journal and flush them to disk"""
+        data = "".join(json.dumps(change) + "\n" for change in changes)
+        with open(self.journal_path, 'a') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self.journal_records += len(changes)
+
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        """
+        Read journal records, dropping a trailing record cut short by a crash
+
+        Returns:
+            List of complete journal records
+        """
+        if not os.path.exists(self.journal_path):
+            return []
+
+        changes = []
+        valid_bytes = 0
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    changes.append(json.loads(line))
+                except ValueError:
+                    break
+                valid_bytes += len(line)
+
+        if valid_bytes < os.path.getsize(self.journal_path):
+            logger.warning(f"Discarding incomplete journal tail in {self.journal_path}")
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(valid_bytes)
+
+        return changes
+
+
+class IndexedGraphFile:
+    """
+    Lazy access to a journaled knowledge graph file through an on-disk index.
+
+    The snapshot and journal stay the copy of record, shared with every
+    MemoryKnowledgeGraph that loads the same file. A SQLite index next to
+    them (".index.sqlite" suffix) mirrors their nodes and edges, so point
+    lookups, type scans and edge lookups read only the rows they need.
+
+    The index catches up with the files on open and on save by replaying
+    the journal records it has not seen yet, and is only rebuilt when the
+    snapshot has been rewritten. Writes are visible in the index right
+    away and reach the journal on save().
+    """
+
+    def __init__(self, snapshot_path: str, index_path: Optional[str] = None, compact_threshold: int = 1000):
+        """
+        Open the index of a knowledge graph file, bringing it up to date
+
+        Args:
+            snapshot_path: Path of the snapshot file
+            index_path: Path of the SQLite index (defaults to next to the snapshot)
+            compact_threshold: Number of journal records that triggers compaction
+        """
+        self.store = JournaledGraphStore(snapshot_path, compact_threshold)
+        self.index = GraphNodeStore(index_path or f"{self.store.snapshot_path}.index.sqlite")
+        self.pending_changes = []
+
+        self.refresh()
+        self.index.commit()
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the snapshot and journal on disk"""
+        snapshot = self._file_signature(self.store.snapshot_path)
+        offset = int(self.index.get_meta("journal_offset") or 0)
+        journal_size = os.path.getsize(self.store.journal_path) if os.path.exists(self.store.journal_path) else 0
+
+        if self.index.get_meta("snapshot") != snapshot or journal_size < offset:
+            self._rebuild(snapshot)
+            offset = 0
+
+        offset, records = self._replay_journal(offset)
+        self.store.journal_records = int(self.index.get_meta("journal_records") or 0) + records
+        self.index.set_meta("journal_offset", str(offset))
+        self.index.set_meta("journal_records", str(self.store.journal_records))
+
+    def save(self) -> None:
+        """Append the changes made since the last save to the journal"""
+        # Discard the indexed writes; they come back from the journal after
+        # any records other writers appended in the meantime
+        self.index.rollback()
+        if self.pending_changes:
+            self.store._append(self.pending_changes)
+            self.pending_changes = []
+
+        self.refresh()
+        if self.store.snapshot_due([]):
+            self.compact()
+        self.index.commit()
+
+    def compact(self) -> None:
+        """Fold the journal into a fresh snapshot written from the index"""
+        memory = empty_graph()
+        graph = memory["knowledge_graph"]
+        graph["nodes"] = dict(self.index.iter_nodes())
+        graph["edges"] = self.index.get_edges()
+
+        # Loaders rebuild the persisted indices from the nodes and edges
+        self.store.write_snapshot(memory)
+
+        self.index.set_meta("snapshot", self._file_signature(self.store.snapshot_path))
+        self.index.set_meta("journal_offset", "0")
+        self.index.set_meta("journal_records", "0")
+
+    def close(self) -> None:
+        """Close the index, dropping writes that were never saved"""
+        self.index.rollback()
+        self.index.close()
+
+    def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Get a node by ID"""
+        return self.index.get_node(node_id)
+
+    def get_nodes(self, node_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several nodes by ID, keyed by the IDs that were found"""
+        return self.index.get_nodes(node_ids)
+
+    def get_nodes_by_type(self, node_type: str) -> List[Dict[str, Any]]:
+        """Get nodes by type"""
+        return self.index.get_nodes_by_type(node_type)
+
+    def get_edges(self, source_id: Optional[str] = None, target_id: Optional[str] = None,
+                  edge_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Find edges by endpoint and type"""
+        return self.index.get_edges(source_id=source_id, target_id=target_id, edge_type=edge_type)
+
+    def add_node(self, node_id: str, node_type: str, properties: Optional[Dict[str, Any]] = None,
+                 metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Add or replace a node"""
+        node = {
+            "id": node_id,
+            "type": node_type,
+            "properties": properties or {},
+            "metadata": metadata or {}
+        }
+        self._record({"op": "put_node", "node": node})
+        return node
+
+    def update_node(self, node_id: str, properties: Optional[Dict[str, Any]] = None,
+                    metadata: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Update a node's properties and metadata"""
+        node = self.index.get_node(node_id)
+        if not node:
+            return None
+        if properties is not None:
+            node["properties"] = properties
+        if metadata is not None:
+            node["metadata"] = metadata
+
+        self._record({"op": "put_node", "node": node})
+        return node
+
+    def add_edge(self, edge_type: str, source_id: str, target_id: str,
+                 properties: Optional[Dict[str, Any]] = None,
+                 metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Add an edge with a stable ID"""
+        edge = {
+            "id": f"edge-{uuid.uuid4().hex}",
+            "type": edge_type,
+            "source": source_id,
+            "target": target_id,
+            "properties": properties or {},
+            "metadata": metadata or {}
+        }
+        self._record({"op": "put_edge", "edge": edge})
+        return edge
+
+    def _record(self, change: Dict[str, Any]) -> None:
+        """Index a change now and queue it for the journal"""
+        self._apply(change)
+        self.pending_changes.append(change)
+
+    def _apply(self, change: Dict[str, Any]) -> None:
+        """Apply one journal record to the index"""
+        op = change.get("op")
+        if op == "put_node":
+            node = change["node"]
+            self.index.put_node(node["id"], node, [node.get("type")])
+        elif op == "remove_node":
+            self.index.delete_node(change["id"])
+        elif op == "put_edge":
+            edge = change["edge"]
+            self.index.put_edge(edge["id"], edge.get("type"), edge.get("source"), edge.get("target"), edge)
+        elif op == "remove_edge":
+            self.index.delete_edge(change["id"])
+        else:
+            logger.warning(f"Skipping unknown journal record: {op}")
+
+    def _rebuild(self, snapshot: str) -> None:
+        """Replace the index contents with the snapshot on disk"""
+        self.index.clear()
+        if os.path.exists(self.store.snapshot_path):
+            with open(self.store.snapshot_path, 'r') as f:
+                graph = json.load(f).get("knowledge_graph", {})
+
+            self.index.insert_nodes(
+                (node_id, node, [node.get("type")]) for node_id, node in graph.get("nodes", {}).items()
+            )
+            for edge in graph.get("edges", []):
+                if edge.get("id"):
+                    self.index.put_edge(edge["id"], edge.get("type"), edge.get("source"), edge.get("target"), edge)
+                else:
+                    self.index.add_edge(edge.get("type"), edge.get("source"), edge.get("target"), edge)
+
+            logger.info(f"Indexed {self.index.count_nodes()} nodes from {self.store.snapshot_path}")
+
+        self.index.set_meta("snapshot", snapshot)
+        self.index.set_meta("journal_records", "0")
+
+    def _replay_journal(self, offset: int) -> Tuple[int, int]:
+        """
+        Apply the complete journal records after a byte offset to the index
+
+        Args:
+            offset: Byte offset of the first record not yet indexed
+
+        Returns:
+            Tuple of the offset after the last applied record and the number of records applied
+        """
+        if not os.path.exists(self.store.journal_path):
+            return offset, 0
+
+        records = 0
+        with open(self.store.journal_path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                # A record cut short by a crash is left for the next full load to discard
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    change = json.loads(line)
+                except ValueError:
+                    break
+                self._apply(change)
+                offset += len(line)
+                records += 1
+
+        return offset, records
+
+    @staticmethod
+    def _file_signature(path: str) -> str:
+        """Identify the current version of a file by its modification time and size"""
+        if not os.path.exists(path):
+            return ""
+        stat = os.stat(path)
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
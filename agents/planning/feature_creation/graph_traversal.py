@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Traversal Engine for the Knowledge Graph
+
+This module provides breadth-first and bidirectional traversals over the
+knowledge graph with edge-type filters, depth, fan-out and result limits.
+Traversals expand one level at a time and keep a single visited set, so
+cycles are followed at most once and each node is expanded once. Transitive
+closures are cached per graph version for repeated impact analysis.
+"""
+
+from typing import Dict, List, Any, Optional, Callable, Iterable, Tuple
+
+
+class GraphTraversal:
+    """
+    Level-synchronous traversals over a knowledge graph.
+
+    The graph is accessed through a get_edges(node_id, edge_type, direction)
+    callable returning edge dictionaries, so the engine works with any
+    knowledge graph the connector can read edges from.
+    """
+
+    def __init__(self, get_edges: Callable[[str, str, str], List[Dict[str, Any]]]):
+        """
+        Initialize the traversal engine
+
+        Args:
+            get_edges: Callable returning the edges of one type attached to a node
+                in one direction ("outgoing" or "incoming")
+        """
+        self.get_edges = get_edges
+        self.closure_cache: Dict[Tuple, List[Dict[str, Any]]] = {}  # (start IDs, edge types, direction) -> visits
+        self.closure_version = None
+
+    def neighbors(self, node_id: str, edge_types: Iterable[str],
+                  direction: str = "outgoing") -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Get the neighbors of a node
+
+        Args:
+            node_id: ID of the node
+            edge_types: Edge types to follow
+            direction: "outgoing", "incoming" or "both"
+
+        Returns:
+            List of (neighbor ID, edge) tuples in edge order
+        """
+        directions = ("outgoing", "incoming") if direction == "both" else (direction,)
+
+        result = []
+        for edge_direction in directions:
+            other_endpoint = "target" if edge_direction == "outgoing" else "source"
+            for edge_type in edge_types:
+                for edge in self.get_edges(node_id, edge_type, edge_direction):
+                    result.append((edge.get(other_endpoint), edge))
+        return result
+
+    def bfs(self, start_ids: Iterable[str], edge_types: Iterable[str], direction: str = "outgoing",
+            max_depth: Optional[int] = None, max_fanout: Optional[int] = None,
+            max_nodes: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Breadth-first traversal from one or more start nodes
+
+        Args:
+            start_ids: IDs of the start nodes (not included in the result)
+            edge_types: Edge types to follow
+            direction: "outgoing", "incoming" or "both"
+            max_depth: Maximum number of hops (None for unlimited)
+            max_fanout: Maximum number of edges followed per node
+            max_nodes: Maximum number of nodes to return
+
+        Returns:
+            Visits in breadth-first order, each with "id", "depth", "parent" and
+            the "edge" it was reached through
+        """
+        edge_types = list(edge_types)
+        frontier = list(dict.fromkeys(start_ids))
+        visited = set(frontier)
+
+        visits = []
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            next_frontier = []
+            for node_id in frontier:
+                neighbors = self.neighbors(node_id, edge_types, direction)
+                if max_fanout is not None:
+                    neighbors = neighbors[:max_fanout]
+
+                for neighbor_id, edge in neighbors:
+                    if neighbor_id in visited:
+                        continue
+                    visited.add(neighbor_id)
+                    next_frontier.append(neighbor_id)
+                    visits.append({"id": neighbor_id, "depth": depth, "parent": node_id, "edge": edge})
+                    if max_nodes is not None and len(visits) >= max_nodes:
+                        return visits
+            frontier = next_frontier
+
+        return visits
+
+    def shortest_path(self, source_id: str, target_id: str, edge_types: Iterable[str],
+                      max_depth: Optional[int] = None) -> Optional[List[str]]:
+        """
+        Find a shortest directed path with a bidirectional search
+
+        The smaller of the two frontiers is expanded at each step: forward
+        along outgoing edges from the source, backward along incoming edges
+        from the target.
+
+        Args:
+            source_id: ID of the start node
+            target_id: ID of the end node
+            edge_types: Edge types to follow
+            max_depth: Maximum path length in hops
+
+        Returns:
+            Node IDs from source to target, or None if no path is found
+        """
+        if source_id == target_id:
+            return [source_id]
+
+        edge_types = list(edge_types)
+        forward_parents = {source_id: None}  # node_id -> previous node on the path from the source
+        backward_parents = {target_id: None}  # node_id -> next node on the path to the target
+        forward_frontier = [source_id]
+        backward_frontier = [target_id]
+        hops = 0
+
+        while forward_frontier and backward_frontier and (max_depth is None or hops < max_depth):
+            hops += 1
+            if len(forward_frontier) <= len(backward_frontier):
+                frontier, parents, others, direction = forward_frontier, forward_parents, backward_parents, "outgoing"
+            else:
+                frontier, parents, others, direction = backward_frontier, backward_parents, forward_parents, "incoming"
+
+            next_frontier = []
+            meeting = None
+            for node_id in frontier:
+                for neighbor_id, _ in self.neighbors(node_id, edge_types, direction):
+                    if neighbor_id in parents:
+                        continue
+                    parents[neighbor_id] = node_id
+                    if neighbor_id in others:
+                        meeting = neighbor_id
+                        break
+                    next_frontier.append(neighbor_id)
+                if meeting is not None:
+                    break
+
+            if meeting is not None:
+                return self._join_path(meeting, forward_parents, backward_parents)
+
+            if direction == "outgoing":
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+
+        return None
+
+    def transitive_closure(self, start_ids: Iterable[str], edge_types: Iterable[str],
+                           direction: str = "outgoing", version: Any = None) -> List[Dict[str, Any]]:
+        """
+        Get every node reachable from the start nodes, cached per graph version
+
+        Args:
+            start_ids: IDs of the start nodes
+            edge_types: Edge types to follow
+            direction: "outgoing", "incoming" or "both"
+            version: Graph version; results are only cached when it is given
+                and the cache is dropped when it changes
+
+        Returns:
+            Visits as returned by bfs(), without limits
+        """
+        if version is None:
+            return self.bfs(start_ids, edge_types, direction)
+
+        if version != self.closure_version:
+            self.closure_cache = {}
+            self.closure_version = version
+
+        key = (frozenset(start_ids), tuple(edge_types), direction)
+        if key not in self.closure_cache:
+            self.closure_cache[key] = self.bfs(key[0], edge_types, direction)
+        return self.closure_cache[key]
+
+    @staticmethod
+    def _join_path(meeting: str, forward_parents: Dict[str, Optional[str]],
+                   backward_parents: Dict[str, Optional[str]]) -> List[str]:
+        """Join the two halves of a bidirectional search at the meeting node"""
+        path = []
+        node_id = meeting
+        while node_id is not None:
+            path.append(node_id)
+            node_id = forward_parents[node_id]
+        path.reverse()
+
+        node_id = backward_parents[meeting]
+        while node_id is not None:
+            path.append(node_id)
+            node_id = backward_parents[node_id]
+        return path
@@ -10,6 +10,7 @@ module and adds feature creation specific capabilities.
 import os
 import sys
 import json
+import uuid
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
@@ -25,6 +26,24 @@ except ImportError:
     except ImportError:
         TAG_MANAGER_AVAILABLE = False
 
+# Typed adjacency layer used by graph traversals
+try:
+    from graph_index import TypedAdjacencyIndex, PropertyIndex
+except ImportError:
+    from agents.planning.feature_creation.graph_index import TypedAdjacencyIndex, PropertyIndex
+
+# Multi-hop traversals and cached transitive closures
+try:
+    from graph_traversal import GraphTraversal
+except ImportError:
+    from agents.planning.feature_creation.graph_traversal import GraphTraversal
+
+# Snapshot and write-ahead journal storage for the knowledge graph
+try:
+    from graph_store import JournaledGraphStore, empty_graph, default_graph_path
+except ImportError:
+    from agents.planning.feature_creation.graph_store import JournaledGraphStore, empty_graph, default_graph_path
+
 # No need for patching, we'll update the schema directly
 
 # Determine project root directory dynamically
@@ -33,6 +52,8 @@ PROJECT_ROOT = os.path.normpath(os.path.join(current_dir, '..', '..', '..'))
 if PROJECT_ROOT not in sys.path:
     sys.path.append(PROJECT_ROOT)
 
+from agents.utils.atomic_write import atomic_write
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -67,8 +88,7 @@ class SimpleMemoryPersistence:
         """Set state to file system"""
         state_file = os.path.join(self.storage_dir, f"{state_key}.json")
         try:
-            os.makedirs(os.path.dirname(state_file), exist_ok=True)
-            with open(state_file, 'w') as f:
+            with atomic_write(state_file) as f:
                 json.dump(state, f, indent=2)
             return True
         except Exception as e:
@@ -94,39 +114,107 @@ except ImportError:
             self.memory_persistence = MemoryPersistence()
             self.kg_state_key = "knowledge_graph"
             
-            if memory_file and os.path.exists(memory_file):
-                with open(memory_file, 'r') as f:
-                    self.memory = json.load(f)
+            # Journaled file storage; saves append the changes recorded since the last save
+            self.store = None
+            self.pending_changes = []
+            self.needs_snapshot = False
+            
+            # Bumped on every mutation so derived caches know when to refresh
+            self.version = 0
+            
+            if memory_file and JournaledGraphStore(memory_file).exists():
+                self.store = JournaledGraphStore(memory_file)
+                self.memory = self.store.load()
             else:
-                self.memory = memory_data or self.memory_persistence.get_state(self.kg_state_key, {
-                    "knowledge_graph": {
-                        "nodes": {},
-                        "edges": [],
-                        "indices": {
-                            "node_type_index": {},
-                            "edge_type_index": {},
-                            "node_outgoing_edges": {},
-                            "node_incoming_edges": {}
-                        }
-                    }
-                })
+                self.memory = memory_data or self.memory_persistence.get_state(self.kg_state_key, empty_graph())
+            
+            self.edges_by_id = {}  # edge_id -> edge
+            self.edge_positions = {}  # edge_id -> position in the "edges" list
+            self.indices_stale = False  # persisted indices still list removed or retyped entries
+            self._load_edges()
+            
+            # Build the typed adjacency layer once; add_node/add_edge keep it current
+            self.adjacency = TypedAdjacencyIndex()
+            self.adjacency.build(self.memory.get("knowledge_graph", {}))
+            
+            # Secondary property indexes, registered per node type by callers
+            self.property_indexes = {}  # node_type -> PropertyIndex
+            
+        def _load_edges(self):
+            """Give every edge a stable ID and rebuild the persisted indices from them"""
+            graph = self.memory.setdefault("knowledge_graph", {})
+            edges = graph.setdefault("edges", [])
+            
+            for position, edge in enumerate(edges):
+                # Older graphs referenced edges by list position; those edges get IDs here
+                if not edge.get("id"):
+                    edge["id"] = self._new_edge_id()
+                    self.needs_snapshot = True
+                self.edges_by_id[edge["id"]] = edge
+                self.edge_positions[edge["id"]] = position
+            
+            self._rebuild_indices()
+            
+        def _rebuild_indices(self):
+            """Rebuild the persisted node and edge indices from the nodes and edges"""
+            graph = self.memory["knowledge_graph"]
+            indices = {
+                "node_type_index": {},
+                "edge_type_index": {},
+                "node_outgoing_edges": {},
+                "node_incoming_edges": {}
+            }
+            for node_id, node in graph.get("nodes", {}).items():
+                indices["node_type_index"].setdefault(node.get("type"), []).append(node_id)
+            
+            for edge in graph.get("edges", []):
+                indices["edge_type_index"].setdefault(edge.get("type"), []).append(edge["id"])
+                indices["node_outgoing_edges"].setdefault(edge.get("source"), []).append(edge["id"])
+                indices["node_incoming_edges"].setdefault(edge.get("target"), []).append(edge["id"])
+            
+            graph["indices"] = indices
+            self.indices_stale = False
+            
+        @staticmethod
+        def _new_edge_id():
+            """Create a stable edge ID"""
+            return f"edge-{uuid.uuid4().hex}"
             
         def save(self, file_path):
             """Save knowledge graph to file or state storage"""
             if file_path:
-                with open(file_path, 'w') as f:
-                    json.dump(self.memory, f, indent=2)
+                if self.store is None or self.store.snapshot_path != os.path.abspath(file_path):
+                    # Journal records only apply to the file they were loaded from
+                    self.store = JournaledGraphStore(file_path)
+                    self.needs_snapshot = True
+                if self.needs_snapshot or self.store.snapshot_due(self.pending_changes):
+                    self._write_snapshot()
+                else:
+                    self.store.commit(self.pending_changes, self.memory)
+                self.needs_snapshot = False
             else:
+                if self.indices_stale:
+                    self._rebuild_indices()
                 self.memory_persistence.set_state(self.kg_state_key, self.memory)
+            self.pending_changes = []
+            
+        def compact(self):
+            """Fold the journal into a fresh snapshot of the current graph"""
+            if self.store is not None:
+                self._write_snapshot()
+                self.pending_changes = []
+                self.needs_snapshot = False
+                
+        def _write_snapshot(self):
+            """Write a snapshot, first dropping removed and retyped entries from the persisted indices"""
+            if self.indices_stale:
+                self._rebuild_indices()
+            self.store.write_snapshot(self.memory)
                 
         def get_nodes_by_type(self, node_type):
             """Get nodes by type from the knowledge graph"""
-            nodes = []
-            if "knowledge_graph" in self.memory and "nodes" in self.memory["knowledge_graph"]:
-                for node_id, node in self.memory["knowledge_graph"]["nodes"].items():
-                    if node.get("type") == node_type:
-                        nodes.append(node)
-            return nodes
+            nodes = self.memory.get("knowledge_graph", {}).get("nodes", {})
+            return [nodes[node_id] for node_id in self.adjacency.node_ids_by_type(node_type) if node_id in nodes]
             
         def get_node(self, node_id):
             """Get a node by ID"""
@@ -134,21 +222,56 @@ except ImportError:
                 return self.memory["knowledge_graph"]["nodes"].get(node_id)
             return None
             
-        def get_connected_nodes(self, node_id, direction="outgoing"):
+        def get_edge(self, edge_id):
+            """Get an edge by ID"""
+            return self.edges_by_id.get(edge_id)
+            
+        def add_property_index(self, node_type, fields):
+            """Register a secondary index over properties/metadata of one node type"""
+            index = PropertyIndex(fields)
+            for node in self.get_nodes_by_type(node_type):
+                index.index_node(node)
+            self.property_indexes[node_type] = index
+            return index
+            
+        def find_nodes(self, node_type, criteria, limit=None):
+            """Find nodes of a type matching indexed property criteria"""
+            index = self.property_indexes.get(node_type)
+            if index is None:
+                raise KeyError(f"No property index registered for node type {node_type}")
+            nodes = self.memory.get("knowledge_graph", {}).get("nodes", {})
+            return [nodes[node_id] for node_id in index.lookup(criteria, limit) if node_id in nodes]
+            
+        def update_node(self, node_id, properties=None, metadata=None):
+            """Update a node's properties and metadata in place"""
+            node = self.get_node(node_id)
+            if not node:
+                return None
+            if properties is not None:
+                node["properties"] = properties
+            if metadata is not None:
+                node["metadata"] = metadata
+            
+            index = self.property_indexes.get(node.get("type"))
+            if index is not None:
+                index.index_node(node)
+            
+            self.pending_changes.append({"op": "put_node", "node": node})
+            self.version += 1
+            return node
+            
+        def get_edges(self, node_id, edge_type=None, direction="outgoing"):
+            """Get edges attached to a node, optionally of one type"""
+            return [self.edges_by_id[edge_id] for edge_id in self.adjacency.edge_ids(node_id, edge_type, direction)]
+            
+        def get_connected_nodes(self, node_id, direction="outgoing", edge_type=None):
             """Get connected nodes"""
             connected_nodes = []
-            if "knowledge_graph" in self.memory and "edges" in self.memory["knowledge_graph"]:
-                for edge in self.memory["knowledge_graph"]["edges"]:
-                    if direction == "outgoing" and edge.get("source") == node_id:
-                        target_id = edge.get("target")
-                        target_node = self.get_node(target_id)
-                        if target_node:
-                            connected_nodes.append(target_node)
-                    elif direction == "incoming" and edge.get("target") == node_id:
-                        source_id = edge.get("source")
-                        source_node = self.get_node(source_id)
-                        if source_node:
-                            connected_nodes.append(source_node)
+            for edge in self.get_edges(node_id, edge_type, direction):
+                other_id = edge.get("target") if edge.get("source") == node_id else edge.get("source")
+                other_node = self.get_node(other_id)
+                if other_node:
+                    connected_nodes.append(other_node)
             return connected_nodes
             
         def add_node(self, node_id, node_type, properties=None, metadata=None):
@@ -188,10 +311,43 @@ except ImportError:
             if node_type not in indices["node_type_index"]:
                 indices["node_type_index"][node_type] = []
                 
-            indices["node_type_index"][node_type].append(node_id)
-            
+            if node_id not in self.adjacency.nodes_by_type.get(node_type, {}):
+                indices["node_type_index"][node_type].append(node_id)
+            
+            previous_type = self.adjacency.node_types.get(node_id)
+            if previous_type is not None and previous_type != node_type:
+                # The old type's entry is dropped when the indices are next persisted
+                self.indices_stale = True
+                if previous_type in self.property_indexes:
+                    self.property_indexes[previous_type].remove_node(node_id)
+            self.adjacency.add_node(node_id, node_type)
+            
+            if node_type in self.property_indexes:
+                self.property_indexes[node_type].index_node(node)
+            
+            self.pending_changes.append({"op": "put_node", "node": node})
+            self.version += 1
             return node
             
+        def remove_node(self, node_id):
+            """Remove a node and the edges attached to it"""
+            node = self.memory.get("knowledge_graph", {}).get("nodes", {}).pop(node_id, None)
+            if not node:
+                return False
+            
+            for edge_id in self.adjacency.edge_ids(node_id, direction="both"):
+                self.remove_edge(edge_id)
+            
+            self.indices_stale = True
+            
+            if node.get("type") in self.property_indexes:
+                self.property_indexes[node.get("type")].remove_node(node_id)
+            self.adjacency.remove_node(node_id)
+            
+            self.pending_changes.append({"op": "remove_node", "id": node_id})
+            self.version += 1
+            return True
+            
         def add_edge(self, edge_type, source_id, target_id, properties=None, metadata=None):
             """Add an edge to the knowledge graph"""
             if "knowledge_graph" not in self.memory:
@@ -202,6 +358,7 @@ except ImportError:
                 
             # Create edge
             edge = {
+                "id": self._new_edge_id(),
                 "type": edge_type,
                 "source": source_id,
                 "target": target_id,
@@ -210,7 +367,9 @@ except ImportError:
             }
             
             # Add to edges
+            self.edge_positions[edge["id"]] = len(self.memory["knowledge_graph"]["edges"])
             self.memory["knowledge_graph"]["edges"].append(edge)
+            self.edges_by_id[edge["id"]] = edge
             
             # Update indices
             if "indices" not in self.memory["knowledge_graph"]:
@@ -230,8 +389,7 @@ except ImportError:
             if edge_type not in indices["edge_type_index"]:
                 indices["edge_type_index"][edge_type] = []
                 
-            edge_index = len(self.memory["knowledge_graph"]["edges"]) - 1
-            indices["edge_type_index"][edge_type].append(edge_index)
+            indices["edge_type_index"][edge_type].append(edge["id"])
             
             # Update node outgoing edges
             if "node_outgoing_edges" not in indices:
@@ -240,7 +398,7 @@ except ImportError:
             if source_id not in indices["node_outgoing_edges"]:
                 indices["node_outgoing_edges"][source_id] = []
                 
-            indices["node_outgoing_edges"][source_id].append(edge_index)
+            indices["node_outgoing_edges"][source_id].append(edge["id"])
             
             # Update node incoming edges
             if "node_incoming_edges" not in indices:
@@ -249,13 +407,51 @@ except ImportError:
             if target_id not in indices["node_incoming_edges"]:
                 indices["node_incoming_edges"][target_id] = []
                 
-            indices["node_incoming_edges"][target_id].append(edge_index)
+            indices["node_incoming_edges"][target_id].append(edge["id"])
+            
+            self.adjacency.add_edge(edge)
             
+            self.pending_changes.append({"op": "put_edge", "edge": edge})
+            self.version += 1
             return edge
+            
+        def remove_edge(self, edge_id):
+            """Remove an edge by its stable ID"""
+            edge = self.edges_by_id.pop(edge_id, None)
+            if not edge:
+                return False
+            
+            # Move the last edge into the freed slot so removal never scans the edge list
+            edges = self.memory["knowledge_graph"]["edges"]
+            position = self.edge_positions.pop(edge_id)
+            last = edges.pop()
+            if last is not edge:
+                edges[position] = last
+                self.edge_positions[last["id"]] = position
+            
+            # The persisted indices drop the edge when they are next written
+            self.indices_stale = True
+            self.adjacency.remove_edge(edge)
+            
+            self.pending_changes.append({"op": "remove_edge", "id": edge_id})
+            self.version += 1
+            return True
     
     USING_REAL_KG = False
 
 
+# Feature fields served by the secondary property index: name -> (section, key)
+FEATURE_INDEX_FIELDS = {
+    "domain": ("properties", "domain"),
+    "purpose": ("properties", "purpose"),
+    "status": ("properties", "status"),
+    "tags": ("properties", "tags"),
+    "milestone": ("metadata", "milestone"),
+    "phase": ("metadata", "phase"),
+    "module": ("metadata", "module")
+}
+
+
 class KnowledgeGraphConnector:
     """
     Connector for interacting with the Devloop Knowledge Graph,
@@ -269,17 +465,8 @@ class KnowledgeGraphConnector:
         Args:
             kg_file_path: Optional path to the knowledge graph file
         """
-        self.kg_file_path = kg_file_path
-        
-        # Default paths
-        if not self.kg_file_path:
-            memory_dir = os.path.join(PROJECT_ROOT, 'backups', 'system-core-backup', 'system-core', 'memory')
-            self.kg_file_path = os.path.join(memory_dir, 'knowledge_graph.json')
-            
-            # If that doesn't exist, use the SDK storage
-            if not os.path.exists(self.kg_file_path):
-                sdk_storage = os.path.expanduser("~/.devloop/sdk/storage")
-                self.kg_file_path = os.path.join(sdk_storage, 'knowledge_graph.json')
+        # Default to the system core memory graph, falling back to the SDK storage
+        self.kg_file_path = kg_file_path or default_graph_path()
         
         # Load the knowledge graph
         try:
@@ -289,6 +476,12 @@ class KnowledgeGraphConnector:
             logger.error(f"Error loading knowledge graph: {str(e)}")
             self.kg = MemoryKnowledgeGraph()
             logger.info("Created new knowledge graph")
+        
+        # Index feature properties so filtered queries don't scan every feature
+        if hasattr(self.kg, "add_property_index"):
+            self.kg.add_property_index("feature", FEATURE_INDEX_FIELDS)
+        
+        self.traversal = GraphTraversal(self._get_edges)
     
     def save(self) -> bool:
         """
@@ -309,6 +502,56 @@ class KnowledgeGraphConnector:
             logger.error(f"Error saving knowledge graph: {str(e)}")
             return False
     
+    def _get_edges(self, node_id: str, edge_type: str, direction: str = "outgoing") -> List[Dict[str, Any]]:
+        """
+        Get edges of one type attached to a node
+        
+        Args:
+            node_id: ID of the node
+            edge_type: Type of edge to follow
+            direction: "outgoing" or "incoming"
+            
+        Returns:
+            List of edge dictionaries
+        """
+        if hasattr(self.kg, "get_edges"):
+            return self.kg.get_edges(node_id, edge_type=edge_type, direction=direction)
+        
+        # Knowledge graphs without a typed adjacency layer need a full edge scan
+        endpoint = "source" if direction == "outgoing" else "target"
+        return [
+            edge for edge in self.kg.memory.get("knowledge_graph", {}).get("edges", [])
+            if edge.get(endpoint) == node_id and edge.get("type") == edge_type
+        ]
+    
+    def _get_traversal(self) -> GraphTraversal:
+        """Get the traversal engine, creating it on first use"""
+        if getattr(self, "traversal", None) is None:
+            self.traversal = GraphTraversal(self._get_edges)
+        return self.traversal
+    
+    def _get_linked_nodes(self, node_id: str, edge_type: str,
+                          direction: str = "outgoing") -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Get nodes linked to a node by edges of one type
+        
+        Args:
+            node_id: ID of the node
+            edge_type: Type of edge to follow
+            direction: "outgoing" or "incoming"
+            
+        Returns:
+            List of (edge, node) tuples for edges whose other end exists
+        """
+        other_endpoint = "target" if direction == "outgoing" else "source"
+        
+        linked = []
+        for edge in self._get_edges(node_id, edge_type, direction):
+            other_node = self.kg.get_node(edge.get(other_endpoint))
+            if other_node:
+                linked.append((edge, other_node))
+        return linked
+    
     def get_project_structure(self) -> Dict[str, Any]:
         """
         Get the project structure from the knowledge graph
@@ -333,18 +576,7 @@ class KnowledgeGraphConnector:
             }
             
             # Get phases for this milestone
-            phase_nodes = []
-            if USING_REAL_KG:
-                # Use real traversal for authentic KG
-                connected_nodes = self.kg.get_connected_nodes(milestone_id, direction="outgoing")
-                phase_nodes = [node for node in connected_nodes if node.get("type") == "phase"]
-            else:
-                # Use a simplified approach for mock KG
-                for edge in self.kg.memory.get("knowledge_graph", {}).get("edges", []):
-                    if edge.get("source") == milestone_id and edge.get("type") == "milestone_contains_phase":
-                        phase_node = self.kg.get_node(edge.get("target"))
-                        if phase_node:
-                            phase_nodes.append(phase_node)
+            phase_nodes = [node for _, node in self._get_linked_nodes(milestone_id, "milestone_contains_phase")]
             
             # Process each phase
             for phase_node in phase_nodes:
@@ -356,18 +588,7 @@ class KnowledgeGraphConnector:
                 }
                 
                 # Get modules for this phase
-                module_nodes = []
-                if USING_REAL_KG:
-                    # Use real traversal for authentic KG
-                    connected_nodes = self.kg.get_connected_nodes(phase_id, direction="outgoing")
-                    module_nodes = [node for node in connected_nodes if node.get("type") == "module"]
-                else:
-                    # Use a simplified approach for mock KG
-                    for edge in self.kg.memory.get("knowledge_graph", {}).get("edges", []):
-                        if edge.get("source") == phase_id and edge.get("type") == "phase_contains_module":
-                            module_node = self.kg.get_node(edge.get("target"))
-                            if module_node:
-                                module_nodes.append(module_node)
+                module_nodes = [node for _, node in self._get_linked_nodes(phase_id, "phase_contains_module")]
                 
                 # Process each module
                 for module_node in module_nodes:
@@ -879,7 +1100,7 @@ class KnowledgeGraphConnector:
     def query_features(self, domain: Optional[str] = None, purpose: Optional[str] = None, 
                      tags: List[str] = None, milestone: Optional[str] = None,
                      phase: Optional[str] = None, module: Optional[str] = None,
-                     limit: int = 10) -> List[Dict[str, Any]]:
+                     limit: int = 10, status: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Query for features based on domain, purpose, tags, and placement
         
@@ -891,48 +1112,39 @@ class KnowledgeGraphConnector:
             phase: Specific phase to filter by
             module: Specific module to filter by
             limit: Maximum number of results to return
+            status: Specific status to filter by
             
         Returns:
             List of matching feature nodes
         """
-        matching_features = []
-        tags = tags or []
+        criteria = {
+            name: value for name, value in {
+                "domain": domain,
+                "purpose": purpose,
+                "status": status,
+                "tags": tags,
+                "milestone": milestone,
+                "phase": phase,
+                "module": module
+            }.items() if value
+        }
         
-        # Get all feature nodes
-        feature_nodes = self.kg.get_nodes_by_type("feature")
+        if "feature" in getattr(self.kg, "property_indexes", {}):
+            # Intersect secondary index postings instead of scanning all features
+            feature_nodes = self.kg.find_nodes("feature", criteria, limit=limit)
+        else:
+            feature_nodes = []
+            for node in self.kg.get_nodes_by_type("feature"):
+                if self._feature_matches(node, criteria):
+                    feature_nodes.append(node)
+                    if len(feature_nodes) >= limit:
+                        break
         
-        # Filter by provided criteria
+        matching_features = []
         for node in feature_nodes:
             properties = node.get("properties", {})
             metadata = node.get("metadata", {})
             
-            # Filter by domain
-            if domain and properties.get("domain") != domain:
-                continue
-                
-            # Filter by purpose
-            if purpose and properties.get("purpose") != purpose:
-                continue
-                
-            # Filter by milestone
-            if milestone and metadata.get("milestone") != milestone:
-                continue
-                
-            # Filter by phase
-            if phase and metadata.get("phase") != phase:
-                continue
-                
-            # Filter by module
-            if module and metadata.get("module") != module:
-                continue
-                
-            # Filter by tags (any match)
-            if tags:
-                node_tags = properties.get("tags", [])
-                if not any(tag in node_tags for tag in tags):
-                    continue
-            
-            # Add matching feature
             matching_features.append({
                 "id": node.get("id"),
                 "name": properties.get("name", ""),
@@ -945,12 +1157,28 @@ class KnowledgeGraphConnector:
                 "phase": metadata.get("phase", ""),
                 "module": metadata.get("module", "")
             })
-            
-            # Respect limit
-            if len(matching_features) >= limit:
-                break
         
         return matching_features
+    
+    def _feature_matches(self, node: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
+        """
+        Check a feature node against query criteria without an index
+        
+        Args:
+            node: Feature node
+            criteria: Mapping of FEATURE_INDEX_FIELDS name to value or list of values (any match)
+            
+        Returns:
+            True if the node matches all criteria
+        """
+        for name, wanted in criteria.items():
+            section, key = FEATURE_INDEX_FIELDS[name]
+            value = node.get(section, {}).get(key)
+            values = value if isinstance(value, list) else [value]
+            wanted_values = wanted if isinstance(wanted, list) else [wanted]
+            if not any(v in values for v in wanted_values):
+                return False
+        return True
         
     def get_related_features(self, feature_id: str, relation_types: List[str] = None, 
                            max_depth: int = 2, limit: int = 10) -> Dict[str, Any]:
@@ -960,11 +1188,12 @@ class KnowledgeGraphConnector:
         Args:
             feature_id: ID of the feature to find relations for
             relation_types: List of relation types to traverse (None for all)
-            max_depth: Maximum depth to traverse
+            max_depth: Maximum number of dependency hops to traverse
             limit: Maximum number of results per relation type
             
         Returns:
-            Dictionary of related features by relation type
+            Dictionary of related features by relation type. Dependencies and
+            dependents are listed nearest first with their hop "depth".
         """
         related = {
             "dependencies": [],
@@ -984,43 +1213,13 @@ class KnowledgeGraphConnector:
         properties = feature_node.get("properties", {})
         metadata = feature_node.get("metadata", {})
         
-        # Get direct dependencies (features this feature depends on)
+        # Get dependencies (features this feature depends on, up to max_depth hops)
         if not relation_types or "dependencies" in relation_types:
-            dependency_edges = []
-            for edge in self.kg.memory.get("knowledge_graph", {}).get("edges", []):
-                if edge.get("source") == feature_id and edge.get("type") == "feature_depends_on":
-                    dependency_edges.append(edge)
-                    
-            for edge in dependency_edges[:limit]:
-                dep_node = self.kg.get_node(edge.get("target"))
-                if dep_node:
-                    dep_props = dep_node.get("properties", {})
-                    related["dependencies"].append({
-                        "id": dep_node.get("id"),
-                        "name": dep_props.get("name", ""),
-                        "type": dep_node.get("type", "feature"),
-                        "relationship": edge.get("properties", {}).get("relationship", "depends_on"),
-                        "strength": edge.get("properties", {}).get("strength", "required")
-                    })
+            related["dependencies"] = self._traverse_dependencies(feature_id, "outgoing", max_depth, limit)
         
-        # Get dependents (features that depend on this feature)
+        # Get dependents (features that depend on this feature, up to max_depth hops)
         if not relation_types or "dependents" in relation_types:
-            dependent_edges = []
-            for edge in self.kg.memory.get("knowledge_graph", {}).get("edges", []):
-                if edge.get("target") == feature_id and edge.get("type") == "feature_depends_on":
-                    dependent_edges.append(edge)
-                    
-            for edge in dependent_edges[:limit]:
-                dep_node = self.kg.get_node(edge.get("source"))
-                if dep_node:
-                    dep_props = dep_node.get("properties", {})
-                    related["dependents"].append({
-                        "id": dep_node.get("id"),
-                        "name": dep_props.get("name", ""),
-                        "type": dep_node.get("type", "feature"),
-                        "relationship": edge.get("properties", {}).get("relationship", "depends_on"),
-                        "strength": edge.get("properties", {}).get("strength", "required")
-                    })
+            related["dependents"] = self._traverse_dependencies(feature_id, "incoming", max_depth, limit)
         
         # Get features in same domain
         if not relation_types or "same_domain" in relation_types:
@@ -1052,6 +1251,105 @@ class KnowledgeGraphConnector:
         
         return related
         
+    def _traverse_dependencies(self, feature_id: str, direction: str, max_depth: Optional[int],
+                               limit: Optional[int]) -> List[Dict[str, Any]]:
+        """
+        Follow feature_depends_on edges breadth first
+        
+        Args:
+            feature_id: ID of the start feature
+            direction: "outgoing" for dependencies, "incoming" for dependents
+            max_depth: Maximum number of hops (None for unlimited)
+            limit: Maximum number of features to return
+            
+        Returns:
+            List of dependency dictionaries, nearest first
+        """
+        visits = self._get_traversal().bfs([feature_id], ["feature_depends_on"], direction,
+                                           max_depth=max_depth, max_nodes=limit)
+        return self._describe_dependency_visits(visits)
+    
+    def _describe_dependency_visits(self, visits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Convert traversal visits into dependency dictionaries"""
+        dependencies = []
+        for visit in visits:
+            dep_node = self.kg.get_node(visit["id"])
+            if dep_node:
+                edge_props = visit["edge"].get("properties", {})
+                dependencies.append({
+                    "id": dep_node.get("id"),
+                    "name": dep_node.get("properties", {}).get("name", ""),
+                    "type": dep_node.get("type", "feature"),
+                    "relationship": edge_props.get("relationship", "depends_on"),
+                    "strength": edge_props.get("strength", "required"),
+                    "depth": visit["depth"],
+                    "via": visit["parent"]
+                })
+        return dependencies
+    
+    def get_transitive_dependencies(self, feature_ids: List[str],
+                                    direction: str = "dependencies") -> List[Dict[str, Any]]:
+        """
+        Get every feature reachable through feature_depends_on edges
+        
+        Results are cached until the knowledge graph changes.
+        
+        Args:
+            feature_ids: IDs of the start features
+            direction: "dependencies" (what they depend on) or "dependents"
+                (what depends on them)
+            
+        Returns:
+            List of dependency dictionaries, nearest first
+        """
+        edge_direction = "outgoing" if direction == "dependencies" else "incoming"
+        visits = self._get_traversal().transitive_closure(feature_ids, ["feature_depends_on"], edge_direction,
+                                                          version=getattr(self.kg, "version", None))
+        return self._describe_dependency_visits(visits)
+    
+    def find_dependency_path(self, source_id: str, target_id: str,
+                             max_depth: Optional[int] = None) -> Optional[List[str]]:
+        """
+        Find the shortest chain of dependencies from one feature to another
+        
+        Args:
+            source_id: ID of the dependent feature
+            target_id: ID of the feature it may depend on
+            max_depth: Maximum chain length in hops
+            
+        Returns:
+            Feature IDs from source to target, or None if it does not depend on it
+        """
+        return self._get_traversal().shortest_path(source_id, target_id, ["feature_depends_on"], max_depth)
+    
+    def get_milestone_impact(self, milestone_id: str) -> Dict[str, Any]:
+        """
+        Analyze the dependencies crossing a milestone's boundary
+        
+        Args:
+            milestone_id: ID of the milestone
+            
+        Returns:
+            Dictionary with the milestone's feature IDs, the outside features
+            they transitively depend on and the outside features that
+            transitively depend on them
+        """
+        structure_visits = self._get_traversal().bfs(
+            [milestone_id], ["milestone_contains_phase", "phase_contains_module", "module_contains_feature"]
+        )
+        feature_ids = [visit["id"] for visit in structure_visits
+                       if visit["edge"].get("type") == "module_contains_feature"]
+        in_milestone = set(feature_ids)
+        
+        return {
+            "milestone_id": milestone_id,
+            "features": feature_ids,
+            "dependencies": [dep for dep in self.get_transitive_dependencies(feature_ids, "dependencies")
+                             if dep["id"] not in in_milestone],
+            "dependents": [dep for dep in self.get_transitive_dependencies(feature_ids, "dependents")
+                           if dep["id"] not in in_milestone]
+        }
+    
     def add_task_to_feature(self, feature_id: str, task_data: Dict[str, Any]) -> Tuple[bool, str]:
         """
         Add a task to a feature in the knowledge graph
@@ -1147,29 +1445,20 @@ class KnowledgeGraphConnector:
             logger.warning(f"Feature {feature_id} not found")
             return tasks
         
-        # Find all feature_has_task edges for this feature
-        task_edges = []
-        for edge in self.kg.memory.get("knowledge_graph", {}).get("edges", []):
-            if edge.get("source") == feature_id and edge.get("type") == "feature_has_task":
-                task_edges.append(edge)
-        
-        # Get task nodes
-        for edge in task_edges:
-            task_id = edge.get("target")
-            task_node = self.kg.get_node(task_id)
-            if task_node:
-                properties = task_node.get("properties", {})
-                tasks.append({
-                    "id": task_id,
-                    "name": properties.get("name", ""),
-                    "description": properties.get("description", ""),
-                    "status": properties.get("status", "not-started"),
-                    "priority": properties.get("priority", "medium"),
-                    "complexity": properties.get("complexity", "medium"),
-                    "estimated_hours": properties.get("estimated_hours", 0),
-                    "created_at": properties.get("created_at", ""),
-                    "updated_at": properties.get("updated_at", "")
-                })
+        # Get task nodes linked by feature_has_task edges
+        for edge, task_node in self._get_linked_nodes(feature_id, "feature_has_task"):
+            properties = task_node.get("properties", {})
+            tasks.append({
+                "id": edge.get("target"),
+                "name": properties.get("name", ""),
+                "description": properties.get("description", ""),
+                "status": properties.get("status", "not-started"),
+                "priority": properties.get("priority", "medium"),
+                "complexity": properties.get("complexity", "medium"),
+                "estimated_hours": properties.get("estimated_hours", 0),
+                "created_at": properties.get("created_at", ""),
+                "updated_at": properties.get("updated_at", "")
+            })
         
         return tasks
 
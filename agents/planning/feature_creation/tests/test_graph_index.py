@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the typed adjacency layer of the knowledge graph
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import agent modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_index import TypedAdjacencyIndex, PropertyIndex
+from knowledge_graph_connector import KnowledgeGraphConnector, MemoryKnowledgeGraph, FEATURE_INDEX_FIELDS
+
+
+def build_roadmap_graph():
+    """Create a small roadmap graph through the MemoryKnowledgeGraph API"""
+    kg = MemoryKnowledgeGraph(memory_data={"knowledge_graph": {"nodes": {}, "edges": [], "indices": {}}})
+    kg.add_node("milestone-1", "milestone", {"name": "Core"})
+    kg.add_node("phase-1", "phase", {"name": "Phase 1"})
+    kg.add_node("module-1", "module", {"name": "Module 1"})
+    kg.add_node("feature-1", "feature", {"name": "Feature 1"})
+    kg.add_node("feature-2", "feature", {"name": "Feature 2"})
+    kg.add_node("task-1", "task", {"name": "Task 1"})
+    kg.add_edge("milestone_contains_phase", "milestone-1", "phase-1")
+    kg.add_edge("phase_contains_module", "phase-1", "module-1")
+    kg.add_edge("module_contains_feature", "module-1", "feature-1")
+    kg.add_edge("feature_depends_on", "feature-2", "feature-1", {"relationship": "depends_on"})
+    kg.add_edge("feature_has_task", "feature-1", "task-1")
+    return kg
+
+
+class TestTypedAdjacencyIndex(unittest.TestCase):
+    """Test the TypedAdjacencyIndex component"""
+
+    def test_build_matches_incremental_updates(self):
+        """Test that rebuilding from the edge list gives the same lookups"""
+        kg = build_roadmap_graph()
+        rebuilt = TypedAdjacencyIndex()
+        rebuilt.build(kg.memory["knowledge_graph"])
+
+        self.assertEqual(rebuilt.outgoing, kg.adjacency.outgoing)
+        self.assertEqual(rebuilt.incoming, kg.adjacency.incoming)
+        self.assertEqual(rebuilt.node_ids_by_type("feature"), ["feature-1", "feature-2"])
+
+    def test_typed_and_directional_lookups(self):
+        """Test lookups by node, edge type and direction"""
+        kg = build_roadmap_graph()
+
+        self.assertEqual([e["target"] for e in kg.get_edges("feature-1", "feature_has_task")], ["task-1"])
+        self.assertEqual([e["source"] for e in kg.get_edges("feature-1", "feature_depends_on", "incoming")],
+                         ["feature-2"])
+        self.assertEqual(len(kg.get_edges("feature-1", direction="both")), 3)
+        self.assertEqual([n["id"] for n in kg.get_connected_nodes("feature-1", direction="incoming")],
+                         ["module-1", "feature-2"])
+
+    def test_retyped_node_moves_between_types(self):
+        """Test that re-adding a node with a new type updates the type index"""
+        kg = build_roadmap_graph()
+        kg.add_node("feature-2", "epic")
+
+        self.assertEqual([n["id"] for n in kg.get_nodes_by_type("feature")], ["feature-1"])
+        self.assertEqual([n["id"] for n in kg.get_nodes_by_type("epic")], ["feature-2"])
+
+        kg.remove_node("feature-1")
+        self.assertNotIn("feature", kg.adjacency.nodes_by_type)
+
+    def test_edge_removal_keeps_positions(self):
+        """Test that removed edges leave the edge list and every position stays valid"""
+        kg = build_roadmap_graph()
+        edges = kg.memory["knowledge_graph"]["edges"]
+        removed = [edges[0]["id"], edges[2]["id"], edges[-1]["id"]]
+        for edge_id in removed:
+            self.assertTrue(kg.remove_edge(edge_id))
+        self.assertFalse(kg.remove_edge(removed[0]))
+
+        self.assertEqual(len(edges), 2)
+        self.assertEqual({edge["id"] for edge in edges}, set(kg.edges_by_id))
+        for edge_id, position in kg.edge_positions.items():
+            self.assertEqual(edges[position]["id"], edge_id)
+
+
+class TestPropertyIndex(unittest.TestCase):
+    """Test the PropertyIndex component"""
+
+    def setUp(self):
+        self.index = PropertyIndex(FEATURE_INDEX_FIELDS)
+        for i, (domain, tags) in enumerate([("ui", ["react"]), ("api", ["rest"]), ("ui", ["css", "react"]), ("ui", [])]):
+            self.index.index_node({"id": f"f{i}", "properties": {"domain": domain, "tags": tags}, "metadata": {}})
+
+    def test_intersection_and_any_tag(self):
+        """Test multi-criteria intersection with any-of tag matching"""
+        self.assertEqual(self.index.lookup({"domain": "ui"}), ["f0", "f2", "f3"])
+        self.assertEqual(self.index.lookup({"domain": "ui", "tags": ["css", "rest"]}), ["f2"])
+        self.assertEqual(self.index.lookup({"domain": "api", "tags": ["react"]}), [])
+        self.assertEqual(self.index.lookup({"domain": "ui"}, limit=2), ["f0", "f2"])
+
+    def test_reindex_keeps_order_and_drops_old_values(self):
+        """Test that re-indexing a node moves it between postings"""
+        self.index.index_node({"id": "f0", "properties": {"domain": "api", "tags": []}, "metadata": {}})
+
+        self.assertEqual(self.index.lookup({"domain": "api"}), ["f0", "f1"])
+        self.assertEqual(self.index.lookup({"tags": ["react"]}), ["f2"])
+
+    def test_removed_nodes_are_forgotten(self):
+        """Test that removing a node drops its sequence number and a re-added node sorts last"""
+        self.index.remove_node("f0")
+
+        self.assertNotIn("f0", self.index.order)
+        self.assertEqual(self.index.lookup({"domain": "ui"}), ["f2", "f3"])
+
+        self.index.index_node({"id": "f0", "properties": {"domain": "ui", "tags": []}, "metadata": {}})
+        self.assertEqual(self.index.lookup({"domain": "ui"}), ["f2", "f3", "f0"])
+
+
+class TestConnectorTraversals(unittest.TestCase):
+    """Test connector queries served by the adjacency layer"""
+
+    def setUp(self):
+        self.connector = KnowledgeGraphConnector.__new__(KnowledgeGraphConnector)
+        self.connector.kg = build_roadmap_graph()
+
+    def test_project_structure(self):
+        """Test rendering the roadmap hierarchy"""
+        structure = self.connector.get_project_structure()
+
+        self.assertEqual(structure["milestones"][0]["phases"][0]["modules"], [{"id": "module-1", "name": "Module 1"}])
+
+    def test_related_features_and_tasks(self):
+        """Test dependency and task lookups"""
+        related = self.connector.get_related_features("feature-1", relation_types=["dependencies", "dependents"])
+
+        self.assertEqual(related["dependencies"], [])
+        self.assertEqual([d["id"] for d in related["dependents"]], ["feature-2"])
+        self.assertEqual([t["id"] for t in self.connector.get_feature_tasks("feature-1")], ["task-1"])
+
+    def test_query_features_matches_scan(self):
+        """Test that indexed queries return what the unindexed scan returns"""
+        kg = self.connector.kg
+        for i in range(20):
+            kg.add_node(f"feature-x{i}", "feature",
+                        {"domain": ["ui", "api"][i % 2], "purpose": "enhancement", "tags": [f"t{i % 3}"]},
+                        {"module": f"module-{i % 4}"})
+
+        scanned = [self.connector.query_features(domain="ui", tags=["t1", "t2"], limit=5),
+                   self.connector.query_features(module="module-1", purpose="enhancement", limit=50)]
+        kg.add_property_index("feature", FEATURE_INDEX_FIELDS)
+        indexed = [self.connector.query_features(domain="ui", tags=["t1", "t2"], limit=5),
+                   self.connector.query_features(module="module-1", purpose="enhancement", limit=50)]
+
+        self.assertEqual(indexed, scanned)
+        self.assertEqual(len(indexed[0]), 5)
+
+    def test_node_updates_maintain_index(self):
+        """Test that node mutations keep the property index current"""
+        kg = self.connector.kg
+        kg.add_property_index("feature", FEATURE_INDEX_FIELDS)
+        kg.add_node("feature-3", "feature", {"name": "Feature 3", "domain": "data", "status": "blocked"})
+
+        self.assertEqual([f["id"] for f in self.connector.query_features(status="blocked")], ["feature-3"])
+
+        kg.update_node("feature-3", properties={"name": "Feature 3", "domain": "data", "status": "done"})
+        self.assertEqual(self.connector.query_features(status="blocked"), [])
+        self.assertEqual([f["id"] for f in self.connector.query_features(domain="data", status="done")], ["feature-3"])
+
+
+if __name__ == '__main__':
+    unittest.main()
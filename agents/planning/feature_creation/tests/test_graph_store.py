@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Unit tests for journaled knowledge graph persistence
+"""
+
+import unittest
+import tempfile
+import shutil
+import json
+import sys
+import os
+
+# Add parent directory to path to import agent modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unittest.mock import patch
+from graph_store import JournaledGraphStore, IndexedGraphFile
+from knowledge_graph_connector import MemoryKnowledgeGraph
+
+
+class TestJournaledPersistence(unittest.TestCase):
+    """Test snapshot, journal and compaction behavior"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "knowledge_graph.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def build_saved_graph(self):
+        """Create a graph and write its first snapshot"""
+        kg = MemoryKnowledgeGraph(memory_data={"knowledge_graph": {"nodes": {}, "edges": [], "indices": {}}})
+        kg.add_node("feature-1", "feature", {"name": "Feature 1"})
+        kg.add_node("task-1", "task", {"name": "Task 1"})
+        kg.add_edge("feature_has_task", "feature-1", "task-1")
+        kg.save(self.path)
+        return kg
+
+    def test_saves_append_changes_and_reload(self):
+        """Test that saves journal only the changes and reload replays them"""
+        kg = self.build_saved_graph()
+        with open(self.path) as f:
+            snapshot = f.read()
+
+        first_edge = kg.get_edges("feature-1", "feature_has_task")[0]
+        kg.add_node("task-2", "task", {"name": "Task 2"})
+        second_edge = kg.add_edge("feature_has_task", "feature-1", "task-2")
+        kg.remove_edge(first_edge["id"])
+        kg.update_node("feature-1", properties={"name": "Feature 1", "status": "done"})
+        kg.save(self.path)
+
+        with open(self.path) as f:
+            self.assertEqual(f.read(), snapshot)
+        with open(f"{self.path}.journal") as f:
+            self.assertEqual(len(f.readlines()), 4)
+
+        reloaded = MemoryKnowledgeGraph(memory_file=self.path)
+
+        self.assertEqual([e["id"] for e in reloaded.get_edges("feature-1", "feature_has_task")], [second_edge["id"]])
+        self.assertEqual(reloaded.get_node("feature-1")["properties"]["status"], "done")
+        self.assertEqual(reloaded.memory["knowledge_graph"]["indices"]["node_outgoing_edges"],
+                         {"feature-1": [second_edge["id"]]})
+
+    def test_truncated_journal_record_is_discarded(self):
+        """Test that a record cut short by a crash is dropped on load"""
+        kg = self.build_saved_graph()
+        kg.add_node("task-2", "task", {"name": "Task 2"})
+        kg.save(self.path)
+
+        with open(f"{self.path}.journal", "a") as f:
+            f.write('{"op": "put_node", "node": {"id": "task-3"')
+
+        reloaded = MemoryKnowledgeGraph(memory_file=self.path)
+
+        self.assertIsNotNone(reloaded.get_node("task-2"))
+        self.assertIsNone(reloaded.get_node("task-3"))
+        with open(f"{self.path}.journal") as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+    def test_journal_compacts_into_snapshot(self):
+        """Test that a long journal is folded into a new snapshot"""
+        kg = self.build_saved_graph()
+        kg.store.compact_threshold = 3
+        for i in range(3):
+            kg.add_node(f"task-x{i}", "task")
+        kg.save(self.path)
+
+        self.assertFalse(os.path.exists(f"{self.path}.journal"))
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+        with open(self.path) as f:
+            self.assertEqual(len(f.readlines()), 1)
+        self.assertEqual(len(JournaledGraphStore(self.path).load()["knowledge_graph"]["nodes"]), 5)
+
+    def test_persisted_indices_drop_removed_and_retyped_entries(self):
+        """Test that snapshots do not list removed edges or a node under its old type"""
+        kg = self.build_saved_graph()
+        edge_id = kg.get_edges("feature-1", "feature_has_task")[0]["id"]
+        kg.remove_edge(edge_id)
+        kg.add_node("task-1", "subtask", {"name": "Task 1"})
+        kg.compact()
+
+        with open(self.path) as f:
+            indices = json.load(f)["knowledge_graph"]["indices"]
+        self.assertEqual(indices["node_type_index"], {"feature": ["feature-1"], "subtask": ["task-1"]})
+        self.assertEqual(indices["edge_type_index"], {})
+        self.assertEqual(indices["node_outgoing_edges"], {})
+
+    def test_positional_graph_gets_stable_edge_ids(self):
+        """Test that graphs saved without edge IDs are migrated on load"""
+        with open(self.path, "w") as f:
+            json.dump({"knowledge_graph": {
+                "nodes": {"a": {"id": "a", "type": "feature"}, "b": {"id": "b", "type": "feature"}},
+                "edges": [{"type": "feature_depends_on", "source": "a", "target": "b"}],
+                "indices": {"node_outgoing_edges": {"a": [0]}}
+            }}, f)
+
+        kg = MemoryKnowledgeGraph(memory_file=self.path)
+        edge_id = kg.memory["knowledge_graph"]["edges"][0]["id"]
+        kg.save(self.path)
+
+        with open(self.path) as f:
+            saved = json.load(f)["knowledge_graph"]
+        self.assertEqual(saved["edges"][0]["id"], edge_id)
+        self.assertEqual(saved["indices"]["node_outgoing_edges"], {"a": [edge_id]})
+        self.assertFalse(os.path.exists(f"{self.path}.journal"))
+
+
+class TestIndexedGraphFile(unittest.TestCase):
+    """Test lazy indexed access to a journaled graph file"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "knowledge_graph.json")
+
+        kg = MemoryKnowledgeGraph(memory_data={"knowledge_graph": {"nodes": {}, "edges": [], "indices": {}}})
+        kg.add_node("feature-1", "feature", {"name": "Feature 1"})
+        kg.add_node("task-1", "task", {"name": "Task 1"})
+        kg.add_edge("feature_has_task", "feature-1", "task-1")
+        kg.save(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_writes_reach_the_shared_graph(self):
+        """Test that saved writes are journaled for graphs loaded from the same file"""
+        graph = IndexedGraphFile(self.path)
+        graph.add_node("doc-1", "document", {"title": "Guide"})
+        edge = graph.add_edge("document_describes", "doc-1", "feature-1")
+
+        # Unsaved writes are readable but not persisted
+        self.assertEqual(graph.get_edges(target_id="feature-1"), [edge])
+        self.assertFalse(os.path.exists(f"{self.path}.journal"))
+
+        graph.save()
+        graph.close()
+
+        kg = MemoryKnowledgeGraph(memory_file=self.path)
+        self.assertEqual(kg.get_node("doc-1")["properties"]["title"], "Guide")
+        self.assertEqual(kg.get_edges("doc-1", "document_describes"), [edge])
+        self.assertEqual([node["id"] for node in IndexedGraphFile(self.path).get_nodes_by_type("document")],
+                         ["doc-1"])
+
+    def test_index_follows_journal_and_snapshot(self):
+        """Test that the index replays new journal records and rebuilds after a new snapshot"""
+        graph = IndexedGraphFile(self.path)
+        self.assertEqual(graph.get_node("task-1")["properties"]["name"], "Task 1")
+
+        kg = MemoryKnowledgeGraph(memory_file=self.path)
+        kg.add_node("task-2", "task", {"name": "Task 2"})
+        kg.save(self.path)
+
+        # Reopening an up-to-date index replays the journal without parsing the snapshot
+        with patch.object(IndexedGraphFile, "_rebuild") as rebuild:
+            graph = IndexedGraphFile(self.path)
+        rebuild.assert_not_called()
+        self.assertEqual([node["id"] for node in graph.get_nodes_by_type("task")], ["task-1", "task-2"])
+
+        kg.remove_node("task-1")
+        kg.compact()
+        graph.refresh()
+
+        self.assertIsNone(graph.get_node("task-1"))
+        self.assertEqual(graph.get_edges(source_id="feature-1"), [])
+        self.assertEqual(sorted(graph.get_nodes(["feature-1", "task-1", "task-2"])), ["feature-1", "task-2"])
+
+    def test_long_journal_compacts_into_snapshot(self):
+        """Test that saves fold a long journal into a snapshot other loaders read"""
+        graph = IndexedGraphFile(self.path, compact_threshold=2)
+        graph.add_node("doc-1", "document")
+        graph.save()
+        self.assertTrue(os.path.exists(f"{self.path}.journal"))
+
+        graph.update_node("doc-1", properties={"title": "Guide"})
+        graph.add_edge("document_describes", "doc-1", "feature-1")
+        graph.save()
+
+        self.assertFalse(os.path.exists(f"{self.path}.journal"))
+        kg = MemoryKnowledgeGraph(memory_file=self.path)
+        self.assertEqual(kg.get_node("doc-1")["properties"], {"title": "Guide"})
+        self.assertEqual(len(kg.get_edges("feature-1", "feature_has_task")), 1)
+
+        # The index recorded its own snapshot and is not rebuilt on reopen
+        with patch.object(IndexedGraphFile, "_rebuild") as rebuild:
+            IndexedGraphFile(self.path)
+        rebuild.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for multi-hop knowledge graph traversals
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import agent modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from knowledge_graph_connector import KnowledgeGraphConnector, MemoryKnowledgeGraph
+
+
+def build_dependency_graph():
+    """
+    Create a milestone whose features sit in a dependency chain with a cycle
+
+    feature-a -> feature-b -> feature-c -> feature-d -> feature-b (cycle);
+    feature-x (outside the milestone) -> feature-a; feature-c -> feature-y (outside)
+    """
+    kg = MemoryKnowledgeGraph(memory_data={"knowledge_graph": {"nodes": {}, "edges": [], "indices": {}}})
+    kg.add_node("milestone-1", "milestone", {"name": "Core"})
+    kg.add_node("phase-1", "phase", {"name": "Phase 1"})
+    kg.add_node("module-1", "module", {"name": "Module 1"})
+    kg.add_edge("milestone_contains_phase", "milestone-1", "phase-1")
+    kg.add_edge("phase_contains_module", "phase-1", "module-1")
+    for name in ("a", "b", "c", "d"):
+        kg.add_node(f"feature-{name}", "feature", {"name": name.upper()})
+        kg.add_edge("module_contains_feature", "module-1", f"feature-{name}")
+    for name in ("x", "y"):
+        kg.add_node(f"feature-{name}", "feature", {"name": name.upper()})
+    for source, target in (("a", "b"), ("b", "c"), ("c", "d"), ("d", "b"), ("x", "a"), ("c", "y")):
+        kg.add_edge("feature_depends_on", f"feature-{source}", f"feature-{target}")
+    return kg
+
+
+class TestGraphTraversal(unittest.TestCase):
+    """Test traversal queries on the connector"""
+
+    def setUp(self):
+        self.connector = KnowledgeGraphConnector.__new__(KnowledgeGraphConnector)
+        self.connector.kg = build_dependency_graph()
+
+    def test_related_features_follow_max_depth(self):
+        """Test that dependencies are followed up to max_depth hops"""
+        related = self.connector.get_related_features("feature-a", relation_types=["dependencies"], max_depth=2)
+        self.assertEqual([(d["id"], d["depth"]) for d in related["dependencies"]],
+                         [("feature-b", 1), ("feature-c", 2)])
+
+        related = self.connector.get_related_features("feature-a", relation_types=["dependencies"],
+                                                      max_depth=10, limit=3)
+        self.assertEqual([d["id"] for d in related["dependencies"]], ["feature-b", "feature-c", "feature-d"])
+
+    def test_transitive_closure_handles_cycles_and_caches(self):
+        """Test closures over a cycle and their invalidation on graph changes"""
+        deps = self.connector.get_transitive_dependencies(["feature-b"])
+        self.assertEqual([d["id"] for d in deps], ["feature-c", "feature-d", "feature-y"])
+        self.assertEqual(len(self.connector.traversal.closure_cache), 1)
+
+        self.connector.get_transitive_dependencies(["feature-b"])
+        self.assertEqual(len(self.connector.traversal.closure_cache), 1)
+
+        self.connector.kg.add_edge("feature_depends_on", "feature-y", "feature-x")
+        deps = self.connector.get_transitive_dependencies(["feature-b"])
+        self.assertEqual([d["id"] for d in deps],
+                         ["feature-c", "feature-d", "feature-y", "feature-x", "feature-a"])
+
+    def test_dependency_path(self):
+        """Test bidirectional shortest path search"""
+        self.assertEqual(self.connector.find_dependency_path("feature-x", "feature-d"),
+                         ["feature-x", "feature-a", "feature-b", "feature-c", "feature-d"])
+        self.assertIsNone(self.connector.find_dependency_path("feature-d", "feature-a"))
+        self.assertIsNone(self.connector.find_dependency_path("feature-x", "feature-d", max_depth=3))
+
+    def test_milestone_impact(self):
+        """Test impact analysis across a milestone boundary in one call"""
+        impact = self.connector.get_milestone_impact("milestone-1")
+
+        self.assertEqual(impact["features"], ["feature-a", "feature-b", "feature-c", "feature-d"])
+        self.assertEqual([d["id"] for d in impact["dependencies"]], ["feature-y"])
+        self.assertEqual([d["id"] for d in impact["dependents"]], ["feature-x"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,6 +24,15 @@ if agents_dir not in sys.path:
 # Import SDK core
 from sdk.core.agent import SDKAgent
 
+# Shared LLM response cache (lives in agents/utils, outside the SDK)
+repo_root = os.path.abspath(os.path.join(agents_dir, ".."))
+if repo_root not in sys.path:
+    sys.path.append(repo_root)
+try:
+    from agents.utils.llm_response_cache import get_response_cache, make_cache_key
+except ImportError:
+    get_response_cache = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -66,6 +75,8 @@ class AIServiceAdapter:
             "api_key": os.environ.get("OPENAI_API_KEY"),
             "model": os.environ.get("OPENAI_MODEL", "gpt-4o"),
             "templates_dir": os.path.join(agents_dir, "templates/prompt"),
+            "response_cache": False,
+            "response_cache_path": None,
         }
         
         # If config path provided, load from file
@@ -270,7 +281,8 @@ class AIServiceAdapter:
             }
     
     def prompt_with_template(self, template_name: str, variables: Dict[str, Any], 
-                            context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                            context: Optional[Dict[str, Any]] = None,
+                            use_cache: Optional[bool] = None) -> Dict[str, Any]:
         """
         Process a prompt using a specific template.
         
@@ -278,6 +290,10 @@ class AIServiceAdapter:
             template_name: Name of the template to use
             variables: Variables to substitute in the template
             context: Optional context information
+            use_cache: Whether to reuse the response to an identical rendered
+                prompt from the shared response cache. Defaults to the
+                "response_cache" configuration value; only enable it for
+                templates whose responses may be reused.
             
         Returns:
             Dict containing the processing result
@@ -310,8 +326,26 @@ class AIServiceAdapter:
             # Get the agent instance
             agent = self._get_or_create_agent()
             
-            # Call the agent
-            response = agent.execute(prompt)
+            # Call the agent, or reuse its response to the same prompt
+            # Mock responses of an agent without API access are never cached
+            cache = self._get_response_cache(use_cache) if agent.openai_available else None
+            cached = False
+            if cache:
+                request = {
+                    "template": template_name,
+                    "prompt": prompt,
+                    "model": agent.config.get("model"),
+                    "instructions": agent.config.get("instructions")
+                }
+                key = make_cache_key(request)
+                response = cache.get(key, "ai_service_adapter.prompt_with_template")
+                cached = response is not None
+                if not cached:
+                    response = agent.execute(prompt)
+                    if not (isinstance(response, dict) and "error" in response):
+                        cache.put(key, response, "ai_service_adapter.prompt_with_template")
+            else:
+                response = agent.execute(prompt)
             
             # Update context
             self._update_context(context_id, {
@@ -327,7 +361,8 @@ class AIServiceAdapter:
                 "success": True,
                 "result": response,
                 "context_id": context_id,
-                "elapsed_time": elapsed_time
+                "elapsed_time": elapsed_time,
+                "cached": cached
             }
             
         except Exception as e:
@@ -460,6 +495,22 @@ class AIServiceAdapter:
                 "error": str(e)
             }
     
+    def _get_response_cache(self, use_cache: Optional[bool] = None):
+        """
+        Get the shared response cache if caching is enabled.
+        
+        Args:
+            use_cache: Per-call override of the "response_cache" setting
+            
+        Returns:
+            LLMResponseCache instance or None
+        """
+        if use_cache is None:
+            use_cache = self.config.get("response_cache", False)
+        if not use_cache or get_response_cache is None:
+            return None
+        return get_response_cache(self.config.get("response_cache_path"))
+    
     def _load_template(self, template_name: str) -> Optional[str]:
         """
         Load a template from file.
@@ -9,10 +9,16 @@ including vector databases, knowledge graphs, and caching layers.
 import os
 import sys
 import json
+import zlib
+import asyncio
+import inspect
 import logging
 import time
 import hashlib
-from typing import Dict, List, Any, Optional, Union, Tuple, Callable
+import weakref
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Any, Optional, Union, Tuple, Callable, Set
 
 # Configure logging
 logging.basicConfig(
@@ -28,6 +34,17 @@ except ImportError:
     REDIS_AVAILABLE = False
     logger.warning("Redis not available, caching will be disabled")
 
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_ASYNC_AVAILABLE = True
+except ImportError:
+    REDIS_ASYNC_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     import pymongo
     MONGODB_AVAILABLE = True
@@ -44,6 +61,56 @@ except ImportError:
     logger.warning("Vector database dependencies not available, semantic search will be disabled")
 
 
+# Prefixes of cached values written by AsyncCachedKnowledgeBaseAdapter
+CACHE_FORMAT_JSON = b"j"
+CACHE_FORMAT_ZLIB = b"z"
+
+
+def encode_cache_value(value: Any, compress_threshold: int = 1024) -> bytes:
+    """
+    Serialize a value for the cache as compact JSON bytes, compressed when large.
+    
+    Args:
+        value: JSON-serializable value
+        compress_threshold: Payload size in bytes from which zlib compression is used
+        
+    Returns:
+        Format prefix followed by the payload
+    """
+    if orjson is not None:
+        payload = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(value, separators=(",", ":")).encode()
+    
+    if len(payload) >= compress_threshold:
+        return CACHE_FORMAT_ZLIB + zlib.compress(payload, 1)
+    return CACHE_FORMAT_JSON + payload
+
+
+def decode_cache_value(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize a cached value.
+    
+    Plain JSON written by CachedKnowledgeBaseAdapter is accepted as well.
+    
+    Args:
+        data: Cached bytes
+        
+    Returns:
+        Deserialized value
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    
+    prefix, payload = data[:1], data[1:]
+    if prefix == CACHE_FORMAT_ZLIB:
+        payload = zlib.decompress(payload)
+    elif prefix != CACHE_FORMAT_JSON:
+        payload = data
+    
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+
 class KnowledgeBaseAdapter:
     """Base adapter for knowledge base systems"""
     
@@ -272,6 +339,305 @@ class CachedKnowledgeBaseAdapter(KnowledgeBaseAdapter):
         return result
 
 
+class AsyncCachedKnowledgeBaseAdapter:
+    """Asynchronous knowledge base adapter with pooled, pipelined Redis caching"""
+    
+    # Redis key holding the cache generation; writes increment it so every
+    # cached query result becomes unreachable at once
+    GENERATION_KEY = "kb:generation"
+    
+    # Connection pools shared by all adapters, per event loop
+    _pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple, Any]]" = weakref.WeakKeyDictionary()
+    
+    def __init__(self, config: Dict[str, Any], adapter: KnowledgeBaseAdapter, redis_client: Any = None):
+        """
+        Initialize the async cached knowledge base adapter.
+        
+        Args:
+            config: Configuration dictionary
+            adapter: Base knowledge base adapter to wrap (sync or async methods)
+            redis_client: Optional async Redis client to use instead of the shared pool
+        """
+        self.config = config
+        self.adapter = adapter
+        self.cache_enabled = config.get("cache_enabled", True) and (redis_client is not None or REDIS_ASYNC_AVAILABLE)
+        self.cache_ttl = config.get("cache_ttl", 3600)  # 1 hour default
+        self.compress_threshold = config.get("cache_compress_threshold", 1024)
+        self.generation_refresh = config.get("cache_generation_refresh", 1.0)
+        
+        self._redis_client = redis_client
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+        self._generation: Optional[int] = None
+        self._generation_checked = 0.0
+        self._pending_writes: Set[asyncio.Task] = set()
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "errors": 0}
+    
+    def _get_client(self) -> Any:
+        """
+        Get the Redis client for the running event loop.
+        
+        Returns:
+            Async Redis client backed by the shared connection pool
+        """
+        if self._redis_client is not None:
+            return self._redis_client
+        
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            pool_key = (
+                self.config.get("redis_host", "localhost"),
+                self.config.get("redis_port", 6379),
+                self.config.get("redis_db", 0),
+                self.config.get("redis_password")
+            )
+            pools = self._pools.setdefault(loop, {})
+            if pool_key not in pools:
+                host, port, db, password = pool_key
+                pools[pool_key] = redis_asyncio.ConnectionPool(
+                    host=host,
+                    port=port,
+                    db=db,
+                    password=password,
+                    max_connections=self.config.get("redis_max_connections", 50)
+                )
+            client = redis_asyncio.Redis(connection_pool=pools[pool_key])
+            self._clients[loop] = client
+        return client
+    
+    async def _get_generation(self, client: Any) -> int:
+        """
+        Get the cache generation, re-reading it from Redis at most every generation_refresh seconds.
+        
+        Args:
+            client: Async Redis client
+            
+        Returns:
+            Current cache generation
+        """
+        now = time.monotonic()
+        if self._generation is None or now - self._generation_checked >= self.generation_refresh:
+            value = await client.get(self.GENERATION_KEY)
+            self._generation = int(value or 0)
+            self._generation_checked = now
+        return self._generation
+    
+    def _get_cache_key(self, generation: int, query: str, kwargs: Dict[str, Any]) -> str:
+        """
+        Generate the cache key of a query.
+        
+        Args:
+            generation: Cache generation
+            query: Query string
+            kwargs: Query keyword arguments
+            
+        Returns:
+            Cache key
+        """
+        key_parts = ["query", str(query)]
+        key_parts.extend([f"{k}={v}" for k, v in sorted(kwargs.items())])
+        key_hash = hashlib.md5("|".join(key_parts).encode()).hexdigest()
+        return f"kb:{generation}:{key_hash}"
+    
+    async def _call_adapter(self, method: str, *args, **kwargs) -> Any:
+        """
+        Call a method of the wrapped adapter without blocking the event loop.
+        
+        Args:
+            method: Adapter method name
+            *args: Method arguments
+            **kwargs: Method keyword arguments
+            
+        Returns:
+            Method result
+        """
+        function = getattr(self.adapter, method)
+        if inspect.iscoroutinefunction(function):
+            return await function(*args, **kwargs)
+        return await asyncio.to_thread(function, *args, **kwargs)
+    
+    async def query(self, query: str, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Query the knowledge base with caching.
+        
+        Args:
+            query: Query string
+            **kwargs: Additional query parameters
+            
+        Returns:
+            List of results
+        """
+        return (await self.query_many([query], **kwargs))[0]
+    
+    async def query_many(self, queries: List[str], **kwargs) -> List[List[Dict[str, Any]]]:
+        """
+        Query the knowledge base for several queries with one cache round trip.
+        
+        Cached results are fetched with a single MGET. Misses are deduplicated
+        and queried concurrently, and their results are written back in one
+        pipeline in the background, after the results have been returned.
+        
+        Args:
+            queries: Query strings
+            **kwargs: Additional query parameters applied to every query
+            
+        Returns:
+            List of results for each query, in order
+        """
+        skip_cache = kwargs.pop("skip_cache", False)
+        
+        if not self.cache_enabled or skip_cache:
+            return list(await asyncio.gather(*(self._call_adapter("query", query, **kwargs) for query in queries)))
+        
+        results: List[Any] = [None] * len(queries)
+        cache_keys = None
+        cached_values = [None] * len(queries)
+        try:
+            client = self._get_client()
+            generation = await self._get_generation(client)
+            cache_keys = [self._get_cache_key(generation, query, kwargs) for query in queries]
+            cached_values = await client.mget(cache_keys)
+        except Exception as e:
+            logger.warning(f"Failed to read cached results: {e}")
+            self.stats["errors"] += 1
+        
+        # Group misses by key so repeated queries hit the adapter once
+        missing: Dict[Any, List[int]] = {}
+        for index, cached_value in enumerate(cached_values):
+            if cached_value is not None:
+                try:
+                    results[index] = decode_cache_value(cached_value)
+                    self.stats["hits"] += 1
+                    continue
+                except Exception as e:
+                    logger.warning(f"Failed to parse cached result: {e}")
+            key = cache_keys[index] if cache_keys else index
+            missing.setdefault(key, []).append(index)
+        
+        if missing:
+            self.stats["misses"] += sum(len(indexes) for indexes in missing.values())
+            fetched = await asyncio.gather(*(
+                self._call_adapter("query", queries[indexes[0]], **kwargs) for indexes in missing.values()
+            ))
+            for indexes, result in zip(missing.values(), fetched):
+                for index in indexes:
+                    results[index] = result
+            
+            if cache_keys:
+                self._schedule_cache_write(dict(zip(missing, fetched)))
+        
+        return results
+    
+    def _schedule_cache_write(self, entries: Dict[str, Any]) -> None:
+        """
+        Write results to the cache in a background task.
+        
+        Args:
+            entries: Results by cache key
+        """
+        task = asyncio.get_running_loop().create_task(self._write_cache(entries))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+    
+    async def _write_cache(self, entries: Dict[str, Any]) -> None:
+        """
+        Write results to the cache in a single pipeline.
+        
+        Args:
+            entries: Results by cache key
+        """
+        try:
+            pipeline = self._get_client().pipeline(transaction=False)
+            for cache_key, result in entries.items():
+                pipeline.setex(cache_key, self.cache_ttl, encode_cache_value(result, self.compress_threshold))
+            await pipeline.execute()
+            self.stats["writes"] += len(entries)
+        except Exception as e:
+            logger.warning(f"Failed to cache result: {e}")
+            self.stats["errors"] += 1
+    
+    async def _invalidate(self) -> None:
+        """Invalidate all cached query results by moving to a new cache generation"""
+        try:
+            self._generation = int(await self._get_client().incr(self.GENERATION_KEY))
+            self._generation_checked = time.monotonic()
+        except Exception as e:
+            logger.warning(f"Failed to invalidate cache: {e}")
+            self.stats["errors"] += 1
+    
+    async def store(self, data: Dict[str, Any], **kwargs) -> Optional[str]:
+        """
+        Store data in the knowledge base and invalidate cached query results.
+        
+        Args:
+            data: Data to store
+            **kwargs: Additional storage parameters
+            
+        Returns:
+            ID of stored data if available
+        """
+        result = await self._call_adapter("store", data, **kwargs)
+        if self.cache_enabled and result:
+            await self._invalidate()
+        return result
+    
+    async def update(self, id: str, data: Dict[str, Any], **kwargs) -> bool:
+        """
+        Update data in the knowledge base and invalidate cached query results.
+        
+        Args:
+            id: ID of data to update
+            data: Updated data
+            **kwargs: Additional update parameters
+            
+        Returns:
+            True if successful
+        """
+        result = await self._call_adapter("update", id, data, **kwargs)
+        if self.cache_enabled and result:
+            await self._invalidate()
+        return result
+    
+    async def delete(self, id: str, **kwargs) -> bool:
+        """
+        Delete data from the knowledge base and invalidate cached query results.
+        
+        Args:
+            id: ID of data to delete
+            **kwargs: Additional deletion parameters
+            
+        Returns:
+            True if successful
+        """
+        result = await self._call_adapter("delete", id, **kwargs)
+        if self.cache_enabled and result:
+            await self._invalidate()
+        return result
+    
+    async def flush(self) -> None:
+        """Wait for background cache writes to finish"""
+        if self._pending_writes:
+            await asyncio.gather(*list(self._pending_writes), return_exceptions=True)
+    
+    async def close(self) -> None:
+        """Finish background cache writes and release this adapter's client"""
+        await self.flush()
+        if self._redis_client is None:
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+            if client is not None:
+                await client.aclose()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with hits, misses, background writes, errors and hit rate
+        """
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {**self.stats, "hit_rate": self.stats["hits"] / lookups if lookups else 0.0}
+
+
 class KnowledgeGraphAdapter(KnowledgeBaseAdapter):
     """Adapter for the Devloop Knowledge Graph"""
     
@@ -906,6 +1272,357 @@ class MongoDBAdapter(KnowledgeBaseAdapter):
             return False
 
 
+class FederatedKnowledgeBaseAdapter(KnowledgeBaseAdapter):
+    """Knowledge base adapter that queries several backends concurrently and fuses their results"""
+    
+    def __init__(self, config: Dict[str, Any], adapters: Dict[str, KnowledgeBaseAdapter]):
+        """
+        Initialize the federated knowledge base adapter.
+        
+        Args:
+            config: Configuration dictionary
+                - federation_timeout: Default deadline in seconds for each backend
+                - backend_timeouts: Deadlines by backend name
+                - backend_weights: Fusion weights by backend name (default 1.0)
+                - rrf_k: Rank constant of reciprocal-rank fusion (default 60)
+                - backend_max_in_flight: Calls a backend may have running at once;
+                  further queries skip it until one returns (default 1)
+            adapters: Backend adapters by name
+        """
+        super().__init__(config)
+        self.adapters = adapters
+        self.default_timeout = config.get("federation_timeout", 2.0)
+        self.backend_timeouts = config.get("backend_timeouts", {})
+        self.backend_weights = config.get("backend_weights", {})
+        self.rrf_k = config.get("rrf_k", 60)
+        
+        self.max_in_flight = max(1, config.get("backend_max_in_flight", 1))
+        
+        # Backends that miss their deadline keep their worker until they return,
+        # so each backend is capped at max_in_flight workers and never starves the others
+        self._in_flight = {name: 0 for name in adapters}
+        self._in_flight_lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=max(1, self.max_in_flight * len(adapters)),
+                                           thread_name_prefix="kb-federation")
+        self.last_report: Dict[str, Dict[str, Any]] = {}
+    
+    def _get_timeout(self, name: str) -> Optional[float]:
+        """
+        Get the deadline of a backend.
+        
+        Args:
+            name: Backend name
+            
+        Returns:
+            Deadline in seconds (None for no deadline)
+        """
+        return self.backend_timeouts.get(name, self.default_timeout)
+    
+    def _submit(self, name: str, query: str, kwargs: Dict[str, Any]) -> Optional[Future]:
+        """
+        Start a backend query unless the backend is at its in-flight cap.
+        
+        Args:
+            name: Backend name
+            query: Query string
+            kwargs: Query parameters
+            
+        Returns:
+            Future of (results, seconds taken), or None if the backend is busy
+        """
+        with self._in_flight_lock:
+            if self._in_flight[name] >= self.max_in_flight:
+                return None
+            self._in_flight[name] += 1
+        
+        future = self.executor.submit(self._timed_query, self.adapters[name], query, kwargs)
+        future.add_done_callback(lambda _: self._release(name))
+        return future
+    
+    def _release(self, name: str) -> None:
+        """Free an in-flight slot of a backend once its call has returned."""
+        with self._in_flight_lock:
+            self._in_flight[name] -= 1
+    
+    def _busy_report(self, name: str) -> Dict[str, Any]:
+        """Report a backend skipped because its earlier calls are still running."""
+        logger.warning(f"Knowledge base {name} still has {self.max_in_flight} call(s) running, skipping it")
+        return {"status": "busy", "count": 0}
+    
+    def query(self, query: str, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Query all backends concurrently and fuse their results.
+        
+        Args:
+            query: Query string
+            **kwargs: Additional query parameters passed to every backend
+                - top_k: Maximum number of fused results
+            
+        Returns:
+            Fused results from the backends that answered in time
+        """
+        return self.federated_query(query, **kwargs)["results"]
+    
+    def federated_query(self, query: str, **kwargs) -> Dict[str, Any]:
+        """
+        Query all backends concurrently and report on each backend.
+        
+        Every backend gets its own deadline, measured from the start of the
+        query, so the call takes as long as the slowest backend that answers
+        in time. Backends that time out or fail are left out of the results,
+        as are backends whose earlier calls are still running.
+        
+        Args:
+            query: Query string
+            **kwargs: Additional query parameters passed to every backend
+                - top_k: Maximum number of fused results
+            
+        Returns:
+            Dictionary with the fused "results", per-backend status in
+            "backends" and a "partial" flag
+        """
+        top_k = kwargs.pop("top_k", None)
+        start = time.monotonic()
+        futures = {name: self._submit(name, query, kwargs) for name in self.adapters}
+        
+        backend_results = {}
+        report = {}
+        for name, future in futures.items():
+            if future is None:
+                report[name] = self._busy_report(name)
+                continue
+            timeout = self._get_timeout(name)
+            remaining = None if timeout is None else max(0.0, start + timeout - time.monotonic())
+            try:
+                results, latency = future.result(timeout=remaining)
+                backend_results[name] = results
+                report[name] = {"status": "ok", "count": len(results), "latency_ms": latency * 1000}
+            except FutureTimeoutError:
+                future.cancel()
+                logger.warning(f"Knowledge base {name} missed its {timeout}s deadline")
+                report[name] = {"status": "timeout", "count": 0, "latency_ms": timeout * 1000}
+            except Exception as e:
+                logger.error(f"Knowledge base {name} query failed: {e}")
+                report[name] = {"status": "error", "count": 0, "error": str(e)}
+        
+        return self._build_response(backend_results, report, top_k)
+    
+    async def query_async(self, query: str, **kwargs) -> Dict[str, Any]:
+        """
+        Query all backends concurrently on the event loop.
+        
+        Backends with async query methods (e.g. AsyncCachedKnowledgeBaseAdapter)
+        are awaited directly; sync backends run on the federation's workers,
+        subject to the same in-flight cap as federated_query().
+        
+        Args:
+            query: Query string
+            **kwargs: Additional query parameters passed to every backend
+                - top_k: Maximum number of fused results
+            
+        Returns:
+            Dictionary with the fused "results", per-backend status in
+            "backends" and a "partial" flag
+        """
+        top_k = kwargs.pop("top_k", None)
+        
+        async def run(name: str, adapter: Any) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+            if not inspect.iscoroutinefunction(adapter.query):
+                future = self._submit(name, query, kwargs)
+                if future is None:
+                    return None
+                return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self._get_timeout(name))
+            
+            started = time.monotonic()
+            results = await asyncio.wait_for(adapter.query(query, **kwargs), timeout=self._get_timeout(name))
+            return results or [], time.monotonic() - started
+        
+        names = list(self.adapters)
+        outcomes = await asyncio.gather(*(run(name, self.adapters[name]) for name in names),
+                                        return_exceptions=True)
+        
+        backend_results = {}
+        report = {}
+        for name, outcome in zip(names, outcomes):
+            if outcome is None:
+                report[name] = self._busy_report(name)
+            elif isinstance(outcome, asyncio.TimeoutError):
+                logger.warning(f"Knowledge base {name} missed its {self._get_timeout(name)}s deadline")
+                report[name] = {"status": "timeout", "count": 0, "latency_ms": self._get_timeout(name) * 1000}
+            elif isinstance(outcome, Exception):
+                logger.error(f"Knowledge base {name} query failed: {outcome}")
+                report[name] = {"status": "error", "count": 0, "error": str(outcome)}
+            else:
+                results, latency = outcome
+                backend_results[name] = results
+                report[name] = {"status": "ok", "count": len(results), "latency_ms": latency * 1000}
+        
+        return self._build_response(backend_results, report, top_k)
+    
+    @staticmethod
+    def _timed_query(adapter: KnowledgeBaseAdapter, query: str,
+                     kwargs: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], float]:
+        """
+        Query one backend and measure its latency.
+        
+        Args:
+            adapter: Backend adapter
+            query: Query string
+            kwargs: Query parameters
+            
+        Returns:
+            Tuple of (results, seconds taken)
+        """
+        started = time.monotonic()
+        results = adapter.query(query, **kwargs)
+        return results or [], time.monotonic() - started
+    
+    def _build_response(self, backend_results: Dict[str, List[Dict[str, Any]]],
+                        report: Dict[str, Dict[str, Any]], top_k: Optional[int]) -> Dict[str, Any]:
+        """
+        Fuse backend results and assemble the federated response.
+        
+        Args:
+            backend_results: Results of the backends that answered
+            report: Status of every backend
+            top_k: Maximum number of fused results
+            
+        Returns:
+            Federated response dictionary
+        """
+        self.last_report = report
+        results = self.fuse_results(backend_results)
+        if top_k is not None:
+            results = results[:top_k]
+        return {
+            "results": results,
+            "backends": report,
+            "partial": any(entry["status"] != "ok" for entry in report.values())
+        }
+    
+    def fuse_results(self, backend_results: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Merge ranked result lists with reciprocal-rank fusion.
+        
+        A result scores weight / (rrf_k + rank) for every backend that
+        returned it. Results are deduplicated by id (or by content when they
+        have no usable id); the copy from the best-ranked occurrence is kept.
+        
+        Args:
+            backend_results: Ranked results by backend name
+            
+        Returns:
+            Fused results, best first, with "fusion_score" and "sources" added
+        """
+        fused: Dict[str, Dict[str, Any]] = {}
+        best_rank: Dict[str, int] = {}
+        
+        for name, results in backend_results.items():
+            weight = self.backend_weights.get(name, 1.0)
+            for rank, result in enumerate(results, start=1):
+                key = self._result_key(result)
+                entry = fused.get(key)
+                if entry is None:
+                    entry = {**result, "fusion_score": 0.0, "sources": []}
+                    fused[key] = entry
+                    best_rank[key] = rank
+                elif rank < best_rank[key]:
+                    entry.update({k: v for k, v in result.items() if k not in ("fusion_score", "sources")})
+                    best_rank[key] = rank
+                if name not in entry["sources"]:
+                    entry["fusion_score"] += weight / (self.rrf_k + rank)
+                    entry["sources"].append(name)
+        
+        # Sorting is stable, so ties keep the order in which results were first seen
+        return sorted(fused.values(), key=lambda entry: -entry["fusion_score"])
+    
+    @staticmethod
+    def _result_key(result: Dict[str, Any]) -> str:
+        """
+        Get the deduplication key of a result.
+        
+        Args:
+            result: Backend result
+            
+        Returns:
+            The result id, or a hash of its content if it has no usable id
+        """
+        result_id = result.get("id")
+        if result_id not in (None, "", "unknown"):
+            return f"id:{result_id}"
+        content = result.get("content", result.get("properties", result))
+        return "content:" + hashlib.md5(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+    
+    def _fan_out(self, method: str, *args, backends: List[str] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Call a write method on several backends concurrently.
+        
+        Args:
+            method: Adapter method name
+            *args: Method arguments
+            backends: Names of the backends to write to (all by default)
+            **kwargs: Method keyword arguments
+            
+        Returns:
+            Result by backend name (None for backends that failed)
+        """
+        names = backends or list(self.adapters)
+        futures = {name: self.executor.submit(getattr(self.adapters[name], method), *args, **kwargs)
+                   for name in names}
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logger.error(f"Knowledge base {name} {method} failed: {e}")
+                results[name] = None
+        return results
+    
+    def store(self, data: Dict[str, Any], **kwargs) -> Optional[str]:
+        """
+        Store data in the backends.
+        
+        Args:
+            data: Data to store
+            **kwargs: Additional storage parameters
+                - backends: Names of the backends to store in (all by default)
+            
+        Returns:
+            ID returned by the first backend that stored the data
+        """
+        results = self._fan_out("store", data, **kwargs)
+        return next((result for result in results.values() if result), None)
+    
+    def update(self, id: str, data: Dict[str, Any], **kwargs) -> bool:
+        """
+        Update data in the backends.
+        
+        Args:
+            id: ID of data to update
+            data: Updated data
+            **kwargs: Additional update parameters
+                - backends: Names of the backends to update (all by default)
+            
+        Returns:
+            True if any backend updated the data
+        """
+        return any(self._fan_out("update", id, data, **kwargs).values())
+    
+    def delete(self, id: str, **kwargs) -> bool:
+        """
+        Delete data from the backends.
+        
+        Args:
+            id: ID of data to delete
+            **kwargs: Additional deletion parameters
+                - backends: Names of the backends to delete from (all by default)
+            
+        Returns:
+            True if any backend deleted the data
+        """
+        return any(self._fan_out("delete", id, **kwargs).values())
+
+
 class KnowledgeBaseFactory:
     """Factory for creating knowledge base adapters"""
     
@@ -943,6 +1660,48 @@ class KnowledgeBaseFactory:
         except Exception as e:
             logger.error(f"Failed to create adapter of type {adapter_type}: {e}")
             raise
+    
+    @staticmethod
+    def create_async_adapter(adapter_type: str, config: Dict[str, Any]) -> AsyncCachedKnowledgeBaseAdapter:
+        """
+        Create a knowledge base adapter wrapped with async Redis caching.
+        
+        Args:
+            adapter_type: Type of adapter to create
+            config: Configuration dictionary
+            
+        Returns:
+            Async cached knowledge base adapter (caching is disabled if
+            redis.asyncio is unavailable or cache_enabled is false)
+        """
+        adapter = KnowledgeBaseFactory.create_adapter(adapter_type, {**config, "cache_enabled": False})
+        return AsyncCachedKnowledgeBaseAdapter(config, adapter)
+    
+    @staticmethod
+    def create_federated_adapter(adapter_types: List[str], config: Dict[str, Any]) -> FederatedKnowledgeBaseAdapter:
+        """
+        Create an adapter that queries several knowledge bases concurrently.
+        
+        Backends that cannot be created are left out of the federation.
+        
+        Args:
+            adapter_types: Types of the adapters to federate
+            config: Configuration dictionary shared by the adapters
+            
+        Returns:
+            Federated knowledge base adapter
+        """
+        adapters = {}
+        for adapter_type in adapter_types:
+            try:
+                adapters[adapter_type] = KnowledgeBaseFactory.create_adapter(adapter_type, config)
+            except Exception as e:
+                logger.warning(f"Leaving {adapter_type} out of the federation: {e}")
+        
+        if not adapters:
+            raise ValueError(f"None of the adapters {adapter_types} could be created")
+        
+        return FederatedKnowledgeBaseAdapter(config, adapters)
 
 
 if __name__ == "__main__":
@@ -7,10 +7,13 @@ This is a direct integration with OpenAI's assistants API.
 """
 
 import os
+import sys
 import json
 import time
 import uuid
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 
@@ -27,6 +30,21 @@ except ImportError:
     logger.warning("OpenAI package not available. Using mock implementation.")
     openai = None
 
+# Determine project root directory dynamically
+PROJECT_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+# Import the tool executor shared with the tool system through its package
+# path, so the import does not depend on which "registry" is on sys.path
+from agents.tools.registry.tool_registry import ToolMetadata
+from agents.tools.registry.tool_executor import ToolExecutor, ToolTask
+
+try:
+    from .run_monitor import RunMonitor
+except ImportError:
+    from run_monitor import RunMonitor
+
 class SDKAgent:
     """Base OpenAI SDK Agent Implementation"""
     
@@ -66,6 +84,17 @@ class SDKAgent:
             self.assistant = None
             self.thread = None
         
+        # Tool calls of one turn run concurrently; limits come from each tool's metadata
+        self.tool_executor = ToolExecutor(max_workers=config.get("max_parallel_tools", 8))
+        self.tool_metadata: Dict[str, ToolMetadata] = {}
+        
+        # Runs are polled with adaptive backoff instead of a fixed interval
+        self.run_monitor = RunMonitor(
+            initial_interval=config.get("run_poll_interval", 0.05),
+            max_interval=config.get("run_poll_max_interval", 2.0),
+            timeout=config.get("run_timeout", 600.0)
+        )
+        
         # Initialize state tracking
         self.state_history = []
         self.created_at = datetime.now()
@@ -154,6 +183,44 @@ class SDKAgent:
             logger.error(f"Error executing agent: {e}")
             return {"error": str(e)}
     
+    async def execute_async(self, prompt: str) -> Any:
+        """Execute the agent with a prompt without blocking the event loop
+        
+        Many agents can be executed concurrently on one event loop, e.g.
+        with asyncio.gather, since waiting for a run holds no thread.
+        
+        Args:
+            prompt: User prompt to execute
+            
+        Returns:
+            Generated response or error information
+        """
+        if not self.openai_available or not self.assistant or not self.thread:
+            logger.warning("Using mock execution due to missing OpenAI setup")
+            return self._mock_execution(prompt)
+        
+        try:
+            # Create a message on the thread
+            await self.run_monitor.call(
+                self.client.beta.threads.messages.create,
+                thread_id=self.thread.id,
+                role="user",
+                content=prompt
+            )
+            
+            # Run the assistant
+            run = await self.run_monitor.call(
+                self.client.beta.threads.runs.create,
+                thread_id=self.thread.id,
+                assistant_id=self.assistant.id
+            )
+            
+            # Monitor and process the run
+            return await self._monitor_run_async(run)
+        except Exception as e:
+            logger.error(f"Error executing agent: {e}")
+            return {"error": str(e)}
+    
     def _monitor_run(self, run: Any) -> Any:
         """Monitor and process an assistant run
         
@@ -163,26 +230,36 @@ class SDKAgent:
         Returns:
             Final result from the run
         """
-        # Poll for completion
-        while run.status in ["queued", "in_progress"]:
-            run = self.client.beta.threads.runs.retrieve(
-                thread_id=self.thread.id,
-                run_id=run.id
-            )
-            
-            # Handle tool calls
-            if run.status == "requires_action":
-                tool_outputs = self._handle_tool_calls(run.required_action.submit_tool_outputs.tool_calls)
-                run = self.client.beta.threads.runs.submit_tool_outputs(
-                    thread_id=self.thread.id,
-                    run_id=run.id,
-                    tool_outputs=tool_outputs
-                )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._monitor_run_async(run))
+        
+        # Called from a coroutine: asyncio.run cannot nest, so give the run its
+        # own loop on a worker thread. Async callers should use execute_async.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self._monitor_run_async(run)).result()
+    
+    async def _monitor_run_async(self, run: Any) -> Any:
+        """Monitor and process an assistant run asynchronously
+        
+        Args:
+            run: The run object to monitor
             
-            time.sleep(0.5)
+        Returns:
+            Final result from the run
+        """
+        # Wait for a terminal state, handling tool calls along the way
+        run = await self.run_monitor.wait(self.client, self.thread.id, run, self._handle_tool_calls)
+        
+        if run.status != "completed":
+            last_error = getattr(run, "last_error", None)
+            detail = f": {last_error.message}" if getattr(last_error, "message", None) else ""
+            return {"error": f"Run {run.id} ended with status {run.status}{detail}"}
         
         # Get the final messages
-        messages = self.client.beta.threads.messages.list(
+        messages = await self.run_monitor.call(
+            self.client.beta.threads.messages.list,
             thread_id=self.thread.id
         )
         
@@ -195,15 +272,20 @@ class SDKAgent:
     def _handle_tool_calls(self, tool_calls: List[Any]) -> List[Dict[str, Any]]:
         """Handle tool calls from the assistant
         
+        Independent calls run concurrently on the agent's tool executor;
+        outputs are returned in the order of the calls.
+        
         Args:
             tool_calls: List of tool calls to handle
             
         Returns:
             List of tool outputs
         """
-        tool_outputs = []
+        results: List[Any] = [None] * len(tool_calls)
+        tasks = []
+        task_indexes = []
         
-        for tool_call in tool_calls:
+        for index, tool_call in enumerate(tool_calls):
             try:
                 # Extract tool information
                 function_name = tool_call.function.name
@@ -212,29 +294,84 @@ class SDKAgent:
                 # Log the tool call
                 logger.info(f"Tool call: {function_name} with args: {arguments}")
                 
-                # Try to find and execute the tool
-                tool_method = getattr(self, function_name, None)
-                if tool_method and callable(tool_method):
-                    # Tool exists as a method on this class
-                    result = tool_method(**arguments)
+                # Try to find the tool as a method on this class
+                metadata = self._get_tool_metadata(function_name)
+                if metadata:
+                    tasks.append(ToolTask(name=function_name, arguments=arguments, metadata=metadata))
+                    task_indexes.append(index)
                 else:
                     # Tool not found
-                    result = {"error": f"Tool {function_name} not implemented"}
-                
-                # Add to outputs
-                tool_outputs.append({
-                    "tool_call_id": tool_call.id,
-                    "output": json.dumps(result)
-                })
+                    results[index] = {"error": f"Tool {function_name} not implemented"}
             except Exception as e:
                 logger.error(f"Error handling tool call: {e}")
-                tool_outputs.append({
-                    "tool_call_id": tool_call.id,
-                    "output": json.dumps({"error": str(e)})
-                })
+                results[index] = {"error": str(e)}
+        
+        # Execute the tools
+        for index, result in zip(task_indexes, self.tool_executor.execute(tasks)):
+            results[index] = result
+        
+        tool_outputs = []
+        for tool_call, result in zip(tool_calls, results):
+            try:
+                output = json.dumps(result)
+            except (TypeError, ValueError) as e:
+                logger.error(f"Error handling tool call: {e}")
+                output = json.dumps({"error": str(e)})
+            
+            # Add to outputs
+            tool_outputs.append({
+                "tool_call_id": tool_call.id,
+                "output": output
+            })
         
         return tool_outputs
     
+    def _get_tool_metadata(self, function_name: str) -> Optional[ToolMetadata]:
+        """Get the metadata of a tool implemented as a method on this agent
+        
+        Timeouts and concurrency limits are read from the method's tool
+        attributes (as set by the @tool decorator), with the agent's
+        tool_timeout configuration as the default timeout.
+        
+        Args:
+            function_name: Name of the tool
+            
+        Returns:
+            ToolMetadata if the method exists, None otherwise
+        """
+        if function_name in self.tool_metadata:
+            return self.tool_metadata[function_name]
+        
+        tool_method = getattr(self, function_name, None)
+        if not tool_method or not callable(tool_method):
+            return None
+        
+        metadata = ToolMetadata(
+            name=function_name,
+            description=tool_method.__doc__ or f"Execute the {function_name} function",
+            parameters={},
+            function=tool_method,
+            timeout=getattr(tool_method, "_tool_timeout", self.config.get("tool_timeout")),
+            max_concurrency=getattr(tool_method, "_tool_max_concurrency", None)
+        )
+        self.tool_metadata[function_name] = metadata
+        return metadata
+    
+    def get_tool_stats(self) -> Dict[str, Any]:
+        """Get invocation counts and latency histograms of the agent's tools
+        
+        Returns:
+            Dictionary mapping tool names to their statistics
+        """
+        return {
+            name: {
+                "invocation_count": metadata.invocation_count,
+                "timeout_count": metadata.timeout_count,
+                "latency": metadata.latency.to_dict()
+            }
+            for name, metadata in self.tool_metadata.items()
+        }
+    
     def _mock_execution(self, prompt: str) -> str:
         """Generate a mock execution response
         
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Run Monitor Module
+
+Supervises OpenAI assistant runs until they reach a terminal state. Runs are
+polled with adaptive backoff: the first checks come quickly so short runs
+finish with little added latency, the interval then grows towards a ceiling
+while a run stays busy, and it resets after tool outputs are submitted.
+Waiting is asynchronous, so one event loop can supervise many concurrent
+runs without holding a thread per run.
+"""
+
+import time
+import random
+import asyncio
+import inspect
+import logging
+from typing import Dict, List, Any, Optional, Callable, Awaitable, Tuple
+
+logger = logging.getLogger("run_monitor")
+
+# Run states that no longer change
+TERMINAL_STATUSES = {"completed", "failed", "cancelled", "expired", "incomplete"}
+
+
+class RunTimeoutError(Exception):
+    """Raised when a run does not finish within the monitor's timeout"""
+
+    def __init__(self, run: Any, timeout: float):
+        super().__init__(f"Run {run.id} did not finish within {timeout}s (last status: {run.status})")
+        self.run = run
+
+
+class RunMonitor:
+    """Asynchronous monitor for assistant runs with adaptive backoff polling"""
+
+    def __init__(self,
+                 initial_interval: float = 0.05,
+                 max_interval: float = 2.0,
+                 backoff_factor: float = 1.5,
+                 jitter: float = 0.1,
+                 timeout: Optional[float] = 600.0,
+                 sleep: Callable[[float], Awaitable[None]] = None):
+        """Initialize the run monitor
+
+        Args:
+            initial_interval: Seconds before the first status check
+            max_interval: Longest interval between status checks
+            backoff_factor: Growth of the interval after each unchanged check
+            jitter: Random fraction added to each interval so concurrent runs spread out
+            timeout: Seconds before an unfinished run is cancelled (None to wait forever)
+            sleep: Coroutine function used to wait (asyncio.sleep by default)
+        """
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.timeout = timeout
+        self.sleep = sleep or asyncio.sleep
+        self.stats = {"runs": 0, "polls": 0, "tool_rounds": 0, "timeouts": 0}
+
+    async def wait(self, client: Any, thread_id: str, run: Any,
+                   handle_tool_calls: Optional[Callable[[List[Any]], List[Dict[str, Any]]]] = None) -> Any:
+        """Wait for a run to reach a terminal state
+
+        Args:
+            client: OpenAI client (sync or async) exposing beta.threads.runs
+            thread_id: ID of the thread the run belongs to
+            run: Run object returned when the run was created
+            handle_tool_calls: Function turning tool calls into tool outputs
+
+        Returns:
+            The run in its terminal state
+
+        Raises:
+            RunTimeoutError: If the run is still active after the timeout
+        """
+        runs = client.beta.threads.runs
+        self.stats["runs"] += 1
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        interval = self.initial_interval
+
+        while run.status not in TERMINAL_STATUSES:
+            if run.status == "requires_action":
+                tool_calls = run.required_action.submit_tool_outputs.tool_calls
+                if handle_tool_calls is None:
+                    tool_outputs = [{"tool_call_id": call.id, "output": '{"error": "Tools not available"}'}
+                                    for call in tool_calls]
+                else:
+                    tool_outputs = await asyncio.to_thread(handle_tool_calls, tool_calls)
+                self.stats["tool_rounds"] += 1
+
+                run = await self.call(runs.submit_tool_outputs, thread_id=thread_id,
+                                       run_id=run.id, tool_outputs=tool_outputs)
+
+                # The run is active again: poll quickly for its next step
+                interval = self.initial_interval
+                continue
+
+            if deadline is not None and time.monotonic() >= deadline:
+                self.stats["timeouts"] += 1
+                await self._cancel(runs, thread_id, run)
+                raise RunTimeoutError(run, self.timeout)
+
+            delay = interval * (1 + random.uniform(0, self.jitter))
+            if deadline is not None:
+                delay = max(0.0, min(delay, deadline - time.monotonic()))
+            await self.sleep(delay)
+
+            previous_status = run.status
+            run = await self.call(runs.retrieve, thread_id=thread_id, run_id=run.id)
+            self.stats["polls"] += 1
+
+            # Back off while nothing changes, and start over when the run moves on
+            if run.status == previous_status:
+                interval = min(interval * self.backoff_factor, self.max_interval)
+            else:
+                interval = self.initial_interval
+
+        logger.info(f"Run {run.id} finished with status {run.status}")
+        return run
+
+    async def wait_all(self, client: Any, runs: List[Tuple[str, Any]],
+                       handle_tool_calls: Optional[Callable[[List[Any]], List[Dict[str, Any]]]] = None) -> List[Any]:
+        """Wait for many runs concurrently
+
+        Args:
+            client: OpenAI client (sync or async) exposing beta.threads.runs
+            runs: (thread_id, run) pairs to supervise
+            handle_tool_calls: Function turning tool calls into tool outputs
+
+        Returns:
+            Terminal run, or the exception raised while waiting, for each pair in order
+        """
+        return await asyncio.gather(
+            *(self.wait(client, thread_id, run, handle_tool_calls) for thread_id, run in runs),
+            return_exceptions=True
+        )
+
+    async def _cancel(self, runs: Any, thread_id: str, run: Any) -> None:
+        """Cancel a run that exceeded the timeout, ignoring failures"""
+        cancel = getattr(runs, "cancel", None)
+        if cancel is None:
+            return
+        try:
+            await self.call(cancel, thread_id=thread_id, run_id=run.id)
+        except Exception as e:
+            logger.warning(f"Could not cancel run {run.id}: {e}")
+
+    @staticmethod
+    async def call(method: Callable[..., Any], **kwargs) -> Any:
+        """Call an assistants API method of a sync or async client without blocking the loop"""
+        if inspect.iscoroutinefunction(method):
+            return await method(**kwargs)
+
+        result = await asyncio.to_thread(method, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared atomic file write helper
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+# The helper lives in agents/utils; append the repository root so it does
+# not shadow the SDK's own packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from agents.utils.atomic_write import atomic_write
+
+
+class TestAtomicWrite(unittest.TestCase):
+    """Tests for atomic_write"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "nested", "state.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_replaces_file_and_creates_directories(self):
+        """Test text and binary writes replace the destination"""
+        with atomic_write(self.path) as f:
+            f.write("first")
+        with atomic_write(self.path, "wb", durable=True) as f:
+            f.write(b"second")
+
+        with open(self.path) as f:
+            self.assertEqual(f.read(), "second")
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["state.json"])
+
+    def test_failed_write_keeps_previous_contents(self):
+        """Test that an exception inside the block leaves the old file and no temporary file"""
+        with atomic_write(self.path) as f:
+            f.write("old")
+
+        with self.assertRaises(RuntimeError):
+            with atomic_write(self.path) as f:
+                f.write("partial")
+                raise RuntimeError("serializer failed")
+
+        with open(self.path) as f:
+            self.assertEqual(f.read(), "old")
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["state.json"])
+
+    def test_rejects_other_modes(self):
+        """Test that appending or reading is refused"""
+        with self.assertRaises(ValueError):
+            with atomic_write(self.path, "a"):
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the resident, adjacency-indexed graph store of the knowledge manager
+"""
+
+import os
+import json
+import random
+import shutil
+import tempfile
+import unittest
+import importlib.util
+
+# The tool system's core package shares its name with the SDK's, so load the
+# graph store module from its file
+_spec = importlib.util.spec_from_file_location(
+    "graph_store",
+    os.path.join(os.path.dirname(__file__), '..', '..', 'tools', 'core', 'graph_store.py')
+)
+graph_store = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(graph_store)
+
+
+def scan_related(graph, node_id, relation_types, max_depth):
+    """Reference implementation: breadth-first search scanning every edge and node"""
+    start_node = next(node for node in graph["nodes"] if node.get("id") == node_id)
+    visited_nodes = {node_id}
+    related_nodes = [start_node]
+    related_edges = []
+    current_level = [node_id]
+    for _ in range(max_depth):
+        next_level = []
+        for current_id in current_level:
+            for edge in graph["edges"]:
+                consider_edge = not relation_types or edge.get("type") in relation_types
+                if edge.get("source") == current_id and consider_edge:
+                    neighbour_id = edge.get("target")
+                elif edge.get("target") == current_id and consider_edge:
+                    neighbour_id = edge.get("source")
+                else:
+                    continue
+                if neighbour_id not in visited_nodes:
+                    visited_nodes.add(neighbour_id)
+                    next_level.append(neighbour_id)
+                    related_edges.append(edge)
+                    for node in graph["nodes"]:
+                        if node.get("id") == neighbour_id:
+                            related_nodes.append(node)
+                            break
+        current_level = next_level
+        if not current_level:
+            break
+    return {"start_node": start_node, "related_nodes": related_nodes, "related_edges": related_edges}
+
+
+class TestGraphStore(unittest.TestCase):
+    """Tests for the GraphStore"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.graph_path = os.path.join(self.temp_dir, "graph.json")
+        self.store = graph_store.GraphStore(self.graph_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def add_random_graph(self, node_count=60, edge_count=200, seed=3):
+        """Add a random multigraph with self-loops and dangling edges"""
+        rng = random.Random(seed)
+        for i in range(node_count):
+            self.store.add_node({"id": f"n{i}", "type": "concept", "name": f"Node {i}"})
+        node_ids = [f"n{i}" for i in range(node_count)] + ["missing"]
+        for i in range(edge_count):
+            self.store.add_edge({"id": f"e{i}", "source": rng.choice(node_ids),
+                                 "target": rng.choice(node_ids), "type": rng.choice(["uses", "part_of"])})
+
+    def test_query_related_matches_full_scan(self):
+        """Test that adjacency BFS returns what scanning the whole graph returns"""
+        self.add_random_graph()
+        graph = self.store.to_dict()
+
+        for node_id in ["n0", "n7", "n42"]:
+            for relation_types in [[], ["uses"]]:
+                for max_depth in [1, 2, 4]:
+                    with self.subTest(node_id=node_id, relation_types=relation_types, max_depth=max_depth):
+                        self.assertEqual(self.store.query_related(node_id, relation_types, max_depth),
+                                         scan_related(graph, node_id, relation_types, max_depth))
+
+        self.assertIsNone(self.store.query_related("missing"))
+
+    def test_writes_go_through_to_file(self):
+        """Test that every change is saved and visible to a new store"""
+        self.store.add_node({"id": "a", "type": "feature", "name": "A"})
+        self.store.add_node({"id": "b", "type": "feature", "name": "B"})
+        self.store.add_edge({"id": "e", "source": "a", "target": "b", "type": "depends_on"})
+
+        with open(self.graph_path) as f:
+            saved = json.load(f)
+        self.assertEqual([node["id"] for node in saved["nodes"]], ["a", "b"])
+
+        reopened = graph_store.GraphStore(self.graph_path)
+        self.assertEqual(reopened.find_node("feature", "B")["id"], "b")
+        self.assertEqual(len(reopened.query_related("a")["related_edges"]), 1)
+
+    def test_reloads_file_changed_by_another_process(self):
+        """Test that the resident graph follows external changes to the file"""
+        self.store.add_node({"id": "a", "type": "feature", "name": "A"})
+        other = graph_store.GraphStore(self.graph_path)
+        other.add_node({"id": "b", "type": "feature", "name": "B"})
+        other.add_edge({"id": "e", "source": "b", "target": "a", "type": "depends_on"})
+
+        related = self.store.query_related("a")
+        self.assertEqual([node["id"] for node in related["related_nodes"]], ["a", "b"])
+
+    def test_unique_ids_and_copies(self):
+        """Test ID de-duplication and that returned data cannot change the graph"""
+        self.store.add_node({"id": "feature-1", "type": "feature", "name": "A"})
+        self.assertEqual(self.store.unique_id("feature-1"), "feature-1-1")
+        self.assertEqual(self.store.unique_id("feature-2"), "feature-2")
+
+        self.store.get_node("feature-1")["name"] = "Changed"
+        self.assertEqual(self.store.get_node("feature-1")["name"], "A")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Unit tests for regex intent recognition in the IntentRecognizer
+"""
+
+import os
+import re
+import sys
+import json
+import tempfile
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.intent_recognition import IntentRecognizer, _default_param_name, _literal_prefix
+
+
+UTTERANCES = [
+    "view the design of the login page",
+    "view design 'C:\\designs\\home.fig'",
+    "show screenshot containing the dashboard",
+    "view screenshot \"\"",
+    "please clean up the project",
+    "clean up the src/utils directory",
+    "run a deep cleanup",
+    "create a feature for user authentication",
+    "we need a feature that handles exports",
+    "run the dashboard feature",
+    "open the dashboard",
+    "refresh the dashboard now",
+    "Tidy up the workspace\nand then open design mockups",
+    "what is the weather like",
+    ""
+]
+
+
+def reference_match(patterns, text):
+    """The best pattern match found by trying every pattern in turn"""
+    best = None
+    for intent_type, intent_patterns in patterns.items():
+        for pattern in intent_patterns:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                confidence = 0.8 + min(0.15, len(pattern) / 1000)
+                params = {}
+                for i, group in enumerate(match.groups()):
+                    if group:
+                        params[_default_param_name(intent_type, i)] = group
+                if best is None or confidence > best[1]:
+                    best = (intent_type, confidence, params)
+    return best
+
+
+def reference_parameters(patterns, intent_type, text):
+    """The parameters of the first pattern of an intent yielding any"""
+    for pattern in patterns.get(intent_type, []):
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            params = {}
+            for i, group in enumerate(match.groups()):
+                if group:
+                    params[_default_param_name(intent_type, i)] = group
+            if params:
+                return params
+    return {}
+
+
+class TestRegexIntentRecognition(unittest.TestCase):
+    """Tests for regex intent recognition"""
+
+    def setUp(self):
+        self.recognizer = IntentRecognizer(use_ai_recognition=False)
+
+    def test_matches_every_pattern_in_turn(self):
+        """Test that skipping patterns finds the same intent as trying each of them"""
+        for text in UTTERANCES:
+            intent = self.recognizer._recognize_intent_regex(text)
+            expected = reference_match(self.recognizer.intent_patterns, text)
+            actual = (intent.intent_type, intent.confidence, intent.parameters) if intent else None
+            self.assertEqual(actual, expected, text)
+
+            for intent_type in self.recognizer.intent_patterns:
+                self.assertEqual(self.recognizer._extract_parameters_regex(intent_type, text),
+                                 reference_parameters(self.recognizer.intent_patterns, intent_type, text),
+                                 (intent_type, text))
+
+    def test_empty_groups_fall_through(self):
+        """Test that parameter extraction skips a first match with only empty groups"""
+        self.recognizer.intent_patterns["lookup"] = [r"find (\d*)", r"find (\w+)"]
+
+        self.assertEqual(self.recognizer._extract_parameters_regex("lookup", "find docs"), {"param1": "docs"})
+        self.assertEqual(self.recognizer._extract_parameters_regex("lookup", "find 42"), {"param1": "42"})
+
+    def test_literal_prefixes(self):
+        """Test that only text every match must start with is used to skip patterns"""
+        self.assertEqual(_literal_prefix(r"View (?:the )?design (.+)"), "view ")
+        self.assertEqual(_literal_prefix(r"runs? the (\w+)"), "run")
+        self.assertEqual(_literal_prefix(r"(?:run|perform) cleanup"), "")
+        self.assertEqual(_literal_prefix(r"start now|stop"), "")
+        self.assertEqual(_literal_prefix(r"start (now|[|(]) later"), "start ")
+
+    def test_named_groups_and_backreferences(self):
+        """Test that custom patterns keep their group names and references"""
+        self.recognizer.intent_patterns["repeat_word"] = [r"say (?P<word>\w+) (?P=word) twice"]
+        self.recognizer.intent_patterns["echo"] = [r"echo (\w+) \1"]
+
+        intent = self.recognizer._recognize_intent_regex("Say hello hello twice")
+        self.assertEqual(intent.intent_type, "repeat_word")
+        self.assertEqual(intent.parameters, {"word": "hello"})
+        self.assertEqual(self.recognizer._extract_parameters_regex("echo", "ECHO hi hi"), {"param1": "hi"})
+        self.assertEqual(self.recognizer._extract_parameters_regex("echo", "echo hi ho"), {})
+
+    def test_repeated_utterances_are_cached(self):
+        """Test the LRU of regex matches and its invalidation"""
+        recognizer = IntentRecognizer(use_ai_recognition=False, regex_cache_size=2)
+        first = recognizer._recognize_intent_regex("run the dashboard feature")
+        first.parameters["feature_name"] = "changed"
+        recognizer._recognize_intent_regex("open the dashboard")
+        recognizer._recognize_intent_regex("run the dashboard feature")
+        recognizer._recognize_intent_regex("hello")
+
+        self.assertEqual(list(recognizer._regex_cache), ["run the dashboard feature", "hello"])
+        self.assertEqual(recognizer._recognize_intent_regex("run the dashboard feature").parameters,
+                         {"feature_name": "dashboard"})
+
+        # Loading a model with new patterns recompiles them
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump({"intent_patterns": {"greet": [r"^hello$"]}}, f)
+        try:
+            recognizer._load_custom_model(f.name)
+        finally:
+            os.unlink(f.name)
+
+        self.assertEqual(recognizer._recognize_intent_regex("hello").intent_type, "greet")
+
+    def test_batch_recognition(self):
+        """Test recognizing a batch of texts, including repeats"""
+        texts = ["open the dashboard", "what is the weather like", "open the dashboard"]
+
+        intents = self.recognizer.recognize_intents(texts)
+
+        self.assertEqual([intent.intent_type for intent in intents],
+                         ["launch_dashboard", "unknown", "launch_dashboard"])
+        self.assertIsNot(intents[0], intents[2])
+        self.assertEqual([intent.raw_text for intent in intents], texts)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,9 @@ Unit tests for the Knowledge Base Adapter components
 import os
 import sys
 import json
+import time
+import asyncio
+import threading
 import unittest
 from unittest.mock import patch, MagicMock, mock_open
 
@@ -15,12 +18,22 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from adapters.knowledge_base_adapter import (
     KnowledgeBaseAdapter,
     CachedKnowledgeBaseAdapter,
+    AsyncCachedKnowledgeBaseAdapter,
+    FederatedKnowledgeBaseAdapter,
     KnowledgeGraphAdapter,
     VectorDatabaseAdapter,
     MongoDBAdapter,
-    KnowledgeBaseFactory
+    KnowledgeBaseFactory,
+    encode_cache_value,
+    decode_cache_value
 )
 
+try:
+    import fakeredis
+    FAKEREDIS_AVAILABLE = True
+except ImportError:
+    FAKEREDIS_AVAILABLE = False
+
 class MockRedis:
     """Mock Redis client for testing"""
     
@@ -37,6 +50,46 @@ class MockRedis:
     def ping(self):
         return True
 
+class MockAsyncPipeline:
+    """Mock Redis pipeline that sends its commands in one round trip"""
+    
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+    
+    def setex(self, key, ttl, value):
+        self.commands.append((key, value))
+        return self
+    
+    async def execute(self):
+        self.redis.round_trips += 1
+        for key, value in self.commands:
+            self.redis.data[key] = value
+        return [True] * len(self.commands)
+
+class MockAsyncRedis:
+    """Mock async Redis client that counts round trips"""
+    
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+    
+    async def get(self, key):
+        self.round_trips += 1
+        return self.data.get(key)
+    
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+    
+    async def incr(self, key):
+        self.round_trips += 1
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+    
+    def pipeline(self, transaction=True):
+        return MockAsyncPipeline(self)
+
 class MockNode:
     """Mock knowledge graph node for testing"""
     
@@ -261,6 +314,233 @@ class TestCachedKnowledgeBaseAdapter(unittest.TestCase):
         self.mock_adapter.delete.assert_called_once_with("test-id")
         self.assertTrue(result)
 
+class TestAsyncCachedKnowledgeBaseAdapter(unittest.TestCase):
+    """Tests for the AsyncCachedKnowledgeBaseAdapter class"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.mock_adapter = MagicMock(spec=KnowledgeBaseAdapter)
+        self.mock_adapter.query.side_effect = lambda query, **kwargs: [{"id": query, "data": "result"}]
+        self.mock_adapter.store.return_value = "test-id"
+        self.mock_redis = MockAsyncRedis()
+        self.adapter = AsyncCachedKnowledgeBaseAdapter({"cache_enabled": True}, self.mock_adapter,
+                                                       redis_client=self.mock_redis)
+    
+    def run_async(self, coroutine):
+        """Run a coroutine, then wait for background cache writes"""
+        async def run():
+            result = await coroutine
+            await self.adapter.flush()
+            return result
+        return asyncio.run(run())
+    
+    def test_query_many_uses_one_round_trip_per_phase(self):
+        """Test that lookups use one MGET and writes one background pipeline"""
+        results = self.run_async(self.adapter.query_many(["a", "b", "a"]))
+        
+        self.assertEqual([result[0]["id"] for result in results], ["a", "b", "a"])
+        # Duplicate queries hit the underlying adapter once
+        self.assertEqual(self.mock_adapter.query.call_count, 2)
+        # Generation GET, MGET and the write pipeline
+        self.assertEqual(self.mock_redis.round_trips, 3)
+        
+        self.mock_redis.round_trips = 0
+        results = self.run_async(self.adapter.query_many(["a", "b"]))
+        
+        self.assertEqual(results[1], [{"id": "b", "data": "result"}])
+        self.assertEqual(self.mock_adapter.query.call_count, 2)
+        self.assertEqual(self.mock_redis.round_trips, 1)
+        self.assertEqual(self.adapter.get_stats()["hits"], 2)
+    
+    def test_cache_write_is_off_the_request_path(self):
+        """Test that results are returned before they are written to the cache"""
+        async def query_then_check():
+            result = await self.adapter.query("a")
+            written_before = [key for key in self.mock_redis.data if key != AsyncCachedKnowledgeBaseAdapter.GENERATION_KEY]
+            await self.adapter.flush()
+            return result, written_before
+        
+        result, written_before = asyncio.run(query_then_check())
+        
+        self.assertEqual(result, [{"id": "a", "data": "result"}])
+        self.assertEqual(written_before, [])
+        self.assertEqual(self.adapter.get_stats()["writes"], 1)
+    
+    def test_writes_invalidate_cached_queries(self):
+        """Test that store moves to a new cache generation"""
+        self.run_async(self.adapter.query("a"))
+        self.assertEqual(self.run_async(self.adapter.store({"data": "new"})), "test-id")
+        self.run_async(self.adapter.query("a"))
+        
+        self.assertEqual(self.mock_adapter.query.call_count, 2)
+    
+    def test_binary_serialization(self):
+        """Test compact and compressed encodings and legacy JSON decoding"""
+        small = [{"id": "a"}]
+        large = [{"id": str(i), "content": "x" * 50} for i in range(100)]
+        
+        self.assertTrue(encode_cache_value(small).startswith(b"j"))
+        self.assertTrue(encode_cache_value(large).startswith(b"z"))
+        self.assertLess(len(encode_cache_value(large)), len(json.dumps(large)))
+        self.assertEqual(decode_cache_value(encode_cache_value(large)), large)
+        self.assertEqual(decode_cache_value(json.dumps(small).encode()), small)
+    
+    @unittest.skipUnless(FAKEREDIS_AVAILABLE, "fakeredis not installed")
+    def test_with_fakeredis(self):
+        """Test caching against a fakeredis server"""
+        adapter = AsyncCachedKnowledgeBaseAdapter({"cache_enabled": True}, self.mock_adapter,
+                                                  redis_client=fakeredis.FakeAsyncRedis())
+        
+        async def run():
+            first = await adapter.query_many(["a", "b"])
+            await adapter.flush()
+            second = await adapter.query_many(["a", "b"])
+            return first, second
+        
+        first, second = asyncio.run(run())
+        
+        self.assertEqual(first, second)
+        self.assertEqual(self.mock_adapter.query.call_count, 2)
+        self.assertEqual(adapter.get_stats()["hits"], 2)
+
+class SlowAdapter(KnowledgeBaseAdapter):
+    """Knowledge base adapter returning fixed results after a delay"""
+    
+    def __init__(self, results, delay=0.0, error=None):
+        super().__init__({})
+        self.results = results
+        self.delay = delay
+        self.error = error
+    
+    def query(self, query, **kwargs):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.results
+
+
+class HungAdapter(KnowledgeBaseAdapter):
+    """Knowledge base adapter whose queries block until released"""
+    
+    def __init__(self, results):
+        super().__init__({})
+        self.results = results
+        self.release = threading.Event()
+        self.calls = 0
+    
+    def query(self, query, **kwargs):
+        self.calls += 1
+        self.release.wait()
+        return self.results
+
+
+class TestFederatedKnowledgeBaseAdapter(unittest.TestCase):
+    """Tests for the FederatedKnowledgeBaseAdapter class"""
+    
+    def test_backends_are_queried_concurrently(self):
+        """Test that latency is that of the slowest backend, not the sum"""
+        adapter = FederatedKnowledgeBaseAdapter({}, {
+            name: SlowAdapter([{"id": name}], delay=0.2) for name in ["knowledge_graph", "vector_db", "mongodb"]
+        })
+        
+        start = time.monotonic()
+        results = adapter.query("test")
+        elapsed = time.monotonic() - start
+        
+        self.assertEqual(len(results), 3)
+        self.assertLess(elapsed, 0.45)
+    
+    def test_reciprocal_rank_fusion_and_dedupe(self):
+        """Test that results found by several backends rank first and appear once"""
+        adapter = FederatedKnowledgeBaseAdapter({}, {
+            "knowledge_graph": SlowAdapter([{"id": "a"}, {"id": "b"}, {"id": "c"}]),
+            "vector_db": SlowAdapter([{"id": "c", "content": "C"}, {"id": "d"}, {"id": "unknown", "content": "x"},
+                                      {"id": "unknown", "content": "y"}])
+        })
+        
+        results = adapter.query("test")
+        
+        self.assertEqual([result["id"] for result in results], ["c", "a", "b", "d", "unknown", "unknown"])
+        self.assertEqual(results[0]["sources"], ["knowledge_graph", "vector_db"])
+        # The best-ranked copy of a duplicate is kept
+        self.assertEqual(results[0]["content"], "C")
+        self.assertAlmostEqual(results[0]["fusion_score"], 1 / 63 + 1 / 61)
+        self.assertEqual(len(adapter.query("test", top_k=2)), 2)
+    
+    def test_partial_results_on_slow_or_failing_backends(self):
+        """Test that slow and failing backends are skipped within their deadlines"""
+        adapter = FederatedKnowledgeBaseAdapter({"federation_timeout": 1.0, "backend_timeouts": {"mongodb": 0.1}}, {
+            "knowledge_graph": SlowAdapter([{"id": "a"}]),
+            "vector_db": SlowAdapter([], error=RuntimeError("down")),
+            "mongodb": SlowAdapter([{"id": "b"}], delay=0.5)
+        })
+        
+        start = time.monotonic()
+        response = adapter.federated_query("test")
+        elapsed = time.monotonic() - start
+        
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual([result["id"] for result in response["results"]], ["a"])
+        self.assertTrue(response["partial"])
+        self.assertEqual({name: entry["status"] for name, entry in response["backends"].items()},
+                         {"knowledge_graph": "ok", "vector_db": "error", "mongodb": "timeout"})
+    
+    def test_hung_backend_holds_one_worker(self):
+        """Test that a backend that never returns is skipped instead of piling up workers"""
+        hung = HungAdapter([{"id": "h"}])
+        self.addCleanup(hung.release.set)
+        adapter = FederatedKnowledgeBaseAdapter({"backend_timeouts": {"hung": 0.05}}, {
+            "hung": hung,
+            "fast": SlowAdapter([{"id": "a"}])
+        })
+        
+        self.assertEqual(adapter.federated_query("test")["backends"]["hung"]["status"], "timeout")
+        for _ in range(5):
+            start = time.monotonic()
+            response = adapter.federated_query("test")
+            self.assertLess(time.monotonic() - start, 0.05)
+            self.assertEqual(response["backends"]["hung"]["status"], "busy")
+            self.assertEqual([result["id"] for result in response["results"]], ["a"])
+            self.assertTrue(response["partial"])
+        
+        response = asyncio.run(adapter.query_async("test"))
+        self.assertEqual(response["backends"]["hung"]["status"], "busy")
+        self.assertEqual(hung.calls, 1)
+        
+        # Once the call returns the backend is queried again
+        hung.release.set()
+        deadline = time.monotonic() + 1.0
+        while adapter._in_flight["hung"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        response = adapter.federated_query("test")
+        self.assertEqual(response["backends"]["hung"]["status"], "ok")
+        self.assertEqual(hung.calls, 2)
+    
+    def test_query_async(self):
+        """Test the async query with sync and async backends"""
+        async_backend = MagicMock()
+        async def query(query, **kwargs):
+            await asyncio.sleep(0.2)
+            return [{"id": "b"}]
+        async_backend.query = query
+        adapter = FederatedKnowledgeBaseAdapter({"backend_timeouts": {"slow": 0.05}}, {
+            "sync": SlowAdapter([{"id": "a"}], delay=0.2),
+            "async": async_backend,
+            "slow": SlowAdapter([{"id": "c"}], delay=0.3)
+        })
+        
+        async def run():
+            # Measured inside the loop: asyncio.run waits for abandoned threads on exit
+            start = time.monotonic()
+            response = await adapter.query_async("test")
+            return response, time.monotonic() - start
+        
+        response, elapsed = asyncio.run(run())
+        
+        self.assertLess(elapsed, 0.28)
+        self.assertEqual([result["id"] for result in response["results"]], ["a", "b"])
+        self.assertEqual(response["backends"]["slow"]["status"], "timeout")
+
 class TestKnowledgeGraphAdapter(unittest.TestCase):
     """Tests for the KnowledgeGraphAdapter class"""
     
@@ -475,6 +755,18 @@ class TestKnowledgeBaseFactory(unittest.TestCase):
         with self.assertRaises(ValueError):
             KnowledgeBaseFactory.create_adapter("unknown", {})
     
+    @patch('adapters.knowledge_base_adapter.MongoDBAdapter')
+    @patch('adapters.knowledge_base_adapter.KnowledgeGraphAdapter')
+    def test_create_federated_adapter(self, mock_kg_adapter, mock_mongo_adapter):
+        """Test creating a federated adapter, leaving out failing backends"""
+        mock_mongo_adapter.side_effect = RuntimeError("no server")
+        
+        adapter = KnowledgeBaseFactory.create_federated_adapter(["knowledge_graph", "mongodb"],
+                                                               {"cache_enabled": False})
+        
+        self.assertIsInstance(adapter, FederatedKnowledgeBaseAdapter)
+        self.assertEqual(list(adapter.adapters), ["knowledge_graph"])
+    
     @patch("adapters.knowledge_base_adapter.KnowledgeGraphAdapter")
     @patch("adapters.knowledge_base_adapter.CachedKnowledgeBaseAdapter")
     @patch("adapters.knowledge_base_adapter.REDIS_AVAILABLE", True)
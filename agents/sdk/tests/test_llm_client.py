@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared LLM client layer of the AI service, run against a
+local mock of the Anthropic Messages API
+"""
+
+import os
+import sys
+import json
+import asyncio
+import unittest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# The AI service lives in agents/utils; append the repository root so it does
+# not shadow the SDK's own packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+try:
+    from agents.utils.ai_service.llm_client import (
+        AsyncLLMClient,
+        TokenBucket,
+        LLMRequestError,
+        get_llm_client,
+        HTTPX_AVAILABLE
+    )
+    from agents.utils.ai_service.core import ClaudeClient, AIService
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+
+class MockAnthropicHandler(BaseHTTPRequestHandler):
+    """Request handler imitating the Messages and Message Batches APIs"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, data, headers=None):
+        body = data if isinstance(data, bytes) else json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_json(self):
+        return json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+    def do_POST(self):
+        server = self.server
+        server.connections.add(self.client_address)
+        server.api_keys.add(self.headers.get("x-api-key"))
+        body = self.read_json()
+
+        if self.path == "/v1/messages":
+            if server.failures:
+                status, headers = server.failures.pop(0)
+                self.send_json(status, {"type": "error", "error": {"message": "try again"}}, headers)
+                return
+            prompt = body["messages"][0]["content"]
+            self.send_json(200, {"content": [{"type": "text", "text": f"echo: {prompt}"}]})
+        elif self.path == "/v1/messages/batches":
+            server.batch_requests = body["requests"]
+            self.send_json(200, {"id": "batch-1", "processing_status": "in_progress"})
+        else:
+            self.send_json(404, {"type": "error"})
+
+    def do_GET(self):
+        server = self.server
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        if self.path == "/v1/messages/batches/batch-1":
+            self.send_json(200, {"id": "batch-1", "processing_status": "ended",
+                                 "results_url": f"{base}/v1/messages/batches/batch-1/results"})
+        elif self.path == "/v1/messages/batches/batch-1/results":
+            # Results come back in any order; prompts containing "fail" error
+            lines = []
+            for request in reversed(server.batch_requests):
+                prompt = request["params"]["messages"][0]["content"]
+                if "fail" in prompt:
+                    result = {"type": "errored", "error": {"message": "invalid request"}}
+                else:
+                    result = {"type": "succeeded",
+                              "message": {"content": [{"type": "text", "text": f"batch: {prompt}"}]}}
+                lines.append(json.dumps({"custom_id": request["custom_id"], "result": result}))
+            self.send_json(200, "\n".join(lines).encode())
+        else:
+            self.send_json(404, {"type": "error"})
+
+
+@unittest.skipUnless(HTTPX_AVAILABLE, "httpx not installed")
+class TestLLMClient(unittest.TestCase):
+    """Tests for the AsyncLLMClient and the AI service components using it"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), MockAnthropicHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.connections = set()
+        self.server.api_keys = set()
+        self.server.failures = []
+        self.server.batch_requests = []
+
+    def run_client(self, client, coroutine):
+        """Run a coroutine, then close the client's connection pool"""
+        async def run():
+            try:
+                return await coroutine
+            finally:
+                await client.aclose()
+        return asyncio.run(run())
+
+    def test_components_share_pooled_connections(self):
+        """Test that Claude clients share one client and reuse its connections"""
+        first = ClaudeClient(api_key="shared-key", base_url=self.base_url)
+        second = ClaudeClient(api_key="shared-key", base_url=self.base_url)
+
+        self.assertIs(first.llm_client, second.llm_client)
+        self.assertIs(first.llm_client, get_llm_client("shared-key", self.base_url))
+
+        responses = [client.complete(f"prompt {i}") for i in range(3) for client in (first, second)]
+
+        self.assertEqual(responses[0], "echo: prompt 0")
+        self.assertEqual(len(self.server.connections), 1)
+        self.assertEqual(self.server.api_keys, {"shared-key"})
+
+    def test_retries_with_backoff(self):
+        """Test that throttled and overloaded requests are retried"""
+        client = AsyncLLMClient("retry-key", self.base_url, retry_base_delay=0.01)
+        self.server.failures = [(429, {"retry-after": "0"}), (529, {})]
+
+        text = self.run_client(client, client.complete("hello", "test-model"))
+
+        self.assertEqual(text, "echo: hello")
+        self.assertEqual(client.stats["retries"], 2)
+        self.assertEqual(client.stats["requests"], 3)
+
+    def test_client_errors_are_not_retried(self):
+        """Test that a bad request fails without retries"""
+        client = AsyncLLMClient("error-key", self.base_url, retry_base_delay=0.01)
+        self.server.failures = [(400, {})]
+
+        with self.assertRaises(LLMRequestError) as context:
+            self.run_client(client, client.complete("hello", "test-model"))
+
+        self.assertEqual(context.exception.status_code, 400)
+        self.assertEqual(client.stats["retries"], 0)
+
+    def test_token_bucket(self):
+        """Test that the bucket admits bursts up to its capacity, then its rate"""
+        bucket = TokenBucket(rate=10.0, capacity=2)
+
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        # Oversized requests wait for a full bucket rather than forever
+        self.assertAlmostEqual(bucket.reserve(5), 0.3, places=2)
+
+    def test_rate_limits_are_per_model(self):
+        """Test that each model is throttled by its own buckets"""
+        client = AsyncLLMClient("limit-key", self.base_url,
+                                rate_limits={"slow-model": {"requests_per_minute": 1}})
+
+        self.run_client(client, client.complete("hello", "slow-model"))
+
+        slow_requests, slow_tokens = client._get_buckets("slow-model")
+        fast_requests, _ = client._get_buckets("fast-model")
+        self.assertGreater(slow_requests.reserve(), 50)
+        self.assertEqual(fast_requests.reserve(), 0.0)
+        self.assertEqual(slow_tokens.capacity, 40000)
+
+    def test_concurrent_responses(self):
+        """Test generating independent responses concurrently"""
+        service = AIService(api_key="service-key")
+        service.claude_client = ClaudeClient(api_key="service-key", base_url=self.base_url)
+
+        responses = service.generate_responses([f"question {i}" for i in range(5)])
+
+        self.assertEqual([response["text"] for response in responses],
+                         [f"echo: question {i}" for i in range(5)])
+        self.assertEqual(service.context_manager.context_items, [])
+
+    def test_batch_submission(self):
+        """Test completing prompts through the Message Batches API"""
+        client = ClaudeClient(api_key="batch-key", base_url=self.base_url)
+
+        texts = client.complete_batch(["one", "fail", "three"], system_prompt="Be brief",
+                                      use_batch_api=True, poll_interval=0)
+
+        self.assertEqual(texts[0], "batch: one")
+        self.assertTrue(texts[1].startswith("Error: Batch request 1 failed"))
+        self.assertEqual(texts[2], "batch: three")
+        self.assertEqual(self.server.batch_requests[0]["params"]["system"], "Be brief")
+        self.assertEqual(client.llm_client.stats["batches"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared LLM response cache
+
+This module tests that the cache returns responses to identical
+canonicalized requests, persists them across instances, evicts the least
+recently used entries at its size cap and counts hits per call site.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+# The cache lives in agents/utils; append the repository root so it does
+# not shadow the SDK's own packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from agents.utils.llm_response_cache import LLMResponseCache, make_cache_key
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    """Test cases for the LLMResponseCache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "responses.db")
+        self.cache = LLMResponseCache(self.db_path)
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_keys_are_canonical(self):
+        """Test that key order does not matter but every value does."""
+        request = {"model": "m", "temperature": 0, "messages": [{"role": "user", "content": "hi"}]}
+        reordered = {"messages": [{"content": "hi", "role": "user"}], "temperature": 0, "model": "m"}
+
+        self.assertEqual(make_cache_key(request), make_cache_key(reordered))
+        self.assertNotEqual(make_cache_key(request), make_cache_key({**request, "temperature": 0.1}))
+
+    def test_get_or_call_reuses_responses(self):
+        """Test that identical requests call the LLM once, across instances."""
+        calls = []
+
+        def call():
+            calls.append(1)
+            return {"text": "answer"}
+
+        request = {"model": "m", "prompt": "question"}
+        self.assertEqual(self.cache.get_or_call("site", request, call), {"text": "answer"})
+        self.assertEqual(self.cache.get_or_call("site", request, call), {"text": "answer"})
+
+        reopened = LLMResponseCache(self.db_path)
+        self.assertEqual(reopened.get_or_call("site", request, call), {"text": "answer"})
+        reopened.close()
+
+        self.assertEqual(len(calls), 1)
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["namespaces"]["site"]["hit_rate"], 0.5)
+
+    def test_failed_responses_are_not_cached(self):
+        """Test that empty and rejected responses are retried."""
+        self.cache.get_or_call("site", {"prompt": "a"}, lambda: "")
+        self.cache.get_or_call("site", {"prompt": "b"}, lambda: "not json", should_cache=lambda r: False)
+
+        self.assertEqual(self.cache.get_stats()["entries"], 0)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """Test that the cache stays within its entry and byte limits."""
+        cache = LLMResponseCache(os.path.join(self.temp_dir, "small.db"), max_entries=2, max_bytes=1000)
+        cache.put("a", "first", "site")
+        cache.put("b", "second", "site")
+        cache.get("a", "site")
+        cache.put("c", "third", "site")
+
+        self.assertIsNone(cache.get("b", "site"))
+        self.assertEqual(cache.get("a", "site"), "first")
+
+        cache.put("d", "x" * 995, "site")
+        self.assertEqual(cache.get_stats()["entries"], 1)
+        self.assertEqual(cache.get_stats()["namespaces"]["site"]["evictions"], 3)
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
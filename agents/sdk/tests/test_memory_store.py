@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the indexed, append-only memory store of the memory tools
+"""
+
+import os
+import json
+import random
+import shutil
+import tempfile
+import unittest
+import importlib.util
+
+# The tool system's core package shares its name with the SDK's, so load the
+# memory store module from its file
+_spec = importlib.util.spec_from_file_location(
+    "memory_store",
+    os.path.join(os.path.dirname(__file__), '..', '..', 'tools', 'core', 'memory_store.py')
+)
+memory_store = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(memory_store)
+
+WORDS = ["deploy", "deployment", "agent", "error", "timeout", "cache", "graph", "memory", "redeploy"]
+TAGS = ["ops", "bug", "perf", "docs"]
+
+
+def scan_query(memories, query="", tags=None, min_importance=0.0, limit=10):
+    """Reference implementation: filter, sort and truncate a full category"""
+    if query:
+        query = query.lower()
+        memories = [m for m in memories if query in m.get("content", "").lower()]
+    if tags:
+        memories = [m for m in memories if any(tag in m.get("tags", []) for tag in tags)]
+    memories = [m for m in memories if m.get("importance", 0.0) >= min_importance]
+    memories.sort(key=lambda x: (-x.get("importance", 0.0), -int(x.get("id", "0").split("-")[0])))
+    return memories[:limit]
+
+
+class TestMemoryStore(unittest.TestCase):
+    """Tests for the MemoryStore"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = memory_store.MemoryStore(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_appends_one_line_per_memory(self):
+        """Test that writes append to the category log"""
+        first = self.store.append("facts", "First fact", importance=0.4, tags=["a"])
+        self.store.append("facts", "Second fact", importance=0.9)
+
+        with open(self.store.get_log_file("facts")) as f:
+            lines = [json.loads(line) for line in f]
+
+        self.assertEqual([line["content"] for line in lines], ["First fact", "Second fact"])
+        self.assertEqual(lines[0]["id"], first["id"])
+        self.assertTrue(first["id"].endswith("-0"))
+        self.assertEqual([m["content"] for m in self.store.query("facts")], ["Second fact", "First fact"])
+
+    def test_matches_full_scan_results(self):
+        """Test that indexed queries return what filtering the whole category returns"""
+        rng = random.Random(7)
+        for i in range(300):
+            content = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 6)))
+            self.store.append("observations", content.capitalize() + ".",
+                              importance=round(rng.random(), 1), tags=rng.sample(TAGS, rng.randint(0, 2)))
+        memories = self.store.get_all("observations")
+
+        queries = [
+            {}, {"limit": 3}, {"min_importance": 0.7}, {"tags": ["bug"]}, {"tags": ["ops", "perf"], "limit": 25},
+            {"query": "deploy"}, {"query": "Agent error"}, {"query": "ploy ag"}, {"query": "error."},
+            {"query": "cache", "tags": ["docs"], "min_importance": 0.3}, {"query": "..."}, {"query": "missing"}
+        ]
+        for params in queries:
+            with self.subTest(params=params):
+                self.assertEqual(self.store.query("observations", **params), scan_query(memories, **params))
+
+    def test_results_are_copies(self):
+        """Test that callers cannot change indexed entries"""
+        self.store.append("facts", "Fact", metadata={"source": "test"})
+        del self.store.query("facts")[0]["metadata"]
+
+        self.assertIn("metadata", self.store.query("facts")[0])
+
+    def test_picks_up_appends_from_other_writers(self):
+        """Test that lines appended by another process are indexed"""
+        self.store.append("facts", "Local fact", importance=0.5)
+        other = memory_store.MemoryStore(self.temp_dir)
+        other.append("facts", "Remote fact", importance=0.8)
+
+        # A partially written line is left until it is complete
+        with open(self.store.get_log_file("facts"), "a") as f:
+            f.write('{"id": "1-9", "content": "Torn')
+
+        self.assertEqual([m["content"] for m in self.store.query("facts")], ["Remote fact", "Local fact"])
+
+    def test_imports_legacy_json_category(self):
+        """Test that a category saved as a JSON array is converted to a log"""
+        legacy = [
+            {"id": "100-0", "content": "Old decision", "importance": 0.2, "tags": ["arch"]},
+            {"id": "200-1", "content": "New decision", "importance": 0.2, "tags": []}
+        ]
+        with open(os.path.join(self.temp_dir, "decisions.json"), "w") as f:
+            json.dump(legacy, f)
+
+        self.assertEqual([m["id"] for m in self.store.query("decisions")], ["200-1", "100-0"])
+        self.assertEqual(self.store.query("decisions", tags=["arch"]), [legacy[0]])
+        self.assertTrue(os.path.exists(self.store.get_log_file("decisions")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the assistant run monitor
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+# Import through the package paths; top-level "core" modules exist in other
+# agents too. Append the repository root so it does not shadow other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from agents.sdk.core.agent import SDKAgent
+from agents.sdk.core.run_monitor import RunMonitor, RunTimeoutError
+
+
+class FakeRuns:
+    """Fake assistants runs API replaying a scripted status sequence per run
+
+    Each retrieve returns the next status of the run's script; the last
+    status repeats once the script is exhausted. submit_tool_outputs
+    records the outputs and moves the run to the next status.
+    """
+
+    def __init__(self, scripts, tool_calls=None):
+        self.scripts = {run_id: list(statuses) for run_id, statuses in scripts.items()}
+        self.tool_calls = tool_calls or {}
+        self.retrieve_calls = 0
+        self.submitted = []
+        self.cancelled = []
+
+    def create(self, thread_id, assistant_id):
+        return self._next("run-1")
+
+    def retrieve(self, thread_id, run_id):
+        self.retrieve_calls += 1
+        return self._next(run_id)
+
+    def submit_tool_outputs(self, thread_id, run_id, tool_outputs):
+        self.submitted.append((run_id, tool_outputs))
+        return self._next(run_id)
+
+    def cancel(self, thread_id, run_id):
+        self.cancelled.append(run_id)
+        return SimpleNamespace(id=run_id, status="cancelling")
+
+    def _next(self, run_id):
+        script = self.scripts[run_id]
+        status = script.pop(0) if len(script) > 1 else script[0]
+        run = SimpleNamespace(id=run_id, status=status, required_action=None, last_error=None)
+        if status == "requires_action":
+            run.required_action = SimpleNamespace(
+                submit_tool_outputs=SimpleNamespace(tool_calls=self.tool_calls[run_id]))
+        elif status == "failed":
+            run.last_error = SimpleNamespace(message="rate limited")
+        return run
+
+
+class FakeAssistantsClient:
+    """Fake OpenAI client exposing the beta.threads API used by SDKAgent"""
+
+    def __init__(self, runs, reply="Done"):
+        messages = SimpleNamespace(
+            create=lambda **kwargs: SimpleNamespace(id="msg-user"),
+            list=lambda thread_id: SimpleNamespace(data=[
+                SimpleNamespace(content=[SimpleNamespace(text=SimpleNamespace(value=reply))])
+            ])
+        )
+        self.runs = runs
+        self.beta = SimpleNamespace(threads=SimpleNamespace(runs=runs, messages=messages))
+
+
+class RecordingSleep:
+    """Sleep replacement that records delays instead of waiting"""
+
+    def __init__(self):
+        self.delays = []
+
+    async def __call__(self, delay):
+        self.delays.append(delay)
+
+
+def first_run(runs, run_id):
+    """Get the initial state of a scripted run"""
+    return runs._next(run_id)
+
+
+def make_agent(client):
+    """Create an SDKAgent wired to a fake assistants client"""
+    agent = SDKAgent({"agent_name": "run-monitor-test"})
+    agent.client = client
+    agent.openai_available = True
+    agent.assistant = SimpleNamespace(id="asst-1")
+    agent.thread = SimpleNamespace(id="thread-1")
+    return agent
+
+
+class TestRunMonitor(unittest.TestCase):
+    """Tests for the RunMonitor"""
+
+    def test_backoff_grows_while_run_is_busy(self):
+        """Test that polling backs off while the status is unchanged and resets on a change"""
+        runs = FakeRuns({"run-1": ["queued", "queued", "in_progress", "in_progress", "in_progress", "completed"]})
+        sleep = RecordingSleep()
+        monitor = RunMonitor(initial_interval=0.1, max_interval=0.2, backoff_factor=2, jitter=0, sleep=sleep)
+
+        run = asyncio.run(monitor.wait(FakeAssistantsClient(runs), "thread-1", first_run(runs, "run-1")))
+
+        self.assertEqual(run.status, "completed")
+        self.assertEqual(runs.retrieve_calls, 5)
+        # queued -> queued (back off), -> in_progress (reset), -> in_progress (back off, capped)
+        self.assertEqual(sleep.delays, [0.1, 0.2, 0.1, 0.2, 0.2])
+
+    def test_tool_calls_are_handled_and_submitted(self):
+        """Test that required actions are answered and polling restarts quickly"""
+        tool_calls = [SimpleNamespace(id="call-1", function=SimpleNamespace(name="echo", arguments="{}"))]
+        runs = FakeRuns({"run-1": ["in_progress", "in_progress", "requires_action", "in_progress", "completed"]},
+                        tool_calls={"run-1": tool_calls})
+        sleep = RecordingSleep()
+        monitor = RunMonitor(initial_interval=0.1, backoff_factor=2, jitter=0, sleep=sleep)
+
+        def handle(calls):
+            return [{"tool_call_id": call.id, "output": "ok"} for call in calls]
+
+        run = asyncio.run(monitor.wait(FakeAssistantsClient(runs), "thread-1", first_run(runs, "run-1"), handle))
+
+        self.assertEqual(run.status, "completed")
+        self.assertEqual(runs.submitted, [("run-1", [{"tool_call_id": "call-1", "output": "ok"}])])
+        self.assertEqual(sleep.delays, [0.1, 0.2, 0.1])
+        self.assertEqual(monitor.stats["tool_rounds"], 1)
+
+    def test_timeout_cancels_run(self):
+        """Test that a run still active at the timeout is cancelled"""
+        runs = FakeRuns({"run-1": ["in_progress"]})
+        monitor = RunMonitor(initial_interval=0.01, max_interval=0.02, timeout=0.1)
+
+        with self.assertRaises(RunTimeoutError) as context:
+            asyncio.run(monitor.wait(FakeAssistantsClient(runs), "thread-1", first_run(runs, "run-1")))
+
+        self.assertEqual(context.exception.run.status, "in_progress")
+        self.assertEqual(runs.cancelled, ["run-1"])
+        self.assertEqual(monitor.stats["timeouts"], 1)
+
+    def test_supervises_many_concurrent_runs(self):
+        """Test that hundreds of runs are supervised concurrently on one event loop"""
+        run_ids = [f"run-{i}" for i in range(300)]
+        runs = FakeRuns({run_id: ["queued"] + ["in_progress"] * 5 + ["completed"] for run_id in run_ids})
+        client = FakeAssistantsClient(runs)
+        monitor = RunMonitor(initial_interval=0.02, max_interval=0.05)
+
+        start = time.perf_counter()
+        results = asyncio.run(monitor.wait_all(client, [("thread-1", first_run(runs, run_id)) for run_id in run_ids]))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual([run.status for run in results], ["completed"] * 300)
+        # Sequential supervision would take at least 300 * 6 polls * 20ms
+        self.assertLess(elapsed, 5.0)
+
+    def test_async_client(self):
+        """Test that coroutine API methods are awaited directly"""
+        statuses = ["in_progress", "completed"]
+
+        async def retrieve(thread_id, run_id):
+            return SimpleNamespace(id=run_id, status=statuses.pop(0))
+
+        client = SimpleNamespace(beta=SimpleNamespace(threads=SimpleNamespace(
+            runs=SimpleNamespace(retrieve=retrieve))))
+        monitor = RunMonitor(initial_interval=0.01)
+
+        run = asyncio.run(monitor.wait(client, "thread-1", SimpleNamespace(id="run-1", status="queued")))
+
+        self.assertEqual(run.status, "completed")
+
+
+class TestSDKAgentRunMonitoring(unittest.TestCase):
+    """Tests for SDKAgent run execution against a fake assistants API"""
+
+    def test_execute_with_tool_call(self):
+        """Test a run that calls an agent tool before completing"""
+        tool_calls = [SimpleNamespace(id="call-1",
+                                      function=SimpleNamespace(name="echo", arguments=json.dumps({"message": "hi"})))]
+        runs = FakeRuns({"run-1": ["queued", "requires_action", "in_progress", "completed"]},
+                        tool_calls={"run-1": tool_calls})
+        agent = make_agent(FakeAssistantsClient(runs, reply="Echoed hi"))
+        agent.echo = lambda message: {"echo": message}
+        agent.run_monitor.initial_interval = 0.01
+
+        self.assertEqual(agent.execute("Echo hi"), "Echoed hi")
+        self.assertEqual(runs.submitted[0][1], [{"tool_call_id": "call-1", "output": json.dumps({"echo": "hi"})}])
+
+    def test_failed_run_returns_error(self):
+        """Test that a failed run reports its error instead of a stale message"""
+        runs = FakeRuns({"run-1": ["queued", "failed"]})
+        agent = make_agent(FakeAssistantsClient(runs))
+        agent.run_monitor.initial_interval = 0.01
+
+        result = agent.execute("Hello")
+
+        self.assertEqual(result, {"error": "Run run-1 ended with status failed: rate limited"})
+
+    def test_execute_inside_running_loop(self):
+        """Test that the synchronous execute also works when called from a coroutine"""
+        runs = FakeRuns({"run-1": ["queued", "in_progress", "completed"]})
+        agent = make_agent(FakeAssistantsClient(runs, reply="From a loop"))
+        agent.run_monitor.initial_interval = 0.01
+
+        async def call_sync():
+            return agent.execute("Hello")
+
+        self.assertEqual(asyncio.run(call_sync()), "From a loop")
+
+    def test_many_agents_execute_concurrently(self):
+        """Test that execute_async lets one event loop drive many agents"""
+        agents = []
+        for i in range(50):
+            runs = FakeRuns({"run-1": ["queued", "in_progress", "in_progress", "completed"]})
+            agent = make_agent(FakeAssistantsClient(runs, reply=f"reply-{i}"))
+            agent.run_monitor.initial_interval = 0.01
+            agents.append(agent)
+
+        async def run_all():
+            return await asyncio.gather(*(agent.execute_async("Hello") for agent in agents))
+
+        self.assertEqual(asyncio.run(run_all()), [f"reply-{i}" for i in range(50)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Unit tests for tool result caching in the ToolRegistry
+"""
+
+import os
+import sys
+import time
+import unittest
+from typing import Dict, Any
+
+# The tool system's registry is imported through its package path; append the
+# repository root so it does not shadow the SDK's own packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from agents.tools.registry.tool_registry import ToolRegistry, ToolCache, tool
+
+
+class TestToolCache(unittest.TestCase):
+    """Tests for the ToolCache LRU"""
+
+    def test_lru_eviction_and_expiry(self):
+        """Test that the least recently used entry is evicted and entries expire"""
+        cache = ToolCache(max_entries=2)
+        cache.put("tool", "a", {"v": 1}, ttl=60)
+        cache.put("tool", "b", {"v": 2}, ttl=60)
+        cache.get("tool", "a")
+        cache.put("tool", "c", {"v": 3}, ttl=60)
+
+        self.assertEqual(cache.get("tool", "a"), (True, {"v": 1}))
+        self.assertEqual(cache.get("tool", "b"), (False, None))
+        self.assertEqual(cache.evictions, 1)
+
+        cache.put("tool", "d", {"v": 4}, ttl=0.01)
+        time.sleep(0.02)
+        self.assertEqual(cache.get("tool", "d"), (False, None))
+
+    def test_results_are_copied(self):
+        """Test that callers cannot mutate cached results"""
+        cache = ToolCache()
+        result = {"items": [1]}
+        cache.put("tool", "k", result, ttl=60)
+        result["items"].append(2)
+
+        _, cached = cache.get("tool", "k")
+        cached["items"].append(3)
+
+        self.assertEqual(cache.get("tool", "k"), (True, {"items": [1]}))
+
+    def test_stale_version_is_not_stored(self):
+        """Test that a result computed across an invalidation is dropped"""
+        cache = ToolCache()
+        version = cache.version
+        cache.invalidate(tags=["memory"])
+
+        self.assertFalse(cache.put("tool", "k", {"v": 1}, ttl=60, version=version))
+        self.assertEqual(len(cache), 0)
+
+
+class TestRegistryCaching(unittest.TestCase):
+    """Tests for cached execution through the ToolRegistry"""
+
+    def setUp(self):
+        self.registry = ToolRegistry()
+        self.registry.invalidate_cache()
+        self.calls = []
+        self.store = {"facts": ["a"], "decisions": []}
+        calls, store = self.calls, self.store
+
+        @tool(name="test_cached_lookup", cache_ttl=60, cache_tags=["notes:{category}"])
+        def lookup(category: str = "facts", limit: int = 10) -> Dict[str, Any]:
+            calls.append((category, limit))
+            return {"notes": store[category][:limit]}
+
+        @tool(name="test_cached_keyed", cache_ttl=60, cache_key=["query"])
+        def keyed(query: str, request_id: str = "") -> Dict[str, Any]:
+            calls.append(("keyed", query))
+            return {"query": query}
+
+        @tool(name="test_note_writer", invalidates=["notes:{category}"])
+        def write(category: str, note: str) -> Dict[str, Any]:
+            store[category].append(note)
+            return {"success": True}
+
+        @tool(name="test_cached_failure", cache_ttl=60)
+        def failing() -> Dict[str, Any]:
+            calls.append("failing")
+            raise RuntimeError("backend down")
+
+    def tearDown(self):
+        for name in ["test_cached_lookup", "test_cached_keyed", "test_note_writer", "test_cached_failure"]:
+            self.registry.unregister(name)
+        self.registry.invalidate_cache()
+
+    def test_repeated_calls_hit_cache_with_normalized_keys(self):
+        """Test that equivalent argument sets share a cached result"""
+        first = self.registry.execute_tool("test_cached_lookup", {"category": "facts"})
+        second = self.registry.execute_tool("test_cached_lookup", {"limit": 10, "category": "facts"})
+        self.registry.execute_tool("test_cached_lookup", {"category": "facts", "limit": 1})
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, [("facts", 10), ("facts", 1)])
+
+        stats = self.registry.get_cache_stats()["tools"]["test_cached_lookup"]
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+        self.assertEqual(self.registry.get_tool("test_cached_lookup").invocation_count, 2)
+
+    def test_key_fields_limit_the_key(self):
+        """Test that arguments outside cache_key do not split the cache"""
+        self.registry.execute_tool("test_cached_keyed", {"query": "q", "request_id": "1"})
+        self.registry.execute_tool("test_cached_keyed", {"query": "q", "request_id": "2"})
+
+        self.assertEqual(self.calls, [("keyed", "q")])
+
+    def test_writes_invalidate_tagged_results(self):
+        """Test that a writer drops only the results carrying its resolved tags"""
+        self.registry.execute_tool("test_cached_lookup", {"category": "facts"})
+        self.registry.execute_tool("test_cached_lookup", {"category": "decisions"})
+
+        self.registry.execute_tool("test_note_writer", {"category": "facts", "note": "b"})
+        result = self.registry.execute_tool("test_cached_lookup", {"category": "facts"})
+        self.registry.execute_tool("test_cached_lookup", {"category": "decisions"})
+
+        self.assertEqual(result, {"notes": ["a", "b"]})
+        self.assertEqual(self.calls, [("facts", 10), ("decisions", 10), ("facts", 10)])
+
+    def test_errors_are_not_cached_and_batches_use_cache(self):
+        """Test that failures are retried and execute_tools serves hits"""
+        self.registry.execute_tool("test_cached_failure", {})
+        self.registry.execute_tool("test_cached_failure", {})
+        self.assertEqual(self.calls, ["failing", "failing"])
+
+        results = self.registry.execute_tools([
+            ("test_cached_lookup", {"category": "facts"}),
+            ("test_cached_lookup", {"category": "facts"}),
+            ("test_cached_keyed", {"query": "q"})
+        ])
+        self.registry.execute_tools([("test_cached_lookup", {"category": "facts"})])
+
+        self.assertEqual(results[0], {"notes": ["a"]})
+        # The two identical calls of the first batch both missed; the second batch hit
+        self.assertEqual(self.calls.count(("facts", 10)), 2)
+        self.assertEqual(self.registry.get_tool("test_cached_lookup").cache_hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Unit tests for concurrent tool-call execution
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import threading
+import unittest
+import importlib.util
+from types import SimpleNamespace
+
+# Import through the package paths; top-level "core" and "registry" modules
+# exist in other agents too. Append the repository root so it does not
+# shadow the SDK's own packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from agents.sdk.core.agent import SDKAgent
+from agents.tools.registry.tool_registry import ToolMetadata, LatencyHistogram
+from agents.tools.registry.tool_executor import ToolExecutor, ToolTask
+
+# The tool system's core package shares its name with the SDK's, so load the
+# SDK integration module from its file
+_spec = importlib.util.spec_from_file_location(
+    "sdk_integration",
+    os.path.join(os.path.dirname(__file__), '..', '..', 'tools', 'core', 'sdk_integration.py')
+)
+sdk_integration = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sdk_integration)
+
+# The provider imports the registry from the tool system's directory, which
+# gives a registry module (and singleton) of its own
+provider_registry = sys.modules[sdk_integration.ToolRegistry.__module__]
+
+
+class ConcurrencyProbe:
+    """Tool function that sleeps and records its peak concurrency"""
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, value):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return {"value": value}
+
+
+def make_metadata(name, function, timeout=None, max_concurrency=None, metadata_class=ToolMetadata):
+    """Create tool metadata for a function"""
+    return metadata_class(name=name, description=name, parameters={}, function=function,
+                        timeout=timeout, max_concurrency=max_concurrency)
+
+
+def make_tool_call(call_id, name, arguments):
+    """Create an assistants API style tool call object"""
+    return SimpleNamespace(id=call_id, function=SimpleNamespace(name=name, arguments=json.dumps(arguments)))
+
+
+class TestToolExecutor(unittest.TestCase):
+    """Tests for the ToolExecutor"""
+
+    def setUp(self):
+        self.executor = ToolExecutor(max_workers=8)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_independent_calls_run_concurrently_in_order(self):
+        """Test that calls overlap and results keep the call order"""
+        probe = ConcurrencyProbe()
+        metadata = make_metadata("probe", probe)
+        tasks = [ToolTask(name="probe", arguments={"value": i}, metadata=metadata) for i in range(4)]
+
+        start = time.perf_counter()
+        results = self.executor.execute(tasks)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(results, [{"value": i} for i in range(4)])
+        self.assertEqual(probe.peak, 4)
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(metadata.invocation_count, 4)
+        self.assertEqual(metadata.latency.count, 4)
+
+    def test_concurrency_limit(self):
+        """Test that a tool's max_concurrency caps its parallel calls"""
+        probe = ConcurrencyProbe(delay=0.05)
+        metadata = make_metadata("probe", probe, max_concurrency=2)
+        tasks = [ToolTask(name="probe", arguments={"value": i}, metadata=metadata) for i in range(6)]
+
+        results = self.executor.execute(tasks)
+
+        self.assertEqual(len(results), 6)
+        self.assertEqual(probe.peak, 2)
+
+    def test_timeout_abandons_slow_call(self):
+        """Test that a slow call times out without holding back the others"""
+        slow = make_metadata("slow", lambda: time.sleep(1), timeout=0.1)
+        fast = make_metadata("fast", lambda: "done")
+
+        start = time.perf_counter()
+        results = self.executor.execute([ToolTask(name="slow", arguments={}, metadata=slow),
+                                         ToolTask(name="fast", arguments={}, metadata=fast)])
+
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertIn("timed out", results[0]["error"])
+        self.assertEqual(results[1], "done")
+        self.assertEqual(slow.timeout_count, 1)
+
+    def test_async_tools_errors_and_unknown_tools(self):
+        """Test async tools, raised errors and unresolvable tools"""
+        async def fetch(key):
+            await asyncio.sleep(0.01)
+            return {"key": key}
+
+        def broken():
+            raise ValueError("bad input")
+
+        results = self.executor.execute([
+            ToolTask(name="fetch", arguments={"key": "a"}, metadata=make_metadata("fetch", fetch)),
+            ToolTask(name="broken", arguments={}, metadata=make_metadata("broken", broken)),
+            ToolTask(name="missing", arguments={})
+        ])
+
+        self.assertEqual(results, [{"key": "a"}, {"error": "bad input"}, {"error": "Tool missing not found"}])
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Tests for the LatencyHistogram"""
+
+    def test_buckets_and_percentiles(self):
+        """Test bucket counts and percentile estimates"""
+        histogram = LatencyHistogram()
+        for ms in [0.5, 3, 3, 40, 2000]:
+            histogram.record(ms / 1000)
+
+        summary = histogram.to_dict()
+        self.assertEqual(summary["count"], 5)
+        self.assertEqual(summary["buckets"]["le_1ms"], 1)
+        self.assertEqual(summary["buckets"]["le_5ms"], 2)
+        self.assertEqual(summary["buckets"]["le_2500ms"], 1)
+        self.assertEqual(histogram.percentile(50), 5)
+        self.assertAlmostEqual(histogram.percentile(100), 2000)
+
+
+class TestSDKToolProvider(unittest.TestCase):
+    """Tests for SDKToolProvider.handle_tool_calls"""
+
+    def setUp(self):
+        self.registry = provider_registry.ToolRegistry()
+        self.probe = ConcurrencyProbe()
+        self.registry.register(make_metadata("test_parallel_probe", self.probe,
+                                             metadata_class=provider_registry.ToolMetadata))
+
+    def tearDown(self):
+        self.registry.unregister("test_parallel_probe")
+
+    def test_calls_run_concurrently_with_stable_outputs(self):
+        """Test that outputs keep the call order and ids"""
+        provider = sdk_integration.SDKToolProvider()
+        tool_calls = [
+            {"id": f"call-{i}", "function": {"name": "test_parallel_probe", "arguments": json.dumps({"value": i})}}
+            for i in range(3)
+        ]
+        tool_calls.append({"id": "call-missing", "function": {"name": "test_missing_tool", "arguments": "{}"}})
+
+        outputs = provider.handle_tool_calls(tool_calls)
+
+        self.assertEqual([output["tool_call_id"] for output in outputs],
+                         ["call-0", "call-1", "call-2", "call-missing"])
+        self.assertEqual([json.loads(output["output"]) for output in outputs[:3]],
+                         [{"value": i} for i in range(3)])
+        self.assertIn("error", json.loads(outputs[3]["output"]))
+        self.assertEqual(self.probe.peak, 3)
+        self.assertEqual(self.registry.get_tool("test_parallel_probe").to_dict()["latency"]["count"], 3)
+
+
+class TestSDKAgentToolCalls(unittest.TestCase):
+    """Tests for SDKAgent._handle_tool_calls"""
+
+    def test_method_tools_run_concurrently(self):
+        """Test concurrent method tools, limits from tool attributes, and stats"""
+        agent = SDKAgent({"agent_name": "tool-test"})
+        probe = ConcurrencyProbe(delay=0.05)
+
+        def lookup(value):
+            return probe(value)
+        lookup._tool_max_concurrency = 2
+        agent.lookup = lookup
+
+        tool_calls = [make_tool_call(f"call-{i}", "lookup", {"value": i}) for i in range(5)]
+        tool_calls.insert(2, make_tool_call("call-x", "not_a_tool", {}))
+
+        outputs = agent._handle_tool_calls(tool_calls)
+
+        self.assertEqual(outputs[2], {"tool_call_id": "call-x",
+                                      "output": json.dumps({"error": "Tool not_a_tool not implemented"})})
+        self.assertEqual([json.loads(o["output"])["value"] for o in outputs if o["tool_call_id"] != "call-x"],
+                         list(range(5)))
+        self.assertEqual(probe.peak, 2)
+        self.assertEqual(agent.get_tool_stats()["lookup"]["invocation_count"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
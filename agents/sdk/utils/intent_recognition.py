@@ -12,7 +12,9 @@ import json
 import re
 import logging
 import time
-from typing import Dict, List, Any, Optional, Union, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Union, Tuple, Callable
 
 # Configure logging
 logging.basicConfig(
@@ -37,6 +39,15 @@ except ImportError:
         """Fallback activity logger that just logs to the intent_recognition logger."""
         logger.debug(f"Activity: {subtype} - {title or 'No title'} - {details}")
 
+# Shared LLM response cache (lives in agents/utils, outside the SDK)
+repo_root = os.path.abspath(os.path.join(sdk_dir, "..", ".."))
+if repo_root not in sys.path:
+    sys.path.append(repo_root)
+try:
+    from agents.utils.llm_response_cache import get_response_cache
+except ImportError:
+    get_response_cache = None
+
 
 # Default command types - a subset of the full list from preserved_scripts
 DEFAULT_COMMAND_TYPES = [
@@ -251,12 +262,80 @@ class Intent:
         return f"Intent({self.intent_type}, confidence={self.confidence:.2f}, params={{{param_str}}})"
 
 
+def _default_param_name(intent_type: str, index: int) -> str:
+    """Name a positional capture group by intent type"""
+    if intent_type in ("create_feature", "run_feature"):
+        return "feature_name"
+    elif intent_type == "view_screenshot":
+        return "screenshot_path"
+    elif intent_type == "view_design":
+        return "design_path"
+    elif intent_type == "clean_directory":
+        return "directory_path"
+    return f"param{index + 1}"
+
+
+def _literal_prefix(pattern: str) -> str:
+    """
+    Get the lowercase literal text every match of a pattern starts with.
+    
+    Patterns whose prefix is missing from a text cannot match it, so they
+    can be skipped without running them. This is conservative: patterns with
+    a top-level alternation have no prefix, and a quantified last character
+    is left out.
+    
+    Args:
+        pattern: Regex pattern
+        
+    Returns:
+        Literal prefix, or an empty string if there is none
+    """
+    match = re.match(r"[a-zA-Z0-9 ]+", pattern)
+    if not match:
+        return ""
+    
+    prefix = match.group(0)
+    if pattern[len(prefix):len(prefix) + 1] in ("?", "*", "{"):
+        prefix = prefix[:-1]
+    
+    depth = 0
+    escaped = False
+    in_class = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return ""
+    
+    return prefix.lower()
+
+
+def _is_json_object(text: str) -> bool:
+    """Check whether an AI response is a JSON object (and so worth caching)"""
+    try:
+        return isinstance(json.loads(text), dict)
+    except (TypeError, ValueError):
+        return False
+
+
 class IntentRecognizer:
     """System for recognizing intents from natural language input"""
     
     def __init__(self, model_path: Optional[str] = None,
                use_ai_recognition: bool = True,
-               default_threshold: float = 0.6):
+               default_threshold: float = 0.6,
+               use_response_cache: bool = False,
+               regex_cache_size: int = 1024):
         """
         Initialize the intent recognizer.
         
@@ -264,6 +343,10 @@ class IntentRecognizer:
             model_path: Path to custom intent model file
             use_ai_recognition: Whether to use AI for intent recognition
             default_threshold: Default confidence threshold
+            use_response_cache: Whether to reuse AI responses to identical
+                recognition requests from the shared LLM response cache
+            regex_cache_size: Number of recent utterances whose regex
+                matches are remembered (0 disables the cache)
         """
         self.intent_patterns = DEFAULT_INTENT_PATTERNS.copy()
         self.command_types = DEFAULT_COMMAND_TYPES.copy()
@@ -271,6 +354,16 @@ class IntentRecognizer:
         self.default_threshold = default_threshold
         self.use_ai_recognition = use_ai_recognition
         self.ai_client = None
+        self.response_cache = get_response_cache() if use_response_cache and get_response_cache else None
+        
+        # Compiled patterns, rebuilt whenever intent_patterns changes,
+        # and an LRU of regex matches for repeated utterances
+        self.regex_cache_size = regex_cache_size
+        self._compiled_patterns: Optional[Dict[str, List[str]]] = None
+        self._ranked_patterns: List[Tuple[str, Any, str, float]] = []
+        self._parameter_patterns: Dict[str, List[Tuple[str, Any]]] = {}
+        self._regex_cache: "OrderedDict[str, Optional[Tuple[str, float, Dict[str, Any]]]]" = OrderedDict()
+        self._regex_lock = threading.Lock()
         
         # Load custom model if provided
         if model_path:
@@ -399,60 +492,61 @@ class IntentRecognizer:
         # No intent recognized
         return Intent("unknown", confidence=0.0, raw_text=text)
     
+    def recognize_intents(self, texts: List[str]) -> List[Intent]:
+        """
+        Recognize intents from a batch of texts.
+        
+        Repeated texts are only recognized once.
+        
+        Args:
+            texts: Input texts to recognize intents from
+            
+        Returns:
+            Recognized intents, in the order of the texts
+        """
+        recognized: Dict[str, Intent] = {}
+        for text in texts:
+            if text not in recognized:
+                recognized[text] = self.recognize_intent(text)
+        
+        intents = []
+        for text in texts:
+            intent = recognized[text]
+            copy = Intent(intent.intent_type, intent.confidence, dict(intent.parameters), intent.raw_text)
+            copy.timestamp = intent.timestamp
+            intents.append(copy)
+        return intents
+    
     def _recognize_intent_regex(self, text: str) -> Optional[Intent]:
         """
         Recognize intent using regex patterns.
         
+        Patterns are compiled once and tried in order of confidence, skipping
+        those whose literal prefix is not in the text, so the first match is
+        the best one. Matches are remembered for the last regex_cache_size
+        texts.
+        
         Args:
             text: Input text
             
         Returns:
             Recognized intent or None
         """
-        best_match = None
-        best_confidence = 0.0
-        best_params = {}
-        
-        # Try each pattern
-        for intent_type, patterns in self.intent_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    # Confidence is static for regex matches, but we slightly
-                    # boost confidence for longer patterns as they're more specific
-                    confidence = 0.8 + min(0.15, len(pattern) / 1000)
-                    
-                    # Extract parameters based on capture groups
-                    params = {}
-                    for i, group in enumerate(match.groups()):
-                        if group:  # Skip empty groups
-                            # Prefer named groups if available, otherwise use positional
-                            if match.lastgroup and match.lastgroup[i+1]:
-                                param_name = match.lastgroup[i+1]
-                            else:
-                                # Default param names based on intent type
-                                if intent_type == "create_feature":
-                                    param_name = "feature_name"
-                                elif intent_type == "run_feature":
-                                    param_name = "feature_name"
-                                elif intent_type == "view_screenshot":
-                                    param_name = "screenshot_path"
-                                elif intent_type == "view_design":
-                                    param_name = "design_path"
-                                elif intent_type == "clean_directory":
-                                    param_name = "directory_path"
-                                else:
-                                    param_name = f"param{i+1}"
-                            
-                            params[param_name] = group
-                    
-                    # If better than current best, update
-                    if confidence > best_confidence:
-                        best_confidence = confidence
-                        best_match = intent_type
-                        best_params = params
-        
-        if best_match:
+        with self._regex_lock:
+            self._refresh_patterns()
+            if text in self._regex_cache:
+                self._regex_cache.move_to_end(text)
+                match = self._regex_cache[text]
+            else:
+                match = self._match_intent(text)
+                if self.regex_cache_size > 0:
+                    self._regex_cache[text] = match
+                    if len(self._regex_cache) > self.regex_cache_size:
+                        self._regex_cache.popitem(last=False)
+        
+        if match:
+            best_match, best_confidence, best_params = match
+            
             # Log the match
             log_prompt_activity("regex_intent_match", {
                 "intent_type": best_match,
@@ -460,10 +554,84 @@ class IntentRecognizer:
                 "parameters": best_params
             })
             
-            return Intent(best_match, best_confidence, best_params, text)
+            return Intent(best_match, best_confidence, dict(best_params), text)
+        
+        return None
+    
+    def _refresh_patterns(self) -> None:
+        """Recompile the intent patterns if they have changed"""
+        if self.intent_patterns == self._compiled_patterns:
+            return
+        
+        patterns = {intent_type: list(intent_patterns)
+                    for intent_type, intent_patterns in self.intent_patterns.items()}
+        ranked_patterns = []
+        parameter_patterns = {}
+        for intent_type, intent_patterns in patterns.items():
+            parameter_patterns[intent_type] = []
+            for pattern in intent_patterns:
+                compiled = re.compile(pattern, re.IGNORECASE)
+                prefix = _literal_prefix(pattern)
+                
+                # Confidence is static for regex matches, but we slightly
+                # boost confidence for longer patterns as they're more specific
+                confidence = 0.8 + min(0.15, len(pattern) / 1000)
+                ranked_patterns.append((prefix, compiled, intent_type, confidence))
+                
+                # Patterns without groups never yield parameters
+                if compiled.groups:
+                    parameter_patterns[intent_type].append((prefix, compiled))
+        
+        # The sort is stable, so the first of equally confident patterns wins
+        ranked_patterns.sort(key=lambda entry: -entry[3])
+        
+        self._ranked_patterns = ranked_patterns
+        self._parameter_patterns = parameter_patterns
+        self._compiled_patterns = patterns
+        self._regex_cache.clear()
+    
+    def _match_intent(self, text: str) -> Optional[Tuple[str, float, Dict[str, Any]]]:
+        """
+        Find the best matching intent pattern for a text.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Tuple of intent type, confidence and parameters, or None
+        """
+        # Prefixes are only compared case-insensitively to ASCII text, as
+        # lower() and re.IGNORECASE fold some other characters differently
+        lowered = text.lower() if text.isascii() else None
+        
+        for prefix, compiled, intent_type, confidence in self._ranked_patterns:
+            if prefix and lowered is not None and prefix not in lowered:
+                continue
+            match = compiled.search(text)
+            if match:
+                return intent_type, confidence, self._groups_to_params(intent_type, match)
         
         return None
     
+    @staticmethod
+    def _groups_to_params(intent_type: str, match: Any) -> Dict[str, Any]:
+        """
+        Extract parameters from the capture groups of a match.
+        
+        Args:
+            intent_type: Intent type the pattern belongs to
+            match: Match of a single pattern
+            
+        Returns:
+            Parameters, named after their group if it has a name
+        """
+        group_names = {index: name for name, index in match.re.groupindex.items()}
+        params = {}
+        for i, group in enumerate(match.groups()):
+            if group:  # Skip empty groups
+                params[group_names.get(i + 1) or _default_param_name(intent_type, i)] = group
+        return params
+    
     def _recognize_intent_ai(self, text: str) -> Optional[Intent]:
         """
         Recognize intent using AI.
@@ -515,36 +683,50 @@ If no intent can be determined, use "unknown" as the intent name with a confiden
             # Call the appropriate API based on the client
             if hasattr(self.ai_client, "chat") and hasattr(self.ai_client.chat, "completions"):
                 # OpenAI
-                response = self.ai_client.chat.completions.create(
-                    model="gpt-4o",  # or other model as appropriate
-                    messages=[
+                provider = "openai"
+                request = {
+                    "model": "gpt-4o",  # or other model as appropriate
+                    "messages": [
                         {"role": "system", "content": system_prompt},
                         {"role": "user", "content": user_prompt}
                     ],
-                    temperature=0.1,  # Low temperature for more deterministic results
-                    response_format={"type": "json_object"}
-                )
+                    "temperature": 0.1,  # Low temperature for more deterministic results
+                    "response_format": {"type": "json_object"}
+                }
                 
-                response_text = response.choices[0].message.content
+                def call_api() -> str:
+                    response = self.ai_client.chat.completions.create(**request)
+                    return response.choices[0].message.content
                 
             elif hasattr(self.ai_client, "messages") and hasattr(self.ai_client.messages, "create"):
                 # Anthropic Claude
-                response = self.ai_client.messages.create(
-                    model="claude-3-opus-20240229",  # or other model as appropriate
-                    system=system_prompt,
-                    messages=[
+                provider = "anthropic"
+                request = {
+                    "model": "claude-3-opus-20240229",  # or other model as appropriate
+                    "system": system_prompt,
+                    "messages": [
                         {"role": "user", "content": user_prompt}
                     ],
-                    temperature=0.1,
-                    max_tokens=500
-                )
+                    "temperature": 0.1,
+                    "max_tokens": 500
+                }
                 
-                response_text = response.content[0].text
+                def call_api() -> str:
+                    response = self.ai_client.messages.create(**request)
+                    return response.content[0].text
             
             else:
                 logger.warning("Unsupported AI client type")
                 return None
             
+            if self.response_cache:
+                response_text = self.response_cache.get_or_call(
+                    "intent_recognizer._recognize_intent_ai", {"provider": provider, **request}, call_api,
+                    should_cache=_is_json_object
+                )
+            else:
+                response_text = call_api()
+            
             # Parse JSON response
             result = json.loads(response_text)
             
@@ -624,38 +806,25 @@ If no intent can be determined, use "unknown" as the intent name with a confiden
         Returns:
             Extracted parameters
         """
-        params = {}
+        with self._regex_lock:
+            self._refresh_patterns()
+            patterns = self._parameter_patterns.get(intent_type, [])
         
-        # Check if we have patterns for this intent
-        if intent_type in self.intent_patterns:
-            patterns = self.intent_patterns[intent_type]
-            
-            # Try each pattern
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    # Extract groups
-                    for i, group in enumerate(match.groups()):
-                        if group:
-                            # Default parameter names based on intent type
-                            if intent_type == "create_feature":
-                                params["feature_name"] = group
-                            elif intent_type == "run_feature":
-                                params["feature_name"] = group
-                            elif intent_type == "view_screenshot":
-                                params["screenshot_path"] = group
-                            elif intent_type == "view_design":
-                                params["design_path"] = group
-                            elif intent_type == "clean_directory":
-                                params["directory_path"] = group
-                            else:
-                                params[f"param{i+1}"] = group
-                    
-                    # If we found parameters, return them
-                    if params:
-                        return params
+        lowered = text.lower() if text.isascii() else None
         
-        return params
+        # Try each pattern
+        for prefix, compiled in patterns:
+            if prefix and lowered is not None and prefix not in lowered:
+                continue
+            match = compiled.search(text)
+            if match:
+                params = self._groups_to_params(intent_type, match)
+                
+                # If we found parameters, return them
+                if params:
+                    return params
+        
+        return {}
     
     def _extract_parameters_ai(self, intent_type: str, text: str, 
                             param_defs: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -1009,7 +1178,7 @@ except ImportError:
 """
         
         # Define methods for intent recognition
-        methods_code = """
+        methods_code = '''
     def recognize_intent(self, text: str) -> Dict[str, Any]:
         """
         Recognize intent from text input.
@@ -1088,7 +1257,7 @@ except ImportError:
         except Exception as e:
             logger.error(f"Error registering intent handler: {e}")
             return False
-"""
+'''
         
         # Find import location
         imports_end = content.find("# Configure logging")
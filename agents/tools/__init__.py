@@ -5,7 +5,10 @@ Provides tools and capabilities for agents in the Devloop system.
 Tools are exposed to OpenAI Assistants via function calling.
 """
 
-from .registry import ToolRegistry, ToolMetadata, tool, param_description
+from .registry import (
+    ToolRegistry, ToolMetadata, ToolCache, LatencyHistogram, tool, param_description,
+    ToolExecutor, ToolTask
+)
 from .core import (
     BaseTool, FileTool, SystemTool, APITool, DatabaseTool, 
     create_tool, SDKToolProvider, ToolPermissionManager
@@ -25,7 +28,8 @@ def register_all_tools():
     # Add more tool registrations here as they're implemented
 
 __all__ = [
-    'ToolRegistry', 'ToolMetadata', 'tool', 'param_description',
+    'ToolRegistry', 'ToolMetadata', 'ToolCache', 'LatencyHistogram', 'tool', 'param_description',
+    'ToolExecutor', 'ToolTask',
     'BaseTool', 'FileTool', 'SystemTool', 'APITool', 'DatabaseTool', 
     'create_tool', 'SDKToolProvider', 'ToolPermissionManager',
     'register_all_tools'
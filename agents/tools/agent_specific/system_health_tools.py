@@ -22,11 +22,8 @@ logging.basicConfig(
 logger = logging.getLogger("system_health_tools")
 
 # Import tool decorators
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from registry.tool_registry import tool, param_description
-from core.base_tool import SystemTool
+from ..registry.tool_registry import tool, param_description
+from ..core.base_tool import SystemTool
 
 
 class SystemHealthTool(SystemTool):
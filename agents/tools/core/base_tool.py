@@ -57,7 +57,11 @@ class BaseTool(ABC):
                 permissions: List[str] = None,
                 local_only: bool = False,
                 version: str = "1.0.0",
-                author: str = "Devloop System") -> str:
+                author: str = "Devloop System",
+                cache_ttl: float = None,
+                cache_key: List[str] = None,
+                cache_tags: List[str] = None,
+                invalidates: List[str] = None) -> str:
         """Register this tool with the registry
         
         Args:
@@ -66,6 +70,10 @@ class BaseTool(ABC):
             local_only: Whether tool is local-only
             version: Tool version
             author: Tool author/owner
+            cache_ttl: Seconds repeated calls are served from the registry cache
+            cache_key: Arguments that identify a result (defaults to all arguments)
+            cache_tags: Invalidation tags of cached results
+            invalidates: Tags whose cached results are dropped after each call
             
         Returns:
             Tool ID
@@ -78,7 +86,11 @@ class BaseTool(ABC):
             permissions=permissions,
             local_only=local_only,
             version=version,
-            author=author
+            author=author,
+            cache_ttl=cache_ttl,
+            cache_key=cache_key,
+            cache_tags=cache_tags,
+            invalidates=invalidates
         )
         def tool_wrapper(**kwargs):
             return self.execute(**kwargs)
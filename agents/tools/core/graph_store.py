@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Graph Store Module
+
+Provides the storage behind the knowledge manager tool. The knowledge graph
+stays resident in the process with an id-to-node map, a (type, name) index
+and per-node adjacency lists, so lookups are constant time and a breadth-first
+query only touches the edges of the nodes it visits. Changes are written
+through to the graph file, which is reloaded if another process changes it.
+"""
+
+import os
+import copy
+import json
+import logging
+import threading
+from typing import Dict, List, Any, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger("graph_store")
+
+
+class GraphStore:
+    """Resident, adjacency-indexed knowledge graph with write-through persistence"""
+
+    def __init__(self, graph_path: str):
+        """Initialize the graph store
+
+        Args:
+            graph_path: Path to the graph JSON file
+        """
+        self.graph_path = graph_path
+        self.nodes: List[Dict[str, Any]] = []
+        self.edges: List[Dict[str, Any]] = []
+        self.node_index: Dict[str, Dict[str, Any]] = {}
+        self.name_index: Dict[Tuple[Any, Any], Dict[str, Any]] = {}
+        self.edge_ids: set = set()
+        self.adjacency: Dict[str, List[Dict[str, Any]]] = {}
+        self._file_state: Optional[Tuple[int, int]] = None
+        self._lock = threading.RLock()
+
+    def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Get a node by ID
+
+        Args:
+            node_id: Node ID
+
+        Returns:
+            Copy of the node, or None if not found
+        """
+        with self._lock:
+            self._refresh()
+            node = self.node_index.get(node_id)
+            return copy.deepcopy(node) if node else None
+
+    def find_node(self, node_type: str, name: str) -> Optional[Dict[str, Any]]:
+        """Find a node by type and name
+
+        Args:
+            node_type: Node type
+            name: Node name
+
+        Returns:
+            Copy of the node, or None if not found
+        """
+        with self._lock:
+            self._refresh()
+            node = self.name_index.get((name, node_type))
+            return copy.deepcopy(node) if node else None
+
+    def add_node(self, node: Dict[str, Any]) -> bool:
+        """Add a node and write the graph through to its file
+
+        Args:
+            node: Node with a unique "id"
+
+        Returns:
+            True if the graph was saved, False otherwise
+        """
+        with self._lock:
+            self._refresh()
+            self._index_node(node)
+            self.nodes.append(node)
+            return self._persist()
+
+    def add_edge(self, edge: Dict[str, Any]) -> bool:
+        """Add an edge and write the graph through to its file
+
+        Args:
+            edge: Edge with "id", "source", "target" and "type"
+
+        Returns:
+            True if the graph was saved, False otherwise
+        """
+        with self._lock:
+            self._refresh()
+            self._index_edge(edge)
+            self.edges.append(edge)
+            return self._persist()
+
+    def unique_id(self, base_id: str, edge: bool = False) -> str:
+        """Make an ID unique among the graph's nodes or edges
+
+        Args:
+            base_id: Preferred ID
+            edge: Whether the ID is for an edge
+
+        Returns:
+            base_id, or base_id with a numeric suffix if it is taken
+        """
+        with self._lock:
+            self._refresh()
+            taken = self.edge_ids if edge else self.node_index
+            candidate, suffix = base_id, 1
+            while candidate in taken:
+                candidate = f"{base_id}-{suffix}"
+                suffix += 1
+            return candidate
+
+    def query_related(self, node_id: str, relation_types: List[str] = None,
+                      max_depth: int = 1) -> Optional[Dict[str, Any]]:
+        """Find nodes related to a node, breadth first
+
+        Edges are followed in both directions. Each level visits the edges
+        of its nodes in the order they were added to the graph.
+
+        Args:
+            node_id: ID of the starting node
+            relation_types: Edge types to follow (all types if empty)
+            max_depth: Maximum number of hops
+
+        Returns:
+            Dictionary with the starting node, related nodes and traversed
+            edges, or None if the starting node does not exist
+        """
+        with self._lock:
+            self._refresh()
+            start_node = self.node_index.get(node_id)
+            if not start_node:
+                return None
+
+            relation_types = set(relation_types or [])
+            visited_nodes = {node_id}
+            related_nodes = [start_node]
+            related_edges = []
+            current_level = [node_id]
+
+            for _ in range(max_depth):
+                next_level = []
+                for current_id in current_level:
+                    for edge in self.adjacency.get(current_id, []):
+                        if relation_types and edge.get("type") not in relation_types:
+                            continue
+
+                        # Follow the edge to its other end
+                        if edge.get("source") == current_id:
+                            neighbour_id = edge.get("target")
+                        else:
+                            neighbour_id = edge.get("source")
+                        if neighbour_id in visited_nodes:
+                            continue
+
+                        visited_nodes.add(neighbour_id)
+                        next_level.append(neighbour_id)
+                        related_edges.append(edge)
+                        if neighbour_id in self.node_index:
+                            related_nodes.append(self.node_index[neighbour_id])
+
+                current_level = next_level
+                if not current_level:
+                    break
+
+            return copy.deepcopy({
+                "start_node": start_node,
+                "related_nodes": related_nodes,
+                "related_edges": related_edges
+            })
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the whole graph
+
+        Returns:
+            Copy of the graph as {"nodes": [...], "edges": [...]}
+        """
+        with self._lock:
+            self._refresh()
+            return copy.deepcopy({"nodes": self.nodes, "edges": self.edges})
+
+    def replace(self, graph: Dict[str, Any]) -> bool:
+        """Replace the whole graph and write it through to its file
+
+        Args:
+            graph: Graph as {"nodes": [...], "edges": [...]}
+
+        Returns:
+            True if the graph was saved, False otherwise
+        """
+        with self._lock:
+            self._build(copy.deepcopy(graph))
+            return self._persist()
+
+    def _refresh(self) -> None:
+        """Load the graph file if it is new or was changed by another process"""
+        state = self._stat()
+        if state is not None and state == self._file_state:
+            return
+
+        graph = {"nodes": [], "edges": []}
+        if state is not None:
+            try:
+                with open(self.graph_path, 'r') as f:
+                    graph = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.error(f"Error loading knowledge graph {self.graph_path}: {e}")
+        self._build(graph)
+        self._file_state = state
+
+    def _build(self, graph: Dict[str, Any]) -> None:
+        """Rebuild the indexes from a graph dictionary"""
+        self.nodes = graph.get("nodes", [])
+        self.edges = graph.get("edges", [])
+        self.node_index = {}
+        self.name_index = {}
+        self.edge_ids = set()
+        self.adjacency = {}
+        for node in self.nodes:
+            self._index_node(node)
+        for edge in self.edges:
+            self._index_edge(edge)
+
+    def _index_node(self, node: Dict[str, Any]) -> None:
+        """Add a node to the indexes (the first node with an ID wins)"""
+        self.node_index.setdefault(node.get("id"), node)
+        self.name_index.setdefault((node.get("name"), node.get("type")), node)
+
+    def _index_edge(self, edge: Dict[str, Any]) -> None:
+        """Add an edge to the adjacency lists of both its ends"""
+        self.edge_ids.add(edge.get("id"))
+        source_id, target_id = edge.get("source"), edge.get("target")
+        self.adjacency.setdefault(source_id, []).append(edge)
+        if target_id != source_id:
+            self.adjacency.setdefault(target_id, []).append(edge)
+
+    def _persist(self) -> bool:
+        """Atomically write the graph to its file"""
+        temp_path = f"{self.graph_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.graph_path) or ".", exist_ok=True)
+            with open(temp_path, 'w') as f:
+                json.dump({"nodes": self.nodes, "edges": self.edges}, f)
+            os.replace(temp_path, self.graph_path)
+        except Exception as e:
+            logger.error(f"Error saving knowledge graph: {e}")
+            # Reload from the file on next access so memory matches disk
+            self._file_state = None
+            return False
+
+        self._file_state = self._stat()
+        return True
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        """Get the modification time and size of the graph file"""
+        try:
+            stat = os.stat(self.graph_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+
+_stores: Dict[str, GraphStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_graph_store(graph_path: str) -> GraphStore:
+    """Get the process-wide graph store for a graph file
+
+    Args:
+        graph_path: Path to the graph JSON file
+
+    Returns:
+        GraphStore instance
+    """
+    graph_path = os.path.abspath(graph_path)
+    with _stores_lock:
+        if graph_path not in _stores:
+            _stores[graph_path] = GraphStore(graph_path)
+        return _stores[graph_path]
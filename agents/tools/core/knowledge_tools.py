@@ -23,6 +23,8 @@ logger = logging.getLogger("knowledge_tools")
 # Import tool decorators
 from ..registry.tool_registry import tool, param_description
 from .base_tool import BaseTool
+from .memory_store import get_memory_store
+from .graph_store import get_graph_store
 
 
 class MemoryTool(BaseTool):
@@ -40,6 +42,7 @@ class MemoryTool(BaseTool):
         # Initialize memory storage
         self.memory_path = os.path.join(os.path.dirname(__file__), "../../../system-core/memory")
         self.ensure_memory_path_exists()
+        self.store = get_memory_store(self.memory_path)
         
     def ensure_memory_path_exists(self):
         """Ensure the memory path exists"""
@@ -54,7 +57,7 @@ class MemoryTool(BaseTool):
         Returns:
             Path to the memory file
         """
-        return os.path.join(self.memory_path, f"{category}.json")
+        return self.store.get_log_file(category)
         
     def load_memory(self, category: str) -> List[Dict[str, Any]]:
         """Load memory from storage
@@ -65,20 +68,10 @@ class MemoryTool(BaseTool):
         Returns:
             List of memory entries
         """
-        memory_file = self.get_memory_file(category)
-        
-        if os.path.exists(memory_file):
-            try:
-                with open(memory_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                logger.error(f"Error loading memory file {memory_file}")
-                return []
-        else:
-            return []
+        return self.store.get_all(category)
             
     def save_memory(self, category: str, memories: List[Dict[str, Any]]) -> bool:
-        """Save memory to storage
+        """Save memory to storage, replacing the category's contents
         
         Args:
             category: Memory category
@@ -87,15 +80,7 @@ class MemoryTool(BaseTool):
         Returns:
             True if successful, False otherwise
         """
-        memory_file = self.get_memory_file(category)
-        
-        try:
-            with open(memory_file, 'w') as f:
-                json.dump(memories, f, indent=2)
-            return True
-        except Exception as e:
-            logger.error(f"Error saving memory file {memory_file}: {e}")
-            return False
+        return self.store.replace(category, memories)
 
 
 class MemoryWriter(MemoryTool):
@@ -135,33 +120,17 @@ class MemoryWriter(MemoryTool):
         if importance < 0.0 or importance > 1.0:
             return {"success": False, "error": "Importance must be between 0.0 and 1.0"}
             
-        # Load existing memories
-        memories = self.load_memory(category)
-        
-        # Create memory entry
-        memory_id = f"{int(time.time())}-{len(memories)}"
-        tags = tags or []
-        metadata = metadata or {}
-        
-        memory_entry = {
-            "id": memory_id,
-            "content": content,
-            "category": category,
-            "importance": importance,
-            "tags": tags,
-            "created_at": datetime.now().isoformat(),
-            "metadata": metadata
-        }
-        
-        # Add to memories
-        memories.append(memory_entry)
-        
-        # Save memories
-        success = self.save_memory(category, memories)
+        # Append the memory entry to the category log
+        try:
+            memory_entry = self.store.append(category, content, importance=importance,
+                                             tags=tags, metadata=metadata)
+        except Exception as e:
+            logger.error(f"Error storing memory in {category}: {e}")
+            return {"success": False, "memory_id": None, "category": category}
         
         return {
-            "success": success,
-            "memory_id": memory_id if success else None,
+            "success": True,
+            "memory_id": memory_entry["id"],
             "category": category
         }
 
@@ -198,26 +167,12 @@ class MemoryReader(MemoryTool):
         Returns:
             List of matching memories
         """
-        # Load memories
-        memories = self.load_memory(category)
+        query = query.lower() if query else query
         
-        # Filter by query if provided
-        if query:
-            query = query.lower()
-            memories = [m for m in memories if query in m.get("content", "").lower()]
-            
-        # Filter by tags if provided
-        if tags:
-            memories = [m for m in memories if any(tag in m.get("tags", []) for tag in tags)]
-            
-        # Filter by importance
-        memories = [m for m in memories if m.get("importance", 0.0) >= min_importance]
-        
-        # Sort by importance (descending) and time (descending)
-        memories.sort(key=lambda x: (-x.get("importance", 0.0), -int(x.get("id", "0").split("-")[0])))
-        
-        # Apply limit
-        memories = memories[:limit]
+        # Filter by query, tags and importance through the store's indexes and
+        # take the top memories by importance (descending) and time (descending)
+        memories = self.store.query(category, query=query, tags=tags,
+                                    min_importance=min_importance, limit=limit)
         
         # Remove metadata if not requested
         if not include_metadata:
@@ -244,6 +199,7 @@ class KnowledgeManager(BaseTool):
         # Initialize knowledge graph storage
         self.graph_path = os.path.join(os.path.dirname(__file__), "../../../system-core/memory/graph.json")
         self.ensure_graph_exists()
+        self.graph = get_graph_store(self.graph_path)
         
     def ensure_graph_exists(self):
         """Ensure the graph file exists"""
@@ -258,11 +214,7 @@ class KnowledgeManager(BaseTool):
         Returns:
             Knowledge graph structure
         """
-        try:
-            with open(self.graph_path, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {"nodes": [], "edges": []}
+        return self.graph.to_dict()
             
     def save_graph(self, graph: Dict[str, Any]) -> bool:
         """Save the knowledge graph
@@ -273,13 +225,7 @@ class KnowledgeManager(BaseTool):
         Returns:
             True if successful, False otherwise
         """
-        try:
-            with open(self.graph_path, 'w') as f:
-                json.dump(graph, f, indent=2)
-            return True
-        except Exception as e:
-            logger.error(f"Error saving knowledge graph: {e}")
-            return False
+        return self.graph.replace(graph)
         
     @param_description({
         "operation": "Operation to perform (add_node, add_edge, query_related)",
@@ -320,16 +266,13 @@ class KnowledgeManager(BaseTool):
         if not node_type or not node_name:
             return {"success": False, "error": "Node type and name are required"}
             
-        # Load graph
-        graph = self.load_graph()
-        
         # Check if node already exists
-        for node in graph["nodes"]:
-            if node.get("name") == node_name and node.get("type") == node_type:
-                return {"success": False, "error": "Node already exists", "node_id": node.get("id")}
+        existing_node = self.graph.find_node(node_type, node_name)
+        if existing_node:
+            return {"success": False, "error": "Node already exists", "node_id": existing_node.get("id")}
                 
         # Create node
-        node_id = f"{node_type}-{int(time.time())}"
+        node_id = self.graph.unique_id(f"{node_type}-{int(time.time())}")
         node = {
             "id": node_id,
             "type": node_type,
@@ -338,11 +281,8 @@ class KnowledgeManager(BaseTool):
             "properties": properties
         }
         
-        # Add to graph
-        graph["nodes"].append(node)
-        
-        # Save graph
-        success = self.save_graph(graph)
+        # Add to graph and save
+        success = self.graph.add_node(node)
         
         return {
             "success": success,
@@ -366,18 +306,9 @@ class KnowledgeManager(BaseTool):
         if not source_id or not target_id or not relation_type:
             return {"success": False, "error": "Source ID, target ID, and relation type are required"}
             
-        # Load graph
-        graph = self.load_graph()
-        
         # Verify nodes exist
-        source_node = None
-        target_node = None
-        
-        for node in graph["nodes"]:
-            if node.get("id") == source_id:
-                source_node = node
-            if node.get("id") == target_id:
-                target_node = node
+        source_node = self.graph.get_node(source_id)
+        target_node = self.graph.get_node(target_id)
                 
         if not source_node:
             return {"success": False, "error": f"Source node {source_id} not found"}
@@ -386,7 +317,7 @@ class KnowledgeManager(BaseTool):
             return {"success": False, "error": f"Target node {target_id} not found"}
             
         # Create edge
-        edge_id = f"{relation_type}-{int(time.time())}"
+        edge_id = self.graph.unique_id(f"{relation_type}-{int(time.time())}", edge=True)
         edge = {
             "id": edge_id,
             "source": source_id,
@@ -396,11 +327,8 @@ class KnowledgeManager(BaseTool):
             "properties": properties
         }
         
-        # Add to graph
-        graph["edges"].append(edge)
-        
-        # Save graph
-        success = self.save_graph(graph)
+        # Add to graph and save
+        success = self.graph.add_edge(edge)
         
         return {
             "success": success,
@@ -423,68 +351,15 @@ class KnowledgeManager(BaseTool):
         if not node_id:
             return {"success": False, "error": "Node ID is required"}
             
-        # Load graph
-        graph = self.load_graph()
-        
-        # Find the starting node
-        start_node = None
-        for node in graph["nodes"]:
-            if node.get("id") == node_id:
-                start_node = node
-                break
-                
-        if not start_node:
+        # Breadth-first search over the adjacency lists
+        related = self.graph.query_related(node_id, relation_types, max_depth)
+        if related is None:
             return {"success": False, "error": f"Node {node_id} not found"}
             
-        # Breadth-first search to find related nodes
-        visited_nodes = {node_id}
-        related_nodes = [start_node]
-        related_edges = []
-        
-        # Process nodes level by level up to max_depth
-        current_level = [node_id]
+        start_node = related["start_node"]
+        related_nodes = related["related_nodes"]
+        related_edges = related["related_edges"]
         
-        for _ in range(max_depth):
-            next_level = []
-            
-            for current_id in current_level:
-                # Find all edges connected to this node
-                for edge in graph["edges"]:
-                    consider_edge = not relation_types or edge.get("type") in relation_types
-                    
-                    if edge.get("source") == current_id and consider_edge:
-                        target_id = edge.get("target")
-                        if target_id not in visited_nodes:
-                            visited_nodes.add(target_id)
-                            next_level.append(target_id)
-                            related_edges.append(edge)
-                            
-                            # Find and add the target node
-                            for node in graph["nodes"]:
-                                if node.get("id") == target_id:
-                                    related_nodes.append(node)
-                                    break
-                                    
-                    elif edge.get("target") == current_id and consider_edge:
-                        source_id = edge.get("source")
-                        if source_id not in visited_nodes:
-                            visited_nodes.add(source_id)
-                            next_level.append(source_id)
-                            related_edges.append(edge)
-                            
-                            # Find and add the source node
-                            for node in graph["nodes"]:
-                                if node.get("id") == source_id:
-                                    related_nodes.append(node)
-                                    break
-            
-            # Update current level for next iteration
-            current_level = next_level
-            
-            # If no more nodes to explore, break
-            if not current_level:
-                break
-                
         return {
             "success": True,
             "start_node": start_node,
@@ -501,7 +376,8 @@ class KnowledgeManager(BaseTool):
     name="record_observation",
     description="Record an observation in the memory system",
     categories=["knowledge", "memory"],
-    permissions=["memory_write"]
+    permissions=["memory_write"],
+    invalidates=["memory", "memory:observations"]
 )
 @param_description({
     "observation": "The observation to record",
@@ -543,7 +419,9 @@ def record_observation(observation: str, importance: float = 0.5,
     name="search_knowledge",
     description="Search for knowledge across categories",
     categories=["knowledge", "memory"],
-    permissions=["memory_read"]
+    permissions=["memory_read"],
+    cache_ttl=30,
+    cache_tags=["memory"]
 )
 @param_description({
     "query": "Text to search for in memories",
@@ -602,13 +480,16 @@ def register_knowledge_tools():
     memory_writer = MemoryWriter()
     memory_writer.register(
         categories=["knowledge", "memory"],
-        permissions=["memory_write"]
+        permissions=["memory_write"],
+        invalidates=["memory", "memory:{category}"]
     )
     
     memory_reader = MemoryReader()
     memory_reader.register(
         categories=["knowledge", "memory"],
-        permissions=["memory_read"]
+        permissions=["memory_read"],
+        cache_ttl=30,
+        cache_tags=["memory:{category}"]
     )
     
     knowledge_manager = KnowledgeManager()
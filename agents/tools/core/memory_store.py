@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Memory Store Module
+
+Provides the storage behind the memory tools. Each category is an append-only
+log of JSON lines, so recording a memory writes one line instead of
+rewriting the category. The log is indexed in memory by tag, by content
+token and by rank (importance, then recency), so retrieval touches only
+matching entries and selects the top results with a heap. The index stays
+resident for the process and picks up lines appended by other processes.
+"""
+
+import os
+import re
+import copy
+import json
+import time
+import heapq
+import bisect
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger("memory_store")
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class CategoryIndex:
+    """In-memory index of one memory category"""
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.rank_keys: Dict[str, Tuple[float, int, int]] = {}
+        self.ranking: List[Tuple[float, int, int, str]] = []
+        self.tag_index: Dict[str, Set[str]] = {}
+        self.token_index: Dict[str, Set[str]] = {}
+        self.offset = 0
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Index one entry
+
+        Args:
+            entry: Memory entry read from the log
+        """
+        memory_id = entry.get("id")
+        if memory_id is None or memory_id in self.entries:
+            return
+
+        # Rank by importance, then recency, then log order (as a stable sort would)
+        try:
+            created = int(str(memory_id).split("-")[0])
+        except ValueError:
+            created = 0
+        rank_key = (-entry.get("importance", 0.0), -created, len(self.entries))
+
+        self.entries[memory_id] = entry
+        self.rank_keys[memory_id] = rank_key
+        bisect.insort(self.ranking, rank_key + (memory_id,))
+
+        for tag in entry.get("tags", []):
+            self.tag_index.setdefault(tag, set()).add(memory_id)
+        for token in set(TOKEN_PATTERN.findall(entry.get("content", "").lower())):
+            self.token_index.setdefault(token, set()).add(memory_id)
+
+    def match_text(self, query: str) -> Optional[Set[str]]:
+        """Find candidate entries whose content may contain a lowercase query
+
+        A query token with non-word characters on both sides must be a
+        whole content token; tokens at the ends of the query may be part of
+        a longer content token.
+
+        Args:
+            query: Lowercase text query
+
+        Returns:
+            Candidate memory IDs, or None if the query has no word tokens
+        """
+        candidates = None
+        for match in TOKEN_PATTERN.finditer(query):
+            token = match.group()
+            bounded_left = match.start() > 0
+            bounded_right = match.end() < len(query)
+
+            if bounded_left and bounded_right:
+                ids = self.token_index.get(token, set())
+            else:
+                ids = set()
+                for content_token, token_ids in self.token_index.items():
+                    if bounded_left:
+                        matched = content_token.startswith(token)
+                    elif bounded_right:
+                        matched = content_token.endswith(token)
+                    else:
+                        matched = token in content_token
+                    if matched:
+                        ids |= token_ids
+
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return set()
+
+        return candidates
+
+
+class MemoryStore:
+    """Append-only, indexed store of memory entries"""
+
+    def __init__(self, memory_path: str):
+        """Initialize the memory store
+
+        Args:
+            memory_path: Directory holding the category logs
+        """
+        self.memory_path = memory_path
+        self.indexes: Dict[str, CategoryIndex] = {}
+        self._lock = threading.RLock()
+        os.makedirs(memory_path, exist_ok=True)
+
+    def get_log_file(self, category: str) -> str:
+        """Get the path to a category's log
+
+        Args:
+            category: Memory category
+
+        Returns:
+            Path to the log file
+        """
+        return os.path.join(self.memory_path, f"{category}.jsonl")
+
+    def append(self, category: str, content: str, importance: float = 0.5,
+               tags: List[str] = None, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Record a memory entry
+
+        Args:
+            category: Memory category
+            content: Memory content
+            importance: Importance rating from 0.0 to 1.0
+            tags: Tags of the memory
+            metadata: Additional metadata
+
+        Returns:
+            The stored memory entry
+        """
+        with self._lock:
+            index = self._sync(category)
+
+            entry = {
+                "id": f"{int(time.time())}-{len(index.entries)}",
+                "content": content,
+                "category": category,
+                "importance": importance,
+                "tags": tags or [],
+                "created_at": datetime.now().isoformat(),
+                "metadata": metadata or {}
+            }
+
+            with open(self.get_log_file(category), 'a') as f:
+                f.write(json.dumps(entry) + "\n")
+
+            # Index through the log so lines appended by other processes keep their order
+            self._sync(category)
+            return copy.deepcopy(entry)
+
+    def query(self, category: str, query: str = "", tags: List[str] = None,
+              min_importance: float = 0.0, limit: int = 10) -> List[Dict[str, Any]]:
+        """Retrieve the highest ranked memories matching the filters
+
+        Args:
+            category: Memory category
+            query: Optional text that must occur in the content (case-insensitive)
+            tags: Optional tags, any of which must be present
+            min_importance: Minimum importance threshold
+            limit: Maximum number of memories to return
+
+        Returns:
+            Copies of the matching memories ordered by importance, then recency
+        """
+        with self._lock:
+            index = self._sync(category)
+            query = query.lower() if query else ""
+
+            # Narrow the candidates with the tag and token indexes
+            candidates = None
+            if tags:
+                candidates = set().union(*(index.tag_index.get(tag, set()) for tag in tags))
+            if query:
+                text_candidates = index.match_text(query)
+                if text_candidates is not None:
+                    candidates = text_candidates if candidates is None else candidates & text_candidates
+
+            if candidates is None and not query:
+                # No filters besides importance: walk the ranking
+                selected = []
+                for neg_importance, _, _, memory_id in index.ranking:
+                    if len(selected) >= limit or -neg_importance < min_importance:
+                        break
+                    selected.append(index.entries[memory_id])
+            else:
+                pool = index.entries if candidates is None else candidates
+                matching = (
+                    memory_id for memory_id in pool
+                    if index.entries[memory_id].get("importance", 0.0) >= min_importance
+                    and (not query or query in index.entries[memory_id].get("content", "").lower())
+                )
+                selected = [index.entries[memory_id]
+                            for memory_id in heapq.nsmallest(limit, matching, key=index.rank_keys.get)]
+
+            return copy.deepcopy(selected)
+
+    def get_all(self, category: str) -> List[Dict[str, Any]]:
+        """Get all memories of a category in log order
+
+        Args:
+            category: Memory category
+
+        Returns:
+            Copies of the memory entries
+        """
+        with self._lock:
+            return copy.deepcopy(list(self._sync(category).entries.values()))
+
+    def replace(self, category: str, memories: List[Dict[str, Any]]) -> bool:
+        """Replace the contents of a category
+
+        Args:
+            category: Memory category
+            memories: Memory entries to keep
+
+        Returns:
+            True if successful, False otherwise
+        """
+        with self._lock:
+            try:
+                self._write_log(category, memories)
+            except Exception as e:
+                logger.error(f"Error rewriting memory log for {category}: {e}")
+                return False
+            self.indexes.pop(category, None)
+            self._sync(category)
+            return True
+
+    def _sync(self, category: str) -> CategoryIndex:
+        """Get a category's index, reading lines appended since the last sync
+
+        Args:
+            category: Memory category
+
+        Returns:
+            Up-to-date category index
+        """
+        log_file = self.get_log_file(category)
+        index = self.indexes.get(category)
+
+        if index is None:
+            index = CategoryIndex()
+            self.indexes[category] = index
+            if not os.path.exists(log_file):
+                self._import_legacy(category)
+
+        try:
+            size = os.path.getsize(log_file)
+        except OSError:
+            return index
+
+        if size < index.offset:
+            # The log was rewritten: rebuild the index
+            index = CategoryIndex()
+            self.indexes[category] = index
+        if size == index.offset:
+            return index
+
+        with open(log_file, 'rb') as f:
+            f.seek(index.offset)
+            data = f.read(size - index.offset)
+
+        # Leave a partially written last line for the next sync
+        complete = data.rfind(b"\n") + 1
+        for line in data[:complete].splitlines():
+            if not line.strip():
+                continue
+            try:
+                index.add(json.loads(line))
+            except json.JSONDecodeError:
+                logger.error(f"Skipping corrupt line in memory log {log_file}")
+        index.offset += complete
+
+        return index
+
+    def _import_legacy(self, category: str) -> None:
+        """Convert a category stored as a JSON array into a log"""
+        legacy_file = os.path.join(self.memory_path, f"{category}.json")
+        if not os.path.exists(legacy_file):
+            return
+
+        try:
+            with open(legacy_file, 'r') as f:
+                memories = json.load(f)
+            self._write_log(category, memories)
+            logger.info(f"Imported {len(memories)} memories from {legacy_file}")
+        except (json.JSONDecodeError, OSError) as e:
+            logger.error(f"Error importing memory file {legacy_file}: {e}")
+
+    def _write_log(self, category: str, memories: List[Dict[str, Any]]) -> None:
+        """Atomically write a category log"""
+        log_file = self.get_log_file(category)
+        temp_file = f"{log_file}.tmp"
+        with open(temp_file, 'w') as f:
+            for memory in memories:
+                f.write(json.dumps(memory) + "\n")
+        os.replace(temp_file, log_file)
+
+
+_stores: Dict[str, MemoryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_memory_store(memory_path: str) -> MemoryStore:
+    """Get the process-wide memory store for a directory
+
+    Args:
+        memory_path: Directory holding the category logs
+
+    Returns:
+        MemoryStore instance
+    """
+    memory_path = os.path.abspath(memory_path)
+    with _stores_lock:
+        if memory_path not in _stores:
+            _stores[memory_path] = MemoryStore(memory_path)
+        return _stores[memory_path]
@@ -85,43 +85,51 @@ class SDKToolProvider:
     def handle_tool_calls(self, tool_calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Handle tool calls from OpenAI assistant
         
+        Independent calls run concurrently through the registry's tool
+        executor; outputs are returned in the order of the calls.
+        
         Args:
             tool_calls: List of tool calls from OpenAI
             
         Returns:
             List of tool outputs
         """
-        tool_outputs = []
-        
+        calls = []
         for tool_call in tool_calls:
+            # Extract tool information
+            function_name = tool_call.get("function", {}).get("name")
+            arguments_str = tool_call.get("function", {}).get("arguments", "{}")
+            
+            # Parse arguments
+            try:
+                arguments = json.loads(arguments_str)
+            except json.JSONDecodeError:
+                arguments = {}
+            
+            # Log the tool call
+            logger.info(f"Tool call: {function_name} with args: {arguments}")
+            calls.append((function_name, arguments))
+        
+        # Execute the tools
+        try:
+            results = self.registry.execute_tools(calls)
+        except Exception as e:
+            logger.error(f"Error handling tool calls: {e}")
+            results = [{"error": str(e)}] * len(calls)
+        
+        tool_outputs = []
+        for tool_call, result in zip(tool_calls, results):
             try:
-                # Extract tool information
-                function_name = tool_call.get("function", {}).get("name")
-                arguments_str = tool_call.get("function", {}).get("arguments", "{}")
-                
-                # Parse arguments
-                try:
-                    arguments = json.loads(arguments_str)
-                except json.JSONDecodeError:
-                    arguments = {}
-                
-                # Log the tool call
-                logger.info(f"Tool call: {function_name} with args: {arguments}")
-                
-                # Execute the tool
-                result = self.registry.execute_tool(function_name, arguments)
-                
-                # Add to outputs
-                tool_outputs.append({
-                    "tool_call_id": tool_call.get("id"),
-                    "output": json.dumps(result)
-                })
-            except Exception as e:
+                output = json.dumps(result)
+            except (TypeError, ValueError) as e:
                 logger.error(f"Error handling tool call: {e}")
-                tool_outputs.append({
-                    "tool_call_id": tool_call.get("id"),
-                    "output": json.dumps({"error": str(e)})
-                })
+                output = json.dumps({"error": str(e)})
+            
+            # Add to outputs
+            tool_outputs.append({
+                "tool_call_id": tool_call.get("id"),
+                "output": output
+            })
         
         return tool_outputs
 
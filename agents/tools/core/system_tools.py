@@ -350,7 +350,9 @@ def register_system_tools():
     file_system_tool = FileSystemTool()
     file_system_tool.register(
         categories=["system", "file"],
-        permissions=["file_read"]
+        permissions=["file_read"],
+        cache_ttl=5,
+        cache_tags=["filesystem"]
     )
     
     process_tool = ProcessTool()
@@ -4,6 +4,10 @@ Tool Registry Package
 Provides the centralized registry for all tools in the Devloop system.
 """
 
-from .tool_registry import ToolRegistry, ToolMetadata, tool, param_description
+from .tool_registry import ToolRegistry, ToolMetadata, ToolCache, LatencyHistogram, tool, param_description
+from .tool_executor import ToolExecutor, ToolTask
 
-__all__ = ['ToolRegistry', 'ToolMetadata', 'tool', 'param_description']
\ No newline at end of file
+__all__ = [
+    'ToolRegistry', 'ToolMetadata', 'ToolCache', 'LatencyHistogram', 'tool', 'param_description',
+    'ToolExecutor', 'ToolTask'
+]
\ No newline at end of file
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Tool Executor Module
+
+Runs the tool calls of one assistant turn concurrently. Independent calls
+share a thread pool (async tools run on an event loop in their worker
+thread), each tool's timeout and concurrency limit from its ToolMetadata
+are enforced, latencies are recorded in the tool's histogram, and results
+are returned in the order of the calls.
+"""
+
+import time
+import asyncio
+import inspect
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Callable
+
+logger = logging.getLogger("tool_executor")
+
+
+@dataclass
+class ToolTask:
+    """A single tool call to execute"""
+    name: str
+    arguments: Dict[str, Any]
+    metadata: Optional[Any] = None                 # ToolMetadata supplying limits and recording stats
+    function: Optional[Callable[..., Any]] = None  # Overrides metadata.function
+
+    @property
+    def callable(self) -> Optional[Callable[..., Any]]:
+        """Function to call, if the tool could be resolved"""
+        if self.function is not None:
+            return self.function
+        return getattr(self.metadata, "function", None)
+
+    @property
+    def timeout(self) -> Optional[float]:
+        """Seconds to wait for the result (None for no limit)"""
+        return getattr(self.metadata, "timeout", None)
+
+    @property
+    def max_concurrency(self) -> Optional[int]:
+        """Maximum concurrent calls of this tool (None for no limit)"""
+        return getattr(self.metadata, "max_concurrency", None)
+
+
+class ToolExecutor:
+    """Concurrent executor for assistant tool calls"""
+
+    def __init__(self, max_workers: int = 8):
+        """Initialize the executor
+
+        Args:
+            max_workers: Size of the shared thread pool
+        """
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def execute(self, tasks: List[ToolTask]) -> List[Any]:
+        """Execute tool calls concurrently
+
+        Timeouts are measured from submission, so they include any time a
+        call waits for its tool's concurrency slot. A call that times out
+        keeps running in its worker thread, but its result is discarded.
+
+        Args:
+            tasks: Tool calls to execute
+
+        Returns:
+            Result of each call in task order; failed, unknown and timed
+            out calls yield a dictionary with an "error" key
+        """
+        results: List[Any] = [None] * len(tasks)
+        runnable = []
+        for index, task in enumerate(tasks):
+            if task.callable is None:
+                results[index] = {"error": f"Tool {task.name} not found"}
+            else:
+                runnable.append(index)
+
+        # A lone call without a timeout needs no worker thread
+        if len(runnable) == 1 and tasks[runnable[0]].timeout is None:
+            index = runnable[0]
+            results[index] = self._collect(tasks[index], lambda: self._run(tasks[index]))
+            return results
+
+        pool = self._get_pool()
+        submitted = []
+        for index in runnable:
+            submitted.append((index, pool.submit(self._run, tasks[index]), time.monotonic()))
+
+        for index, future, submitted_at in submitted:
+            task = tasks[index]
+            timeout = task.timeout
+            remaining = None if timeout is None else max(0.0, submitted_at + timeout - time.monotonic())
+            try:
+                results[index] = self._collect(task, lambda: future.result(timeout=remaining))
+            except FutureTimeoutError:
+                future.cancel()
+                if task.metadata is not None:
+                    task.metadata.record_timeout()
+                logger.warning(f"Tool {task.name} timed out after {timeout}s")
+                results[index] = {"error": f"Tool {task.name} timed out after {timeout}s"}
+
+        return results
+
+    def shutdown(self) -> None:
+        """Shut down the thread pool, if one was started"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def _collect(self, task: ToolTask, get_result: Callable[[], Any]) -> Any:
+        """Get a call's result, turning tool errors into error dictionaries"""
+        try:
+            return get_result()
+        except FutureTimeoutError:
+            raise
+        except Exception as e:
+            logger.error(f"Error executing tool {task.name}: {e}")
+            return {"error": str(e)}
+
+    def _run(self, task: ToolTask) -> Any:
+        """Run one call in the current thread under its tool's concurrency limit"""
+        semaphore = self._get_semaphore(task.name, task.max_concurrency)
+        if semaphore is not None:
+            semaphore.acquire()
+        try:
+            if task.metadata is not None:
+                task.metadata.increment_count()
+
+            start = time.perf_counter()
+            try:
+                result = task.callable(**task.arguments)
+                if inspect.isawaitable(result):
+                    result = asyncio.run(self._await(result))
+                return result
+            finally:
+                if task.metadata is not None:
+                    task.metadata.record_latency(time.perf_counter() - start)
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    @staticmethod
+    async def _await(awaitable: Any) -> Any:
+        """Await an async tool's result on the worker thread's event loop"""
+        return await awaitable
+
+    def _get_semaphore(self, tool_name: str, max_concurrency: Optional[int]) -> Optional[threading.BoundedSemaphore]:
+        """Get the semaphore limiting concurrent calls of a tool"""
+        if not max_concurrency:
+            return None
+        with self._lock:
+            semaphore = self._semaphores.get(tool_name)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(max_concurrency)
+                self._semaphores[tool_name] = semaphore
+            return semaphore
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Get the thread pool, creating it on first use"""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="tool")
+            return self._pool
@@ -7,11 +7,16 @@ Tools are exposed to OpenAI Assistants via the function calling mechanism.
 """
 
 import os
+import copy
 import json
+import time
 import uuid
+import bisect
 import inspect
 import logging
-from typing import Dict, List, Any, Optional, Union, Callable, TypeVar, Generic, Set
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Union, Callable, TypeVar, Generic, Set, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +29,183 @@ logger = logging.getLogger("tool_registry")
 ToolFunc = Callable[..., Any]
 T = TypeVar('T')
 
+# Upper bounds (in milliseconds) of the latency histogram buckets; slower
+# calls fall into a final overflow bucket
+LATENCY_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of tool call latencies"""
+    
+    def __init__(self, bounds_ms: List[float] = None):
+        """Initialize the histogram
+        
+        Args:
+            bounds_ms: Ascending bucket upper bounds in milliseconds
+        """
+        self.bounds_ms = list(bounds_ms or LATENCY_BUCKETS_MS)
+        self.counts = [0] * (len(self.bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._lock = threading.Lock()
+        
+    def record(self, seconds: float) -> None:
+        """Record one call latency
+        
+        Args:
+            seconds: Call duration in seconds
+        """
+        ms = seconds * 1000
+        with self._lock:
+            self.counts[bisect.bisect_left(self.bounds_ms, ms)] += 1
+            self.count += 1
+            self.total_ms += ms
+            self.max_ms = max(self.max_ms, ms)
+    
+    def percentile(self, p: float) -> float:
+        """Estimate a latency percentile from the bucket upper bounds
+        
+        Args:
+            p: Percentile between 0 and 100
+            
+        Returns:
+            Upper bound in milliseconds of the bucket holding the percentile
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, p / 100 * self.count)
+            seen = 0
+            for bound, bucket_count in zip(self.bounds_ms + [self.max_ms], self.counts):
+                seen += bucket_count
+                if seen >= rank:
+                    return min(bound, self.max_ms)
+            return self.max_ms
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the histogram to a dictionary
+        
+        Returns:
+            Dictionary with bucket counts and summary statistics
+        """
+        with self._lock:
+            buckets = {f"le_{bound:g}ms": count for bound, count in zip(self.bounds_ms, self.counts)}
+            buckets["overflow"] = self.counts[-1]
+            count, total_ms, max_ms = self.count, self.total_ms, self.max_ms
+        return {
+            "count": count,
+            "mean_ms": total_ms / count if count else 0.0,
+            "max_ms": max_ms,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "buckets": buckets
+        }
+
+
+class ToolCache:
+    """Bounded LRU cache of tool results
+    
+    Entries are keyed by tool name and normalized arguments, expire after
+    their tool's TTL and carry invalidation tags. Invalidating a tag drops
+    every entry carrying it; results computed while an invalidation happened
+    are not stored, so a slow read cannot bring back stale data.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        """Initialize the cache
+        
+        Args:
+            max_entries: Maximum number of cached results
+        """
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self.evictions = 0
+        self.version = 0
+        self._lock = threading.Lock()
+    
+    def get(self, tool_name: str, key: str) -> Tuple[bool, Any]:
+        """Get a cached result
+        
+        Args:
+            tool_name: Name of the tool
+            key: Normalized arguments key
+            
+        Returns:
+            Tuple of (hit, copy of the cached result)
+        """
+        with self._lock:
+            entry = self.entries.get((tool_name, key))
+            if entry is None:
+                return False, None
+            if entry["expires_at"] <= time.monotonic():
+                del self.entries[(tool_name, key)]
+                return False, None
+            self.entries.move_to_end((tool_name, key))
+            value = entry["value"]
+        return True, copy.deepcopy(value)
+    
+    def put(self, tool_name: str, key: str, value: Any, ttl: float,
+            tags: List[str] = None, version: Optional[int] = None) -> bool:
+        """Store a result
+        
+        Args:
+            tool_name: Name of the tool
+            key: Normalized arguments key
+            value: Result to cache
+            ttl: Seconds the result stays valid
+            tags: Invalidation tags of the result
+            version: Cache version read before the result was computed;
+                the result is dropped if an invalidation happened since
+            
+        Returns:
+            True if the result was stored
+        """
+        value = copy.deepcopy(value)
+        with self._lock:
+            if version is not None and version != self.version:
+                return False
+            self.entries[(tool_name, key)] = {
+                "value": value,
+                "expires_at": time.monotonic() + ttl,
+                "tags": set(tags or [])
+            }
+            self.entries.move_to_end((tool_name, key))
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return True
+    
+    def invalidate(self, tags: List[str] = None, tool_name: str = None) -> int:
+        """Drop cached results by tag and/or tool
+        
+        Args:
+            tags: Drop entries carrying any of these tags
+            tool_name: Drop entries of this tool
+            
+        Returns:
+            Number of entries dropped
+        """
+        tags = set(tags or [])
+        with self._lock:
+            self.version += 1
+            stale = [
+                entry_key for entry_key, entry in self.entries.items()
+                if (tool_name and entry_key[0] == tool_name) or (tags & entry["tags"])
+            ]
+            for entry_key in stale:
+                del self.entries[entry_key]
+        return len(stale)
+    
+    def clear(self) -> None:
+        """Drop all cached results"""
+        with self._lock:
+            self.version += 1
+            self.entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
 class ToolMetadata:
     """Metadata for a registered tool"""
     
@@ -36,7 +218,13 @@ class ToolMetadata:
                  required_permissions: List[str] = None,
                  version: str = "1.0.0",
                  author: str = "Devloop System",
-                 is_local_only: bool = False):
+                 is_local_only: bool = False,
+                 timeout: Optional[float] = None,
+                 max_concurrency: Optional[int] = None,
+                 cache_ttl: Optional[float] = None,
+                 cache_key: List[str] = None,
+                 cache_tags: List[str] = None,
+                 invalidates: List[str] = None):
         """Initialize tool metadata
         
         Args:
@@ -49,6 +237,12 @@ class ToolMetadata:
             version: Tool version
             author: Tool author/owner
             is_local_only: Whether this tool can only be called locally
+            timeout: Seconds a call may take before its result is abandoned (None for no limit)
+            max_concurrency: Maximum number of concurrent calls of this tool (None for no limit)
+            cache_ttl: Seconds results are served from the registry cache (None to disable caching)
+            cache_key: Arguments that identify a result (None for all arguments)
+            cache_tags: Invalidation tags of cached results; "{arg}" placeholders are filled from the call
+            invalidates: Tags whose cached results are dropped after each call of this tool
         """
         self.id = str(uuid.uuid4())
         self.name = name
@@ -60,7 +254,18 @@ class ToolMetadata:
         self.version = version
         self.author = author
         self.is_local_only = is_local_only
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.cache_ttl = cache_ttl
+        self.cache_key = cache_key
+        self.cache_tags = cache_tags or []
+        self.invalidates = invalidates or []
         self.invocation_count = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.timeout_count = 0
+        self.latency = LatencyHistogram()
+        self._count_lock = threading.Lock()
         
     def to_openai_format(self) -> Dict[str, Any]:
         """Convert tool metadata to OpenAI format
@@ -93,12 +298,110 @@ class ToolMetadata:
             "version": self.version,
             "author": self.author,
             "is_local_only": self.is_local_only,
-            "invocation_count": self.invocation_count
+            "timeout": self.timeout,
+            "max_concurrency": self.max_concurrency,
+            "invocation_count": self.invocation_count,
+            "timeout_count": self.timeout_count,
+            "latency": self.latency.to_dict(),
+            "cache": self.cache_stats()
         }
         
     def increment_count(self) -> None:
         """Increment the invocation count"""
-        self.invocation_count += 1
+        with self._count_lock:
+            self.invocation_count += 1
+    
+    def record_latency(self, seconds: float) -> None:
+        """Record the duration of a call in the latency histogram
+        
+        Args:
+            seconds: Call duration in seconds
+        """
+        self.latency.record(seconds)
+    
+    def record_timeout(self) -> None:
+        """Count a call whose result was abandoned after the timeout"""
+        with self._count_lock:
+            self.timeout_count += 1
+    
+    @property
+    def cacheable(self) -> bool:
+        """Whether results of this tool may be served from the cache"""
+        return bool(self.cache_ttl)
+    
+    def record_cache_lookup(self, hit: bool) -> None:
+        """Count a cache hit or miss
+        
+        Args:
+            hit: Whether the result was served from the cache
+        """
+        with self._count_lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get the cache statistics of this tool
+        
+        Returns:
+            Dictionary with cache settings, hits, misses and hit rate
+        """
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "enabled": self.cacheable,
+            "ttl": self.cache_ttl,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0
+        }
+    
+    def cache_key_for(self, arguments: Dict[str, Any]) -> Optional[str]:
+        """Build the normalized cache key of a call
+        
+        Defaults are applied so equivalent calls share a key, and keyword
+        order does not matter.
+        
+        Args:
+            arguments: Call arguments
+            
+        Returns:
+            Cache key, or None if the arguments do not fit the tool's signature
+        """
+        bound = self._bind_arguments(arguments)
+        if bound is None:
+            return None
+        if self.cache_key:
+            bound = {name: bound.get(name) for name in self.cache_key}
+        return json.dumps(bound, sort_keys=True, default=str)
+    
+    def resolve_tags(self, tags: List[str], arguments: Dict[str, Any]) -> List[str]:
+        """Fill "{arg}" placeholders of tags from call arguments
+        
+        Args:
+            tags: Tag templates
+            arguments: Call arguments
+            
+        Returns:
+            Resolved tags; tags with unknown placeholders are kept as written
+        """
+        bound = self._bind_arguments(arguments) or arguments
+        resolved = []
+        for tag in tags:
+            try:
+                resolved.append(tag.format(**bound))
+            except (KeyError, IndexError, ValueError):
+                resolved.append(tag)
+        return resolved
+    
+    def _bind_arguments(self, arguments: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Bind call arguments to the function signature with defaults applied"""
+        try:
+            bound = inspect.signature(self.function).bind(**arguments)
+        except (TypeError, ValueError):
+            return None
+        bound.apply_defaults()
+        return dict(bound.arguments)
 
 
 class ToolRegistry:
@@ -121,6 +424,8 @@ class ToolRegistry:
         self.tools: Dict[str, ToolMetadata] = {}
         self.categories: Dict[str, Set[str]] = {}
         self.permission_index: Dict[str, Set[str]] = {}
+        self.executor = None
+        self.cache = ToolCache()
         self._initialized = True
         logger.info("Tool registry initialized")
     
@@ -294,21 +599,146 @@ class ToolRegistry:
             logger.error(f"Tool {tool_name} not found for execution")
             return {"error": f"Tool {tool_name} not found"}
             
-        try:
-            # Increment invocation count
-            tool.increment_count()
+        # Serve repeated calls of cacheable tools from the cache
+        hit, cached, cache_key, version = self._cache_lookup(tool, arguments)
+        if hit:
+            return cached
             
+        # Increment invocation count
+        tool.increment_count()
+        
+        start = time.perf_counter()
+        try:
             # Execute the function
             result = tool.function(**arguments)
             
             # Ensure the result is JSON serializable
-            if isinstance(result, dict):
-                return result
-            else:
-                return {"result": result}
+            if not isinstance(result, dict):
+                result = {"result": result}
         except Exception as e:
             logger.error(f"Error executing tool {tool_name}: {e}")
-            return {"error": str(e)}
+            result = {"error": str(e)}
+        finally:
+            tool.record_latency(time.perf_counter() - start)
+        
+        self._cache_store(tool, arguments, cache_key, version, result)
+        return result
+    
+    def execute_tools(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Execute several registered tools concurrently
+        
+        Calls run on the registry's ToolExecutor under the timeout and
+        concurrency limit of each tool's metadata.
+        
+        Args:
+            calls: List of (tool name, arguments) pairs
+            
+        Returns:
+            Tool execution results, in the order of the calls
+        """
+        from .tool_executor import ToolExecutor, ToolTask
+        
+        if self.executor is None:
+            self.executor = ToolExecutor()
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(calls)
+        pending = []
+        for index, (tool_name, arguments) in enumerate(calls):
+            tool = self.get_tool(tool_name)
+            if not tool:
+                logger.error(f"Tool {tool_name} not found for execution")
+            
+            # Serve repeated calls of cacheable tools from the cache
+            hit, cached, cache_key, version = self._cache_lookup(tool, arguments)
+            if hit:
+                results[index] = cached
+            else:
+                pending.append((index, tool, arguments, cache_key, version))
+        
+        tasks = [ToolTask(name=calls[index][0], arguments=arguments, metadata=tool)
+                 for index, tool, arguments, _, _ in pending]
+        for (index, tool, arguments, cache_key, version), result in zip(pending, self.executor.execute(tasks)):
+            # Ensure every result is JSON serializable
+            if not isinstance(result, dict):
+                result = {"result": result}
+            self._cache_store(tool, arguments, cache_key, version, result)
+            results[index] = result
+        
+        return results
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get statistics of the tool result cache
+        
+        Returns:
+            Dictionary with cache size, evictions and per-tool hit rates
+        """
+        return {
+            "entries": len(self.cache),
+            "max_entries": self.cache.max_entries,
+            "evictions": self.cache.evictions,
+            "tools": {name: tool.cache_stats() for name, tool in self.tools.items() if tool.cacheable}
+        }
+    
+    def invalidate_cache(self, tags: List[str] = None, tool_name: str = None) -> int:
+        """Drop cached tool results
+        
+        Args:
+            tags: Drop results carrying any of these tags
+            tool_name: Drop results of this tool
+            
+        Returns:
+            Number of results dropped
+        """
+        if not tags and not tool_name:
+            count = len(self.cache)
+            self.cache.clear()
+            return count
+        return self.cache.invalidate(tags=tags, tool_name=tool_name)
+    
+    def _cache_lookup(self, tool: Optional[ToolMetadata],
+                      arguments: Dict[str, Any]) -> Tuple[bool, Any, Optional[str], Optional[int]]:
+        """Look up a call in the result cache
+        
+        Args:
+            tool: Metadata of the called tool
+            arguments: Call arguments
+            
+        Returns:
+            Tuple of (hit, cached result, cache key, cache version before the call)
+        """
+        if not tool or not tool.cacheable:
+            return False, None, None, None
+        
+        cache_key = tool.cache_key_for(arguments)
+        if cache_key is None:
+            return False, None, None, None
+        
+        version = self.cache.version
+        hit, cached = self.cache.get(tool.name, cache_key)
+        tool.record_cache_lookup(hit)
+        return hit, cached, cache_key, version
+    
+    def _cache_store(self, tool: Optional[ToolMetadata], arguments: Dict[str, Any],
+                     cache_key: Optional[str], version: Optional[int], result: Dict[str, Any]) -> None:
+        """Cache a call result and apply the tool's invalidations
+        
+        Args:
+            tool: Metadata of the called tool
+            arguments: Call arguments
+            cache_key: Cache key from the lookup (None if not cacheable)
+            version: Cache version read before the call
+            result: Call result
+        """
+        if not tool:
+            return
+        
+        if tool.invalidates:
+            self.cache.invalidate(tags=tool.resolve_tags(tool.invalidates, arguments))
+        
+        # Errors are not cached so failing calls are retried
+        if cache_key is not None and "error" not in result:
+            self.cache.put(tool.name, cache_key, result, tool.cache_ttl,
+                           tags=tool.resolve_tags(tool.cache_tags, arguments), version=version)
     
     def _create_metadata_from_function(self, func: ToolFunc) -> Optional[ToolMetadata]:
         """Create tool metadata from a function
@@ -330,6 +760,12 @@ class ToolRegistry:
             is_local_only = False
             version = "1.0.0"
             author = "Devloop System"
+            timeout = getattr(func, "_tool_timeout", None)
+            max_concurrency = getattr(func, "_tool_max_concurrency", None)
+            cache_ttl = getattr(func, "_tool_cache_ttl", None)
+            cache_key = getattr(func, "_tool_cache_key", None)
+            cache_tags = getattr(func, "_tool_cache_tags", None)
+            invalidates = getattr(func, "_tool_invalidates", None)
             
             # Extract tool decorators if available
             if hasattr(func, "_tool_categories"):
@@ -360,7 +796,13 @@ class ToolRegistry:
                 required_permissions=required_permissions,
                 version=version,
                 author=author,
-                is_local_only=is_local_only
+                is_local_only=is_local_only,
+                timeout=timeout,
+                max_concurrency=max_concurrency,
+                cache_ttl=cache_ttl,
+                cache_key=cache_key,
+                cache_tags=cache_tags,
+                invalidates=invalidates
             )
         except Exception as e:
             logger.error(f"Error creating metadata for function {func.__name__}: {e}")
@@ -431,7 +873,13 @@ def tool(name: str = None, description: str = None,
          permissions: List[str] = None,
          local_only: bool = False,
          version: str = "1.0.0",
-         author: str = "Devloop System"):
+         author: str = "Devloop System",
+         timeout: float = None,
+         max_concurrency: int = None,
+         cache_ttl: float = None,
+         cache_key: List[str] = None,
+         cache_tags: List[str] = None,
+         invalidates: List[str] = None):
     """Decorator to register a function as a tool
     
     Args:
@@ -442,6 +890,12 @@ def tool(name: str = None, description: str = None,
         local_only: Whether tool is local-only
         version: Tool version
         author: Tool author/owner
+        timeout: Seconds a call may take before its result is abandoned
+        max_concurrency: Maximum number of concurrent calls of the tool
+        cache_ttl: Seconds repeated calls are served from the registry cache
+        cache_key: Arguments that identify a result (defaults to all arguments)
+        cache_tags: Invalidation tags of cached results, e.g. "memory:{category}"
+        invalidates: Tags whose cached results are dropped after each call
         
     Returns:
         Decorated function
@@ -468,6 +922,24 @@ def tool(name: str = None, description: str = None,
             
         if author:
             func._tool_author = author
+            
+        if timeout:
+            func._tool_timeout = timeout
+            
+        if max_concurrency:
+            func._tool_max_concurrency = max_concurrency
+            
+        if cache_ttl:
+            func._tool_cache_ttl = cache_ttl
+            
+        if cache_key:
+            func._tool_cache_key = cache_key
+            
+        if cache_tags:
+            func._tool_cache_tags = cache_tags
+            
+        if invalidates:
+            func._tool_invalidates = invalidates
         
         # Register with the registry
         registry = ToolRegistry()
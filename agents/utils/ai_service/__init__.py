@@ -1,5 +1,6 @@
 # AI Service Module
 
 from .core import AIService
+from .llm_client import AsyncLLMClient, get_llm_client
 
-__all__ = ['AIService']
\ No newline at end of file
+__all__ = ['AIService', 'AsyncLLMClient', 'get_llm_client']
\ No newline at end of file
@@ -10,9 +10,15 @@ import os
 import sys
 import json
 import time
+import asyncio
 import logging
 from typing import Dict, List, Any, Optional, Union
 
+try:
+    from .llm_client import get_llm_client, run_sync, HTTPX_AVAILABLE
+except ImportError:
+    from llm_client import get_llm_client, run_sync, HTTPX_AVAILABLE
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,18 +29,29 @@ logger = logging.getLogger("ai_service")
 class ClaudeClient:
     """Client for Claude API interactions"""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-sonnet-20240229"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-sonnet-20240229",
+                 base_url: Optional[str] = None):
         """Initialize the Claude client
         
         Args:
             api_key: Anthropic API key (defaults to environment variable)
             model: Model to use for completions
+            base_url: Optional API base URL
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self.model = model
+        self.client = None
+        self.llm_client = None
         
         if not self.api_key:
             logger.warning("No API key provided. Functionality will be limited.")
+        
+        # Share the process-wide connection pool and rate limits if possible
+        if HTTPX_AVAILABLE:
+            self.llm_client = get_llm_client(self.api_key, base_url)
+            self.anthropic_available = True
+            logger.info(f"Shared LLM client initialized with model {model}")
+            return
             
         # Import Anthropic client if available
         try:
@@ -67,6 +84,11 @@ class ClaudeClient:
             return self._mock_completion(prompt)
         
         try:
+            if self.llm_client:
+                return run_sync(self.llm_client.complete(
+                    prompt, self.model, system_prompt, max_tokens, temperature
+                ))
+            
             # Prepare messages
             messages = [{"role": "user", "content": prompt}]
             
@@ -85,6 +107,75 @@ class ClaudeClient:
             logger.error(f"Error calling Claude API: {e}")
             return f"Error: {str(e)}"
     
+    async def complete_async(self, prompt: str,
+                             system_prompt: Optional[str] = None,
+                             max_tokens: int = 1000,
+                             temperature: float = 0.7) -> str:
+        """Generate a completion from Claude without blocking the event loop
+        
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            
+        Returns:
+            Generated text from Claude
+        """
+        if not self.llm_client or not self.api_key:
+            return await asyncio.to_thread(self.complete, prompt, system_prompt, max_tokens, temperature)
+        
+        try:
+            return await self.llm_client.complete(prompt, self.model, system_prompt, max_tokens, temperature)
+        except Exception as e:
+            logger.error(f"Error calling Claude API: {e}")
+            return f"Error: {str(e)}"
+    
+    def complete_batch(self, prompts: List[str],
+                       system_prompt: Optional[str] = None,
+                       max_tokens: int = 1000,
+                       temperature: float = 0.7,
+                       use_batch_api: bool = False,
+                       poll_interval: float = 30.0) -> List[str]:
+        """Generate completions for several prompts
+        
+        Args:
+            prompts: The user prompts
+            system_prompt: Optional system prompt shared by the prompts
+            max_tokens: Maximum tokens to generate per prompt
+            temperature: Sampling temperature
+            use_batch_api: Submit through the Message Batches API (for offline
+                jobs) instead of sending concurrent requests
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            Generated text from Claude for each prompt in order
+        """
+        if not self.llm_client or not self.api_key:
+            return [self.complete(prompt, system_prompt, max_tokens, temperature) for prompt in prompts]
+        
+        requests = [
+            {"prompt": prompt, "model": self.model, "system_prompt": system_prompt,
+             "max_tokens": max_tokens, "temperature": temperature}
+            for prompt in prompts
+        ]
+        try:
+            if use_batch_api:
+                completions = run_sync(self.llm_client.complete_batch(requests, poll_interval=poll_interval))
+            else:
+                completions = run_sync(self.llm_client.complete_many(requests))
+        except Exception as e:
+            logger.error(f"Error calling Claude API: {e}")
+            return [f"Error: {str(e)}"] * len(prompts)
+        
+        results = []
+        for completion in completions:
+            if isinstance(completion, Exception):
+                logger.error(f"Error calling Claude API: {completion}")
+                completion = f"Error: {str(completion)}"
+            results.append(completion)
+        return results
+    
     def _mock_completion(self, prompt: str) -> str:
         """Generate a mock completion for testing
         
@@ -329,6 +420,39 @@ class AIService:
             "timestamp": time.time()
         }
     
+    def generate_responses(self, prompts: List[str],
+                         system_prompt: Optional[str] = None,
+                         max_tokens: int = 1000,
+                         temperature: float = 0.7,
+                         use_batch_api: bool = False) -> List[Dict[str, Any]]:
+        """Generate independent responses for several prompts
+        
+        The prompts are sent concurrently (or as one message batch) and do
+        not use or change the conversation context.
+        
+        Args:
+            prompts: Prompts to respond to
+            system_prompt: Optional system prompt shared by the prompts
+            max_tokens: Maximum tokens to generate per prompt
+            temperature: Sampling temperature
+            use_batch_api: Submit through the Message Batches API (for offline jobs)
+            
+        Returns:
+            Response data for each prompt in order
+        """
+        texts = self.claude_client.complete_batch(
+            prompts,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            use_batch_api=use_batch_api
+        )
+        
+        return [
+            {"text": text, "model": self.claude_client.model, "timestamp": time.time()}
+            for text in texts
+        ]
+    
     def analyze_system(self, system_data: Dict[str, Any], 
                      analysis_type: str = "health",
                      template_content: Optional[str] = None) -> Dict[str, Any]:
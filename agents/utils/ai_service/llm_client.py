@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+LLM Client Module
+
+Provides the process-wide asynchronous client that AI service components use
+to call the Anthropic Messages API. Components share one pool of keep-alive
+connections per event loop, requests are throttled by per-model token buckets
+and failed requests are retried with jittered exponential backoff. Offline
+jobs can submit their requests through the Message Batches API instead.
+
+Synchronous callers run requests on a shared background event loop, so they
+share its connection pool as well.
+"""
+
+import os
+import json
+import time
+import random
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Dict, List, Any, Optional, Tuple, Coroutine
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger("llm_client")
+
+ANTHROPIC_API_URL = "https://api.anthropic.com"
+ANTHROPIC_VERSION = "2023-06-01"
+
+# Throttling, overload and transient server errors are worth retrying
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+DEFAULT_RATE_LIMITS = {
+    "requests_per_minute": 50,
+    "tokens_per_minute": 40000
+}
+
+
+class LLMRequestError(Exception):
+    """Raised when an LLM API request fails"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        """Initialize the error
+
+        Args:
+            message: Error message
+            status_code: HTTP status code of the failed response, if any
+        """
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class TokenBucket:
+    """Token bucket rate limiter shared by all event loops of the process"""
+
+    def __init__(self, rate: float, capacity: float):
+        """Initialize a full bucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens in the bucket
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take tokens from the bucket, borrowing against future refills
+
+        Callers are served in the order they reserve. A request for more
+        than the capacity waits for a full bucket.
+
+        Args:
+            amount: Number of tokens to take
+
+        Returns:
+            Seconds to wait before the tokens are available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= min(amount, self.capacity)
+            return max(0.0, -self.tokens / self.rate)
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Wait until tokens are available and take them
+
+        Args:
+            amount: Number of tokens to take
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class AsyncLLMClient:
+    """Pooled, rate-limited asynchronous client for the Anthropic Messages API"""
+
+    def __init__(self, api_key: Optional[str] = None,
+                 base_url: Optional[str] = None,
+                 max_connections: int = 20,
+                 max_keepalive_connections: int = 10,
+                 timeout: float = 120.0,
+                 max_retries: int = 4,
+                 retry_base_delay: float = 0.5,
+                 retry_max_delay: float = 30.0,
+                 rate_limits: Optional[Dict[str, Dict[str, float]]] = None):
+        """Initialize the client
+
+        Args:
+            api_key: Anthropic API key (defaults to environment variable)
+            base_url: API base URL (defaults to ANTHROPIC_BASE_URL or the public API)
+            max_connections: Maximum open connections per event loop
+            max_keepalive_connections: Maximum idle connections kept alive per event loop
+            timeout: Request timeout in seconds
+            max_retries: Maximum retries of a failed request
+            retry_base_delay: Backoff ceiling of the first retry in seconds
+            retry_max_delay: Maximum backoff in seconds
+            rate_limits: Limits by model name ("default" for other models), each
+                with "requests_per_minute" and "tokens_per_minute"
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required for the LLM client. Install with: pip install httpx")
+
+        self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+        self.base_url = (base_url or os.environ.get("ANTHROPIC_BASE_URL") or ANTHROPIC_API_URL).rstrip("/")
+        self.limits = httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_keepalive_connections)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.rate_limits = {"default": dict(DEFAULT_RATE_LIMITS)}
+        self.rate_limits.update(rate_limits or {})
+
+        # httpx clients are bound to the event loop they were created on
+        self._http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = \
+            weakref.WeakKeyDictionary()
+        self._buckets: Dict[str, Tuple[TokenBucket, TokenBucket]] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "retries": 0,
+            "errors": 0,
+            "throttled_seconds": 0.0,
+            "batches": 0
+        }
+
+    def _get_http_client(self) -> "httpx.AsyncClient":
+        """Get the connection pool of the running event loop"""
+        loop = asyncio.get_running_loop()
+        client = self._http_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={
+                    "x-api-key": self.api_key or "",
+                    "anthropic-version": ANTHROPIC_VERSION,
+                    "content-type": "application/json"
+                },
+                timeout=self.timeout,
+                limits=self.limits
+            )
+            self._http_clients[loop] = client
+        return client
+
+    def _get_buckets(self, model: str) -> Tuple[TokenBucket, TokenBucket]:
+        """Get the request and token buckets of a model"""
+        with self._lock:
+            if model not in self._buckets:
+                limits = {**self.rate_limits["default"], **self.rate_limits.get(model, {})}
+                requests_per_minute = limits["requests_per_minute"]
+                tokens_per_minute = limits["tokens_per_minute"]
+                self._buckets[model] = (
+                    TokenBucket(requests_per_minute / 60.0, requests_per_minute),
+                    TokenBucket(tokens_per_minute / 60.0, tokens_per_minute)
+                )
+            return self._buckets[model]
+
+    async def _throttle(self, model: str, body: Dict[str, Any]) -> None:
+        """Wait for the rate limits of a model to admit a request"""
+        # Estimate input tokens at 4 characters per token, plus the output allowance
+        characters = len(str(body.get("system") or "")) + sum(
+            len(str(message.get("content", ""))) for message in body.get("messages", [])
+        )
+        tokens = characters / 4 + body.get("max_tokens", 0)
+
+        request_bucket, token_bucket = self._get_buckets(model)
+        waited = await request_bucket.acquire(1)
+        waited += await token_bucket.acquire(tokens)
+        if waited:
+            self.stats["throttled_seconds"] += waited
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Get the delay before a retry
+
+        Args:
+            attempt: Number of the failed attempt, starting at 0
+            retry_after: Retry-After header of the failed response
+
+        Returns:
+            Delay in seconds: full jitter over an exponential ceiling, but no
+            less than the server asked for
+        """
+        delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * (2 ** attempt)))
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), self.retry_max_delay))
+            except ValueError:
+                pass
+        return delay
+
+    async def _request(self, method: str, url: str, json_body: Optional[Dict[str, Any]] = None) -> "httpx.Response":
+        """Send a request, retrying throttled and transient failures
+
+        Args:
+            method: HTTP method
+            url: Path relative to the base URL, or an absolute URL
+            json_body: Optional JSON request body
+
+        Returns:
+            Successful HTTP response
+
+        Raises:
+            LLMRequestError: If the request fails or retries are exhausted
+        """
+        client = self._get_http_client()
+
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            self.stats["requests"] += 1
+            try:
+                response = await client.request(method, url, json=json_body)
+            except httpx.TransportError as e:
+                error = LLMRequestError(f"{method} {url} failed: {e}")
+            else:
+                if response.status_code < 400:
+                    return response
+                error = LLMRequestError(
+                    f"{method} {url} returned {response.status_code}: {response.text[:200]}",
+                    response.status_code
+                )
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    self.stats["errors"] += 1
+                    raise error
+                retry_after = response.headers.get("retry-after")
+
+            if attempt == self.max_retries:
+                self.stats["errors"] += 1
+                raise error
+
+            delay = self._backoff_delay(attempt, retry_after)
+            logger.warning(f"{error}; retrying in {delay:.2f}s")
+            self.stats["retries"] += 1
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _message_params(prompt: str, model: str, system_prompt: Optional[str] = None,
+                        max_tokens: int = 1000, temperature: float = 0.7) -> Dict[str, Any]:
+        """Build the parameters of a single-turn Messages API request"""
+        params = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": prompt}]
+        }
+        if system_prompt:
+            params["system"] = system_prompt
+        return params
+
+    @staticmethod
+    def _message_text(message: Dict[str, Any]) -> str:
+        """Get the text of a Messages API response"""
+        return "".join(block.get("text", "") for block in message.get("content", [])
+                       if block.get("type") == "text")
+
+    async def create_message(self, **params) -> Dict[str, Any]:
+        """Create a message
+
+        Args:
+            **params: Messages API parameters (model, messages, max_tokens, ...)
+
+        Returns:
+            Messages API response
+        """
+        await self._throttle(params["model"], params)
+        response = await self._request("POST", "/v1/messages", params)
+        return response.json()
+
+    async def complete(self, prompt: str, model: str,
+                       system_prompt: Optional[str] = None,
+                       max_tokens: int = 1000,
+                       temperature: float = 0.7) -> str:
+        """Generate a completion
+
+        Args:
+            prompt: The user prompt
+            model: Model to use
+            system_prompt: Optional system prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+
+        Returns:
+            Generated text
+        """
+        message = await self.create_message(**self._message_params(
+            prompt, model, system_prompt, max_tokens, temperature
+        ))
+        return self._message_text(message)
+
+    async def complete_many(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """Generate completions concurrently
+
+        Args:
+            requests: Keyword arguments of complete for each completion
+
+        Returns:
+            Generated text, or the raised exception, for each request in order
+        """
+        return await asyncio.gather(*(self.complete(**request) for request in requests),
+                                    return_exceptions=True)
+
+    async def submit_batch(self, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Submit completions to the Message Batches API
+
+        Args:
+            requests: Keyword arguments of complete for each completion
+
+        Returns:
+            Message batch; results are identified by "request-<index>"
+        """
+        body = {"requests": [
+            {"custom_id": f"request-{index}", "params": self._message_params(**request)}
+            for index, request in enumerate(requests)
+        ]}
+        response = await self._request("POST", "/v1/messages/batches", body)
+        self.stats["batches"] += 1
+        return response.json()
+
+    async def get_batch(self, batch_id: str) -> Dict[str, Any]:
+        """Get the status of a message batch
+
+        Args:
+            batch_id: Message batch ID
+
+        Returns:
+            Message batch
+        """
+        response = await self._request("GET", f"/v1/messages/batches/{batch_id}")
+        return response.json()
+
+    async def get_batch_results(self, batch: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Download the results of an ended message batch
+
+        Args:
+            batch: Message batch with a results URL
+
+        Returns:
+            Result by custom ID
+        """
+        response = await self._request("GET", batch["results_url"])
+        results = {}
+        for line in response.text.splitlines():
+            if line.strip():
+                entry = json.loads(line)
+                results[entry["custom_id"]] = entry["result"]
+        return results
+
+    async def complete_batch(self, requests: List[Dict[str, Any]],
+                             poll_interval: float = 30.0,
+                             timeout: float = 24 * 60 * 60) -> List[Any]:
+        """Generate completions through the Message Batches API
+
+        Batches cost less than individual requests but can take up to a day,
+        so this suits offline jobs.
+
+        Args:
+            requests: Keyword arguments of complete for each completion
+            poll_interval: Seconds between status checks
+            timeout: Seconds to wait for the batch to end
+
+        Returns:
+            Generated text, or an LLMRequestError, for each request in order
+        """
+        if not requests:
+            return []
+
+        batch = await self.submit_batch(requests)
+        deadline = time.monotonic() + timeout
+        while batch.get("processing_status") != "ended":
+            if time.monotonic() >= deadline:
+                raise LLMRequestError(f"Message batch {batch['id']} did not end within {timeout}s")
+            await asyncio.sleep(poll_interval)
+            batch = await self.get_batch(batch["id"])
+
+        results = await self.get_batch_results(batch)
+        completions = []
+        for index in range(len(requests)):
+            result = results.get(f"request-{index}", {"type": "missing"})
+            if result.get("type") == "succeeded":
+                completions.append(self._message_text(result["message"]))
+            else:
+                detail = result.get("error", {}).get("message", result.get("type"))
+                completions.append(LLMRequestError(f"Batch request {index} failed: {detail}"))
+        return completions
+
+    async def aclose(self) -> None:
+        """Close the connection pool of the running event loop"""
+        client = self._http_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_clients: Dict[Tuple[Optional[str], Optional[str]], AsyncLLMClient] = {}
+_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop that runs requests of synchronous callers"""
+    global _background_loop
+    with _lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(target=_background_loop.run_forever, name="llm-client-loop", daemon=True).start()
+        return _background_loop
+
+
+def run_sync(coroutine: Coroutine) -> Any:
+    """Run a coroutine on the shared background event loop and wait for it
+
+    Args:
+        coroutine: Coroutine using an AsyncLLMClient
+
+    Returns:
+        Result of the coroutine
+    """
+    loop = _get_background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coroutine.close()
+        raise RuntimeError("run_sync cannot be called from the LLM client's own event loop")
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+
+def get_llm_client(api_key: Optional[str] = None, base_url: Optional[str] = None,
+                   **config) -> AsyncLLMClient:
+    """Get the process-wide LLM client for an API key and base URL
+
+    Args:
+        api_key: Anthropic API key (defaults to environment variable)
+        base_url: API base URL
+        **config: AsyncLLMClient settings, used when the client is created
+
+    Returns:
+        AsyncLLMClient instance
+    """
+    api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+    key = (api_key, base_url)
+    with _lock:
+        if key not in _clients:
+            _clients[key] = AsyncLLMClient(api_key, base_url, **config)
+        return _clients[key]
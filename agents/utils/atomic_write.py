@@ -0,0 +1,71 @@
+"""
+Atomic File Writes
+
+Shared helper for the caches, stores and snapshots that persist state to
+disk. Data is written to a uniquely named temporary file next to the
+destination, which then replaces the destination with os.replace, so a
+crash or a failing serializer never leaves a truncated file behind and
+readers only ever see the previous or the new contents.
+"""
+
+import os
+import uuid
+from contextlib import contextmanager
+from typing import IO, Any, Iterator
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = "w", durable: bool = False, **open_kwargs: Any) -> Iterator[IO]:
+    """
+    Open a temporary file that replaces path once the block completes.
+
+    If the block raises, the temporary file is removed and path is left
+    untouched.
+
+    Args:
+        path: Destination file path (parent directories are created)
+        mode: "w" for text or "wb" for binary data
+        durable: Flush the data to disk before the rename, and the rename after it
+        **open_kwargs: Additional arguments for open(), e.g. encoding
+
+    Yields:
+        File object to write the new contents to
+    """
+    if mode not in ("w", "wb"):
+        raise ValueError(f"atomic_write supports modes 'w' and 'wb', not {mode!r}")
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    # Unique per call, so concurrent writers never share a temporary file
+    temp_path = os.path.join(directory, f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(temp_path, mode, **open_kwargs) as f:
+            yield f
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    if durable:
+        _sync_directory(directory)
+
+
+def _sync_directory(directory: str) -> None:
+    """Flush a directory entry so a rename survives a crash"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,375 @@
+"""
+Graph Node Store
+
+A SQLite-backed store for knowledge graph nodes and edges. Nodes are kept
+as JSON documents keyed by ID, with a separate type index, and edges are
+indexed by source and target. Point lookups, type scans and edge lookups
+read only the rows they need, so opening a large graph costs nothing until
+it is queried. Writes go into the current transaction and become durable
+on commit().
+"""
+
+import os
+import json
+import sqlite3
+import logging
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of bound parameters per statement
+_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS node_types (
+    type TEXT NOT NULL,
+    node_id TEXT NOT NULL,
+    UNIQUE (type, node_id)
+);
+CREATE INDEX IF NOT EXISTS node_types_by_node ON node_types (node_id);
+CREATE TABLE IF NOT EXISTS edges (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    type TEXT,
+    source TEXT,
+    target TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS edges_by_source ON edges (source, type);
+CREATE INDEX IF NOT EXISTS edges_by_target ON edges (target, type);
+CREATE TABLE IF NOT EXISTS edge_keys (
+    id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class GraphNodeStore:
+    """
+    On-disk node and edge index backed by SQLite.
+
+    A node can be indexed under several types (for example the labels of a
+    kg_manager entity). Type scans and edge lookups return rows in
+    insertion order.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open or create a store.
+
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        self.db_path = db_path
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a node by ID.
+
+        Args:
+            node_id: ID of the node
+
+        Returns:
+            Node dictionary or None
+        """
+        row = self.conn.execute("SELECT data FROM nodes WHERE id = ?", (node_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_nodes(self, node_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several nodes by ID.
+
+        Args:
+            node_ids: IDs of the nodes
+
+        Returns:
+            Dictionary mapping found node IDs to node dictionaries
+        """
+        node_ids = list(node_ids)
+        nodes = {}
+        for start in range(0, len(node_ids), _BATCH_SIZE):
+            batch = node_ids[start:start + _BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            for node_id, data in self.conn.execute(
+                    f"SELECT id, data FROM nodes WHERE id IN ({placeholders})", batch):
+                nodes[node_id] = json.loads(data)
+        return nodes
+
+    def node_ids_by_type(self, node_type: str) -> List[str]:
+        """
+        Get the IDs of all nodes of a type.
+
+        Args:
+            node_type: Type of node
+
+        Returns:
+            Node IDs in insertion order
+        """
+        rows = self.conn.execute(
+            "SELECT node_id FROM node_types WHERE type = ? ORDER BY rowid", (node_type,))
+        return [row[0] for row in rows]
+
+    def get_nodes_by_type(self, node_type: str) -> List[Dict[str, Any]]:
+        """
+        Get all nodes of a type.
+
+        Args:
+            node_type: Type of node
+
+        Returns:
+            List of node dictionaries in insertion order
+        """
+        rows = self.conn.execute(
+            "SELECT nodes.data FROM node_types JOIN nodes ON nodes.id = node_types.node_id "
+            "WHERE node_types.type = ? ORDER BY node_types.rowid", (node_type,))
+        return [json.loads(row[0]) for row in rows]
+
+    def iter_nodes(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over (node ID, node) pairs in insertion order."""
+        for node_id, data in self.conn.execute("SELECT id, data FROM nodes ORDER BY rowid"):
+            yield node_id, json.loads(data)
+
+    def iter_node_ids(self) -> Iterator[str]:
+        """Iterate over node IDs in insertion order."""
+        for row in self.conn.execute("SELECT id FROM nodes ORDER BY rowid"):
+            yield row[0]
+
+    def count_nodes(self) -> int:
+        """Get the number of stored nodes."""
+        return self.conn.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+
+    def put_node(self, node_id: str, node: Dict[str, Any], node_types: Iterable[str] = ()) -> None:
+        """
+        Insert or replace a node.
+
+        Args:
+            node_id: ID of the node
+            node: Node dictionary
+            node_types: Types to index the node under (replaces previous types)
+        """
+        self.put_nodes([(node_id, node, node_types)])
+
+    def put_nodes(self, nodes: Iterable[Tuple[str, Dict[str, Any], Iterable[str]]]) -> None:
+        """
+        Insert or replace several nodes.
+
+        Args:
+            nodes: Iterable of (node ID, node dictionary, node types) tuples
+        """
+        for node_id, node, node_types in nodes:
+            node_types = [t for t in dict.fromkeys(node_types) if t is not None]
+            # Keep the original row (and insertion order) when a node is replaced
+            self.conn.execute(
+                "INSERT INTO nodes (id, data) VALUES (?, ?) ON CONFLICT(id) DO UPDATE SET data = excluded.data",
+                (node_id, json.dumps(node)))
+
+            current = [row[0] for row in self.conn.execute(
+                "SELECT type FROM node_types WHERE node_id = ? ORDER BY rowid", (node_id,))]
+            if current != node_types:
+                self.conn.execute("DELETE FROM node_types WHERE node_id = ?", (node_id,))
+                self.conn.executemany("INSERT INTO node_types (type, node_id) VALUES (?, ?)",
+                                      [(node_type, node_id) for node_type in node_types])
+
+    def insert_nodes(self, nodes: Iterable[Tuple[str, Dict[str, Any], Iterable[str]]]) -> None:
+        """
+        Bulk-insert nodes that are not in the store yet (used for imports).
+
+        Args:
+            nodes: Iterable of (node ID, node dictionary, node types) tuples
+        """
+        node_rows = []
+        type_rows = []
+        for node_id, node, node_types in nodes:
+            node_rows.append((node_id, json.dumps(node)))
+            type_rows.extend((node_type, node_id) for node_type in dict.fromkeys(node_types) if node_type is not None)
+
+        self.conn.executemany("INSERT OR REPLACE INTO nodes (id, data) VALUES (?, ?)", node_rows)
+        self.conn.executemany("INSERT OR IGNORE INTO node_types (type, node_id) VALUES (?, ?)", type_rows)
+
+    def delete_node(self, node_id: str) -> bool:
+        """
+        Delete a node and its type entries (edges are left in place).
+
+        Args:
+            node_id: ID of the node
+
+        Returns:
+            True if the node existed
+        """
+        self.conn.execute("DELETE FROM node_types WHERE node_id = ?", (node_id,))
+        return self.conn.execute("DELETE FROM nodes WHERE id = ?", (node_id,)).rowcount > 0
+
+    def add_edge(self, edge_type: str, source_id: str, target_id: str, edge: Dict[str, Any]) -> int:
+        """
+        Append an edge.
+
+        Args:
+            edge_type: Type of the edge
+            source_id: ID of the source node
+            target_id: ID of the target node
+            edge: Edge dictionary
+
+        Returns:
+            Sequence number of the stored edge
+        """
+        cursor = self.conn.execute(
+            "INSERT INTO edges (type, source, target, data) VALUES (?, ?, ?, ?)",
+            (edge_type, source_id, target_id, json.dumps(edge)))
+        return cursor.lastrowid
+
+    def add_edges(self, edges: Iterable[Tuple[str, str, str, Dict[str, Any]]]) -> None:
+        """
+        Append several edges.
+
+        Args:
+            edges: Iterable of (edge type, source ID, target ID, edge dictionary) tuples
+        """
+        self.conn.executemany(
+            "INSERT INTO edges (type, source, target, data) VALUES (?, ?, ?, ?)",
+            ((edge_type, source_id, target_id, json.dumps(edge))
+             for edge_type, source_id, target_id, edge in edges))
+
+    def put_edge(self, edge_id: str, edge_type: str, source_id: str, target_id: str,
+                 edge: Dict[str, Any]) -> None:
+        """
+        Insert or replace an edge identified by a stable ID.
+
+        Args:
+            edge_id: Stable ID of the edge
+            edge_type: Type of the edge
+            source_id: ID of the source node
+            target_id: ID of the target node
+            edge: Edge dictionary
+        """
+        row = self.conn.execute("SELECT seq FROM edge_keys WHERE id = ?", (edge_id,)).fetchone()
+        if row:
+            # Keep the original row (and insertion order) when an edge is replaced
+            self.conn.execute("UPDATE edges SET type = ?, source = ?, target = ?, data = ? WHERE seq = ?",
+                              (edge_type, source_id, target_id, json.dumps(edge), row[0]))
+        else:
+            seq = self.add_edge(edge_type, source_id, target_id, edge)
+            self.conn.execute("INSERT INTO edge_keys (id, seq) VALUES (?, ?)", (edge_id, seq))
+
+    def delete_edge(self, edge_id: str) -> bool:
+        """
+        Delete an edge stored with put_edge.
+
+        Args:
+            edge_id: Stable ID of the edge
+
+        Returns:
+            True if the edge existed
+        """
+        row = self.conn.execute("SELECT seq FROM edge_keys WHERE id = ?", (edge_id,)).fetchone()
+        if not row:
+            return False
+        self.conn.execute("DELETE FROM edge_keys WHERE id = ?", (edge_id,))
+        self.conn.execute("DELETE FROM edges WHERE seq = ?", (row[0],))
+        return True
+
+    def get_edges(self, source_id: Optional[str] = None, target_id: Optional[str] = None,
+                  edge_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Find edges by endpoint and type.
+
+        Args:
+            source_id: Source node ID to match
+            target_id: Target node ID to match
+            edge_type: Edge type to match
+
+        Returns:
+            List of edge dictionaries in insertion order
+        """
+        clauses = []
+        params = []
+        for column, value in (("source", source_id), ("target", target_id), ("type", edge_type)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.conn.execute(f"SELECT data FROM edges{where} ORDER BY seq", params)
+        return [json.loads(row[0]) for row in rows]
+
+    def count_edges(self) -> int:
+        """Get the number of stored edges."""
+        return self.conn.execute("SELECT COUNT(*) FROM edges").fetchone()[0]
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Get a metadata value."""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Set a metadata value."""
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def clear(self) -> None:
+        """Delete all nodes, edges and metadata."""
+        for table in ("nodes", "node_types", "edges", "edge_keys", "meta"):
+            self.conn.execute(f"DELETE FROM {table}")
+
+    def import_once(self, source_path: str, load_graph) -> bool:
+        """
+        Migrate a JSON graph file into an empty store.
+
+        The import runs once; afterwards the store is the copy of record and
+        the JSON file is left untouched.
+
+        Args:
+            source_path: Path of the JSON file to import
+            load_graph: Callable taking the store and the parsed JSON and
+                writing its nodes and edges
+
+        Returns:
+            True if the source was imported
+        """
+        if self.get_meta("imported_from") is not None or not os.path.exists(source_path):
+            return False
+        if self.count_nodes() or self.count_edges():
+            return False
+
+        try:
+            with open(source_path, 'r') as f:
+                data = json.load(f)
+
+            load_graph(self, data)
+            self.set_meta("imported_from", source_path)
+            self.commit()
+
+            logger.info(f"Imported {self.count_nodes()} nodes from {source_path} into {self.db_path}")
+            return True
+
+        except Exception as e:
+            self.rollback()
+            logger.error(f"Error importing {source_path}: {e}")
+            return False
+
+    def commit(self) -> None:
+        """Make pending writes durable."""
+        self.conn.commit()
+
+    def rollback(self) -> None:
+        """Discard pending writes."""
+        self.conn.rollback()
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        self.conn.commit()
+        self.conn.close()
@@ -0,0 +1,272 @@
+"""
+LLM Response Cache
+
+A persistent, size-capped cache of LLM responses shared by every call site
+in the process (and by other processes using the same file). Entries are
+keyed on a hash of the canonicalized request - model, system prompt, prompt
+or messages, sampling parameters and anything else the call site passes -
+so only identical requests hit. Entries are evicted least recently used
+first once the cache exceeds its entry or byte limit.
+
+Caching is opt-in per call site: a response may only be reused if the call
+is deterministic (temperature 0) or the caller accepts a previous sample.
+Hits and misses are counted per call site.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, Optional, Callable, Awaitable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    "LLM_RESPONSE_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".devloop", "llm_response_cache.db")
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_by_access ON responses (accessed_at);
+"""
+
+
+def make_cache_key(request: Dict[str, Any]) -> str:
+    """
+    Hash a canonicalized LLM request.
+
+    Args:
+        request: Everything that determines the response
+
+    Returns:
+        Hex digest of the request serialized with sorted keys
+    """
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed LRU cache of LLM responses.
+
+    Responses must be JSON-serializable. Empty responses (None, "" and
+    empty collections) are never cached, so failures that return nothing
+    are retried.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH,
+                 max_entries: int = 10000,
+                 max_bytes: int = 100 * 1024 * 1024):
+        """
+        Open or create a cache.
+
+        Args:
+            db_path: Path of the SQLite database file
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached responses
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.metrics: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def get(self, key: str, namespace: str = "default") -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_cache_key
+            namespace: Call site, for metrics
+
+        Returns:
+            Cached response or None
+        """
+        with self._lock:
+            row = self.conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._count(namespace, "misses")
+                return None
+            self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self.conn.commit()
+            self._count(namespace, "hits")
+            return json.loads(row[0])
+
+    def put(self, key: str, response: Any, namespace: str = "default") -> None:
+        """
+        Cache a response, evicting the least recently used ones if needed.
+
+        Args:
+            key: Cache key from make_cache_key
+            response: JSON-serializable response
+            namespace: Call site that produced the response
+        """
+        if response is None or response == "" or response == [] or response == {}:
+            return
+
+        data = json.dumps(response)
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, namespace, response, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, namespace, data, len(data), now, now)
+            )
+            self._evict()
+            self.conn.commit()
+            self._count(namespace, "writes")
+
+    def get_or_call(self, namespace: str, request: Dict[str, Any], call: Callable[[], Any],
+                    should_cache: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Return the cached response to a request, calling the LLM on a miss.
+
+        Args:
+            namespace: Call site, for metrics
+            request: Everything that determines the response
+            call: Function making the LLM call
+            should_cache: Optional check that a fresh response is worth caching
+
+        Returns:
+            Cached or fresh response
+        """
+        key = make_cache_key(request)
+        response = self.get(key, namespace)
+        if response is None:
+            response = call()
+            if should_cache is None or should_cache(response):
+                self.put(key, response, namespace)
+        return response
+
+    async def get_or_call_async(self, namespace: str, request: Dict[str, Any],
+                                call: Callable[[], Awaitable[Any]],
+                                should_cache: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Return the cached response to a request, awaiting the LLM on a miss.
+
+        Args:
+            namespace: Call site, for metrics
+            request: Everything that determines the response
+            call: Coroutine function making the LLM call
+            should_cache: Optional check that a fresh response is worth caching
+
+        Returns:
+            Cached or fresh response
+        """
+        key = make_cache_key(request)
+        response = self.get(key, namespace)
+        if response is None:
+            response = await call()
+            if should_cache is None or should_cache(response):
+                self.put(key, response, namespace)
+        return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit-rate metrics and cache size.
+
+        Returns:
+            Dictionary with totals, a hit rate and counters per call site
+        """
+        with self._lock:
+            entries, size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            namespaces = {name: dict(counts) for name, counts in self.metrics.items()}
+
+        for counts in namespaces.values():
+            lookups = counts.get("hits", 0) + counts.get("misses", 0)
+            counts["hit_rate"] = counts.get("hits", 0) / lookups if lookups else 0.0
+
+        hits = sum(counts.get("hits", 0) for counts in namespaces.values())
+        misses = sum(counts.get("misses", 0) for counts in namespaces.values())
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "namespaces": namespaces
+        }
+
+    def clear(self) -> None:
+        """Remove all cached responses and reset the metrics."""
+        with self._lock:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.commit()
+            self.metrics = {}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+    def _count(self, namespace: str, counter: str) -> None:
+        """Increment a per-call-site counter."""
+        counts = self.metrics.setdefault(namespace, {"hits": 0, "misses": 0, "writes": 0, "evictions": 0})
+        counts[counter] += 1
+
+    def _evict(self) -> None:
+        """Delete least recently used responses until the cache is within its limits."""
+        entries, size = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if entries <= self.max_entries and size <= self.max_bytes:
+            return
+
+        evicted = []
+        for key, namespace, entry_size in self.conn.execute(
+                "SELECT key, namespace, size FROM responses ORDER BY accessed_at"):
+            if entries <= self.max_entries and size <= self.max_bytes:
+                break
+            evicted.append((key, namespace))
+            entries -= 1
+            size -= entry_size
+
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", [(key,) for key, _ in evicted])
+        for _, namespace in evicted:
+            self._count(namespace, "evictions")
+        logger.debug(f"Evicted {len(evicted)} cached LLM responses")
+
+
+_caches: Dict[str, LLMResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(db_path: Optional[str] = None, **limits) -> LLMResponseCache:
+    """
+    Get the process-wide response cache for a database file.
+
+    Args:
+        db_path: Path of the SQLite database file (defaults to
+            LLM_RESPONSE_CACHE_PATH or ~/.devloop/llm_response_cache.db)
+        **limits: max_entries and max_bytes, used when the cache is opened
+
+    Returns:
+        LLMResponseCache instance
+    """
+    db_path = os.path.abspath(db_path or DEFAULT_CACHE_PATH)
+    with _caches_lock:
+        if db_path not in _caches:
+            _caches[db_path] = LLMResponseCache(db_path, **limits)
+        return _caches[db_path]
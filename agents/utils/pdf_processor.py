@@ -32,6 +32,22 @@ try:
 except ImportError:
     logging.warning("Anthropic Python SDK not installed. Install with: pip install anthropic")
 
+try:
+    from ai_service.llm_client import get_llm_client, run_sync, HTTPX_AVAILABLE
+except ImportError:
+    try:
+        from agents.utils.ai_service.llm_client import get_llm_client, run_sync, HTTPX_AVAILABLE
+    except ImportError:
+        HTTPX_AVAILABLE = False
+
+try:
+    from llm_response_cache import get_response_cache
+except ImportError:
+    try:
+        from agents.utils.llm_response_cache import get_response_cache
+    except ImportError:
+        get_response_cache = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -41,6 +57,8 @@ CACHE_DIR = os.environ.get("KNOWLEDGE_CACHE_DIR", "knowledge_cache")
 CLAUDE_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
 CHUNK_SIZE = 10000  # Characters per chunk
 CHUNK_OVERLAP = 1000  # Character overlap between chunks
+CLAUDE_MODEL = "claude-3-opus-20240229"
+ANALYSIS_SYSTEM_PROMPT = "You are a document analysis assistant that helps extract key information from PDFs. Always provide accurate information based solely on the document contents."
 
 
 class PDFProcessor:
@@ -48,17 +66,21 @@ class PDFProcessor:
     Process PDF documents for knowledge base integration with Claude API.
     """
 
-    def __init__(self, cache_dir: str = CACHE_DIR, use_claude: bool = True):
+    def __init__(self, cache_dir: str = CACHE_DIR, use_claude: bool = True,
+                 use_response_cache: bool = False):
         """
         Initialize the PDF processor.
 
         Args:
             cache_dir: Directory to store cached results
             use_claude: Whether to use Claude API for enhanced PDF understanding
+            use_response_cache: Whether to reuse Claude's responses to identical
+                analysis requests from the shared LLM response cache
         """
         self.cache_dir = Path(cache_dir)
         self.use_claude = use_claude
         self.claude_client = None
+        self.response_cache = get_response_cache() if use_response_cache and get_response_cache else None
 
         # Ensure cache directory exists
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -321,9 +343,51 @@ class PDFProcessor:
             return cached_data
             
         try:
-            # Prepare prompt for Claude
-            if query:
-                prompt = f"""
+            request = {
+                "model": CLAUDE_MODEL,
+                "max_tokens": 4000,
+                "temperature": 0,
+                "system": ANALYSIS_SYSTEM_PROMPT,
+                "messages": [
+                    {"role": "user", "content": self._build_analysis_prompt(document, query)}
+                ]
+            }
+
+            def call_claude() -> str:
+                return self.claude_client.messages.create(**request).content[0].text
+
+            # Analysis runs at temperature 0, so identical requests can share a response
+            if self.response_cache:
+                response_text = self.response_cache.get_or_call(
+                    "pdf_processor.process_with_claude", request, call_claude
+                )
+            else:
+                response_text = call_claude()
+            
+            analysis = self._build_analysis(doc_id, query, response_text)
+            
+            # Cache analysis (7 days TTL)
+            self._save_to_cache(doc_id, cache_key, analysis, ttl=7 * 24 * 60 * 60)
+            
+            return analysis
+            
+        except Exception as e:
+            logger.error(f"Error processing document with Claude: {e}")
+            return {"error": str(e)}
+
+    def _build_analysis_prompt(self, document: Dict[str, Any], query: Optional[str] = None) -> str:
+        """
+        Build the prompt asking Claude to analyze a document.
+
+        Args:
+            document: Document dictionary
+            query: Optional specific query about the document
+
+        Returns:
+            str: Prompt text
+        """
+        if query:
+            return f"""
                 <document>
                 {document['full_text'][:100000]}  # Limit to first 100K chars for API limits
                 </document>
@@ -333,8 +397,8 @@ class PDFProcessor:
 
                 Provide a detailed and accurate response based only on the document contents.
                 """
-            else:
-                prompt = f"""
+
+        return f"""
                 <document>
                 {document['full_text'][:100000]}  # Limit to first 100K chars for API limits
                 </document>
@@ -348,54 +412,98 @@ class PDFProcessor:
 
                 Format your response as JSON with these sections as keys.
                 """
-            
-            # Call Claude API
-            response = self.claude_client.messages.create(
-                model="claude-3-opus-20240229",
-                max_tokens=4000,
-                temperature=0,
-                system="You are a document analysis assistant that helps extract key information from PDFs. Always provide accurate information based solely on the document contents.",
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            
-            # Process response
-            analysis = {
-                'doc_id': doc_id,
-                'query': query,
-                'response': response.content[0].text,
-                'model': "claude-3-opus-20240229"
+
+    def _build_analysis(self, doc_id: str, query: Optional[str], response_text: str) -> Dict[str, Any]:
+        """
+        Build the analysis record from Claude's response.
+
+        Args:
+            doc_id: Document ID
+            query: Query the response answers (None for a summary)
+            response_text: Text of Claude's response
+
+        Returns:
+            Dict: Claude's analysis of the document
+        """
+        analysis = {
+            'doc_id': doc_id,
+            'query': query,
+            'response': response_text,
+            'model': CLAUDE_MODEL
+        }
+        
+        # Try to parse JSON if it's a summary (no query)
+        if not query:
+            try:
+                # Find JSON block if it exists
+                import re
+                json_match = re.search(r'```json\n(.*?)\n```', analysis['response'], re.DOTALL)
+                
+                if json_match:
+                    json_text = json_match.group(1)
+                    analysis['structured_data'] = json.loads(json_text)
+                else:
+                    # Try parsing the whole response as JSON
+                    analysis['structured_data'] = json.loads(analysis['response'])
+            except Exception as e:
+                logger.warning(f"Could not parse Claude response as JSON: {e}")
+                # Create a simple structured data
+                analysis['structured_data'] = {
+                    'summary': analysis['response']
+                }
+        
+        return analysis
+
+    def _prefetch_summaries_with_batch(self, file_paths: List[str]) -> None:
+        """
+        Summarize uncached documents with one Message Batches API submission.
+
+        Summaries are saved to the cache, where process_with_claude finds them.
+
+        Args:
+            file_paths: List of paths to PDF files
+        """
+        if not HTTPX_AVAILABLE:
+            logger.warning("httpx not installed. Summarizing documents one at a time.")
+            return
+
+        documents = []
+        for file_path in file_paths:
+            try:
+                document = self.extract_text_from_pdf(file_path)
+            except Exception as e:
+                # Reported when the document is processed
+                logger.debug(f"Skipping batch summary of {file_path}: {e}")
+                continue
+            if not self._load_from_cache(document['doc_id'], "claude_summary"):
+                documents.append(document)
+
+        if not documents:
+            return
+
+        logger.info(f"Submitting {len(documents)} document summaries as a message batch")
+        requests = [
+            {
+                "prompt": self._build_analysis_prompt(document),
+                "model": CLAUDE_MODEL,
+                "system_prompt": ANALYSIS_SYSTEM_PROMPT,
+                "max_tokens": 4000,
+                "temperature": 0
             }
-            
-            # Try to parse JSON if it's a summary (no query)
-            if not query:
-                try:
-                    # Find JSON block if it exists
-                    import re
-                    json_match = re.search(r'```json\n(.*?)\n```', analysis['response'], re.DOTALL)
-                    
-                    if json_match:
-                        json_text = json_match.group(1)
-                        analysis['structured_data'] = json.loads(json_text)
-                    else:
-                        # Try parsing the whole response as JSON
-                        analysis['structured_data'] = json.loads(analysis['response'])
-                except Exception as e:
-                    logger.warning(f"Could not parse Claude response as JSON: {e}")
-                    # Create a simple structured data
-                    analysis['structured_data'] = {
-                        'summary': analysis['response']
-                    }
-            
-            # Cache analysis (7 days TTL)
-            self._save_to_cache(doc_id, cache_key, analysis, ttl=7 * 24 * 60 * 60)
-            
-            return analysis
-            
+            for document in documents
+        ]
+        try:
+            completions = run_sync(get_llm_client(CLAUDE_API_KEY).complete_batch(requests))
         except Exception as e:
-            logger.error(f"Error processing document with Claude: {e}")
-            return {"error": str(e)}
+            logger.error(f"Message batch failed, summarizing documents one at a time: {e}")
+            return
+
+        for document, completion in zip(documents, completions):
+            if isinstance(completion, Exception):
+                logger.error(f"Batch summary of {document['file_path']} failed: {completion}")
+                continue
+            analysis = self._build_analysis(document['doc_id'], None, completion)
+            self._save_to_cache(document['doc_id'], "claude_summary", analysis, ttl=7 * 24 * 60 * 60)
 
     def process_document_with_vision(self, file_path: str, query: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -761,13 +869,16 @@ class PDFProcessor:
 
         return match.group(1).strip()
 
-    def batch_process_documents(self, file_paths: List[str], auto_tag: bool = True) -> Dict[str, List[Dict[str, Any]]]:
+    def batch_process_documents(self, file_paths: List[str], auto_tag: bool = True,
+                                use_batch_api: bool = False) -> Dict[str, List[Dict[str, Any]]]:
         """
         Process multiple documents in batch.
 
         Args:
             file_paths: List of paths to PDF files
             auto_tag: Whether to perform automatic tag generation
+            use_batch_api: Whether to summarize the documents with one Message
+                Batches API submission (cheaper, but may take hours)
 
         Returns:
             Dict: Summary of processing results
@@ -777,6 +888,9 @@ class PDFProcessor:
             'failed': []
         }
 
+        if use_batch_api and self.use_claude:
+            self._prefetch_summaries_with_batch(file_paths)
+
         for file_path in file_paths:
             try:
                 logger.info(f"Processing {file_path}")
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark roadmap rendering on synthetic knowledge graphs
+
+Builds graphs with a fixed roadmap (milestones, phases, modules) and a
+growing number of feature, task and dependency edges, then times
+get_project_structure and get_feature_tasks with the typed adjacency layer
+and with the previous full edge scan, query_features with and without
+the feature property index, and a cold milestone impact analysis.
+
+Usage:
+  benchmark_graph_index.py [--nodes 100000] [--edges 1000000]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "agents", "planning", "feature_creation"))
+
+from knowledge_graph_connector import KnowledgeGraphConnector, MemoryKnowledgeGraph, FEATURE_INDEX_FIELDS
+
+
+class EdgeScanKnowledgeGraph:
+    """Wrapper hiding get_edges so the connector falls back to edge scans"""
+
+    def __init__(self, kg):
+        self.memory = kg.memory
+        self.get_node = kg.get_node
+        self.get_nodes_by_type = kg.get_nodes_by_type
+
+
+def build_graph(num_nodes, num_edges, seed=42):
+    """
+    Build a synthetic knowledge graph
+
+    Args:
+        num_nodes: Approximate total number of nodes
+        num_edges: Approximate total number of edges
+        seed: Random seed
+
+    Returns:
+        MemoryKnowledgeGraph instance
+    """
+    rng = random.Random(seed)
+    nodes = {}
+    edges = []
+
+    def add_node(node_id, node_type, properties=None, metadata=None):
+        nodes[node_id] = {"id": node_id, "type": node_type,
+                          "properties": dict(properties or {}, name=node_id), "metadata": metadata or {}}
+
+    def add_edge(edge_type, source, target):
+        edges.append({"type": edge_type, "source": source, "target": target, "properties": {}, "metadata": {}})
+
+    # Fixed roadmap: 10 milestones x 5 phases x 4 modules
+    modules = []
+    for m in range(10):
+        milestone_id = f"milestone-{m}"
+        add_node(milestone_id, "milestone")
+        for p in range(5):
+            phase_id = f"phase-{m}-{p}"
+            add_node(phase_id, "phase")
+            add_edge("milestone_contains_phase", milestone_id, phase_id)
+            for d in range(4):
+                module_id = f"module-{m}-{p}-{d}"
+                add_node(module_id, "module")
+                add_edge("phase_contains_module", phase_id, module_id)
+                modules.append(module_id)
+
+    # Features and tasks make up the remaining nodes
+    num_features = max(1, (num_nodes - len(nodes)) // 2)
+    features = [f"feature-{i}" for i in range(num_features)]
+    domains = ["ui", "api", "data", "testing", "agent"]
+    tags = [f"tag-{i}" for i in range(200)]
+    for i, feature_id in enumerate(features):
+        module_id = rng.choice(modules)
+        add_node(feature_id, "feature",
+                 {"domain": rng.choice(domains), "status": rng.choice(["not-started", "in-progress", "done"]),
+                  "tags": rng.sample(tags, 3)},
+                 {"module": module_id})
+        add_edge("module_contains_feature", module_id, feature_id)
+        task_id = f"task-{i}"
+        add_node(task_id, "task")
+        add_edge("feature_has_task", feature_id, task_id)
+
+    # Dependencies fill up the edge budget
+    while len(edges) < num_edges:
+        add_edge("feature_depends_on", rng.choice(features), rng.choice(features))
+
+    return MemoryKnowledgeGraph(memory_data={"knowledge_graph": {"nodes": nodes, "edges": edges, "indices": {}}})
+
+
+def time_call(func, repeat):
+    """Return the best wall time of several calls in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(num_nodes, num_edges, repeat):
+    """Run the benchmark for one graph size and print a result line"""
+    start = time.perf_counter()
+    kg = build_graph(num_nodes, num_edges)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    indexed = KnowledgeGraphConnector.__new__(KnowledgeGraphConnector)
+    indexed.kg = kg
+    scanning = KnowledgeGraphConnector.__new__(KnowledgeGraphConnector)
+    scanning.kg = EdgeScanKnowledgeGraph(kg)
+
+    query = dict(domain="ui", status="done", tags=["tag-7", "tag-8"], limit=10)
+    scanned_features = scanning.query_features(**query)
+    kg.add_property_index("feature", FEATURE_INDEX_FIELDS)
+    assert indexed.query_features(**query) == scanned_features
+
+    assert indexed.get_project_structure() == scanning.get_project_structure()
+
+    indexed_ms = time_call(indexed.get_project_structure, repeat)
+    scanning_ms = time_call(scanning.get_project_structure, 1)
+    tasks_indexed_ms = time_call(lambda: indexed.get_feature_tasks("feature-0"), repeat)
+    tasks_scanning_ms = time_call(lambda: scanning.get_feature_tasks("feature-0"), 1)
+    query_indexed_ms = time_call(lambda: indexed.query_features(**query), repeat)
+    query_scanning_ms = time_call(lambda: scanning.query_features(**query), 1)
+    impact_ms = time_call(lambda: indexed.get_milestone_impact("milestone-0"), 1)
+
+    print(f"{len(kg.memory['knowledge_graph']['nodes']):>9} nodes {len(kg.memory['knowledge_graph']['edges']):>9} edges | "
+          f"build+index {build_ms:9.1f} ms | "
+          f"project structure {indexed_ms:7.2f} ms (scan {scanning_ms:9.1f} ms) | "
+          f"feature tasks {tasks_indexed_ms:6.3f} ms (scan {tasks_scanning_ms:7.1f} ms) | "
+          f"query features {query_indexed_ms:6.3f} ms (scan {query_scanning_ms:7.1f} ms) | "
+          f"milestone impact {impact_ms:7.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark knowledge graph traversals")
+    parser.add_argument("--nodes", type=int, default=100000, help="Number of nodes in the largest graph")
+    parser.add_argument("--edges", type=int, default=1000000, help="Number of edges in the largest graph")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions for indexed timings")
+    args = parser.parse_args()
+
+    # Same roadmap, ten times more edges per step
+    for scale in (100, 10, 1):
+        run(args.nodes // scale, args.edges // scale, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
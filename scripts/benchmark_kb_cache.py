@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark the knowledge base query cache
+
+Runs the same batch of queries through the synchronous
+CachedKnowledgeBaseAdapter (one GET and one SETEX round trip per query, JSON
+values) and the AsyncCachedKnowledgeBaseAdapter (one MGET per batch, cache
+writes pipelined in the background, binary values), cold and then warm.
+The backend adapter sleeps to simulate a slow knowledge base.
+
+By default both adapters talk to fakeredis, with a simulated network round
+trip added to every command or pipeline; pass --redis-url to measure
+against a real Redis server instead.
+
+Usage:
+  benchmark_kb_cache.py [--queries 200] [--rtt-ms 0.5] [--backend-ms 5] [--redis-url redis://localhost:6379/0]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "agents", "sdk"))
+
+import redis
+import redis.asyncio as redis_asyncio
+
+from adapters.knowledge_base_adapter import (
+    KnowledgeBaseAdapter,
+    CachedKnowledgeBaseAdapter,
+    AsyncCachedKnowledgeBaseAdapter
+)
+
+
+class SlowKnowledgeBase(KnowledgeBaseAdapter):
+    """Knowledge base whose queries take a fixed time"""
+
+    def __init__(self, latency_ms):
+        super().__init__({})
+        self.latency_ms = latency_ms
+
+    def query(self, query, **kwargs):
+        time.sleep(self.latency_ms / 1000)
+        return [{"id": f"{query}-{i}", "content": f"Result {i} for {query} " * 5, "score": 1 / (i + 1)}
+                for i in range(10)]
+
+
+class RoundTripDelay:
+    """Proxy adding a simulated network round trip to each Redis command or pipeline"""
+
+    def __init__(self, client, rtt_ms, is_async):
+        self._client = client
+        self._rtt = rtt_ms / 1000
+        self._is_async = is_async
+
+    def pipeline(self, *args, **kwargs):
+        return RoundTripDelay(self._client.pipeline(*args, **kwargs), self._rtt * 1000, self._is_async)
+
+    def __getattr__(self, name):
+        attribute = getattr(self._client, name)
+        if not callable(attribute) or not (name in ("execute", "ping") or hasattr(redis.Redis, name)):
+            return attribute
+
+        # Pipelined commands are only sent on execute
+        if type(self._client).__name__.endswith("Pipeline") and name != "execute":
+            return attribute
+
+        if self._is_async:
+            async def call(*args, **kwargs):
+                await asyncio.sleep(self._rtt)
+                return await attribute(*args, **kwargs)
+        else:
+            def call(*args, **kwargs):
+                time.sleep(self._rtt)
+                return attribute(*args, **kwargs)
+        return call
+
+
+def make_clients(args):
+    """Create sync and async Redis clients for the benchmark"""
+    if args.redis_url:
+        sync_client = redis.Redis.from_url(args.redis_url)
+        async_client = redis_asyncio.Redis.from_url(args.redis_url)
+        sync_client.flushdb()
+        return sync_client, async_client
+
+    import fakeredis
+    server = fakeredis.FakeServer()
+    sync_client = RoundTripDelay(fakeredis.FakeRedis(server=server), args.rtt_ms, is_async=False)
+    async_client = RoundTripDelay(fakeredis.FakeAsyncRedis(server=server), args.rtt_ms, is_async=True)
+    return sync_client, async_client
+
+
+def run_sync(adapter, queries):
+    """Query one at a time and return per-query latencies in milliseconds"""
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        adapter.query(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def run_async(adapter, queries):
+    """Query as one batch and return the batch latency in milliseconds"""
+    start = time.perf_counter()
+    await adapter.query_many(queries)
+    elapsed = (time.perf_counter() - start) * 1000
+    await adapter.flush()
+    return elapsed
+
+
+def report(label, total_ms, count):
+    """Print one benchmark line"""
+    print(f"  {label:<34} {total_ms:9.1f} ms total  {total_ms / count:7.3f} ms/query")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the knowledge base query cache")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per batch")
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="Simulated Redis round trip (fakeredis only)")
+    parser.add_argument("--backend-ms", type=float, default=5.0, help="Backend query latency")
+    parser.add_argument("--redis-url", help="Benchmark against this Redis server instead of fakeredis")
+    args = parser.parse_args()
+
+    queries = [f"query {i}" for i in range(args.queries)]
+    backend = SlowKnowledgeBase(args.backend_ms)
+    sync_client, async_client = make_clients(args)
+
+    sync_adapter = CachedKnowledgeBaseAdapter({"cache_enabled": False}, backend)
+    sync_adapter.cache_enabled = True
+    sync_adapter.cache_ttl = 3600
+    sync_adapter.redis = sync_client
+
+    print(f"{args.queries} queries, backend {args.backend_ms} ms/query, "
+          f"{'Redis at ' + args.redis_url if args.redis_url else f'fakeredis with {args.rtt_ms} ms round trips'}")
+
+    cold = run_sync(sync_adapter, queries)
+    warm = run_sync(sync_adapter, queries)
+    print("CachedKnowledgeBaseAdapter (sync, GET/SETEX per query)")
+    report("cold", sum(cold), len(queries))
+    report("warm", sum(warm), len(queries))
+    print(f"  warm p50 {statistics.median(warm):.3f} ms, max {max(warm):.3f} ms")
+
+    async def run_async_benchmark():
+        adapter = AsyncCachedKnowledgeBaseAdapter({"cache_enabled": True}, backend, redis_client=async_client)
+        await async_client.delete(AsyncCachedKnowledgeBaseAdapter.GENERATION_KEY)
+        cold_ms = await run_async(adapter, queries)
+        warm_ms = await run_async(adapter, queries)
+        single = []
+        for query in queries[:50]:
+            start = time.perf_counter()
+            await adapter.query(query)
+            single.append((time.perf_counter() - start) * 1000)
+        return cold_ms, warm_ms, single, adapter.get_stats()
+
+    cold_ms, warm_ms, single, stats = asyncio.run(run_async_benchmark())
+    print("AsyncCachedKnowledgeBaseAdapter (query_many: MGET, pipelined background writes)")
+    report("cold", cold_ms, len(queries))
+    report("warm", warm_ms, len(queries))
+    print(f"  warm single query p50 {statistics.median(single):.3f} ms")
+    print(f"  stats: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark kg_manager.py startup on a large knowledge graph
+
+Writes a synthetic graph in the legacy entities.json/relationships.json
+format into a temporary home directory, then times the `show` and
+`list-features` commands end to end against the indexed SQLite store,
+next to the cost of parsing the legacy JSON files that every command used
+to pay at startup.
+
+Usage:
+  benchmark_kg_manager_startup.py [--features 50000] [--tasks-per-feature 4] [--repeat 3]
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+KG_MANAGER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kg_manager.py")
+
+
+def write_legacy_graph(storage_dir, num_features, tasks_per_feature):
+    """Write a synthetic graph in the legacy JSON storage format"""
+    entities = {}
+    relationships = []
+
+    for m in range(20):
+        milestone_id = f"milestone:m{m}"
+        entities[milestone_id] = {"id": milestone_id, "labels": ["Milestone"],
+                                  "properties": {"name": f"m{m}", "description": "Milestone"}}
+
+    for f in range(num_features):
+        feature_id = f"feature:f{f}"
+        entities[feature_id] = {"id": feature_id, "labels": ["Feature"],
+                                "properties": {"name": f"f{f}", "description": f"Feature number {f}",
+                                               "status": "not_started", "priority": "medium"}}
+        relationships.append({"from": f"milestone:m{f % 20}", "to": feature_id,
+                              "type": "CONTAINS_FEATURE", "properties": {}})
+        for t in range(tasks_per_feature):
+            task_id = f"task:f{f}_t{t}"
+            entities[task_id] = {"id": task_id, "labels": ["Task"],
+                                 "properties": {"name": f"t{t}", "description": "Task", "progress": 0}}
+            relationships.append({"from": feature_id, "to": task_id, "type": "HAS_TASK", "properties": {}})
+
+    os.makedirs(storage_dir, exist_ok=True)
+    with open(os.path.join(storage_dir, "entities.json"), "w") as f:
+        json.dump(entities, f, indent=2)
+    with open(os.path.join(storage_dir, "relationships.json"), "w") as f:
+        json.dump(relationships, f, indent=2)
+    return len(entities), len(relationships)
+
+
+def run_command(home, args):
+    """Run kg_manager.py with a given home directory and return wall time in ms"""
+    env = dict(os.environ, HOME=home)
+    start = time.perf_counter()
+    subprocess.run([sys.executable, KG_MANAGER] + args, env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+
+def best_of(repeat, func):
+    """Return the best of several timings"""
+    return min(func() for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark kg_manager.py startup")
+    parser.add_argument("--features", type=int, default=50000, help="Number of features")
+    parser.add_argument("--tasks-per-feature", type=int, default=4, help="Tasks per feature")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per command")
+    args = parser.parse_args()
+
+    home = tempfile.mkdtemp()
+    try:
+        storage_dir = os.path.join(home, ".kg_manager")
+        num_entities, num_relationships = write_legacy_graph(storage_dir, args.features, args.tasks_per_feature)
+        print(f"Graph: {num_entities} entities, {num_relationships} relationships")
+
+        # What every command paid before: parse both JSON files in full
+        def parse_legacy():
+            start = time.perf_counter()
+            with open(os.path.join(storage_dir, "entities.json")) as f:
+                json.load(f)
+            with open(os.path.join(storage_dir, "relationships.json")) as f:
+                json.load(f)
+            return (time.perf_counter() - start) * 1000
+        print(f"legacy JSON parse (per command)   {best_of(args.repeat, parse_legacy):9.1f} ms")
+
+        # The first command migrates the JSON files into the SQLite store
+        print(f"first run (one-time import)       {run_command(home, ['show', 'feature:f0']):9.1f} ms")
+
+        baseline = best_of(args.repeat, lambda: run_command(home, ["--help"]))
+        print(f"interpreter + import baseline     {baseline:9.1f} ms")
+        for label, command in (("show feature", ["show", "feature:f123"]),
+                               ("list-tasks --feature", ["list-tasks", "--feature", "feature:f123"]),
+                               ("list-features --milestone", ["list-features", "--milestone", "m3"])):
+            print(f"{label:<34}{best_of(args.repeat, lambda: run_command(home, command)):9.1f} ms")
+    finally:
+        shutil.rmtree(home)
+
+
+if __name__ == "__main__":
+    main()
@@ -42,6 +42,7 @@ import re
 
 # Add project root to path
 sys.path.append('/mnt/c/Users/angel/Devloop')
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Try to import real implementation, fall back to stub
 try:
@@ -49,6 +50,60 @@ try:
 except ImportError:
     print("Warning: Real KnowledgeGraph implementation not found. Using stub that simulates operations.")
     
+    from collections.abc import MutableMapping
+    from agents.utils.graph_node_store import GraphNodeStore
+    
+    class LazyEntities(MutableMapping):
+        """Entity mapping that reads entities from the node store on first access"""
+        
+        def __init__(self, store):
+            self.store = store
+            self.loaded = {}  # entity_id -> entity read or written this session
+            
+        def __getitem__(self, entity_id):
+            if entity_id not in self.loaded:
+                entity = self.store.get_node(entity_id)
+                if entity is None:
+                    raise KeyError(entity_id)
+                self.loaded[entity_id] = entity
+            return self.loaded[entity_id]
+            
+        def __setitem__(self, entity_id, entity):
+            self.loaded[entity_id] = entity
+            self.store.put_node(entity_id, entity, entity.get("labels", []))
+            
+        def __delitem__(self, entity_id):
+            self.loaded.pop(entity_id, None)
+            if not self.store.delete_node(entity_id):
+                raise KeyError(entity_id)
+            
+        def __iter__(self):
+            return self.store.iter_node_ids()
+                
+        def __len__(self):
+            return self.store.count_nodes()
+            
+        def get_many(self, entity_ids):
+            """Get (entity_id, entity) pairs for several entities with batched store queries"""
+            missing = [entity_id for entity_id in entity_ids if entity_id not in self.loaded]
+            self.loaded.update(self.store.get_nodes(missing))
+            return [(entity_id, self.loaded[entity_id]) for entity_id in entity_ids if entity_id in self.loaded]
+            
+        def flush(self):
+            """Write back every entity touched this session (they may have been changed in place)"""
+            self.store.put_nodes(
+                (entity_id, entity, entity.get("labels", [])) for entity_id, entity in self.loaded.items()
+            )
+    
+    def import_json_storage(store, data):
+        """Import entities.json/relationships.json written by earlier versions"""
+        store.insert_nodes(
+            (entity_id, entity, entity.get("labels", [])) for entity_id, entity in data["entities"].items()
+        )
+        store.add_edges(
+            (rel["type"], rel["from"], rel["to"], rel) for rel in data["relationships"]
+        )
+    
     # Stub implementation for demonstration
     class StubNeo4j:
         def __init__(self):
@@ -152,14 +207,13 @@ except ImportError:
             self.storage_dir = os.path.expanduser("~/.kg_manager")
             os.makedirs(self.storage_dir, exist_ok=True)
             
-            # Load or initialize storage files
+            # Entities and relationships live in an indexed SQLite store; older
+            # JSON storage files are imported the first time it is opened
+            self.db_file = os.path.join(self.storage_dir, "knowledge_graph.sqlite")
             self.entities_file = os.path.join(self.storage_dir, "entities.json")
             self.relationships_file = os.path.join(self.storage_dir, "relationships.json")
             
-            self.entities = {}
-            self.relationships = []
-            
-            # Load existing data from disk
+            # Open the store; nothing is read until an entity is requested
             self._load_data()
             
             # Initialize stubs with references to our data
@@ -172,36 +226,33 @@ except ImportError:
             self.events = self.short_term  # Simplified
             
         def _load_data(self):
-            # Load entities
-            if os.path.exists(self.entities_file):
-                try:
-                    with open(self.entities_file, 'r') as f:
-                        self.entities = json.load(f)
-                except:
-                    self.entities = {}
+            self.store = GraphNodeStore(self.db_file)
+            self.entities = LazyEntities(self.store)
             
-            # Load relationships
-            if os.path.exists(self.relationships_file):
+            if self.store.get_meta("imported_from") is None and os.path.exists(self.entities_file):
                 try:
-                    with open(self.relationships_file, 'r') as f:
-                        self.relationships = json.load(f)
+                    with open(self.entities_file, 'r') as f:
+                        entities = json.load(f)
                 except:
-                    self.relationships = []
+                    entities = {}
+                relationships = []
+                if os.path.exists(self.relationships_file):
+                    try:
+                        with open(self.relationships_file, 'r') as f:
+                            relationships = json.load(f)
+                    except:
+                        relationships = []
+                import_json_storage(self.store, {"entities": entities, "relationships": relationships})
+                self.store.set_meta("imported_from", self.storage_dir)
+                self.store.commit()
                         
         def _save_data(self):
-            # Make sure the directory exists
-            os.makedirs(os.path.dirname(self.entities_file), exist_ok=True)
-            
-            # Save entities
-            with open(self.entities_file, 'w') as f:
-                json.dump(self.entities, f, indent=2)
-                
-            # Save relationships
-            with open(self.relationships_file, 'w') as f:
-                json.dump(self.relationships, f, indent=2)
+            # Only entities read or written this session can have changed
+            self.entities.flush()
+            self.store.commit()
                 
             # Print a message for debugging
-            print(f"Saved {len(self.entities)} entities and {len(self.relationships)} relationships to {self.storage_dir}")
+            print(f"Saved {len(self.entities.loaded)} entities to {self.db_file}")
             
         def store_fact(self, entity_id, attribute, value, ttl=None):
             # Update the entity in our stub storage
@@ -252,7 +303,7 @@ except ImportError:
                 "properties": properties,
                 "created_at": datetime.now().isoformat()
             }
-            self.relationships.append(relationship)
+            self.store.add_edge(relation_type, from_id, to_id, relationship)
             
             # Save to disk
             self._save_data()
@@ -274,11 +325,16 @@ except ImportError:
             """Find entities matching criteria"""
             results = []
             
-            for entity_id, entity in self.entities.items():
-                # Skip if labels don't match
-                if labels and not any(label in entity.get("labels", []) for label in labels):
-                    continue
-                    
+            if labels:
+                # Label scans read only the matching entities through the type index
+                entity_ids = list(dict.fromkeys(
+                    entity_id for label in labels for entity_id in self.store.node_ids_by_type(label)
+                ))
+                candidates = self.entities.get_many(entity_ids)
+            else:
+                candidates = self.store.iter_nodes()
+            
+            for entity_id, entity in candidates:
                 # Skip if query doesn't match any property
                 if query:
                     query = query.lower()
@@ -309,21 +365,8 @@ except ImportError:
             
         def find_relationships(self, from_id=None, to_id=None, relation_type=None):
             """Find relationships matching criteria"""
-            results = []
-            
-            for rel in self.relationships:
-                if from_id and rel["from"] != from_id:
-                    continue
-                    
-                if to_id and rel["to"] != to_id:
-                    continue
-                    
-                if relation_type and rel["type"] != relation_type:
-                    continue
-                    
-                results.append(rel)
-                
-            return results
+            return self.store.get_edges(source_id=from_id or None, target_id=to_id or None,
+                                        edge_type=relation_type or None)
 
 # Utility Functions
 def generate_id(prefix, name):
@@ -331,6 +374,15 @@ def generate_id(prefix, name):
     safe_name = re.sub(r'[^a-zA-Z0-9_]', '_', name.lower())
     return f"{prefix}:{safe_name}"
 
+def get_entities(kg, entity_ids, label=None):
+    """Get entities by ID, optionally keeping only those with a label"""
+    if hasattr(kg, "entities") and hasattr(kg.entities, "get_many"):
+        entities = [entity for _, entity in kg.entities.get_many(entity_ids)]
+    else:
+        entities = [kg.get_entity(entity_id) for entity_id in entity_ids]
+    return [entity for entity in entities
+            if entity and (label is None or label in entity.get("labels", []))]
+
 def format_date():
     """Return current date in ISO format"""
     return datetime.now().isoformat()
@@ -526,50 +578,23 @@ def list_features(args):
     """List features matching criteria"""
     kg = KnowledgeGraph()
     
-    # Find features
-    features = kg.find_entities(labels=["Feature"])
-    
-    # Filter by milestone if specified
-    if args.milestone:
-        milestone_id = generate_id("milestone", args.milestone)
-        milestone_features = []
-        
-        rels = kg.find_relationships(from_id=milestone_id, relation_type="CONTAINS_FEATURE")
-        feature_ids = [rel["to"] for rel in rels]
-        
-        for feature in features:
-            if feature.get("id") in feature_ids:
-                milestone_features.append(feature)
-                
-        features = milestone_features
+    # Relationship filters narrow the candidates before any entity is read
+    feature_ids = None
+    for prefix, value in (("milestone", args.milestone), ("module", args.module), ("phase", args.phase)):
+        if not value:
+            continue
+        rels = kg.find_relationships(from_id=generate_id(prefix, value), relation_type="CONTAINS_FEATURE")
+        linked_ids = dict.fromkeys(rel["to"] for rel in rels)
+        if feature_ids is None:
+            feature_ids = list(linked_ids)
+        else:
+            feature_ids = [feature_id for feature_id in feature_ids if feature_id in linked_ids]
     
-    # Filter by module if specified
-    if args.module:
-        module_id = generate_id("module", args.module)
-        module_features = []
-        
-        rels = kg.find_relationships(from_id=module_id, relation_type="CONTAINS_FEATURE")
-        feature_ids = [rel["to"] for rel in rels]
-        
-        for feature in features:
-            if feature.get("id") in feature_ids:
-                module_features.append(feature)
-                
-        features = module_features
-        
-    # Filter by phase if specified
-    if args.phase:
-        phase_id = generate_id("phase", args.phase)
-        phase_features = []
-        
-        rels = kg.find_relationships(from_id=phase_id, relation_type="CONTAINS_FEATURE")
-        feature_ids = [rel["to"] for rel in rels]
-        
-        for feature in features:
-            if feature.get("id") in feature_ids:
-                phase_features.append(feature)
-                
-        features = phase_features
+    # Find features
+    if feature_ids is None:
+        features = kg.find_entities(labels=["Feature"])
+    else:
+        features = get_entities(kg, feature_ids, label="Feature")
     
     # Display results
     if not features:
@@ -595,21 +620,13 @@ def list_tasks(args):
     """List tasks matching criteria"""
     kg = KnowledgeGraph()
     
-    # Find tasks
-    tasks = kg.find_entities(labels=["Task"])
-    
-    # Filter by feature if specified
+    # Find tasks, reading only the feature's tasks if a feature is specified
     if args.feature:
-        feature_tasks = []
-        
         rels = kg.find_relationships(from_id=args.feature, relation_type="HAS_TASK")
-        task_ids = [rel["to"] for rel in rels]
-        
-        for task in tasks:
-            if task.get("id") in task_ids:
-                feature_tasks.append(task)
-                
-        tasks = feature_tasks
+        task_ids = list(dict.fromkeys(rel["to"] for rel in rels))
+        tasks = get_entities(kg, task_ids, label="Task")
+    else:
+        tasks = kg.find_entities(labels=["Task"])
     
     # Filter by status if specified
     if args.status: